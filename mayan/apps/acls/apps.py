@@ -1,3 +1,4 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.apps import MayanAppConfig
@@ -9,6 +10,11 @@ from mayan.apps.views.html_widgets import ObjectLinkWidget
 
 from .classes import ModelPermission
 from .events import event_acl_deleted, event_acl_edited
+from .handlers import (
+    handler_materialized_access_acl_permissions_changed,
+    handler_materialized_access_object_deleted,
+    handler_materialized_access_object_saved
+)
 from .links import (
     link_acl_create, link_acl_delete, link_acl_permissions,
     link_global_acl_list
@@ -76,3 +82,17 @@ class ACLsApp(MayanAppConfig):
         menu_setup.bind_links(
             links=(link_global_acl_list,)
         )
+
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_materialized_access_acl_permissions_changed',
+            receiver=handler_materialized_access_acl_permissions_changed,
+            sender=AccessControlList.permissions.through
+        )
+        post_delete.connect(
+            dispatch_uid='acls_handler_materialized_access_object_deleted',
+            receiver=handler_materialized_access_object_deleted
+        )
+        post_save.connect(
+            dispatch_uid='acls_handler_materialized_access_object_saved',
+            receiver=handler_materialized_access_object_saved
+        )
@@ -95,6 +95,28 @@ class ModelPermission:
 
         return cls._inheritances[model]
 
+    @classmethod
+    def get_inheritances_reverse(cls, model):
+        """
+        Return the models that inherit the access from the model along with
+        the name of the field that relates them to the model.
+        """
+        result = []
+
+        for child_model in cls._inheritances_reverse.get(model, ()):
+            for inheritance in cls._inheritances[child_model]:
+                related_model = get_related_field(
+                    model=child_model,
+                    related_field_name=inheritance['field_name']
+                ).related_model
+
+                entry = (child_model, inheritance['field_name'])
+
+                if related_model == model and entry not in result:
+                    result.append(entry)
+
+        return result
+
     @classmethod
     def get_manager(cls, model):
         try:
@@ -0,0 +1,77 @@
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+
+from .classes import ModelPermission
+from .settings import setting_materialized_access
+
+
+def handler_materialized_access_acl_permissions_changed(
+    sender, instance, action, pk_set, reverse, **kwargs
+):
+    if not setting_materialized_access.value:
+        return
+
+    AccessControlList = apps.get_model(
+        app_label='acls', model_name='AccessControlList'
+    )
+    AccessGrant = apps.get_model(app_label='acls', model_name='AccessGrant')
+
+    if action == 'post_add':
+        if reverse:
+            # Instance is the permission, pk_set are ACLs.
+            for acl in AccessControlList.objects.filter(pk__in=pk_set):
+                AccessGrant.objects.add_acl_permissions(
+                    acl=acl, permission_ids=(instance.pk,)
+                )
+        else:
+            AccessGrant.objects.add_acl_permissions(
+                acl=instance, permission_ids=pk_set
+            )
+    elif action == 'post_remove':
+        if reverse:
+            AccessGrant.objects.filter(
+                acl_id__in=pk_set, permission=instance
+            ).delete()
+        else:
+            AccessGrant.objects.filter(
+                acl=instance, permission_id__in=pk_set
+            ).delete()
+    elif action == 'post_clear':
+        if reverse:
+            AccessGrant.objects.filter(permission=instance).delete()
+        else:
+            AccessGrant.objects.filter(acl=instance).delete()
+
+
+def handler_materialized_access_object_deleted(sender, instance, **kwargs):
+    if not setting_materialized_access.value:
+        return
+
+    try:
+        ModelPermission.get_inheritances(model=sender)
+    except KeyError:
+        if not ModelPermission.get_for_class(klass=sender):
+            # Not an access controlled model.
+            return
+
+    AccessGrant = apps.get_model(app_label='acls', model_name='AccessGrant')
+
+    AccessGrant.objects.filter(
+        content_type=ContentType.objects.get_for_model(model=sender),
+        object_id=instance.pk
+    ).delete()
+
+
+def handler_materialized_access_object_saved(sender, instance, **kwargs):
+    if not setting_materialized_access.value:
+        return
+
+    try:
+        ModelPermission.get_inheritances(model=sender)
+    except KeyError:
+        # The access of the object only depends on its own ACLs.
+        return
+
+    AccessGrant = apps.get_model(app_label='acls', model_name='AccessGrant')
+
+    AccessGrant.objects.update_object(obj=instance)
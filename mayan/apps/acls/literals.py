@@ -0,0 +1,8 @@
+DEFAULT_ACLS_MATERIALIZED_ACCESS = False
+DEFAULT_BENCHMARK_MODEL = 'documents.Document'
+DEFAULT_BENCHMARK_PERMISSION = 'documents.document_view'
+DEFAULT_BENCHMARK_ROUNDS = 5
+
+MATERIALIZED_ACCESS_BATCH_SIZE = 1000
+
+REQUEST_ACCESS_CACHE_ATTRIBUTE_NAME = '_acls_access_cache'
@@ -0,0 +1,102 @@
+import time
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core import management
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.permissions.classes import Permission
+
+from ...literals import (
+    DEFAULT_BENCHMARK_MODEL, DEFAULT_BENCHMARK_PERMISSION,
+    DEFAULT_BENCHMARK_ROUNDS
+)
+from ...models import AccessControlList, AccessGrant
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Measure the time to restrict a model queryset to the objects a '
+        'user can access using the recursive ACL filters and using the '
+        'materialized access table.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'username', action='store',
+            help=_('Name of the user whose access is checked.')
+        )
+        parser.add_argument(
+            '--model', action='store', default=DEFAULT_BENCHMARK_MODEL,
+            dest='model', help=_(
+                'Model to restrict, in the app_label.ModelName format.'
+            )
+        )
+        parser.add_argument(
+            '--permission', action='store',
+            default=DEFAULT_BENCHMARK_PERMISSION, dest='permission',
+            help=_('Permission to check, in the namespace.name format.')
+        )
+        parser.add_argument(
+            '--rounds', action='store', default=DEFAULT_BENCHMARK_ROUNDS,
+            dest='rounds', type=int,
+            help=_('Number of times each query is executed.')
+        )
+
+    def benchmark(self, function, rounds):
+        start = time.time()
+        for round in range(rounds):
+            result = set(function().values_list('pk', flat=True))
+        elapsed = time.time() - start
+
+        return result, elapsed
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise management.CommandError(
+                'Unknown user: {}'.format(options['username'])
+            )
+
+        model = apps.get_model(model_name=options['model'])
+        permission = Permission.get(
+            class_only=True, pk=options['permission']
+        )
+        queryset = model._meta.default_manager.all()
+
+        if not AccessGrant.objects.is_model_supported(model=model):
+            raise management.CommandError(
+                'The access of model {} cannot be materialized.'.format(
+                    options['model']
+                )
+            )
+
+        results = {}
+        for label, function in (
+            (
+                'acl filters', lambda: AccessControlList.objects._restrict_queryset_acl_filters(
+                    permission=permission, queryset=queryset, user=user
+                )
+            ), (
+                'materialized', lambda: AccessControlList.objects._restrict_queryset_materialized(
+                    permission=permission, queryset=queryset, user=user
+                )
+            )
+        ):
+            results[label], elapsed = self.benchmark(
+                function=function, rounds=options['rounds']
+            )
+            self.stdout.write(
+                '{}: {:.3f} s per query, {} objects'.format(
+                    label, elapsed / options['rounds'], len(results[label])
+                )
+            )
+
+        if results['acl filters'] != results['materialized']:
+            self.stderr.write(
+                'The results differ. Execute "rebuildaccess --verify" to '
+                'check the materialized access.'
+            )
@@ -0,0 +1,42 @@
+from django.core import management
+from django.utils.translation import ugettext_lazy as _
+
+from ...models import AccessGrant
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Rebuild the materialized access table from the ACLs or verify '
+        'that it matches them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify', action='store_true', dest='verify',
+            help=_(
+                'Compare the materialized access of each ACL with the '
+                'access calculated from the current ACLs and objects '
+                'instead of rebuilding the table.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        if options['verify']:
+            mismatch_count = 0
+
+            for acl, missing, extra in AccessGrant.objects.verify():
+                mismatch_count += 1
+                self.stdout.write(
+                    'ACL {}: {} missing, {} extra grants.'.format(
+                        acl.pk, missing, extra
+                    )
+                )
+
+            if mismatch_count:
+                raise management.CommandError(
+                    '{} ACLs do not match the materialized access. '
+                    'Execute this command without --verify to rebuild '
+                    'it.'.format(mismatch_count)
+                )
+        else:
+            AccessGrant.objects.rebuild()
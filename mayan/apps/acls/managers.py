@@ -2,11 +2,13 @@ from functools import reduce
 import logging
 import operator
 
+from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.db import models
+from django.db import models, transaction
 from django.db.models import CharField, Q, Value
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.functions import Cast, Concat
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext
@@ -17,8 +19,12 @@ from mayan.apps.common.utils import (
 from mayan.apps.permissions import Permission
 from mayan.apps.permissions.models import StoredPermission
 
-from .exceptions import PermissionNotValidForClass
 from .classes import ModelPermission
+from .exceptions import PermissionNotValidForClass
+from .literals import (
+    MATERIALIZED_ACCESS_BATCH_SIZE, REQUEST_ACCESS_CACHE_ATTRIBUTE_NAME
+)
+from .settings import setting_materialized_access
 
 logger = logging.getLogger(name=__name__)
 
@@ -230,6 +236,46 @@ class AccessControlListManager(models.Manager):
 
         return result
 
+    def _get_request_access_cache(self, request):
+        try:
+            return getattr(request, REQUEST_ACCESS_CACHE_ATTRIBUTE_NAME)
+        except AttributeError:
+            cache = {}
+            setattr(request, REQUEST_ACCESS_CACHE_ATTRIBUTE_NAME, cache)
+            return cache
+
+    def _restrict_queryset_acl_filters(self, permission, queryset, user):
+        acl_filters = self._get_acl_filters(
+            queryset=queryset,
+            stored_permission=permission.stored_permission, user=user
+        )
+
+        final_query = None
+        for acl_filter in acl_filters:
+            if final_query is None:
+                final_query = acl_filter
+            else:
+                final_query = final_query | acl_filter
+
+        return queryset.filter(final_query)
+
+    def _restrict_queryset_materialized(self, permission, queryset, user):
+        AccessGrant = apps.get_model(
+            app_label='acls', model_name='AccessGrant'
+        )
+
+        content_type = ContentType.objects.get_for_model(
+            model=queryset.model
+        )
+
+        return queryset.filter(
+            pk__in=AccessGrant.objects.filter(
+                content_type=content_type,
+                permission=permission.stored_permission,
+                role__groups__user=user
+            ).values('object_id')
+        )
+
     def check_access(self, obj, permissions, user):
         # Allow specific managers for models that have more than one
         # for example the Document model when checking for access for a trashed
@@ -247,16 +293,13 @@ class AccessControlListManager(models.Manager):
             return True
         else:
             manager = ModelPermission.get_manager(model=obj._meta.model)
-            source_queryset = manager.all()
 
-        restricted_queryset = manager.none()
-        for permission in permissions:
-            # Default relationship betweens permissions is OR.
-            restricted_queryset = restricted_queryset | self.restrict_queryset(
-                permission=permission, queryset=source_queryset, user=user
-            )
+        allowed_object_ids = self.get_allowed_object_ids(
+            permissions=permissions, queryset=manager.filter(pk=obj.pk),
+            user=user
+        )
 
-        if restricted_queryset.filter(pk=obj.pk).exists():
+        if obj.pk in allowed_object_ids:
             return True
         else:
             raise PermissionDenied(
@@ -265,6 +308,74 @@ class AccessControlListManager(models.Manager):
                 )
             )
 
+    def check_request_access(self, obj, permissions, request, object_list=None):
+        """
+        Same as check_access but the results are memoized in the request,
+        keyed by user, permission, model and primary key. The access to the
+        objects of object_list of the same model as obj is resolved in the
+        same query so that checking them later does not query the database.
+        """
+        meta = getattr(obj, '_meta', None)
+
+        if not meta:
+            return self.check_access(
+                obj=obj, permissions=permissions, user=request.user
+            )
+
+        cache = self._get_request_access_cache(request=request)
+        model = meta.model
+        manager = ModelPermission.get_manager(model=model)
+        user = request.user
+
+        objects = [obj]
+        for item in object_list or ():
+            item_meta = getattr(item, '_meta', None)
+            if item_meta and item_meta.model == model:
+                objects.append(item)
+
+        for permission in permissions:
+            key = (user.pk, permission.pk, model, obj.pk)
+
+            if key not in cache:
+                object_ids = {
+                    item.pk for item in objects if (
+                        user.pk, permission.pk, model, item.pk
+                    ) not in cache
+                }
+                allowed_object_ids = self.get_allowed_object_ids(
+                    permissions=(permission,),
+                    queryset=manager.filter(pk__in=object_ids), user=user
+                )
+                for object_id in object_ids:
+                    cache[
+                        (user.pk, permission.pk, model, object_id)
+                    ] = object_id in allowed_object_ids
+
+            # Default relationship betweens permissions is OR.
+            if cache[key]:
+                return True
+
+        raise PermissionDenied(
+            ugettext(message='Insufficient access for: %s') % force_text(
+                s=obj
+            )
+        )
+
+    def get_allowed_object_ids(self, permissions, queryset, user):
+        """
+        Return the set of primary keys of the objects of the queryset for
+        which the user has at least one of the permissions. The access is
+        resolved with a single query.
+        """
+        restricted_queryset = queryset.none()
+        for permission in permissions:
+            # Default relationship betweens permissions is OR.
+            restricted_queryset = restricted_queryset | self.restrict_queryset(
+                permission=permission, queryset=queryset, user=user
+            )
+
+        return set(restricted_queryset.values_list('pk', flat=True))
+
     def restrict_queryset(self, permission, queryset, user):
         if not user.is_authenticated:
             return queryset.none()
@@ -275,19 +386,23 @@ class AccessControlListManager(models.Manager):
                 permissions=(permission,), user=user
             )
         except PermissionDenied:
-            acl_filters = self._get_acl_filters(
-                queryset=queryset,
-                stored_permission=permission.stored_permission, user=user
+            AccessGrant = apps.get_model(
+                app_label='acls', model_name='AccessGrant'
             )
 
-            final_query = None
-            for acl_filter in acl_filters:
-                if final_query is None:
-                    final_query = acl_filter
-                else:
-                    final_query = final_query | acl_filter
+            is_materialized = (
+                setting_materialized_access.value and
+                AccessGrant.objects.is_model_supported(model=queryset.model)
+            )
 
-            return queryset.filter(final_query)
+            if is_materialized:
+                return self._restrict_queryset_materialized(
+                    permission=permission, queryset=queryset, user=user
+                )
+            else:
+                return self._restrict_queryset_acl_filters(
+                    permission=permission, queryset=queryset, user=user
+                )
         else:
             # User has direct permission assignment via a role, is superuser
             # or is staff. Return the entire queryset.
@@ -380,3 +495,396 @@ class AccessControlListManager(models.Manager):
 
         if acl.permissions.count() == 0:
             acl.delete()
+
+
+class AccessGrantManager(models.Manager):
+    """
+    Maintain the materialized access table. Each row records that the role
+    of an ACL holds one of its permissions for an object, either the object
+    of the ACL or an object that inherits the access from it.
+
+    The table is updated by the post_save, post_delete and m2m_changed
+    handlers. Code that inserts objects with bulk_create must call
+    .add_objects() for them. Code that changes the fields an object
+    inherits its access through with queryset.update() must call
+    .update_object() for each changed object or .rebuild().
+    """
+    def _get_acl_grants(self, acl):
+        """
+        Return the content type ID, object ID and permission ID of the
+        grants that the ACL should produce.
+        """
+        permission_ids = list(acl.permissions.values_list('pk', flat=True))
+
+        result = set()
+        if permission_ids:
+            for content_type_id, object_id in self._get_acl_objects(acl=acl):
+                for permission_id in permission_ids:
+                    result.add((content_type_id, object_id, permission_id))
+
+        return result
+
+    def _get_acl_objects(self, acl):
+        """
+        Yield the content type ID and object ID of the object of the ACL and
+        of every object that inherits the access from it.
+        """
+        model = acl.content_type.model_class()
+
+        if not model:
+            # Stale content type.
+            return
+
+        inheritance_lookups = self._get_inheritance_lookups(model=model)
+
+        for inherited_model, lookups in inheritance_lookups.items():
+            content_type = ContentType.objects.get_for_model(
+                model=inherited_model
+            )
+            query = reduce(
+                operator.or_, [
+                    Q(**{lookup: acl.object_id}) for lookup in lookups
+                ]
+            )
+            queryset = inherited_model._base_manager.filter(query)
+
+            for object_id in queryset.values_list('pk', flat=True).iterator():
+                yield content_type.pk, object_id
+
+    def _get_inheritance_lookups(
+        self, model, ancestors=(), lookup='pk', result=None
+    ):
+        """
+        Return a dictionary of the model and the models that inherit from it
+        directly or transitively, with the set of lookups that relate each
+        of them to the primary key of an instance of the model. Inheritance
+        paths that are shortcuts of longer paths produce the same lookup.
+        """
+        if result is None:
+            result = {}
+
+        model = model._meta.concrete_model
+        result.setdefault(model, set()).add(lookup)
+
+        inheritances_reverse = ModelPermission.get_inheritances_reverse(
+            model=model
+        )
+
+        for child_model, field_name in inheritances_reverse:
+            child_model = child_model._meta.concrete_model
+
+            if child_model not in ancestors and child_model != model:
+                if lookup == 'pk':
+                    child_lookup = field_name
+                else:
+                    child_lookup = '{}{}{}'.format(
+                        field_name, LOOKUP_SEP, lookup
+                    )
+
+                self._get_inheritance_lookups(
+                    ancestors=ancestors + (model,), lookup=child_lookup,
+                    model=child_model, result=result
+                )
+
+        return result
+
+    def _get_object_grants(self, content_type, obj):
+        """
+        Return the ACL, permission and role of the grants that an object
+        should have based on its own ACLs and the grants of the objects it
+        inherits from.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        model = content_type.model_class()
+
+        result = set(
+            AccessControlList.objects.filter(
+                content_type=content_type, object_id=obj.pk,
+                permissions__isnull=False
+            ).values_list('pk', 'permissions', 'role')
+        )
+
+        try:
+            inheritances = ModelPermission.get_inheritances(model=model)
+        except KeyError:
+            """Does not inherit access from other models."""
+        else:
+            for inheritance in inheritances:
+                parent_model = get_related_field(
+                    model=model, related_field_name=inheritance['field_name']
+                ).related_model
+                parent_ids = model._base_manager.filter(
+                    pk=obj.pk, **{
+                        '{}__isnull'.format(inheritance['field_name']): False
+                    }
+                ).values_list(inheritance['field_name'], flat=True)
+
+                result.update(
+                    self.filter(
+                        content_type=ContentType.objects.get_for_model(
+                            model=parent_model
+                        ), object_id__in=parent_ids
+                    ).values_list('acl', 'permission', 'role')
+                )
+
+        return result
+
+    def add_acl_permissions(self, acl, permission_ids):
+        permission_ids = list(permission_ids)
+
+        if not permission_ids:
+            return
+
+        entries = []
+        for content_type_id, object_id in self._get_acl_objects(acl=acl):
+            for permission_id in permission_ids:
+                entries.append(
+                    self.model(
+                        acl=acl, content_type_id=content_type_id,
+                        object_id=object_id, permission_id=permission_id,
+                        role_id=acl.role_id
+                    )
+                )
+
+            if len(entries) >= MATERIALIZED_ACCESS_BATCH_SIZE:
+                self.bulk_create(objs=entries, ignore_conflicts=True)
+                entries = []
+
+        if entries:
+            self.bulk_create(objs=entries, ignore_conflicts=True)
+
+    def add_objects(self, model, object_ids):
+        """
+        Create the grants of new objects inserted with bulk_create, which
+        does not send the post_save signal. The objects must not have
+        objects inheriting access from them yet.
+        """
+        if not setting_materialized_access.value:
+            return
+
+        if not self.is_model_supported(model=model):
+            return
+
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        content_type = ContentType.objects.get_for_model(model=model)
+        object_ids = list(object_ids)
+
+        try:
+            inheritances = ModelPermission.get_inheritances(model=model)
+        except KeyError:
+            inheritances = ()
+
+        for index in range(0, len(object_ids), MATERIALIZED_ACCESS_BATCH_SIZE):
+            batch_ids = object_ids[
+                index:index + MATERIALIZED_ACCESS_BATCH_SIZE
+            ]
+
+            grants = set(
+                AccessControlList.objects.filter(
+                    content_type=content_type, object_id__in=batch_ids,
+                    permissions__isnull=False
+                ).values_list('object_id', 'pk', 'permissions', 'role')
+            )
+
+            for inheritance in inheritances:
+                parent_model = get_related_field(
+                    model=model, related_field_name=inheritance['field_name']
+                ).related_model
+
+                parent_ids = {}
+                queryset = model._base_manager.filter(
+                    pk__in=batch_ids, **{
+                        '{}__isnull'.format(inheritance['field_name']): False
+                    }
+                ).values_list('pk', inheritance['field_name'])
+
+                for object_id, parent_id in queryset:
+                    parent_ids.setdefault(parent_id, []).append(object_id)
+
+                parent_grants = self.filter(
+                    content_type=ContentType.objects.get_for_model(
+                        model=parent_model
+                    ), object_id__in=parent_ids
+                ).values_list('object_id', 'acl', 'permission', 'role')
+
+                for parent_id, acl_id, permission_id, role_id in parent_grants:
+                    for object_id in parent_ids[parent_id]:
+                        grants.add(
+                            (object_id, acl_id, permission_id, role_id)
+                        )
+
+            self.bulk_create(
+                batch_size=MATERIALIZED_ACCESS_BATCH_SIZE, objs=[
+                    self.model(
+                        acl_id=acl_id, content_type=content_type,
+                        object_id=object_id, permission_id=permission_id,
+                        role_id=role_id
+                    ) for object_id, acl_id, permission_id, role_id in grants
+                ], ignore_conflicts=True
+            )
+
+    def is_model_supported(self, model, ancestors=()):
+        """
+        Return True if the access of the model can be resolved using the
+        materialized access table. Models with a field query function or
+        that inherit access via a generic foreign key are not supported.
+        """
+        model = model._meta.concrete_model
+
+        if model in ancestors:
+            return False
+
+        try:
+            ModelPermission.get_field_query_function(model=model)
+        except KeyError:
+            """No field query function."""
+        else:
+            return False
+
+        try:
+            inheritances = ModelPermission.get_inheritances(model=model)
+        except KeyError:
+            return True
+
+        for inheritance in inheritances:
+            related_field = get_related_field(
+                model=model, related_field_name=inheritance['field_name']
+            )
+
+            if isinstance(related_field, GenericForeignKey):
+                return False
+
+            is_parent_supported = self.is_model_supported(
+                ancestors=ancestors + (model,),
+                model=related_field.related_model
+            )
+            if not is_parent_supported:
+                return False
+
+        return True
+
+    def rebuild(self):
+        """
+        Bring the stored grants of every ACL in line with the calculated
+        ones. Only the differences are written and in a single transaction
+        so other connections keep seeing the previous grants until the
+        rebuild is committed.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        with transaction.atomic():
+            # The grants of deleted ACLs are removed by the cascade.
+            for acl in AccessControlList.objects.iterator():
+                expected_grants = self._get_acl_grants(acl=acl)
+                queryset = self.filter(acl=acl)
+                stored_grants = set(
+                    queryset.values_list(
+                        'content_type', 'object_id', 'permission'
+                    )
+                )
+
+                extra_grants = stored_grants - expected_grants
+                missing_grants = expected_grants - stored_grants
+
+                for content_type_id, object_id, permission_id in extra_grants:
+                    queryset.filter(
+                        content_type_id=content_type_id, object_id=object_id,
+                        permission_id=permission_id
+                    ).delete()
+
+                entries = []
+                for content_type_id, object_id, permission_id in missing_grants:
+                    entries.append(
+                        self.model(
+                            acl=acl, content_type_id=content_type_id,
+                            object_id=object_id, permission_id=permission_id,
+                            role_id=acl.role_id
+                        )
+                    )
+
+                self.bulk_create(
+                    batch_size=MATERIALIZED_ACCESS_BATCH_SIZE, objs=entries,
+                    ignore_conflicts=True
+                )
+
+    def update_object(self, obj):
+        """
+        Update the grants of an object after it is saved, in case the
+        objects it inherits from changed. The objects that inherit from it
+        are updated too when its grants change.
+        """
+        content_type = ContentType.objects.get_for_model(model=obj)
+        model = content_type.model_class()
+
+        if not self.is_model_supported(model=model):
+            return
+
+        expected_grants = self._get_object_grants(
+            content_type=content_type, obj=obj
+        )
+        queryset = self.filter(content_type=content_type, object_id=obj.pk)
+        current_grants = set(
+            queryset.values_list('acl', 'permission', 'role')
+        )
+
+        if expected_grants == current_grants:
+            return
+
+        for acl_id, permission_id, role_id in current_grants - expected_grants:
+            queryset.filter(
+                acl_id=acl_id, permission_id=permission_id
+            ).delete()
+
+        self.bulk_create(
+            objs=[
+                self.model(
+                    acl_id=acl_id, content_type=content_type,
+                    object_id=obj.pk, permission_id=permission_id,
+                    role_id=role_id
+                ) for acl_id, permission_id, role_id in expected_grants - current_grants
+            ], ignore_conflicts=True
+        )
+
+        inheritances_reverse = ModelPermission.get_inheritances_reverse(
+            model=model
+        )
+
+        for child_model, field_name in inheritances_reverse:
+            child_queryset = child_model._base_manager.filter(
+                **{field_name: obj.pk}
+            )
+            for child in child_queryset.iterator():
+                self.update_object(obj=child)
+
+    def verify(self):
+        """
+        Compare the stored grants of each ACL with the ones calculated from
+        the current ACLs and objects. Yield the ACL, the number of missing
+        grants and the number of extra grants of every ACL that differs.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        for acl in AccessControlList.objects.iterator():
+            expected_grants = self._get_acl_grants(acl=acl)
+
+            stored_grants = set(
+                self.filter(acl=acl).values_list(
+                    'content_type', 'object_id', 'permission'
+                )
+            )
+
+            if expected_grants != stored_grants:
+                yield (
+                    acl, len(expected_grants - stored_grants),
+                    len(stored_grants - expected_grants)
+                )
@@ -14,7 +14,7 @@ from mayan.apps.events.decorators import method_event
 from mayan.apps.permissions.models import Role, StoredPermission
 
 from .events import event_acl_created, event_acl_deleted, event_acl_edited
-from .managers import AccessControlListManager
+from .managers import AccessControlListManager, AccessGrantManager
 
 logger = logging.getLogger(name=__name__)
 
@@ -118,6 +118,43 @@ class AccessControlList(ExtraDataModelMixin, models.Model):
         return super().save(*args, **kwargs)
 
 
+class AccessGrant(models.Model):
+    """
+    Materialized access. Records that the role of an ACL holds a permission
+    for an object, either the object of the ACL or an object that inherits
+    the access from it. Only used when ACLS_MATERIALIZED_ACCESS is enabled.
+    """
+    acl = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='grants',
+        to=AccessControlList, verbose_name=_('ACL')
+    )
+    content_type = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='access_grants',
+        to=ContentType
+    )
+    object_id = models.PositiveIntegerField()
+    permission = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='access_grants',
+        to=StoredPermission, verbose_name=_('Permission')
+    )
+    role = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='access_grants', to=Role,
+        verbose_name=_('Role')
+    )
+
+    objects = AccessGrantManager()
+
+    class Meta:
+        index_together = (
+            ('content_type', 'permission', 'role', 'object_id'),
+        )
+        unique_together = (
+            'acl', 'permission', 'content_type', 'object_id'
+        )
+        verbose_name = _('Access grant')
+        verbose_name_plural = _('Access grants')
+
+
 class GlobalAccessControlListProxy(AccessControlList):
     class Meta:
         proxy = True
@@ -0,0 +1,18 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from .literals import DEFAULT_ACLS_MATERIALIZED_ACCESS
+
+namespace = SettingNamespace(label=_('ACLs'), name='acls')
+
+setting_materialized_access = namespace.add_setting(
+    default=DEFAULT_ACLS_MATERIALIZED_ACCESS,
+    global_name='ACLS_MATERIALIZED_ACCESS', help_text=_(
+        'Store the access granted by each ACL to its object and to the '
+        'objects that inherit from it in a table that is updated as ACLs '
+        'and objects change. Access checks then use a single indexed query '
+        'instead of following the inheritance of each model. Execute the '
+        'management command "rebuildaccess" after enabling this setting.'
+    )
+)
@@ -2,12 +2,14 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
 from django.db import models
+from django.http import HttpRequest
 
 from mayan.apps.events.classes import EventModelRegistry
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..classes import ModelPermission
-from ..models import AccessControlList
+from ..models import AccessControlList, AccessGrant
+from ..settings import setting_materialized_access
 
 from .mixins import ACLTestMixin
 
@@ -166,6 +168,126 @@ class PermissionTestCase(ACLTestMixin, BaseTestCase):
         )
         self.assertTrue(self.test_object_child in result)
 
+    def test_materialized_access_with_inherited_acl(self):
+        setting_materialized_access.set(value=True)
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.assertTrue(
+            AccessGrant.objects.filter(
+                content_type=ContentType.objects.get_for_model(
+                    model=self.test_object_child
+                ), object_id=self.test_object_child.pk
+            ).exists()
+        )
+
+        result = AccessControlList.objects.restrict_queryset(
+            permission=self.test_permission,
+            queryset=self.TestModelChild.objects.all(),
+            user=self._test_case_user,
+        )
+        self.assertTrue(self.test_object_child in result)
+
+    def test_materialized_access_with_new_child(self):
+        setting_materialized_access.set(value=True)
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        test_object_child_2 = self.TestModelChild.objects.create(
+            parent=self.test_object_parent
+        )
+
+        result = AccessControlList.objects.restrict_queryset(
+            permission=self.test_permission,
+            queryset=self.TestModelChild.objects.all(),
+            user=self._test_case_user,
+        )
+        self.assertTrue(test_object_child_2 in result)
+
+    def test_materialized_access_with_revoked_acl(self):
+        setting_materialized_access.set(value=True)
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self.revoke_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        result = AccessControlList.objects.restrict_queryset(
+            permission=self.test_permission,
+            queryset=self.TestModelChild.objects.all(),
+            user=self._test_case_user,
+        )
+        self.assertFalse(self.test_object_child in result)
+
+    def test_materialized_access_with_bulk_created_child(self):
+        setting_materialized_access.set(value=True)
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.TestModelChild.objects.bulk_create(
+            objs=[self.TestModelChild(parent=self.test_object_parent)]
+        )
+        test_object_child_2 = self.TestModelChild.objects.exclude(
+            pk=self.test_object_child.pk
+        ).get()
+
+        AccessGrant.objects.add_objects(
+            model=self.TestModelChild, object_ids=(test_object_child_2.pk,)
+        )
+
+        result = AccessControlList.objects.restrict_queryset(
+            permission=self.test_permission,
+            queryset=self.TestModelChild.objects.all(),
+            user=self._test_case_user,
+        )
+        self.assertTrue(test_object_child_2 in result)
+
+    def test_materialized_access_rebuild_stale_grants(self):
+        setting_materialized_access.set(value=True)
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        test_grant = AccessGrant.objects.first()
+        AccessGrant.objects.create(
+            acl=test_grant.acl, content_type=test_grant.content_type,
+            object_id=self.test_object_parent.pk + 1000,
+            permission=test_grant.permission, role=test_grant.role
+        )
+
+        self.assertEqual(len(list(AccessGrant.objects.verify())), 1)
+
+        AccessGrant.objects.rebuild()
+
+        self.assertEqual(list(AccessGrant.objects.verify()), [])
+
+    def test_materialized_access_rebuild_and_verify(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.assertEqual(len(list(AccessGrant.objects.verify())), 1)
+
+        AccessGrant.objects.rebuild()
+
+        self.assertEqual(list(AccessGrant.objects.verify()), [])
+        self.assertEqual(AccessGrant.objects.count(), 2)
+
     def test_method_get_absolute_url(self):
         self._create_acl_test_object()
         self._create_test_acl()
@@ -173,6 +295,56 @@ class PermissionTestCase(ACLTestMixin, BaseTestCase):
         self.assertTrue(self.test_acl.get_absolute_url())
 
 
+class RequestAccessTestCase(ACLTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._create_acl_test_object()
+        self.test_object_2 = self.TestModel.objects.create()
+
+        self.test_request = HttpRequest()
+        self.test_request.user = self._test_case_user
+
+    def test_get_allowed_object_ids(self):
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        self.assertEqual(
+            AccessControlList.objects.get_allowed_object_ids(
+                permissions=(self.test_permission,),
+                queryset=self.TestModel.objects.all(),
+                user=self._test_case_user
+            ), {self.test_object.pk}
+        )
+
+    def test_check_request_access_object_list(self):
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        object_list = [self.test_object, self.test_object_2]
+
+        AccessControlList.objects.check_request_access(
+            obj=self.test_object, object_list=object_list,
+            permissions=(self.test_permission,), request=self.test_request
+        )
+
+        with self.assertNumQueries(num=0):
+            with self.assertRaises(expected_exception=PermissionDenied):
+                AccessControlList.objects.check_request_access(
+                    obj=self.test_object_2, object_list=object_list,
+                    permissions=(self.test_permission,),
+                    request=self.test_request
+                )
+
+    def test_check_request_access_without_permissions(self):
+        with self.assertRaises(expected_exception=PermissionDenied):
+            AccessControlList.objects.check_request_access(
+                obj=self.test_object, permissions=(self.test_permission,),
+                request=self.test_request
+            )
+
+
 class InheritedPermissionTestCase(ACLTestMixin, BaseTestCase):
     def test_retrieve_inherited_role_permission_not_model_applicable(self):
         self.TestModel = self._create_test_model()
@@ -3,12 +3,15 @@
 class MayanImage {
     constructor (options) {
         this.element = options.element;
+        this.retryCount = 0;
         this.load();
     }
 
     static intialize (options) {
         this.options = options || {};
         this.options.templateInvalidImage = this.options.templateInvalidImage || '<span>Error loading image</span>';
+        this.options.retryDelay = this.options.retryDelay || 2000;
+        this.options.retryMaximum = this.options.retryMaximum || 30;
 
         $().fancybox({
             afterShow: function (instance, current) {
@@ -80,6 +83,30 @@ class MayanImage {
                         // It is a cached image, set the src attribute to
                         // trigger its display.
                         this.src = dataURL;
+                    } else if (self.retryCount < MayanImage.options.retryMaximum) {
+                        // Image elements do not expose the HTTP status.
+                        // Request the headers to retry only while the
+                        // image is still being generated by the server
+                        // (HTTP 202) or the server is busy (HTTP 503).
+                        var element = this;
+                        $.ajax({
+                            complete: function (jqXHR) {
+                                if (jqXHR.status === 202 || jqXHR.status === 503) {
+                                    self.retryCount += 1;
+                                    setTimeout(function () {
+                                        element.src = dataURL;
+                                    }, MayanImage.options.retryDelay);
+                                } else if (jqXHR.status === 200) {
+                                    element.src = dataURL;
+                                } else {
+                                    container.html(
+                                        MayanImage.options.templateInvalidImage
+                                    );
+                                }
+                            },
+                            type: 'HEAD',
+                            url: dataURL
+                        });
                     } else {
                         container.html(
                             MayanImage.options.templateInvalidImage
@@ -18,10 +18,10 @@ class DocumentCabinetWidget(SourceColumnWidget):
         )
 
         try:
-            AccessControlList.objects.check_access(
-                obj=self.value,
+            AccessControlList.objects.check_request_access(
+                obj=self.value, object_list=self.object_list,
                 permissions=(permission_cabinet_view,),
-                user=self.request.user
+                request=self.request
             )
         except PermissionDenied:
             queryset = self.value.cabinets.none()
@@ -1,5 +1,6 @@
 import io
 import logging
+import os
 import shutil
 import struct
 
@@ -10,7 +11,7 @@ import sh
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import NamedTemporaryFile, fs_cleanup, mkdtemp
 
 from ..classes import ConverterBase
 from ..exceptions import PageCountError
@@ -18,7 +19,8 @@ from ..settings import setting_graphics_backend_arguments
 
 from ..literals import (
     DEFAULT_PDFTOPPM_DPI, DEFAULT_PDFTOPPM_FORMAT, DEFAULT_PDFTOPPM_PATH,
-    DEFAULT_PDFINFO_PATH, DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS
+    DEFAULT_PDFINFO_PATH, DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS,
+    PDFTOPPM_OUTPUT_PREFIX
 )
 
 logger = logging.getLogger(name=__name__)
@@ -62,27 +64,155 @@ Image.MAX_IMAGE_PIXELS = pillow_maximum_image_pixels
 
 
 class Python(ConverterBase):
-    def convert(self, *args, **kwargs):
-        super().convert(*args, **kwargs)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.local_file_object = None
 
-        if self.mime_type == 'application/pdf' and pdftoppm:
-            new_file_object = NamedTemporaryFile()
-            input_filepath = new_file_object.name
+    def _get_local_file_path(self):
+        """
+        Copy the source file object to a named temporary file the first
+        time it is needed. The copy is kept until the converter is closed so
+        that rendering several pages copies the file only once.
+        """
+        if not self.local_file_object:
+            self.local_file_object = NamedTemporaryFile()
             self.file_object.seek(0)
-            shutil.copyfileobj(fsrc=self.file_object, fdst=new_file_object)
+            shutil.copyfileobj(
+                fsrc=self.file_object, fdst=self.local_file_object
+            )
             self.file_object.seek(0)
-            new_file_object.seek(0)
+            self.local_file_object.flush()
+
+        return self.local_file_object.name
+
+    def _render_page_range(self, page_number_first, page_number_last, width=None):
+        output_directory = mkdtemp()
+
+        try:
+            arguments = [
+                '-f', str(page_number_first + 1),
+                '-l', str(page_number_last + 1)
+            ]
+            if width:
+                # Render directly at the final width, keeping the aspect
+                # ratio of each page.
+                arguments.extend(
+                    ('-scale-to-x', str(width), '-scale-to-y', '-1')
+                )
+
+            arguments.extend(
+                (
+                    self._get_local_file_path(),
+                    os.path.join(output_directory, PDFTOPPM_OUTPUT_PREFIX)
+                )
+            )
+            pdftoppm(*arguments)
+
+            # Output files are named <prefix>-<page number>.<extension>
+            # with the page number zero padded to the width of the page
+            # count.
+            image_paths = {}
+            for filename in os.listdir(output_directory):
+                name, extension = os.path.splitext(filename)
+                image_paths[int(name.rsplit('-', 1)[-1])] = os.path.join(
+                    output_directory, filename
+                )
+
+            for page_number in sorted(image_paths):
+                image = Image.open(fp=image_paths[page_number])
+                image.load()
+                os.unlink(image_paths[page_number])
+
+                yield page_number - 1, image
+        finally:
+            fs_cleanup(filename=output_directory)
+
+    def close(self):
+        super().close()
+
+        if self.local_file_object:
+            self.local_file_object.close()
+            self.local_file_object = None
+
+    def convert(self, *args, **kwargs):
+        super().convert(*args, **kwargs)
 
+        if self.mime_type == 'application/pdf' and pdftoppm:
             image_buffer = io.BytesIO()
-            try:
-                pdftoppm(
-                    input_filepath, f=self.page_number + 1,
-                    l=self.page_number + 1, _out=image_buffer
+            pdftoppm(
+                self._get_local_file_path(), f=self.page_number + 1,
+                l=self.page_number + 1, _out=image_buffer
+            )
+            image_buffer.seek(0)
+            return Image.open(fp=image_buffer)
+
+    def get_page_widths(self, page_number_first, page_number_last):
+        """
+        Return the width in pixels of each page of a range when rendered at
+        the default resolution. Return None if the page sizes cannot be
+        read.
+        """
+        try:
+            with open(file=self._get_local_file_path(), mode='rb') as file_object:
+                pdf_reader = PyPDF2.PdfFileReader(
+                    stream=file_object, strict=False
                 )
-                image_buffer.seek(0)
-                return Image.open(fp=image_buffer)
-            finally:
-                new_file_object.close()
+                if pdf_reader.isEncrypted:
+                    pdf_reader.decrypt(password=b'')
+
+                result = {}
+                for page_number in range(page_number_first, page_number_last + 1):
+                    page = pdf_reader.getPage(page_number)
+                    if page.get('/Rotate', 0) % 180:
+                        page_width = page.mediaBox.getHeight()
+                    else:
+                        page_width = page.mediaBox.getWidth()
+
+                    result[page_number] = int(
+                        round(float(page_width) * float(pdftoppm_dpi) / 72)
+                    )
+
+                return result
+        except Exception as exception:
+            logger.debug('Unable to read the PDF page sizes; %s', exception)
+
+    def render_pages(self, page_number_first, page_number_last, width=None):
+        if self.mime_type != 'application/pdf' or not pdftoppm:
+            yield from super().render_pages(
+                page_number_first=page_number_first,
+                page_number_last=page_number_last, width=width
+            )
+            return
+
+        if width:
+            page_widths = self.get_page_widths(
+                page_number_first=page_number_first,
+                page_number_last=page_number_last
+            ) or {}
+        else:
+            page_widths = {}
+
+        # Split the range into runs of consecutive pages rendered with the
+        # same width. Pages are never rendered wider than at the default
+        # resolution, which the pages narrower than the requested width
+        # keep, to produce the same images as resizing the base image.
+        page_ranges = []
+        for page_number in range(page_number_first, page_number_last + 1):
+            if width and page_widths.get(page_number, 0) > width:
+                page_width = width
+            else:
+                page_width = None
+
+            if page_ranges and page_ranges[-1][2] == page_width:
+                page_ranges[-1][1] = page_number
+            else:
+                page_ranges.append([page_number, page_number, page_width])
+
+        for page_range_first, page_range_last, page_width in page_ranges:
+            yield from self._render_page_range(
+                page_number_first=page_range_first,
+                page_number_last=page_range_last, width=page_width
+            )
 
     def get_page_count(self):
         super().get_page_count()
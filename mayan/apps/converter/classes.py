@@ -1,6 +1,7 @@
 import copy
 from io import BytesIO
 import logging
+import math
 import os
 import shutil
 
@@ -31,12 +32,14 @@ from .exceptions import (
     InvalidOfficeFormat, LayerError, OfficeConversionError
 )
 from .literals import (
+    AFFINE_MATRIX_IDENTITY, AFFINE_MATRIX_TOLERANCE,
     CONVERTER_OFFICE_FILE_MIMETYPES, DEFAULT_LIBREOFFICE_PATH,
-    DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT
+    DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT, IMAGE_REDUCING_GAP
 )
 from .settings import (
     setting_graphics_backend, setting_graphics_backend_arguments
 )
+from .utils import affine_matrix_invert, affine_matrix_multiply
 
 logger = logging.getLogger(name=__name__)
 
@@ -91,6 +94,18 @@ class ConverterBase:
         except sh.CommandNotFound:
             self.command_libreoffice = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Release the resources kept by the converter to render several pages
+        of the same file.
+        """
+
     def convert(self, page_number=DEFAULT_PAGE_NUMBER):
         self.page_number = page_number
 
@@ -110,7 +125,12 @@ class ConverterBase:
             # RGB. Removes modes: P and RGBA
             new_mode = 'RGB'
 
-        self.image.convert(new_mode).save(image_buffer, format=output_format)
+        if self.image.mode == new_mode:
+            image = self.image
+        else:
+            image = self.image.convert(new_mode)
+
+        image.save(image_buffer, format=output_format)
 
         image_buffer.seek(0)
 
@@ -122,11 +142,25 @@ class ConverterBase:
         except InvalidOfficeFormat as exception:
             logger.debug('Is not an office format document; %s', exception)
 
-    def seek_page(self, page_number):
+    def render_pages(self, page_number_first, page_number_last, width=None):
+        """
+        Yield the page number and image of each page of a range, in order.
+        The page numbers start with #0 and the range includes both ends.
+        Backends that support it render the pages at the requested `width`
+        instead of their default resolution and render the whole range at
+        once.
+        """
+        for page_number in range(page_number_first, page_number_last + 1):
+            self.seek_page(page_number=page_number)
+            yield page_number, self.image
+
+    def seek_page(self, page_number, transformation_plan=None):
         """
         Seek the specified page number from the source file object.
         If the file is a paged image get the page if not convert it to a
         paged image format and return the specified page as an image.
+        When a transformation plan is provided, image formats that support
+        it are decoded at the smallest size the plan needs.
         """
         # Starting with #0
         self.file_object.seek(0)
@@ -146,6 +180,8 @@ class ConverterBase:
             raise
         else:
             self.image.seek(page_number)
+            if transformation_plan:
+                transformation_plan.draft(image=self.image)
             self.image.load()
 
     def soffice(self):
@@ -267,11 +303,161 @@ class ConverterBase:
         self.image = transformation.execute_on(image=self.image)
 
     def transform_many(self, transformations):
+        transformation_plan = TransformationPlan(
+            transformations=transformations
+        )
+
         if not self.image:
-            self.seek_page(page_number=0)
+            self.seek_page(
+                page_number=0, transformation_plan=transformation_plan
+            )
+
+        self.image = transformation_plan.execute_on(image=self.image)
+
+
+class TransformationPlan:
+    """
+    Execute a transformation list as a whole. Consecutive transformations
+    that only scale or rotate the image are folded into a single affine
+    map and the image is resampled once for all of them. When the list
+    starts with such transformations, JPEG images are decoded directly at
+    the smallest size that is enough for the result.
+    """
+    def __init__(self, transformations):
+        self.source_size = None
+        self.transformations = list(transformations)
+
+    def _get_geometry(self, size, transformations):
+        """
+        Fold the leading geometric transformations of the list. Return the
+        combined matrix, the size of the result, the fill color and the
+        number of transformations folded.
+        """
+        count = 0
+        fillcolor = None
+        matrix = AFFINE_MATRIX_IDENTITY
 
         for transformation in transformations:
-            self.image = transformation.execute_on(image=self.image)
+            geometry = transformation.get_geometry(size=size)
+            if geometry is None:
+                break
+
+            transformation_fillcolor = transformation.get_fillcolor()
+            if transformation_fillcolor is not None:
+                if fillcolor is not None and fillcolor != transformation_fillcolor:
+                    break
+
+                fillcolor = transformation_fillcolor
+
+            transformation_matrix, size = geometry
+            matrix = affine_matrix_multiply(
+                first=matrix, second=transformation_matrix
+            )
+            count += 1
+
+        return matrix, size, fillcolor, count
+
+    def _get_scaled_size(self, matrix, size):
+        scale_x = math.hypot(matrix[0], matrix[3])
+        scale_y = math.hypot(matrix[1], matrix[4])
+
+        return (
+            max(1, round(size[0] * scale_x)),
+            max(1, round(size[1] * scale_y))
+        )
+
+    def _resample(self, fillcolor, image, matrix, output_size, size):
+        a, b, c, d, e, f = matrix
+
+        if abs(b) < AFFINE_MATRIX_TOLERANCE and abs(d) < AFFINE_MATRIX_TOLERANCE:
+            # No rotation or a half turn.
+            image = self._resize(image=image, size=output_size)
+            if a < 0:
+                image = image.transpose(Image.ROTATE_180)
+            return image
+        elif abs(a) < AFFINE_MATRIX_TOLERANCE and abs(e) < AFFINE_MATRIX_TOLERANCE:
+            # Quarter turn, scale to the transposed size and transpose
+            # without resampling again.
+            image = self._resize(
+                image=image, size=(output_size[1], output_size[0])
+            )
+            if d > 0:
+                return image.transpose(Image.ROTATE_270)
+            else:
+                return image.transpose(Image.ROTATE_90)
+        else:
+            # Scale with antialiasing first as the affine resampling does
+            # not filter, then rotate at the final scale.
+            scaled_size = self._get_scaled_size(matrix=matrix, size=size)
+            image = self._resize(image=image, size=scaled_size)
+
+            matrix = affine_matrix_multiply(
+                first=(
+                    size[0] / scaled_size[0], 0.0, 0.0,
+                    0.0, size[1] / scaled_size[1], 0.0
+                ), second=matrix
+            )
+
+            return image.transform(
+                size=output_size, method=Image.AFFINE,
+                data=affine_matrix_invert(matrix=matrix),
+                resample=Image.BICUBIC, fillcolor=fillcolor
+            )
+
+    def _resize(self, image, size):
+        if image.size == size:
+            return image
+        else:
+            return image.resize(
+                size=size, resample=Image.ANTIALIAS,
+                reducing_gap=IMAGE_REDUCING_GAP
+            )
+
+    def draft(self, image):
+        """
+        Configure an image that is not loaded yet to be decoded at the
+        smallest size the plan needs.
+        """
+        self.source_size = image.size
+
+        matrix, output_size, fillcolor, count = self._get_geometry(
+            size=image.size, transformations=self.transformations
+        )
+
+        if count:
+            scaled_size = self._get_scaled_size(matrix=matrix, size=image.size)
+            if scaled_size[0] < image.size[0] and scaled_size[1] < image.size[1]:
+                image.draft(
+                    mode=None, size=(
+                        math.ceil(scaled_size[0] * IMAGE_REDUCING_GAP),
+                        math.ceil(scaled_size[1] * IMAGE_REDUCING_GAP)
+                    )
+                )
+
+    def execute_on(self, image):
+        # Drafted images are smaller than the size the transformations
+        # refer to.
+        size = self.source_size or image.size
+        index = 0
+
+        while index < len(self.transformations):
+            matrix, output_size, fillcolor, count = self._get_geometry(
+                size=size, transformations=self.transformations[index:]
+            )
+
+            if count:
+                image = self._resample(
+                    fillcolor=fillcolor, image=image, matrix=matrix,
+                    output_size=output_size, size=size
+                )
+                index += count
+            else:
+                image = self.transformations[index].execute_on(image=image)
+                index += 1
+
+            size = image.size
+
+        return image
 
 
 class Layer:
@@ -4,6 +4,8 @@ import platform
 
 from django.conf import settings
 
+AFFINE_MATRIX_IDENTITY = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+AFFINE_MATRIX_TOLERANCE = 1e-9
 ASSET_IMAGE_TASK_TIMEOUT = 60  # seconds
 
 CONVERTER_OFFICE_FILE_MIMETYPES = (
@@ -91,6 +93,10 @@ DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
     'pillow_maximum_image_pixels': DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS,
 }
 
+IMAGE_REDUCING_GAP = 2.0
+
+PDFTOPPM_OUTPUT_PREFIX = 'page'
+
 STORAGE_NAME_ASSETS = 'converter__assets'
 STORAGE_NAME_ASSETS_CACHE = 'converter__assets_cache'
 
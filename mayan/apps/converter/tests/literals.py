@@ -19,6 +19,7 @@ TEST_TRANSFORMATION_ARGUMENT_EDITED = 'degrees: 270'
 TEST_TRANSFORMATION_COMBINED_CACHE_HASH = '384bf78014d2aed7255d9e548a0694c70af0b22545653214bcceb1ac6286b5f7'
 TEST_TRANSFORMATION_LABEL = 'Test transformation class'
 TEST_TRANSFORMATION_NAME = 'test_transformation_class'
+TEST_TRANSFORMATION_PLAN_IMAGE_SIZE = (2550, 3300)
 TEST_TRANSFORMATION_RESIZE_CACHE_HASH = b'4aa319f5a6950985a19380a1f279a66769d04138bd1583844270fe8c269260fc'
 TEST_TRANSFORMATION_RESIZE_CACHE_HASH_2 = b'cc8d220d40e810b995181c0c69b44b7a61c3bb039c0be96a5465fcaf698ca99a'
 TEST_TRANSFORMATION_RESIZE_HEIGHT = 528
@@ -1,7 +1,12 @@
+from io import BytesIO
+
+from PIL import Image
+
 from django.test import TestCase
 
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 
+from ..classes import TransformationPlan
 from ..transformations import (
     BaseTransformation, TransformationCrop, TransformationLineArt,
     TransformationResize, TransformationRotate, TransformationRotate90,
@@ -15,8 +20,8 @@ from .literals import (
     TEST_TRANSFORMATION_RESIZE_HEIGHT, TEST_TRANSFORMATION_RESIZE_HEIGHT_2,
     TEST_TRANSFORMATION_RESIZE_WIDTH, TEST_TRANSFORMATION_RESIZE_WIDTH_2,
     TEST_TRANSFORMATION_ROTATE_CACHE_HASH,
-    TEST_TRANSFORMATION_ROTATE_DEGRESS, TEST_TRANSFORMATION_ZOOM_CACHE_HASH,
-    TEST_TRANSFORMATION_ZOOM_PERCENT
+    TEST_TRANSFORMATION_PLAN_IMAGE_SIZE, TEST_TRANSFORMATION_ROTATE_DEGRESS,
+    TEST_TRANSFORMATION_ZOOM_CACHE_HASH, TEST_TRANSFORMATION_ZOOM_PERCENT
 )
 from .mixins import LayerTestMixin
 
@@ -108,6 +113,76 @@ class TransformationBaseTestCase(TestCase):
         )
 
 
+class TransformationPlanTestCase(TestCase):
+    def _test_transformation_plan(self, transformations):
+        image = Image.new(mode='RGB', size=TEST_TRANSFORMATION_PLAN_IMAGE_SIZE)
+
+        expected_image = image
+        for transformation in transformations:
+            expected_image = transformation.execute_on(image=expected_image)
+
+        result_image = TransformationPlan(
+            transformations=transformations
+        ).execute_on(image=image)
+
+        # The transformations executed one at a time round the size at
+        # every step.
+        self.assertAlmostEqual(
+            result_image.size[0], expected_image.size[0], delta=1
+        )
+        self.assertAlmostEqual(
+            result_image.size[1], expected_image.size[1], delta=1
+        )
+
+    def test_plan_quarter_turn(self):
+        self._test_transformation_plan(
+            transformations=(
+                TransformationRotate(degrees=90),
+                TransformationResize(width=800),
+                TransformationZoom(percent=50)
+            )
+        )
+
+    def test_plan_rotation(self):
+        self._test_transformation_plan(
+            transformations=(
+                TransformationRotate(
+                    degrees=TEST_TRANSFORMATION_ROTATE_DEGRESS
+                ), TransformationResize(width=800),
+                TransformationZoom(percent=100)
+            )
+        )
+
+    def test_plan_non_geometric_transformation(self):
+        self._test_transformation_plan(
+            transformations=(
+                TransformationResize(width=800),
+                TransformationCrop(left=10, top=10, right=10, bottom=10),
+                TransformationRotate270(), TransformationZoom(percent=200)
+            )
+        )
+
+    def test_plan_draft(self):
+        image_buffer = BytesIO()
+        Image.new(mode='RGB', size=TEST_TRANSFORMATION_PLAN_IMAGE_SIZE).save(
+            image_buffer, format='JPEG'
+        )
+        image_buffer.seek(0)
+
+        transformation_plan = TransformationPlan(
+            transformations=(TransformationResize(width=150),)
+        )
+
+        image = Image.open(fp=image_buffer)
+        transformation_plan.draft(image=image)
+        image.load()
+
+        self.assertTrue(image.size[0] < TEST_TRANSFORMATION_PLAN_IMAGE_SIZE[0])
+        self.assertEqual(
+            transformation_plan.execute_on(image=image).size[0], 150
+        )
+
+
 class TransformationTestCase(LayerTestMixin, GenericDocumentTestCase):
     auto_create_test_transformation_class = False
 
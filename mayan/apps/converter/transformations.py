@@ -9,6 +9,9 @@ from django.utils.text import format_lazy
 from django.utils.translation import ugettext_lazy as _
 
 from .layers import layer_decorations, layer_saved_transformations
+from .utils import (
+    affine_matrix_rotate, affine_matrix_scale, get_thumbnail_size
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -125,6 +128,22 @@ class BaseTransformation(metaclass=BaseTransformationType):
         self.image = image
         self.aspect = 1.0 * image.size[0] / image.size[1]
 
+    def get_fillcolor(self):
+        """
+        Return the color of the areas uncovered by a geometric
+        transformation, None for the default.
+        """
+        return None
+
+    def get_geometry(self, size):
+        """
+        Return the affine matrix that maps the coordinates of an image of
+        the given size to the coordinates of the result and the size of the
+        result. Transformations that do more than scale or rotate the image
+        return None and are executed on their own.
+        """
+        return None
+
 
 class AssertTransformationMixin:
     @classmethod
@@ -691,6 +710,14 @@ class TransformationResize(BaseTransformation):
 
         return self.image
 
+    def get_geometry(self, size):
+        width = int(self.width)
+        height = int(self.height or 1.0 * width / (1.0 * size[0] / size[1]))
+
+        new_size = get_thumbnail_size(box=(width, height), size=size)
+
+        return affine_matrix_scale(new_size=new_size, size=size), new_size
+
 
 class TransformationRotate(BaseTransformation):
     arguments = ('degrees', 'fillcolor')
@@ -716,6 +743,14 @@ class TransformationRotate(BaseTransformation):
             fillcolor=fillcolor
         )
 
+    def get_fillcolor(self):
+        fillcolor_value = getattr(self, 'fillcolor', None)
+        if fillcolor_value and float(self.degrees) % 90:
+            return ImageColor.getrgb(fillcolor_value)
+
+    def get_geometry(self, size):
+        return affine_matrix_rotate(degrees=float(self.degrees), size=size)
+
 
 class TransformationRotate90(TransformationRotate):
     arguments = ()
@@ -785,6 +820,15 @@ class TransformationZoom(BaseTransformation):
             ), Image.ANTIALIAS
         )
 
+    def get_geometry(self, size):
+        decimal_value = float(self.percent) / 100
+
+        new_size = (
+            int(size[0] * decimal_value), int(size[1] * decimal_value)
+        )
+
+        return affine_matrix_scale(new_size=new_size, size=size), new_size
+
 
 BaseTransformation.register(
     layer=layer_decorations, transformation=TransformationAssetPaste
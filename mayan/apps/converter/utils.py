@@ -0,0 +1,110 @@
+import math
+
+from .literals import AFFINE_MATRIX_IDENTITY
+
+
+def affine_matrix_invert(matrix):
+    a, b, c, d, e, f = matrix
+    determinant = a * e - b * d
+
+    inverse_a = e / determinant
+    inverse_b = -b / determinant
+    inverse_d = -d / determinant
+    inverse_e = a / determinant
+
+    return (
+        inverse_a, inverse_b, -(inverse_a * c + inverse_b * f),
+        inverse_d, inverse_e, -(inverse_d * c + inverse_e * f)
+    )
+
+
+def affine_matrix_multiply(first, second):
+    """
+    Return the matrix that applies the `first` affine map and then the
+    `second` one. Matrices are tuples (a, b, c, d, e, f) that map the point
+    (x, y) to (a * x + b * y + c, d * x + e * y + f), the same layout used
+    by Pillow.
+    """
+    a1, b1, c1, d1, e1, f1 = first
+    a2, b2, c2, d2, e2, f2 = second
+
+    return (
+        a2 * a1 + b2 * d1, a2 * b1 + b2 * e1, a2 * c1 + b2 * f1 + c2,
+        d2 * a1 + e2 * d1, d2 * b1 + e2 * e1, d2 * c1 + e2 * f1 + f2
+    )
+
+
+def affine_matrix_rotate(degrees, size):
+    """
+    Return the matrix and resulting size of a clockwise rotation of an
+    image of the given size. The canvas is expanded to fit the rotated
+    image, the same way Image.rotate(expand=True) does.
+    """
+    degrees %= 360
+    if not degrees:
+        return AFFINE_MATRIX_IDENTITY, size
+
+    width, height = size
+    radians = math.radians(degrees)
+    cosine = round(math.cos(radians), 15)
+    sine = round(math.sin(radians), 15)
+
+    if degrees % 90 == 0:
+        if degrees == 180:
+            new_size = (width, height)
+        else:
+            new_size = (height, width)
+    else:
+        x_list = []
+        y_list = []
+        for x, y in ((0, 0), (width, 0), (width, height), (0, height)):
+            x_list.append(
+                cosine * (x - width / 2) - sine * (y - height / 2) + width / 2
+            )
+            y_list.append(
+                sine * (x - width / 2) + cosine * (y - height / 2) + height / 2
+            )
+
+        new_size = (
+            math.ceil(max(x_list)) - math.floor(min(x_list)),
+            math.ceil(max(y_list)) - math.floor(min(y_list))
+        )
+
+    return (
+        cosine, -sine,
+        new_size[0] / 2 - cosine * width / 2 + sine * height / 2,
+        sine, cosine,
+        new_size[1] / 2 - sine * width / 2 - cosine * height / 2
+    ), new_size
+
+
+def affine_matrix_scale(size, new_size):
+    return (
+        new_size[0] / size[0], 0.0, 0.0, 0.0, new_size[1] / size[1], 0.0
+    )
+
+
+def get_thumbnail_size(box, size):
+    """
+    Return the size Image.thumbnail would give an image of the given size:
+    the largest size that keeps the aspect ratio, fits the box and is not
+    larger than the image.
+    """
+    x, y = map(math.floor, box)
+    width, height = size
+
+    if x >= width and y >= height:
+        return size
+
+    def round_aspect(number, key):
+        return max(min(math.floor(number), math.ceil(number), key=key), 1)
+
+    aspect = width / height
+    if x / y >= aspect:
+        x = round_aspect(y * aspect, key=lambda n: abs(aspect - n / y))
+    else:
+        y = round_aspect(
+            x / aspect, key=lambda n: 0 if n == 0 else abs(aspect - x / n)
+        )
+
+    return (x, y)
@@ -1,3 +1,4 @@
+from django.db.models.signals import post_delete, post_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -13,6 +14,7 @@ from mayan.apps.navigation.classes import SourceColumn
 
 from .classes import KeyStub
 from .events import event_key_downloaded
+from .handlers import handler_keyring_version_update
 from .links import (
     link_key_delete, link_key_detail, link_key_download, link_key_query,
     link_key_receive, link_key_setup, link_key_upload, link_private_keys,
@@ -107,3 +109,12 @@ class DjangoGPGApp(MayanAppConfig):
             )
         )
         menu_setup.bind_links(links=(link_key_setup,))
+
+        post_delete.connect(
+            dispatch_uid='django_gpg_handler_keyring_version_update_delete',
+            receiver=handler_keyring_version_update, sender=Key
+        )
+        post_save.connect(
+            dispatch_uid='django_gpg_handler_keyring_version_update_save',
+            receiver=handler_keyring_version_update, sender=Key
+        )
@@ -1,5 +1,8 @@
+import atexit
+import logging
 import os
 import shutil
+import threading
 
 import gnupg
 
@@ -9,12 +12,83 @@ from ..classes import GPGBackend
 from ..literals import DEFAULT_GPG_PATH
 from ..settings import setting_gpg_backend_arguments
 
+logger = logging.getLogger(name=__name__)
+
 gpg_path = setting_gpg_backend_arguments.value.get(
     'gpg_path', DEFAULT_GPG_PATH
 )
 
 
+class PythonGNUPGKeyring:
+    """
+    GnuPG home directory that lives as long as the process and holds a
+    copy of the stored keys. Keys added since the last synchronization are
+    imported, the keyring is created again only when keys are removed.
+    """
+    def __init__(self):
+        self.directory = None
+        self.fingerprints = frozenset()
+        self.gpg = None
+        self.lock = threading.Lock()
+        self.version = None
+
+        atexit.register(self.remove)
+
+    def create(self, gpg_path):
+        self.remove()
+
+        self.directory = mkdtemp()
+        os.chmod(self.directory, 0x1C0)
+        self.fingerprints = frozenset()
+        self.gpg = gnupg.GPG(gnupghome=self.directory, gpgbinary=gpg_path)
+
+    def execute(self, function, **kwargs):
+        """
+        Call `function` with the GnuPG instance of the keyring. The lock
+        keeps a concurrent synchronization from removing the home directory
+        while it is in use.
+        """
+        with self.lock:
+            return function(gpg=self.gpg, **kwargs)
+
+    def remove(self):
+        if self.directory:
+            shutil.rmtree(path=self.directory, ignore_errors=True)
+            self.directory = None
+
+    def synchronize(self, gpg_path, keys, version):
+        """
+        Bring the keyring up to date with the `keys` queryset. Nothing is
+        queried or imported while the `version` stamp does not change.
+        """
+        with self.lock:
+            if self.gpg and version == self.version:
+                return self.gpg
+
+            fingerprints = frozenset(
+                keys.values_list('fingerprint', flat=True)
+            )
+
+            if not self.gpg or self.fingerprints - fingerprints:
+                logger.debug(msg='creating keyring')
+                self.create(gpg_path=gpg_path)
+
+            queryset = keys.filter(
+                fingerprint__in=fingerprints - self.fingerprints
+            ).values_list('key_data', flat=True)
+
+            for key_data in queryset.iterator():
+                self.gpg.import_keys(key_data=key_data)
+
+            self.fingerprints = fingerprints
+            self.version = version
+
+            return self.gpg
+
+
 class PythonGNUPGBackend(GPGBackend):
+    _keyring = PythonGNUPGKeyring()
+
     @staticmethod
     def _import_key(gpg, **kwargs):
         return gpg.import_keys(**kwargs)
@@ -44,14 +118,14 @@ class PythonGNUPGBackend(GPGBackend):
         )
 
     @staticmethod
-    def _decrypt_file(gpg, file_object, keys):
+    def _decrypt_file(gpg, file_object, keys=()):
         for key in keys:
             gpg.import_keys(key_data=key['key_data'])
 
         return gpg.decrypt_file(file=file_object)
 
     @staticmethod
-    def _verify_file(gpg, file_object, keys, data_filename=None):
+    def _verify_file(gpg, file_object, keys=(), data_filename=None):
         for key in keys:
             gpg.import_keys(key_data=key['key_data'])
 
@@ -75,6 +149,10 @@ class PythonGNUPGBackend(GPGBackend):
         )
 
     def gpg_command(self, function, **kwargs):
+        """
+        Execute the function with a GnuPG instance using an empty temporary
+        home directory.
+        """
         temporary_directory = mkdtemp()
         os.chmod(temporary_directory, 0x1C0)
 
@@ -114,17 +192,47 @@ class PythonGNUPGBackend(GPGBackend):
             detached=detached, binary=binary, output=output
         )
 
-    def decrypt_file(self, file_object, keys):
-        return self.gpg_command(
-            function=PythonGNUPGBackend._decrypt_file, file_object=file_object,
-            keys=keys
+    def decrypt_file(self, file_object, keys=None):
+        """
+        Decrypt with the keys provided or with the keyring when `keys` is
+        None.
+        """
+        if keys is None:
+            return self._keyring.execute(
+                function=PythonGNUPGBackend._decrypt_file,
+                file_object=file_object
+            )
+        else:
+            return self.gpg_command(
+                function=PythonGNUPGBackend._decrypt_file,
+                file_object=file_object, keys=keys
+            )
+
+    def keyring_synchronize(self, keys, version):
+        """
+        Update the keyring of the process with the `keys` queryset when the
+        `version` stamp changes.
+        """
+        self._keyring.synchronize(
+            gpg_path=self.kwargs['gpg_path'], keys=keys, version=version
         )
 
-    def verify_file(self, file_object, keys, data_filename=None):
-        return self.gpg_command(
-            function=PythonGNUPGBackend._verify_file, file_object=file_object,
-            keys=keys, data_filename=data_filename
-        )
+    def verify_file(self, file_object, keys=None, data_filename=None):
+        """
+        Verify with the keys provided or with the keyring when `keys` is
+        None.
+        """
+        if keys is None:
+            return self._keyring.execute(
+                function=PythonGNUPGBackend._verify_file,
+                data_filename=data_filename, file_object=file_object
+            )
+        else:
+            return self.gpg_command(
+                function=PythonGNUPGBackend._verify_file,
+                data_filename=data_filename, file_object=file_object,
+                keys=keys
+            )
 
     def recv_keys(self, keyserver, key_id):
         return self.gpg_command(
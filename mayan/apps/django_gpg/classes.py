@@ -3,6 +3,7 @@ from datetime import datetime
 from django.utils.module_loading import import_string
 from django.utils.timezone import make_aware
 
+from .literals import SIGNATURE_VERIFICATION_FIELDS
 from .settings import (
     setting_gpg_backend, setting_gpg_backend_arguments
 )
@@ -42,6 +43,11 @@ class KeyStub:
 
 class SignatureVerification:
     def __init__(self, raw):
+        # Copy of the result fields that can be cached.
+        self.raw = {
+            field: raw[field] for field in SIGNATURE_VERIFICATION_FIELDS
+        }
+
         self.user_id = raw['username']
         self.status = raw['status']
         self.key_id = raw['key_id']
@@ -0,0 +1,17 @@
+import uuid
+
+from django.apps import apps
+
+
+def handler_keyring_version_update(sender, **kwargs):
+    """
+    Change the keyring version in the transaction of the key change so
+    that the other processes see both at the same time.
+    """
+    KeyringVersion = apps.get_model(
+        app_label='django_gpg', model_name='KeyringVersion'
+    )
+
+    keyring_version = KeyringVersion.get_solo()
+    keyring_version.version = uuid.uuid4()
+    keyring_version.save()
@@ -14,6 +14,7 @@ DEFAULT_DEFAULT_GPG_PATH = {
     'gpg_path': DEFAULT_GPG_PATH,
 }
 DEFAULT_SIGNATURES_KEYSERVER = 'pool.sks-keyservers.net'
+DEFAULT_SIGNATURES_VERIFICATION_CACHE_TIMEOUT = 86400
 
 ERROR_MSG_BAD_PASSPHRASE = 'BAD_PASSPHRASE'
 ERROR_MSG_GOOD_PASSPHRASE = 'GOOD_PASSPHRASE'
@@ -50,6 +51,13 @@ KEYSERVER_DEFAULT_PORT = 11371
 
 OUTPUT_MESSAGE_CONTAINS_PRIVATE_KEY = 'Contains private key'
 
+SIGNATURE_VERIFICATION_CACHE_KEY = 'django_gpg_verification_{}'
+SIGNATURE_VERIFICATION_FIELDS = (
+    'expire_timestamp', 'fingerprint', 'key_id', 'pubkey_fingerprint',
+    'signature_id', 'status', 'stderr', 'timestamp', 'trust_level',
+    'trust_text', 'username', 'valid'
+)
+
 SIGNATURE_STATE_BAD = 'signature bad'
 SIGNATURE_STATE_NONE = None
 SIGNATURE_STATE_ERROR = 'signature error'
@@ -1,7 +1,10 @@
+import hashlib
 import io
 import logging
 import shutil
 
+from django.apps import apps
+from django.core.cache import caches
 from django.db import models
 
 from mayan.apps.storage.utils import NamedTemporaryFile
@@ -10,19 +13,33 @@ from .classes import GPGBackend, KeyStub, SignatureVerification
 from .exceptions import (
     DecryptionError, KeyDoesNotExist, KeyFetchingError, VerificationError
 )
-from .literals import KEY_TYPE_PUBLIC, KEY_TYPE_SECRET
-from .settings import setting_keyserver
+from .literals import (
+    KEY_TYPE_PUBLIC, KEY_TYPE_SECRET, SIGNATURE_VERIFICATION_CACHE_KEY
+)
+from .settings import setting_keyserver, setting_verification_cache_timeout
 
 logger = logging.getLogger(name=__name__)
 
 
 class KeyManager(models.Manager):
-    def _preload_keys(self, all_keys=False, key_fingerprint=None, key_id=None):
+    def _get_keyring_keys(self, key_fingerprint=None, key_id=None):
+        """
+        Return the keys to load for a single command or None when the
+        persistent keyring of the backend can be used instead. The keyring
+        holds every stored key and is synchronized before returning.
+        """
+        if key_fingerprint or key_id:
+            return self._preload_keys(
+                key_fingerprint=key_fingerprint, key_id=key_id
+            )
+        else:
+            GPGBackend.get_instance().keyring_synchronize(
+                keys=self.all(), version=self.get_keyring_version()
+            )
+
+    def _preload_keys(self, key_fingerprint=None, key_id=None):
         # Preload keys
-        if all_keys:
-            logger.debug(msg='preloading all keys')
-            keys = self.values()
-        elif key_fingerprint:
+        if key_fingerprint:
             logger.debug('preloading key fingerprint: %s', key_fingerprint)
             keys = self.filter(fingerprint=key_fingerprint).values()
             if not keys:
@@ -42,11 +59,47 @@ class KeyManager(models.Manager):
 
         return keys
 
-    def decrypt_file(
-        self, file_object, all_keys=False, key_fingerprint=None, key_id=None
-    ):
-        keys = self._preload_keys(
-            all_keys=all_keys, key_fingerprint=key_fingerprint, key_id=key_id
+    def _verify_file(self, file_object, keys, signature_file=None):
+        if signature_file:
+            # Save the original data and invert the argument order
+            # Signature first, file second
+            temporary_file_object = NamedTemporaryFile()
+            temporary_filename = temporary_file_object.name
+            shutil.copyfileobj(fsrc=file_object, fdst=temporary_file_object)
+            temporary_file_object.seek(0)
+
+            signature_file_buffer = io.BytesIO()
+            signature_file_buffer.write(signature_file.read())
+            signature_file_buffer.seek(0)
+            signature_file.seek(0)
+            verify_result = GPGBackend.get_instance().verify_file(
+                file_object=signature_file_buffer,
+                data_filename=temporary_filename, keys=keys
+            )
+            signature_file_buffer.close()
+            temporary_file_object.close()
+        else:
+            verify_result = GPGBackend.get_instance().verify_file(
+                file_object=file_object, keys=keys
+            )
+
+        logger.debug('verify_result.status: %s', verify_result.status)
+
+        if verify_result:
+            # Signed and key present
+            logger.debug(msg='signed and key present')
+            return SignatureVerification(verify_result.__dict__)
+        elif verify_result.key_id:
+            # Signed and key not found
+            logger.debug(msg='signed and key not found')
+            return SignatureVerification(verify_result.__dict__)
+        else:
+            logger.debug(msg='file not signed')
+            raise VerificationError('File not signed')
+
+    def decrypt_file(self, file_object, key_fingerprint=None, key_id=None):
+        keys = self._get_keyring_keys(
+            key_fingerprint=key_fingerprint, key_id=key_id
         )
 
         decrypt_result = GPGBackend.get_instance().decrypt_file(
@@ -62,6 +115,17 @@ class KeyManager(models.Manager):
 
         return io.BytesIO(decrypt_result.data)
 
+    def get_keyring_version(self):
+        """
+        Stamp that changes when keys are saved or deleted, by this or by
+        any other process.
+        """
+        KeyringVersion = apps.get_model(
+            app_label='django_gpg', model_name='KeyringVersion'
+        )
+
+        return KeyringVersion.get_solo().version
+
     def private_keys(self):
         return self.filter(key_type=KEY_TYPE_SECRET)
 
@@ -90,54 +154,51 @@ class KeyManager(models.Manager):
         return result
 
     def verify_file(
-        self, file_object, signature_file=None, all_keys=False,
-        key_fingerprint=None, key_id=None
+        self, file_object, signature_file=None, key_fingerprint=None,
+        key_id=None, checksum=None
     ):
-        keys = self._preload_keys(
-            all_keys=all_keys, key_fingerprint=key_fingerprint, key_id=key_id
+        """
+        Verify an embedded or detached signature. When the `checksum` of an
+        embedded signed file is provided, the result is cached until the
+        stored keys change.
+        """
+        keys = self._get_keyring_keys(
+            key_fingerprint=key_fingerprint, key_id=key_id
         )
 
-        if signature_file:
-            # Save the original data and invert the argument order
-            # Signature first, file second
-            temporary_file_object = NamedTemporaryFile()
-            temporary_filename = temporary_file_object.name
-            shutil.copyfileobj(fsrc=file_object, fdst=temporary_file_object)
-            temporary_file_object.seek(0)
-
-            signature_file_buffer = io.BytesIO()
-            signature_file_buffer.write(signature_file.read())
-            signature_file_buffer.seek(0)
-            signature_file.seek(0)
-            verify_result = GPGBackend.get_instance().verify_file(
-                file_object=signature_file_buffer,
-                data_filename=temporary_filename, keys=keys
-            )
-            signature_file_buffer.close()
-            temporary_file_object.close()
-        else:
-            verify_result = GPGBackend.get_instance().verify_file(
-                file_object=file_object, keys=keys
+        if checksum and not signature_file:
+            cache = caches['default']
+            cache_key = SIGNATURE_VERIFICATION_CACHE_KEY.format(
+                hashlib.sha256(
+                    '{}:{}:{}:{}'.format(
+                        checksum, key_fingerprint, key_id,
+                        self.get_keyring_version()
+                    ).encode()
+                ).hexdigest()
             )
 
-        logger.debug('verify_result.status: %s', verify_result.status)
+            raw = cache.get(key=cache_key)
+            if raw is None:
+                try:
+                    raw = self._verify_file(
+                        file_object=file_object, keys=keys
+                    ).raw
+                except VerificationError:
+                    raw = {}
+
+                cache.set(
+                    key=cache_key, value=raw,
+                    timeout=setting_verification_cache_timeout.value
+                )
+            else:
+                logger.debug(msg='verification result cached')
 
-        if verify_result:
-            # Signed and key present
-            logger.debug(msg='signed and key present')
-            return SignatureVerification(verify_result.__dict__)
-        elif verify_result.status == 'no public key' and not (key_fingerprint or all_keys or key_id):
-            # Signed but key not present, retry with key fetch
-            logger.debug(msg='no public key')
-            file_object.seek(0)
-            return self.verify_file(
-                file_object=file_object, signature_file=signature_file,
-                key_id=verify_result.key_id
-            )
-        elif verify_result.key_id:
-            # Signed, retried and key still not found
-            logger.debug(msg='signed, retried and key still not found')
-            return SignatureVerification(verify_result.__dict__)
+            if raw:
+                return SignatureVerification(raw)
+            else:
+                raise VerificationError('File not signed')
         else:
-            logger.debug(msg='file not signed')
-            raise VerificationError('File not signed')
+            return self._verify_file(
+                file_object=file_object, keys=keys,
+                signature_file=signature_file
+            )
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_gpg', '0008_auto_20210128_0505'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeyringVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.UUIDField(default=uuid.uuid4, editable=False, verbose_name='Version')),
+            ],
+            options={
+                'verbose_name': 'Keyring version',
+                'verbose_name_plural': 'Keyring version',
+            },
+        ),
+    ]
@@ -1,5 +1,6 @@
 from datetime import datetime
 import logging
+import uuid
 
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -8,6 +9,8 @@ from django.utils.encoding import force_text
 from django.utils.timezone import make_aware
 from django.utils.translation import ugettext_lazy as _
 
+from solo.models import SingletonModel
+
 from mayan.apps.databases.model_mixins import ExtraDataModelMixin
 from mayan.apps.events.classes import EventManagerSave
 from mayan.apps.events.decorators import method_event
@@ -158,3 +161,16 @@ class Key(ExtraDataModelMixin, models.Model):
             raise PassphraseError
 
         return file_sign_results
+
+
+class KeyringVersion(SingletonModel):
+    """
+    Stamp of the stored keys. It is changed when keys are saved or deleted
+    and tells the processes when to synchronize their keyrings.
+    """
+    version = models.UUIDField(
+        default=uuid.uuid4, editable=False, verbose_name=_('Version')
+    )
+
+    class Meta:
+        verbose_name = verbose_name_plural = _('Keyring version')
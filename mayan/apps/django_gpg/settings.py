@@ -4,7 +4,8 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
     DEFAULT_SIGNATURES_BACKEND, DEFAULT_DEFAULT_GPG_PATH,
-    DEFAULT_SIGNATURES_KEYSERVER
+    DEFAULT_SIGNATURES_KEYSERVER,
+    DEFAULT_SIGNATURES_VERIFICATION_CACHE_TIMEOUT
 )
 
 namespace = SettingNamespace(label=_('Signatures'), name='django_gpg')
@@ -24,3 +25,11 @@ setting_keyserver = namespace.add_setting(
     default=DEFAULT_SIGNATURES_KEYSERVER, global_name='SIGNATURES_KEYSERVER',
     help_text=_('Keyserver used to query for keys.')
 )
+setting_verification_cache_timeout = namespace.add_setting(
+    default=DEFAULT_SIGNATURES_VERIFICATION_CACHE_TIMEOUT,
+    global_name='SIGNATURES_VERIFICATION_CACHE_TIMEOUT',
+    help_text=_(
+        'Time in seconds to cache the verification result of an embedded '
+        'signature. Results are discarded when keys are added or deleted.'
+    )
+)
@@ -103,6 +103,7 @@ TEST_SIGNED_FILE = os.path.join(
     settings.BASE_DIR, 'apps', 'django_gpg', 'tests', 'contrib',
     'test_files', 'test_file.txt.gpg'
 )
+TEST_SIGNED_FILE_CHECKSUM = 'a48ceec2e8b02e66862494980e8f9226acb7ab130f7aab328125a2b81278973a'
 TEST_SIGNED_FILE_CONTENT = b'test_file.txt\n'
 
 TEST_RECEIVE_KEY = '''-----BEGIN PGP PUBLIC KEY BLOCK-----
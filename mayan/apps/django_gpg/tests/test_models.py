@@ -8,6 +8,7 @@ from django.utils.encoding import force_bytes
 from mayan.apps.storage.utils import TemporaryFile
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..backends.python_gnupg import PythonGNUPGBackend
 from ..exceptions import (
     DecryptionError, KeyDoesNotExist, NeedPassphrase, PassphraseError,
     VerificationError
@@ -18,7 +19,7 @@ from .literals import (
     MOCK_SEARCH_KEYS_RESPONSE, TEST_DETACHED_SIGNATURE, TEST_FILE,
     TEST_KEY_PRIVATE_DATA, TEST_KEY_PRIVATE_FINGERPRINT,
     TEST_KEY_PRIVATE_PASSPHRASE, TEST_SEARCH_FINGERPRINT, TEST_SEARCH_UID,
-    TEST_SIGNED_FILE, TEST_SIGNED_FILE_CONTENT
+    TEST_SIGNED_FILE, TEST_SIGNED_FILE_CHECKSUM, TEST_SIGNED_FILE_CONTENT
 )
 from .mocks import mock_recv_keys
 
@@ -30,6 +31,18 @@ class KeyTestCase(BaseTestCase):
 
         self.assertEqual(key.fingerprint, TEST_KEY_PRIVATE_FINGERPRINT)
 
+    def test_keyring_version_change(self):
+        version = Key.objects.get_keyring_version()
+
+        key = Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
+        version_created = Key.objects.get_keyring_version()
+        self.assertNotEqual(version_created, version)
+
+        key.delete()
+        self.assertNotEqual(
+            Key.objects.get_keyring_version(), version_created
+        )
+
     @mock.patch.object(gnupg.GPG, 'search_keys', autospec=True)
     def test_key_search(self, search_keys):
         search_keys.return_value = MOCK_SEARCH_KEYS_RESPONSE
@@ -95,6 +108,40 @@ class KeyTestCase(BaseTestCase):
             with self.assertRaises(expected_exception=KeyDoesNotExist):
                 Key.objects.verify_file(signed_file, key_fingerprint='999')
 
+    def test_embedded_verification_key_added(self):
+        with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+            result = Key.objects.verify_file(signed_file)
+
+        self.assertFalse(result.valid)
+
+        Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
+
+        with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+            result = Key.objects.verify_file(signed_file)
+
+        self.assertTrue(result.valid)
+        self.assertEqual(result.fingerprint, TEST_KEY_PRIVATE_FINGERPRINT)
+
+    def test_embedded_verification_with_checksum(self):
+        Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
+
+        with mock.patch.object(
+            PythonGNUPGBackend, 'verify_file', autospec=True,
+            side_effect=PythonGNUPGBackend.verify_file
+        ) as verify_file:
+            for count in range(2):
+                with open(file=TEST_SIGNED_FILE, mode='rb') as signed_file:
+                    result = Key.objects.verify_file(
+                        checksum=TEST_SIGNED_FILE_CHECKSUM,
+                        file_object=signed_file
+                    )
+
+                self.assertEqual(
+                    result.fingerprint, TEST_KEY_PRIVATE_FINGERPRINT
+                )
+
+        self.assertEqual(verify_file.call_count, 1)
+
     def test_signed_file_decryption(self):
         Key.objects.create(key_data=TEST_KEY_PRIVATE_DATA)
 
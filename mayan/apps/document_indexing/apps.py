@@ -1,5 +1,5 @@
 from django.apps import apps
-from django.db.models.signals import post_delete, post_save, pre_delete
+from django.db.models.signals import post_save, pre_delete
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -19,8 +19,8 @@ from mayan.apps.views.html_widgets import TwoStateWidget
 
 from .events import event_index_template_created, event_index_template_edited
 from .handlers import (
-    handler_create_default_document_index, handler_delete_empty,
-    handler_index_document, handler_remove_document
+    handler_create_default_document_index, handler_index_document,
+    handler_remove_document
 )
 from .html_widgets import (
     get_instance_link, index_instance_item_link, node_level
@@ -274,11 +274,6 @@ class DocumentIndexingApp(MayanAppConfig):
             receiver=handler_index_document,
             sender=Document
         )
-        post_delete.connect(
-            dispatch_uid='document_indexing_handler_delete_empty',
-            receiver=handler_delete_empty,
-            sender=Document
-        )
         pre_delete.connect(
             dispatch_uid='document_indexing_handler_remove_document',
             receiver=handler_remove_document,
@@ -1,9 +1,7 @@
 from django.apps import apps
 from django.utils.translation import ugettext_lazy as _
 
-from .tasks import (
-    task_delete_empty, task_index_document, task_remove_document
-)
+from .tasks import task_index_document, task_remove_document
 
 
 def handler_create_default_document_index(sender, **kwargs):
@@ -31,10 +29,6 @@ def handler_create_default_document_index(sender, **kwargs):
     )
 
 
-def handler_delete_empty(sender, **kwargs):
-    task_delete_empty.apply_async()
-
-
 def handler_index_document(sender, **kwargs):
     task_index_document.apply_async(
         kwargs=dict(document_id=kwargs['instance'].pk)
@@ -42,6 +36,15 @@ def handler_index_document(sender, **kwargs):
 
 
 def handler_remove_document(sender, **kwargs):
+    # Pass the nodes of the document since its links will be deleted
+    # along with it.
     task_remove_document.apply_async(
-        kwargs=dict(document_id=kwargs['instance'].pk)
+        kwargs=dict(
+            document_id=kwargs['instance'].pk,
+            index_instance_node_ids=list(
+                kwargs['instance'].index_instance_nodes.values_list(
+                    'pk', flat=True
+                )
+            )
+        )
     )
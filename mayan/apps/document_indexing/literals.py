@@ -1 +1,7 @@
+DEFAULT_BENCHMARK_DOCUMENTS = 1000
+DEFAULT_BENCHMARK_ROUNDS = 1
+DEFAULT_REBUILD_SHARD_SIZE = 1000
+DEFAULT_REBUILD_TIMEOUT = 86400
 DEFAULT_TASK_RETRY_DELAY = 5
+
+INDEX_REBUILD_BATCH_SIZE = 1000
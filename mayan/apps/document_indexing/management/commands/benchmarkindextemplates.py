@@ -0,0 +1,87 @@
+import time
+
+from django.core import management
+from django.template import Context, Engine, Template as DjangoTemplate
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.documents.models import Document
+from mayan.apps.templating.classes import Template
+from mayan.apps.templating.literals import TEMPLATE_BUILTINS
+
+from ...literals import DEFAULT_BENCHMARK_DOCUMENTS, DEFAULT_BENCHMARK_ROUNDS
+from ...models import IndexTemplateNode
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Measure the evaluation throughput of the index template node '
+        'expressions with and without the compiled template cache. The '
+        'indexes are not modified.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--documents', action='store',
+            default=DEFAULT_BENCHMARK_DOCUMENTS, dest='documents', type=int,
+            help=_('Maximum number of documents to evaluate.')
+        )
+        parser.add_argument(
+            '--rounds', action='store', default=DEFAULT_BENCHMARK_ROUNDS,
+            dest='rounds', type=int,
+            help=_('Number of times each document is evaluated.')
+        )
+
+    def benchmark(self, documents, expressions, render, rounds):
+        evaluations = 0
+
+        start = time.time()
+        for round in range(rounds):
+            for document in documents:
+                for expression in expressions:
+                    try:
+                        render(
+                            context={'document': document},
+                            template_string=expression
+                        )
+                    except Exception:
+                        # Errors are evaluations too, like during a rebuild.
+                        pass
+                    evaluations += 1
+        elapsed = time.time() - start
+
+        return evaluations, elapsed
+
+    def handle(self, *args, **options):
+        expressions = list(
+            IndexTemplateNode.objects.filter(
+                enabled=True, index__enabled=True, parent__isnull=False
+            ).values_list('expression', flat=True)
+        )
+        documents = list(
+            Document.valid.all()[:options['documents']]
+        )
+
+        def render_cached(context, template_string):
+            return Template(template_string=template_string).render(
+                context=context
+            )
+
+        def render_uncached(context, template_string):
+            # Behavior before the compiled template cache.
+            return DjangoTemplate(
+                engine=Engine(builtins=list(TEMPLATE_BUILTINS)),
+                template_string=template_string
+            ).render(context=Context(dict_=context))
+
+        for label, render in (
+            ('uncached', render_uncached), ('cached', render_cached)
+        ):
+            evaluations, elapsed = self.benchmark(
+                documents=documents, expressions=expressions, render=render,
+                rounds=options['rounds']
+            )
+            self.stdout.write(
+                '{}: {:.0f} evaluations/s, {} evaluations, {:.2f} s'.format(
+                    label, evaluations / (elapsed or 1), evaluations, elapsed
+                )
+            )
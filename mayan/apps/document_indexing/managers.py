@@ -1,7 +1,13 @@
+from datetime import timedelta
+
+from django.apps import apps
 from django.db import models
+from django.utils import timezone
 
 from mptt.managers import TreeManager
 
+from .settings import setting_rebuild_timeout
+
 
 class DocumentIndexInstanceNodeManager(models.Manager):
     def get_for(self, document):
@@ -15,9 +21,86 @@ class IndexInstanceNodeManager(TreeManager):
             for index_instance_node in root_nodes.get_leafnodes():
                 index_instance_node.delete_empty()
 
+    def prune(self, index_instance_node_ids):
+        """
+        Delete the nodes that have no documents and no children. The parents
+        of the deleted nodes are checked next, until a non empty node or the
+        root node is reached. Only the nodes provided and their ancestors are
+        checked.
+        """
+        Document = apps.get_model(app_label='documents', model_name='Document')
+
+        pending_ids = set(index_instance_node_ids)
+
+        while pending_ids:
+            empty_index_instance_nodes = list(
+                self.filter(
+                    children__isnull=True, parent__isnull=False,
+                    pk__in=pending_ids
+                ).exclude(documents__in=Document.valid.all())
+            )
+
+            pending_ids = set()
+            for index_instance_node in empty_index_instance_nodes:
+                pending_ids.add(index_instance_node.parent_id)
+                index_instance_node.delete()
+
     def remove_document(self, document):
+        index_instance_node_ids = []
+
         for index_instance_node in self.filter(documents=document):
             index_instance_node.remove_document(document=document)
+            index_instance_node_ids.append(index_instance_node.pk)
+
+        self.prune(index_instance_node_ids=index_instance_node_ids)
+
+
+class IndexRebuildManager(models.Manager):
+    def active(self):
+        return self.filter(datetime_created__gte=self.get_expiration())
+
+    def delete_expired(self):
+        queryset = self.filter(datetime_created__lt=self.get_expiration())
+
+        for index_rebuild in queryset:
+            index_rebuild.delete()
+
+    def get_expiration(self):
+        return timezone.now() - timedelta(
+            seconds=setting_rebuild_timeout.value
+        )
+
+    def start(self, index_template, shard_size):
+        """
+        Start a sharded rebuild of the index, replacing any previous rebuild
+        in progress. Return the rebuild and the list of document primary
+        key ranges of its shards. The last range is open ended to include
+        the documents created after the start.
+        """
+        Document = apps.get_model(app_label='documents', model_name='Document')
+
+        self.delete_expired()
+
+        for index_rebuild in index_template.rebuilds.all():
+            index_rebuild.delete()
+
+        queryset = Document.valid.filter(
+            document_type__in=index_template.document_types.all()
+        ).order_by('pk').values_list('pk', flat=True)
+
+        document_id_starts = [
+            document_id for count, document_id in enumerate(queryset.iterator()) if count % shard_size == 0
+        ]
+
+        shards = list(
+            zip(document_id_starts, document_id_starts[1:] + [None])
+        )
+
+        index_rebuild = self.create(
+            index_template=index_template, shard_count=len(shards)
+        )
+
+        return index_rebuild, shards
 
 
 class IndexTemplateManager(models.Manager):
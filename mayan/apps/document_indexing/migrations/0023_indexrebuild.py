@@ -0,0 +1,90 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0075_delete_duplicateddocumentold'),
+        ('document_indexing', '0022_indexinstance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexRebuild',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'datetime_created', models.DateTimeField(
+                        auto_now_add=True, db_index=True,
+                        verbose_name='Date time created'
+                    )
+                ),
+                (
+                    'shard_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Shard count'
+                    )
+                ),
+                (
+                    'shard_completed_count', models.PositiveIntegerField(
+                        default=0, verbose_name='Shards completed'
+                    )
+                ),
+                (
+                    'index_template', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='rebuilds',
+                        to='document_indexing.IndexTemplate',
+                        verbose_name='Index'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Index rebuild',
+                'verbose_name_plural': 'Index rebuilds',
+                'ordering': ('datetime_created',),
+            },
+        ),
+        migrations.CreateModel(
+            name='IndexRebuildDocument',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'index_paths', models.TextField(
+                        blank=True, help_text='JSON list of the index paths '
+                        'of the document. Each path is a list of template '
+                        'node and value pairs.', verbose_name='Index paths'
+                    )
+                ),
+                (
+                    'document', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='index_rebuild_documents',
+                        to='documents.Document', verbose_name='Document'
+                    )
+                ),
+                (
+                    'rebuild', models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='rebuild_documents',
+                        to='document_indexing.IndexRebuild',
+                        verbose_name='Index rebuild'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Index rebuild document',
+                'verbose_name_plural': 'Index rebuild documents',
+                'unique_together': {('rebuild', 'document')},
+            },
+        ),
+    ]
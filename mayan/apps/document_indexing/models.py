@@ -1,3 +1,5 @@
+import itertools
+import json
 import logging
 
 from django.db import models, transaction
@@ -8,7 +10,7 @@ from django.utils.translation import ugettext, ugettext_lazy as _
 from mptt.fields import TreeForeignKey
 from mptt.models import MPTTModel
 
-from mayan.apps.acls.models import AccessControlList
+from mayan.apps.acls.models import AccessControlList, AccessGrant
 from mayan.apps.databases.model_mixins import ExtraDataModelMixin
 from mayan.apps.documents.models import Document, DocumentType
 from mayan.apps.documents.permissions import permission_document_view
@@ -19,9 +21,10 @@ from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.templating.classes import Template
 
 from .events import event_index_template_created, event_index_template_edited
+from .literals import INDEX_REBUILD_BATCH_SIZE
 from .managers import (
-    DocumentIndexInstanceNodeManager, IndexTemplateManager,
-    IndexInstanceNodeManager
+    DocumentIndexInstanceNodeManager, IndexInstanceNodeManager,
+    IndexRebuildManager, IndexTemplateManager
 )
 
 logger = logging.getLogger(name=__name__)
@@ -92,6 +95,27 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
         except IndexInstanceNode.DoesNotExist:
             return '#'
 
+    def get_document_index_paths(
+        self, document, template_children=None, template_root=None
+    ):
+        """
+        Evaluate the index for the document. Return the index paths as
+        tuples of template node primary key and value pairs.
+        """
+        if template_children is None:
+            template_children = self._get_template_children()
+
+        if template_root is None:
+            template_root = self.template_root
+
+        return [
+            tuple(
+                (template_node.pk, value) for template_node, value in index_path
+            ) for index_path in template_root.get_document_index_paths(
+                document=document, template_children=template_children
+            )
+        ]
+
     def get_document_types_names(self):
         return ', '.join(
             [
@@ -99,14 +123,27 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
             ] or ['None']
         )
 
+    def _get_template_children(self):
+        """
+        Return the enabled template nodes of the index grouped by the
+        primary key of their parent, in tree order.
+        """
+        result = {}
+        for template_node in self.node_templates.filter(enabled=True):
+            result.setdefault(template_node.parent_id, []).append(
+                template_node
+            )
+
+        return result
+
     def index_document(self, document):
         """
-        Method to start the indexing process for a document. The entire process
-        happens inside one transaction. The document is first removed from all
-        the index nodes to which it already belongs. The different index
-        templates that match this document's type are evaluated and for each
-        result a node is fetched or created and the document is added to that
-        node.
+        Method to start the indexing process for a document. The entire
+        process happens inside one transaction. The index template nodes are
+        evaluated for the document and the result is compared with the
+        index instance nodes that already contain the document. Only the
+        nodes that differ are updated and only the nodes from which the
+        document was removed and their ancestors are checked for deletion.
         """
         logger.debug('Index; Indexing document: %s', document)
 
@@ -114,17 +151,81 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
             # Only index valid documents
             self.initialize_instance_root()
 
-            with transaction.atomic():
-                # Remove the document from all instance nodes from
-                # this index
-                for index_instance_node in IndexInstanceNode.objects.filter(index_template_node__index=self, documents=document):
-                    index_instance_node.remove_document(document=document)
+            # Start transaction after the lock in case the locking backend
+            # uses the database.
+            lock = LockingBackend.get_backend().acquire_lock(
+                name=self.template_root.get_lock_string()
+            )
+            try:
+                with transaction.atomic():
+                    self._index_document(document=document)
+            finally:
+                lock.release()
+
+    def _index_document(self, document):
+        current_index_instance_nodes = {
+            index_instance_node.pk: index_instance_node for index_instance_node in IndexInstanceNode.objects.filter(
+                documents=document, index_template_node__index=self
+            )
+        }
+        index_instance_nodes = {(): self.instance_root}
+        linked_node_ids = set()
+        visited_node_ids = set()
+        staged_index_paths = []
+
+        index_paths = self.template_root.get_document_index_paths(
+            document=document, template_children=self._get_template_children()
+        )
+
+        for index_path in index_paths:
+            index_template_node, value = index_path[-1]
+            index_instance_node, created = index_template_node.index_instance_nodes.get_or_create(
+                parent=index_instance_nodes[index_path[:-1]], value=value
+            )
+            index_instance_nodes[index_path] = index_instance_node
+            visited_node_ids.add(index_instance_node.pk)
+            staged_index_paths.append(
+                [
+                    (template_node.pk, template_node_value) for template_node, template_node_value in index_path
+                ]
+            )
+
+            if index_template_node.link_documents:
+                linked_node_ids.add(index_instance_node.pk)
+
+                if index_instance_node.pk not in current_index_instance_nodes:
+                    index_instance_node.documents.add(document)
+
+        for index_instance_node in current_index_instance_nodes.values():
+            if index_instance_node.pk not in linked_node_ids:
+                index_instance_node.documents.remove(document)
 
-                # Delete all empty nodes. Starting from the bottom up
-                for index_instance_node in self.instance_root.get_leafnodes():
-                    index_instance_node.delete_empty()
+        # Evaluated nodes that are not linked may be empty leaves.
+        IndexInstanceNode.objects.prune(
+            index_instance_node_ids=(
+                set(current_index_instance_nodes) | visited_node_ids
+            ) - linked_node_ids
+        )
 
-            self.template_root.index_document(document=document)
+        # Keep the rebuilds in progress current with the changes made
+        # after their shard was evaluated. The row is inserted ignoring
+        # conflicts and then updated so a shard inserting the same row
+        # concurrently can't make this fail. The rows of a shard never
+        # replace existing ones.
+        index_paths = json.dumps(obj=staged_index_paths)
+
+        for index_rebuild in self.rebuilds.active():
+            IndexRebuildDocument.objects.bulk_create(
+                ignore_conflicts=True, objs=[
+                    IndexRebuildDocument(
+                        document=document, index_paths=index_paths,
+                        rebuild=index_rebuild
+                    )
+                ]
+            )
+            index_rebuild.rebuild_documents.filter(
+                document=document
+            ).update(index_paths=index_paths)
 
     def initialize_instance_root(self):
         return self.template_root.initialize_index_instance_root_node()
@@ -140,25 +241,172 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
         """
         Delete and reconstruct the index by deleting of all its instance nodes
         and recreating them for the documents whose types are associated with
-        this index
+        this index. The index template nodes are evaluated for all the
+        documents first. The index instance nodes are then inserted one
+        level at a time and the tree is rebuilt once at the end.
         """
-        # Delete all index instance nodes by deleting the root index
-        # instance node. All child index instance nodes will be cascade
-        # deleted.
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.template_root.get_lock_string()
+        )
         try:
-            self.instance_root.delete()
-        except IndexInstanceNode.DoesNotExist:
-            # Empty index, ignore this exception
-            pass
+            with transaction.atomic():
+                self._rebuild()
+        finally:
+            lock.release()
 
-        # Create the new root index instance node
-        self.template_root.index_instance_nodes.create()
+    def _rebuild(self):
+        template_children = self._get_template_children()
+        template_root = self.template_root
+
+        queryset = Document.valid.filter(
+            document_type__in=self.document_types.all()
+        )
 
-        # Re-index each document with a type associated with this index
-        for document in Document.objects.filter(document_type__in=self.document_types.all()):
-            # Evaluate each index template node for each document
-            # associated with this index.
-            self.index_document(document=document)
+        self._build_instance_tree(
+            document_index_paths=(
+                (
+                    document.pk, self.get_document_index_paths(
+                        document=document,
+                        template_children=template_children,
+                        template_root=template_root
+                    )
+                ) for document in queryset.iterator()
+            )
+        )
+
+    def _build_instance_tree(self, document_index_paths):
+        """
+        Replace the index instance nodes with the tree described by
+        `document_index_paths`, an iterable of document primary key and
+        index paths pairs. Each index path is a tuple of template node
+        primary key and value pairs. The documents are processed in batches
+        and the index instance nodes of each batch are inserted one level
+        at a time. The tree is rebuilt once at the end.
+        """
+        # Delete all index instance nodes by deleting the root index
+        # instance node and create a new one.
+        self.reset()
+
+        instance_root = self.instance_root
+        template_node_ids = set()
+        linked_template_node_ids = set()
+
+        for template_nodes in self._get_template_children().values():
+            for template_node in template_nodes:
+                template_node_ids.add(template_node.pk)
+                if template_node.link_documents:
+                    linked_template_node_ids.add(template_node.pk)
+
+        # Primary key of the index instance nodes created so far, keyed by
+        # their parent primary key, template node primary key and value.
+        index_instance_node_ids = {}
+        insert_ids = itertools.count(start=1)
+
+        document_index_paths = iter(document_index_paths)
+
+        while True:
+            batch = list(
+                itertools.islice(
+                    document_index_paths, INDEX_REBUILD_BATCH_SIZE
+                )
+            )
+            if not batch:
+                break
+
+            self._build_instance_tree_batch(
+                document_index_paths=batch,
+                index_instance_node_ids=index_instance_node_ids,
+                insert_ids=insert_ids, instance_root=instance_root,
+                linked_template_node_ids=linked_template_node_ids,
+                template_node_ids=template_node_ids
+            )
+
+        IndexInstanceNode.objects.partial_rebuild(
+            tree_id=instance_root.tree_id
+        )
+
+    def _build_instance_tree_batch(
+        self, document_index_paths, index_instance_node_ids, insert_ids,
+        instance_root, linked_template_node_ids, template_node_ids
+    ):
+        # Index paths of the batch keyed by their depth, in order of
+        # appearance, and the documents linked to each path.
+        index_paths = {}
+        index_path_documents = {}
+
+        for document_id, document_index_paths in document_index_paths:
+            for index_path in document_index_paths:
+                index_template_node_id, value = index_path[-1]
+
+                if index_template_node_id in template_node_ids:
+                    index_paths.setdefault(len(index_path), {})[index_path] = None
+
+                    if index_template_node_id in linked_template_node_ids:
+                        index_path_documents.setdefault(
+                            index_path, []
+                        ).append(document_id)
+
+        index_path_node_ids = {(): instance_root.pk}
+
+        for depth in sorted(index_paths):
+            pending_index_paths = {}
+            for index_path in index_paths[depth]:
+                parent_id = index_path_node_ids.get(index_path[:-1])
+                if parent_id:
+                    index_template_node_id, value = index_path[-1]
+                    key = (parent_id, index_template_node_id, value)
+
+                    if key in index_instance_node_ids:
+                        index_path_node_ids[index_path] = index_instance_node_ids[key]
+                    else:
+                        pending_index_paths[key] = index_path
+
+            if not pending_index_paths:
+                continue
+
+            # Tree fields are calculated by the final rebuild. Until then
+            # the right value of the new nodes identifies their insert.
+            insert_id = next(insert_ids)
+
+            IndexInstanceNode.objects.bulk_create(
+                batch_size=INDEX_REBUILD_BATCH_SIZE, objs=[
+                    IndexInstanceNode(
+                        index_template_node_id=index_template_node_id,
+                        level=0, lft=0, parent_id=parent_id, rght=insert_id,
+                        tree_id=instance_root.tree_id, value=value
+                    ) for parent_id, index_template_node_id, value in pending_index_paths
+                ]
+            )
+
+            queryset = IndexInstanceNode.objects.filter(
+                lft=0, rght=insert_id, tree_id=instance_root.tree_id
+            ).values_list('pk', 'parent_id', 'index_template_node_id', 'value')
+
+            new_index_instance_node_ids = []
+            for pk, parent_id, index_template_node_id, value in queryset.iterator():
+                key = (parent_id, index_template_node_id, value)
+                index_path = pending_index_paths.get(key)
+                if index_path:
+                    index_instance_node_ids[key] = pk
+                    index_path_node_ids[index_path] = pk
+                new_index_instance_node_ids.append(pk)
+
+            # Bulk inserts do not trigger the access grant handlers.
+            AccessGrant.objects.add_objects(
+                model=IndexInstanceNode,
+                object_ids=new_index_instance_node_ids
+            )
+
+        IndexInstanceNodeDocument = IndexInstanceNode.documents.through
+
+        IndexInstanceNodeDocument.objects.bulk_create(
+            batch_size=INDEX_REBUILD_BATCH_SIZE, objs=[
+                IndexInstanceNodeDocument(
+                    document_id=document_id,
+                    indexinstancenode_id=index_path_node_ids[index_path]
+                ) for index_path, document_ids in index_path_documents.items() if index_path in index_path_node_ids for document_id in document_ids
+            ]
+        )
 
     def reset(self):
         try:
@@ -253,82 +501,54 @@ class IndexTemplateNode(MPTTModel):
     def get_instance_root_node(self):
         return self.index_instance_nodes.get(parent=None)
 
-    def index_document(self, document, acquire_lock=True, index_instance_node_parent=None):
-        # Start transaction after the lock in case the locking backend uses
-        # the database.
+    def evaluate(self, document):
+        """
+        Render the expression of the node for the document. Errors are
+        logged and produce an empty result.
+        """
+        logger.debug(
+            'IndexTemplateNode; Evaluating template: %s', self.expression
+        )
+
         try:
-            if acquire_lock:
-                lock = LockingBackend.get_backend().acquire_lock(
-                    name=self.get_lock_string()
-                )
-        except LockError:
-            raise
+            result = Template(template_string=self.expression).render(
+                context={'document': document}
+            )
+        except Exception as exception:
+            logger.debug('Evaluating error: %s', exception)
+            error_message = _(
+                'Error indexing document: %(document)s; expression: '
+                '%(expression)s; %(exception)s'
+            ) % {
+                'document': document,
+                'expression': self.expression,
+                'exception': exception
+            }
+            logger.debug(error_message)
+            return ''
         else:
-            try:
-                logger.debug(
-                    'IndexTemplateNode; Indexing document: %s', document
-                )
-
-                if not index_instance_node_parent:
-                    # I'm the root
-                    with transaction.atomic():
-                        index_instance_root_node = self.get_instance_root_node()
-
-                        for child in self.get_children():
-                            child.index_document(
-                                document=document, acquire_lock=False,
-                                index_instance_node_parent=index_instance_root_node
-                            )
-                elif self.enabled:
-                    with transaction.atomic():
-                        logger.debug('IndexTemplateNode; non parent: evaluating')
-                        logger.debug('My parent template is: %s', self.parent)
-                        logger.debug(
-                            'My parent instance node is: %s',
-                            index_instance_node_parent
-                        )
-                        logger.debug(
-                            'IndexTemplateNode; Evaluating template: %s', self.expression
-                        )
+            logger.debug('Evaluation result: %s', result)
+            return result
 
-                        try:
-                            template = Template(
-                                template_string=self.expression
-                            )
-                            result = template.render(
-                                context={'document': document}
-                            )
-                        except Exception as exception:
-                            logger.debug('Evaluating error: %s', exception)
-                            error_message = _(
-                                'Error indexing document: %(document)s; expression: '
-                                '%(expression)s; %(exception)s'
-                            ) % {
-                                'document': document,
-                                'expression': self.expression,
-                                'exception': exception
-                            }
-                            logger.debug(error_message)
-                        else:
-                            logger.debug('Evaluation result: %s', result)
-
-                            if result:
-                                index_instance_node, created = self.index_instance_nodes.get_or_create(
-                                    parent=index_instance_node_parent,
-                                    value=result
-                                )
-
-                                if self.link_documents:
-                                    index_instance_node.documents.add(document)
-
-                                for child in self.get_children():
-                                    child.index_document(
-                                        document=document, acquire_lock=False,
-                                        index_instance_node_parent=index_instance_node
-                                    )
-            finally:
-                if acquire_lock:
-                    lock.release()
+    def get_document_index_paths(
+        self, document, template_children, index_path=()
+    ):
+        """
+        Evaluate the enabled descendants of the node for the document.
+        Yield the path of template node and value pairs of every index
+        instance node the document produces, parents before children.
+        Evaluation stops at the nodes that produce an empty result.
+        """
+        for child in template_children.get(self.pk, ()):
+            value = child.evaluate(document=document)
+
+            if value:
+                child_index_path = index_path + ((child, value),)
+                yield child_index_path
+                yield from child.get_document_index_paths(
+                    document=document, index_path=child_index_path,
+                    template_children=template_children
+                )
 
     def initialize_index_instance_root_node(self):
         self.index_instance_nodes.get_or_create(parent=None)
@@ -420,7 +640,7 @@ class IndexInstanceNode(MPTTModel):
                         # I'm not a root node, I can be deleted
                         self.delete()
 
-                        if self.parent.is_root_node():
+                        if not self.parent.is_root_node():
                             # My parent is not a root node, it can be deleted
                             self.parent.delete_empty()
             finally:
@@ -527,3 +747,169 @@ class IndexInstanceNodeSearchResult(IndexInstanceNode):
         proxy = True
         verbose_name = _('Index instance node')
         verbose_name_plural = _('Index instance nodes')
+
+
+class IndexRebuild(models.Model):
+    """
+    Sharded rebuild of an index. Worker tasks evaluate the index for ranges
+    of documents and stage the result. The index instance nodes are left
+    untouched until all the shards complete, then they are replaced with the
+    staged result in a single transaction.
+    """
+    index_template = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='rebuilds',
+        to=IndexTemplate, verbose_name=_('Index')
+    )
+    datetime_created = models.DateTimeField(
+        auto_now_add=True, db_index=True, verbose_name=_('Date time created')
+    )
+    shard_count = models.PositiveIntegerField(
+        default=0, verbose_name=_('Shard count')
+    )
+    shard_completed_count = models.PositiveIntegerField(
+        default=0, verbose_name=_('Shards completed')
+    )
+
+    objects = IndexRebuildManager()
+
+    class Meta:
+        ordering = ('datetime_created',)
+        verbose_name = _('Index rebuild')
+        verbose_name_plural = _('Index rebuilds')
+
+    def __str__(self):
+        return force_text(s=self.index_template)
+
+    def complete_shard(self):
+        """
+        Record the completion of a shard. Return True only to the caller
+        that completes the last shard.
+        """
+        with transaction.atomic():
+            try:
+                index_rebuild = IndexRebuild.objects.select_for_update().get(
+                    pk=self.pk
+                )
+            except IndexRebuild.DoesNotExist:
+                # Superseded by a newer rebuild or abandoned after the
+                # failure of another shard.
+                return False
+
+            index_rebuild.shard_completed_count += 1
+            index_rebuild.save(update_fields=('shard_completed_count',))
+
+        self.shard_completed_count = index_rebuild.shard_completed_count
+
+        return self.shard_completed_count == self.shard_count
+
+    def delete(self, *args, **kwargs):
+        # Delete the staged documents in batches to bound the memory used
+        # by the collector.
+        while True:
+            rebuild_document_ids = list(
+                self.rebuild_documents.values_list('pk', flat=True)[
+                    :INDEX_REBUILD_BATCH_SIZE
+                ]
+            )
+            if not rebuild_document_ids:
+                break
+
+            IndexRebuildDocument.objects.filter(
+                pk__in=rebuild_document_ids
+            ).delete()
+
+        return super().delete(*args, **kwargs)
+
+    def finish(self):
+        """
+        Replace the index instance nodes with the staged result. The staged
+        documents that are no longer valid or no longer of a type of the
+        index are skipped.
+        """
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.index_template.template_root.get_lock_string()
+        )
+        try:
+            with transaction.atomic():
+                if not IndexRebuild.objects.select_for_update().filter(pk=self.pk).exists():
+                    # Superseded by a newer rebuild.
+                    return
+
+                self.index_template._build_instance_tree(
+                    document_index_paths=self.get_document_index_paths()
+                )
+                self.delete()
+        finally:
+            lock.release()
+
+    def get_document_index_paths(self):
+        queryset = self.rebuild_documents.filter(
+            document__in=Document.valid.filter(
+                document_type__in=self.index_template.document_types.all()
+            )
+        ).values_list('document_id', 'index_paths')
+
+        for document_id, index_paths in queryset.iterator():
+            yield document_id, [
+                tuple(
+                    (index_template_node_id, value) for index_template_node_id, value in index_path
+                ) for index_path in json.loads(s=index_paths)
+            ]
+
+    def stage_documents(self, document_id_start, document_id_end=None):
+        """
+        Evaluate the index for the documents of a shard. Documents staged
+        after the start of the rebuild by the regular indexing are
+        preserved as they are at least as recent.
+        """
+        queryset = Document.valid.filter(
+            document_type__in=self.index_template.document_types.all(),
+            pk__gte=document_id_start
+        )
+        if document_id_end is not None:
+            queryset = queryset.filter(pk__lt=document_id_end)
+
+        template_children = self.index_template._get_template_children()
+        template_root = self.index_template.template_root
+
+        IndexRebuildDocument.objects.bulk_create(
+            batch_size=INDEX_REBUILD_BATCH_SIZE, ignore_conflicts=True, objs=[
+                IndexRebuildDocument(
+                    document=document, index_paths=json.dumps(
+                        obj=self.index_template.get_document_index_paths(
+                            document=document,
+                            template_children=template_children,
+                            template_root=template_root
+                        )
+                    ), rebuild=self
+                ) for document in queryset.iterator()
+            ]
+        )
+
+
+class IndexRebuildDocument(models.Model):
+    """
+    Evaluation result of an index for a document, staged by a rebuild.
+    """
+    rebuild = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='rebuild_documents',
+        to=IndexRebuild, verbose_name=_('Index rebuild')
+    )
+    document = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='index_rebuild_documents',
+        to=Document, verbose_name=_('Document')
+    )
+    index_paths = models.TextField(
+        blank=True, help_text=_(
+            'JSON list of the index paths of the document. Each path is a '
+            'list of template node and value pairs.'
+        ), verbose_name=_('Index paths')
+    )
+
+    class Meta:
+        unique_together = ('rebuild', 'document')
+        verbose_name = _('Index rebuild document')
+        verbose_name_plural = _('Index rebuild documents')
+
+    def __str__(self):
+        return force_text(s=self.document)
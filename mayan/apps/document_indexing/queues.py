@@ -24,3 +24,11 @@ queue_tools.add_task_type(
     label=_('Rebuild index'),
     dotted_path='mayan.apps.document_indexing.tasks.task_rebuild_index'
 )
+queue_tools.add_task_type(
+    label=_('Rebuild index shard'),
+    dotted_path='mayan.apps.document_indexing.tasks.task_rebuild_index_shard'
+)
+queue_tools.add_task_type(
+    label=_('Finish index rebuild'),
+    dotted_path='mayan.apps.document_indexing.tasks.task_rebuild_index_finish'
+)
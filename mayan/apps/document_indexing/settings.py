@@ -2,12 +2,32 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.smart_settings.classes import SettingNamespace
 
-from .literals import DEFAULT_TASK_RETRY_DELAY
+from .literals import (
+    DEFAULT_REBUILD_SHARD_SIZE, DEFAULT_REBUILD_TIMEOUT,
+    DEFAULT_TASK_RETRY_DELAY
+)
 
 namespace = SettingNamespace(
     label=_('Document indexing'), name='document_indexing',
 )
 
+setting_rebuild_shard_size = namespace.add_setting(
+    default=DEFAULT_REBUILD_SHARD_SIZE,
+    global_name='DOCUMENT_INDEXING_REBUILD_SHARD_SIZE', help_text=_(
+        'Number of documents evaluated by each task of an index rebuild. '
+        'The shards are processed in parallel by the available workers and '
+        'the index is replaced once all of them complete.'
+    )
+)
+setting_rebuild_timeout = namespace.add_setting(
+    default=DEFAULT_REBUILD_TIMEOUT,
+    global_name='DOCUMENT_INDEXING_REBUILD_TIMEOUT', help_text=_(
+        'Time in seconds after which an index rebuild that did not finish '
+        'is considered failed. Expired rebuilds stop receiving the changes '
+        'of the regular indexing and are deleted when the next rebuild '
+        'starts.'
+    )
+)
 setting_task_retry = namespace.add_setting(
     default=DEFAULT_TASK_RETRY_DELAY,
     global_name='DOCUMENT_INDEXING_TASK_RETRY_DELAY', help_text=_(
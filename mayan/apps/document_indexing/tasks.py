@@ -6,7 +6,7 @@ from django.db import OperationalError
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
-from .settings import setting_task_retry
+from .settings import setting_rebuild_shard_size, setting_task_retry
 
 logger = logging.getLogger(name=__name__)
 
@@ -61,28 +61,111 @@ def task_index_document(self, document_id):
             raise self.retry(exc=exception)
 
 
+@app.task(ignore_result=True)
+def task_rebuild_index(index_id):
+    IndexRebuild = apps.get_model(
+        app_label='document_indexing', model_name='IndexRebuild'
+    )
+    IndexTemplate = apps.get_model(
+        app_label='document_indexing', model_name='IndexTemplate'
+    )
+
+    index_template = IndexTemplate.objects.get(pk=index_id)
+    index_rebuild, shards = IndexRebuild.objects.start(
+        index_template=index_template,
+        shard_size=setting_rebuild_shard_size.value
+    )
+
+    if shards:
+        for document_id_start, document_id_end in shards:
+            task_rebuild_index_shard.apply_async(
+                kwargs={
+                    'document_id_end': document_id_end,
+                    'document_id_start': document_id_start,
+                    'index_rebuild_id': index_rebuild.pk
+                }
+            )
+    else:
+        task_rebuild_index_finish.apply_async(
+            kwargs={'index_rebuild_id': index_rebuild.pk}
+        )
+
+
+@app.task(
+    bind=True, default_retry_delay=setting_task_retry.value, max_retries=None,
+    ignore_result=True
+)
+def task_rebuild_index_finish(self, index_rebuild_id):
+    IndexRebuild = apps.get_model(
+        app_label='document_indexing', model_name='IndexRebuild'
+    )
+
+    try:
+        index_rebuild = IndexRebuild.objects.get(pk=index_rebuild_id)
+    except IndexRebuild.DoesNotExist:
+        # Superseded by a newer rebuild.
+        pass
+    else:
+        try:
+            index_rebuild.finish()
+        except LockError as exception:
+            # The index is being updated by another task, retry later
+            raise self.retry(exc=exception)
+
+
 @app.task(
     bind=True, default_retry_delay=setting_task_retry.value,
     ignore_result=True
 )
-def task_rebuild_index(self, index_id):
-    IndexTemplate = apps.get_model(
-        app_label='document_indexing', model_name='IndexTemplate'
+def task_rebuild_index_shard(
+    self, index_rebuild_id, document_id_start, document_id_end=None
+):
+    IndexRebuild = apps.get_model(
+        app_label='document_indexing', model_name='IndexRebuild'
     )
 
     try:
-        index = IndexTemplate.objects.get(pk=index_id)
-        index.rebuild()
-    except LockError as exception:
-        # This index is being rebuilt by another task, retry later
-        raise self.retry(exc=exception)
+        index_rebuild = IndexRebuild.objects.get(pk=index_rebuild_id)
+    except IndexRebuild.DoesNotExist:
+        # Superseded by a newer rebuild.
+        pass
+    else:
+        try:
+            index_rebuild.stage_documents(
+                document_id_end=document_id_end,
+                document_id_start=document_id_start
+            )
+        except OperationalError as exception:
+            logger.warning(
+                'Operational error while rebuilding index shard: '
+                '%s; %s', index_rebuild, exception
+            )
+            if self.request.retries < self.max_retries:
+                raise self.retry(exc=exception)
+            else:
+                index_rebuild.delete()
+                raise
+        except Exception as exception:
+            # The index can't be replaced without this shard, abandon the
+            # rebuild so the regular indexing stops staging documents.
+            logger.error(
+                'Unable to rebuild index shard: %s; %s', index_rebuild,
+                exception
+            )
+            index_rebuild.delete()
+            raise
+
+        if index_rebuild.complete_shard():
+            task_rebuild_index_finish.apply_async(
+                kwargs={'index_rebuild_id': index_rebuild.pk}
+            )
 
 
 @app.task(
     bind=True, default_retry_delay=setting_task_retry.value, max_retries=None,
     ignore_result=True
 )
-def task_remove_document(self, document_id):
+def task_remove_document(self, document_id, index_instance_node_ids=None):
     Document = apps.get_model(
         app_label='documents', model_name='Document'
     )
@@ -97,7 +180,12 @@ def task_remove_document(self, document_id):
         # Since it was automatically removed from the document M2M
         # we just now delete the empty instance nodes
         try:
-            IndexInstanceNode.objects.delete_empty()
+            if index_instance_node_ids is None:
+                IndexInstanceNode.objects.delete_empty()
+            else:
+                IndexInstanceNode.objects.prune(
+                    index_instance_node_ids=index_instance_node_ids
+                )
         except LockError as exception:
             raise self.retry(exc=exception)
     else:
@@ -0,0 +1,27 @@
+from io import StringIO
+
+from django.core import management
+
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+
+from .mixins import IndexTemplateTestMixin
+
+
+class BenchmarkIndexTemplatesManagementCommandTestCase(
+    IndexTemplateTestMixin, GenericDocumentTestCase
+):
+    def test_benchmarkindextemplates_command(self):
+        self._create_test_index_template(add_test_document_type=True)
+        self._create_test_index_template_node()
+
+        stdout = StringIO()
+
+        management.call_command(
+            command_name='benchmarkindextemplates', documents=1, rounds=1,
+            stdout=stdout
+        )
+
+        output = stdout.getvalue()
+        self.assertTrue('uncached:' in output)
+        self.assertTrue('cached:' in output)
+        self.assertTrue('1 evaluations' in output)
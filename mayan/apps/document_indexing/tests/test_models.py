@@ -1,3 +1,11 @@
+from datetime import timedelta
+
+import mock
+
+from django.utils import timezone
+
+from mayan.apps.acls.models import AccessControlList
+from mayan.apps.acls.settings import setting_materialized_access
 from mayan.apps.documents.tests.base import DocumentTestMixin
 from mayan.apps.documents.tests.literals import (
     TEST_DOCUMENT_DESCRIPTION, TEST_DOCUMENT_DESCRIPTION_EDITED,
@@ -6,7 +14,12 @@ from mayan.apps.documents.tests.literals import (
 from mayan.apps.metadata.models import MetadataType, DocumentTypeMetadataType
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..models import IndexInstanceNode, IndexTemplate, IndexTemplateNode
+from ..models import (
+    IndexInstanceNode, IndexRebuild, IndexTemplate, IndexTemplateNode
+)
+from ..permissions import permission_index_instance_view
+from ..settings import setting_rebuild_timeout
+from ..tasks import task_rebuild_index_shard
 
 from .literals import (
     TEST_INDEX_TEMPLATE_DOCUMENT_DESCRIPTION_EXPRESSION,
@@ -131,6 +144,40 @@ class IndexTestCase(IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase):
             )
         )
 
+    def test_document_index_update_emptied_ancestors(self):
+        level_1 = self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_LABEL_EXPRESSION,
+            link_documents=False
+        )
+        self.test_index_template.node_templates.create(
+            parent=level_1,
+            expression=TEST_INDEX_TEMPLATE_DOCUMENT_DESCRIPTION_EXPRESSION,
+            link_documents=True
+        )
+
+        self.test_document.description = TEST_DOCUMENT_DESCRIPTION
+        self.test_document.save()
+
+        self.test_document.description = TEST_DOCUMENT_DESCRIPTION_EDITED
+        self.test_document.save()
+
+        self.assertEqual(
+            list(IndexInstanceNode.objects.values_list('value', flat=True)),
+            ['', self.test_document.label, TEST_DOCUMENT_DESCRIPTION_EDITED]
+        )
+
+        self.test_document.label = TEST_DOCUMENT_LABEL_EDITED
+        self.test_document.save()
+
+        self.assertEqual(
+            list(IndexInstanceNode.objects.values_list('value', flat=True)),
+            ['', TEST_DOCUMENT_LABEL_EDITED, TEST_DOCUMENT_DESCRIPTION_EDITED]
+        )
+        self.assertTrue(
+            self.test_document in IndexInstanceNode.objects.last().documents.all()
+        )
+
     def test_metadata_indexing(self):
         metadata_type = MetadataType.objects.create(
             name=TEST_METADATA_TYPE_NAME, label=TEST_METADATA_TYPE_LABEL
@@ -272,5 +319,180 @@ class IndexTestCase(IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase):
             instance_node.documents.all(), [repr(self.test_document)]
         )
 
+    def test_rebuild_tree_structure(self):
+        self._create_test_document_stub()
+
+        level_1 = self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.uuid }}', link_documents=False
+        )
+        self.test_index_template.node_templates.create(
+            parent=level_1, expression='{{ document.label }}',
+            link_documents=True
+        )
+
+        self.test_index_template.rebuild()
+
+        instance_root = self.test_index_template.instance_root
+        self.assertEqual(instance_root.get_descendant_count(), 4)
+
+        for test_document in self.test_documents:
+            index_instance_node = IndexInstanceNode.objects.get(
+                documents=test_document
+            )
+            self.assertEqual(
+                [
+                    node.value for node in index_instance_node.get_ancestors(
+                        include_self=True
+                    )
+                ], ['', str(test_document.uuid), test_document.label]
+            )
+
+    @mock.patch(
+        'mayan.apps.document_indexing.models.INDEX_REBUILD_BATCH_SIZE', 1
+    )
+    def test_rebuild_tree_structure_batched(self):
+        self._create_test_document_stub()
+
+        level_1 = self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.document_type.label }}',
+            link_documents=False
+        )
+        self.test_index_template.node_templates.create(
+            parent=level_1, expression='{{ document.label }}',
+            link_documents=True
+        )
+
+        self.test_index_template.rebuild()
+
+        instance_root = self.test_index_template.instance_root
+        self.assertEqual(instance_root.get_descendant_count(), 3)
+
+        for test_document in self.test_documents:
+            index_instance_node = IndexInstanceNode.objects.get(
+                documents=test_document
+            )
+            self.assertEqual(
+                [
+                    node.value for node in index_instance_node.get_ancestors(
+                        include_self=True
+                    )
+                ], [
+                    '', self.test_document_type.label, test_document.label
+                ]
+            )
+
+    def test_rebuild_materialized_access(self):
+        setting_materialized_access.set(value=True)
+
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.label }}', link_documents=True
+        )
+        self.grant_access(
+            obj=self.test_index_template,
+            permission=permission_index_instance_view
+        )
+
+        self.test_index_template.rebuild()
+
+        queryset = AccessControlList.objects.restrict_queryset(
+            permission=permission_index_instance_view,
+            queryset=IndexInstanceNode.objects.all(),
+            user=self._test_case_user
+        )
+        self.assertEqual(
+            queryset.count(), IndexInstanceNode.objects.count()
+        )
+
+    def test_rebuild_sharded(self):
+        self._create_test_document_stub()
+
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.label }}', link_documents=True
+        )
+        self.test_index_template.reset()
+
+        index_instance_node_ids = set(
+            IndexInstanceNode.objects.values_list('pk', flat=True)
+        )
+
+        index_rebuild, shards = IndexRebuild.objects.start(
+            index_template=self.test_index_template, shard_size=1
+        )
+        self.assertEqual(len(shards), 2)
+        self.assertEqual(shards[-1][1], None)
+
+        completed = []
+        for document_id_start, document_id_end in shards:
+            index_rebuild.stage_documents(
+                document_id_end=document_id_end,
+                document_id_start=document_id_start
+            )
+            completed.append(index_rebuild.complete_shard())
+
+        self.assertEqual(completed, [False, True])
+        self.assertEqual(index_rebuild.rebuild_documents.count(), 2)
+
+        # The index is not modified until the rebuild finishes.
+        self.assertEqual(
+            set(IndexInstanceNode.objects.values_list('pk', flat=True)),
+            index_instance_node_ids
+        )
+
+        index_rebuild.finish()
+
+        self.assertFalse(IndexRebuild.objects.exists())
+        for test_document in self.test_documents:
+            index_instance_node = IndexInstanceNode.objects.get(
+                documents=test_document
+            )
+            self.assertEqual(index_instance_node.value, test_document.label)
+
     def test_method_get_absolute_url(self):
         self.assertTrue(self.test_index_template.get_absolute_url())
+
+    def test_rebuild_expired(self):
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.label }}', link_documents=True
+        )
+
+        index_rebuild, shards = IndexRebuild.objects.start(
+            index_template=self.test_index_template, shard_size=1
+        )
+        IndexRebuild.objects.filter(pk=index_rebuild.pk).update(
+            datetime_created=timezone.now() - timedelta(
+                seconds=setting_rebuild_timeout.value + 1
+            )
+        )
+
+        self.test_index_template.index_document(document=self.test_document)
+        self.assertEqual(index_rebuild.rebuild_documents.count(), 0)
+
+        IndexRebuild.objects.start(
+            index_template=self.test_index_template, shard_size=1
+        )
+        self.assertFalse(
+            IndexRebuild.objects.filter(pk=index_rebuild.pk).exists()
+        )
+
+    def test_rebuild_shard_failure(self):
+        index_rebuild, shards = IndexRebuild.objects.start(
+            index_template=self.test_index_template, shard_size=1
+        )
+
+        with mock.patch.object(
+            IndexRebuild, 'stage_documents', side_effect=ValueError
+        ):
+            task_rebuild_index_shard.apply(
+                kwargs={
+                    'document_id_end': shards[0][1],
+                    'document_id_start': shards[0][0],
+                    'index_rebuild_id': index_rebuild.pk
+                }, throw=False
+            )
+
+        self.assertFalse(IndexRebuild.objects.exists())
@@ -6,3 +6,5 @@ else:
     DEFAULT_DOCUMENT_PARSING_PDFTOTEXT_PATH = '/usr/bin/pdftotext'
 
 DEFAULT_DOCUMENT_PARSING_AUTO_PARSING = True
+
+DOCUMENT_FILE_PAGE_CONTENT_BATCH_SIZE = 1000
@@ -27,6 +27,24 @@ class DocumentFilePageContentManager(models.Manager):
                 target=document_file
             )
 
+    def get_document_file_contents(self, document_file):
+        """
+        Parse the document file and return the list of the contents of its
+        pages without storing them. Return None when the document type has
+        parsing disabled or when the document file cannot be parsed.
+        """
+        DocumentTypeSettings = apps.get_model(
+            app_label='document_parsing', model_name='DocumentTypeSettings'
+        )
+
+        if not DocumentTypeSettings.objects.filter(
+            auto_parsing=True,
+            document_type=document_file.document.document_type
+        ).exists():
+            return None
+
+        return Parser.get_document_file_contents(document_file=document_file)
+
     def process_document_file(self, document_file):
         logger.info(
             'Starting parsing for document file: %s', document_file
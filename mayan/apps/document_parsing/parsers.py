@@ -4,12 +4,14 @@ from shutil import copyfileobj
 import subprocess
 
 from django.apps import apps
+from django.db import transaction
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.storage.utils import NamedTemporaryFile
 
 from .exceptions import ParserError
+from .literals import DOCUMENT_FILE_PAGE_CONTENT_BATCH_SIZE
 from .settings import setting_pdftotext_path
 
 logger = logging.getLogger(name=__name__)
@@ -35,6 +37,23 @@ class Parser:
                 # others in the list for this mimetype
                 return
 
+    @classmethod
+    def get_document_file_contents(cls, document_file):
+        """
+        Return the list of the contents of the pages of the document file
+        without storing them. Return None if no parser can parse the
+        document file.
+        """
+        for parser_class in cls._registry.get(document_file.mimetype, ()):
+            try:
+                parser = parser_class()
+                return parser.execute_document_file(
+                    document_file=document_file
+                )
+            except ParserError:
+                # If parser raises error, try next parser in the list
+                pass
+
     @classmethod
     def parse_document_file(cls, document_file):
         for parser_class in cls._registry.get(document_file.mimetype, ()):
@@ -57,14 +76,98 @@ class Parser:
                     mimetype, []
                 ).append(parser_class)
 
+    def execute_document_file(self, document_file):
+        """
+        Return the list of the contents of the pages of the document file.
+        The whole file is parsed at once when the parser supports it,
+        otherwise the pages are parsed one at a time.
+        """
+        file_object = document_file.get_intermediate_file()
+
+        try:
+            page_contents = self.execute_document(file_object=file_object)
+
+            if page_contents is None:
+                page_contents = []
+                for document_file_page in document_file.pages.all():
+                    file_object.seek(0)
+                    page_contents.append(
+                        self.execute(
+                            file_object=file_object,
+                            page_number=document_file_page.page_number
+                        )
+                    )
+        except Exception as exception:
+            error_message = _('Exception parsing document file; %s') % exception
+            logger.error(error_message, exc_info=True)
+            raise ParserError(error_message)
+        finally:
+            file_object.close()
+
+        return page_contents
+
     def process_document_file(self, document_file):
         logger.info(
             'Starting parsing for document file: %s', document_file
         )
         logger.debug('document file: %d', document_file.pk)
 
-        for document_file_page in document_file.pages.all():
-            self.process_document_file_page(document_file_page=document_file_page)
+        self.save_document_file_page_contents(
+            document_file=document_file,
+            page_contents=self.execute_document_file(
+                document_file=document_file
+            )
+        )
+
+    def save_document_file_page_contents(self, document_file, page_contents):
+        """
+        Create or update the content of all the pages of the document file
+        in a single transaction. `page_contents` is the list of page
+        contents in page order.
+        """
+        DocumentFilePageContent = apps.get_model(
+            app_label='document_parsing', model_name='DocumentFilePageContent'
+        )
+
+        with transaction.atomic():
+            document_file_page_contents = {
+                document_file_page_content.document_file_page_id: document_file_page_content for document_file_page_content in DocumentFilePageContent.objects.filter(
+                    document_file_page__document_file=document_file
+                )
+            }
+
+            created_contents = []
+            updated_contents = []
+
+            for document_file_page in document_file.pages.all():
+                try:
+                    content = page_contents[document_file_page.page_number - 1]
+                except IndexError:
+                    content = ''
+
+                try:
+                    document_file_page_content = document_file_page_contents[
+                        document_file_page.pk
+                    ]
+                except KeyError:
+                    created_contents.append(
+                        DocumentFilePageContent(
+                            content=content,
+                            document_file_page=document_file_page
+                        )
+                    )
+                else:
+                    document_file_page_content.content = content
+                    updated_contents.append(document_file_page_content)
+
+            DocumentFilePageContent.objects.bulk_create(
+                batch_size=DOCUMENT_FILE_PAGE_CONTENT_BATCH_SIZE,
+                objs=created_contents
+            )
+            DocumentFilePageContent.objects.bulk_update(
+                batch_size=DOCUMENT_FILE_PAGE_CONTENT_BATCH_SIZE,
+                fields=('content',), objs=updated_contents
+            )
 
     def process_document_file_page(self, document_file_page):
         DocumentFilePageContent = apps.get_model(
@@ -104,6 +207,13 @@ class Parser:
             self.__class__.__name__
         )
 
+    def execute_document(self, file_object):
+        """
+        Return the list of the contents of all the pages of the file.
+        Parsers that can only parse one page at a time return None.
+        """
+        return None
+
 
 class PopplerParser(Parser):
     """
@@ -159,6 +269,38 @@ class PopplerParser(Parser):
 
         return force_text(s=output)
 
+    def execute_document(self, file_object):
+        """
+        Extract the text of all the pages with a single pdftotext call.
+        The pages of the output are terminated by form feeds.
+        """
+        logger.debug('Parsing PDF document')
+
+        with NamedTemporaryFile() as temporary_file_object:
+            copyfileobj(fsrc=file_object, fdst=temporary_file_object)
+            temporary_file_object.flush()
+
+            proc = subprocess.Popen(
+                (self.pdftotext_path, temporary_file_object.name, '-'),
+                close_fds=True, stderr=subprocess.PIPE,
+                stdout=subprocess.PIPE
+            )
+            output, errors = proc.communicate()
+
+        if proc.returncode != 0:
+            logger.error(errors)
+            raise ParserError
+
+        result = []
+        # The last form feed terminates the last page.
+        for page_output in output.split(b'\x0c')[:-1]:
+            if page_output[-2:] == b'\x0a\x0a':
+                page_output = page_output[:-2]
+
+            result.append(force_text(s=page_output))
+
+        return result
+
 
 Parser.register(
     mimetypes=('application/pdf',),
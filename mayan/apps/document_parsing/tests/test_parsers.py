@@ -17,3 +17,22 @@ class ParserTestCase(GenericDocumentTestCase):
         self.assertTrue(
             TEST_DOCUMENT_CONTENT in self.test_document_file.pages.first().content.content
         )
+
+    def test_poppler_parser_document_matches_pages(self):
+        parser = PopplerParser()
+
+        parser.process_document_file(self.test_document_file)
+        document_contents = [
+            document_file_page.content.content for document_file_page in self.test_document_file.pages.all()
+        ]
+
+        for document_file_page in self.test_document_file.pages.all():
+            parser.process_document_file_page(
+                document_file_page=document_file_page
+            )
+
+        self.assertEqual(
+            [
+                document_file_page.content.content for document_file_page in self.test_document_file.pages.all()
+            ], document_contents
+        )
@@ -20,7 +20,8 @@ from .handlers import (
     handler_unverify_key_signatures, handler_verify_key_signatures
 )
 from .hooks import (
-    hook_create_embedded_signature, hook_decrypt_document_file
+    hook_check_decrypt_document_file, hook_create_embedded_signature,
+    hook_decrypt_document_file
 )
 from .links import (
     link_document_file_all_signature_refresh,
@@ -76,6 +77,7 @@ class DocumentSignaturesApp(MayanAppConfig):
             func=hook_create_embedded_signature, order=1
         )
         DocumentFile.register_pre_open_hook(
+            check=hook_check_decrypt_document_file,
             func=hook_decrypt_document_file, order=1
         )
 
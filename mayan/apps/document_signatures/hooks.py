@@ -9,6 +9,14 @@ def hook_create_embedded_signature(instance):
     EmbeddedSignature.objects.create(document_file=instance)
 
 
+def hook_check_decrypt_document_file(instance):
+    EmbeddedSignature = apps.get_model(
+        app_label='document_signatures', model_name='EmbeddedSignature'
+    )
+
+    return EmbeddedSignature.objects.filter(document_file=instance).exists()
+
+
 def hook_decrypt_document_file(instance, file_object):
     EmbeddedSignature = apps.get_model(
         app_label='document_signatures', model_name='EmbeddedSignature'
@@ -221,6 +221,7 @@ class EmbeddedSignature(SignatureBaseModel):
         with self.document_file.open(raw=raw) as file_object:
             try:
                 verify_result = Key.objects.verify_file(
+                    checksum=self.document_file.checksum,
                     file_object=file_object
                 )
             except VerificationError as exception:
@@ -291,6 +291,18 @@ class EmbeddedSignaturesTestCase(
 
         self.assertEqual(EmbeddedSignature.objects.count(), 0)
 
+    def test_document_no_signature_file_path(self):
+        self.test_document_path = TEST_SMALL_DOCUMENT_PATH
+        self._upload_test_document()
+
+        self.assertTrue(self.test_document.file_latest.get_file_path())
+
+    def test_embedded_signature_file_path(self):
+        self.test_document_path = TEST_SIGNED_DOCUMENT_PATH
+        self._upload_test_document()
+
+        self.assertEqual(self.test_document.file_latest.get_file_path(), None)
+
     def test_new_signed_file(self):
         self.test_document_path = TEST_SMALL_DOCUMENT_PATH
         self._upload_test_document()
@@ -1,9 +1,5 @@
 import logging
 
-from django.conf import settings
-from django.http import HttpResponse
-from django.views.decorators.cache import cache_control, patch_cache_control
-
 from rest_framework import status
 from rest_framework.response import Response
 
@@ -11,7 +7,6 @@ from mayan.apps.rest_api import generics
 from mayan.apps.storage.models import SharedUploadedFile
 from mayan.apps.views.generics import DownloadViewMixin
 
-from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 from ..permissions import (
     permission_document_file_delete, permission_document_file_download,
     permission_document_file_edit, permission_document_file_new,
@@ -26,7 +21,8 @@ from ..tasks import (
 )
 
 from .mixins import (
-    ParentObjectDocumentAPIViewMixin, ParentObjectDocumentFileAPIViewMixin
+    PageImageAPIViewMixin, ParentObjectDocumentAPIViewMixin,
+    ParentObjectDocumentFileAPIViewMixin
 )
 
 logger = logging.getLogger(name=__name__)
@@ -113,9 +109,20 @@ class APIDocumentFileDownloadView(
         instance._event_actor = self.request.user
         return instance.get_download_file_object()
 
+    def get_download_etag(self):
+        checksum = self.get_object().checksum
+        if checksum:
+            return '"{}"'.format(checksum)
+
+    def get_download_file_path(self):
+        return self.get_object().get_file_path()
+
     def get_download_filename(self):
         return self.get_object().filename
 
+    def get_download_mime_type(self):
+        return self.get_object().mimetype or None
+
     def get_serializer(self, *args, **kwargs):
         return None
 
@@ -149,11 +156,15 @@ class APIDocumentFilePageDetailView(
 
 
 class APIDocumentFilePageImageView(
-    ParentObjectDocumentFileAPIViewMixin, generics.RetrieveAPIView
+    PageImageAPIViewMixin, ParentObjectDocumentFileAPIViewMixin,
+    generics.RetrieveAPIView
 ):
     """
     get: Returns an image representation of the selected document.
     """
+    image_cache_time_setting = setting_document_file_page_image_cache_time
+    image_task = task_document_file_page_image_generate
+    image_task_object_kwarg = 'document_file_page_id'
     lookup_url_kwarg = 'document_file_page_id'
     mayan_object_permissions = {
         'GET': (permission_document_file_view,),
@@ -162,60 +173,6 @@ class APIDocumentFilePageImageView(
     def get_queryset(self):
         return self.get_document_file().pages.all()
 
-    def get_serializer(self, *args, **kwargs):
-        return None
-
-    def get_serializer_class(self):
-        return None
-
-    @cache_control(private=True)
-    def retrieve(self, request, *args, **kwargs):
-        width = request.GET.get('width')
-        height = request.GET.get('height')
-        zoom = request.GET.get('zoom')
-
-        if zoom:
-            zoom = int(zoom)
-
-        rotation = request.GET.get('rotation')
-
-        if rotation:
-            rotation = int(rotation)
-
-        maximum_layer_order = request.GET.get('maximum_layer_order')
-        if maximum_layer_order:
-            maximum_layer_order = int(maximum_layer_order)
-
-        task = task_document_file_page_image_generate.apply_async(
-            kwargs={
-                'document_file_page_id': self.get_object().pk,
-                'height': height,
-                'maximum_layer_order': maximum_layer_order,
-                'rotation': rotation,
-                'user_id': request.user.pk,
-                'width': width,
-                'zoom': zoom
-            }
-        )
-
-        kwargs = {'timeout': DOCUMENT_IMAGE_TASK_TIMEOUT}
-        if settings.DEBUG:
-            # In debug more, task are run synchronously, causing this method
-            # to be called inside another task. Disable the check of nested
-            # tasks when using debug mode.
-            kwargs['disable_sync_subtasks'] = False
-
-        cache_filename = task.get(**kwargs)
-        cache_file = self.get_object().cache_partition.get_file(filename=cache_filename)
-        with cache_file.open() as file_object:
-            response = HttpResponse(file_object.read(), content_type='image')
-            if '_hash' in request.GET:
-                patch_cache_control(
-                    response=response,
-                    max_age=setting_document_file_page_image_cache_time.value
-                )
-            return response
-
 
 class APIDocumentFilePageListView(
     ParentObjectDocumentFileAPIViewMixin, generics.ListAPIView
@@ -1,11 +1,173 @@
+import hashlib
+
+from django.http import HttpResponse
+from django.utils.cache import add_never_cache_headers, patch_cache_control
+from django.views.decorators.cache import cache_control
+
+from rest_framework import status
 from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
 
 from mayan.apps.acls.models import AccessControlList
-
+from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
+
+from ..literals import (
+    DOCUMENT_IMAGE_API_RETRY_AFTER, DOCUMENT_IMAGE_TASK_DISPATCH_LOCK_PREFIX,
+    DOCUMENT_IMAGE_TASK_TIMEOUT
+)
 from ..models.document_models import Document
 from ..models.document_type_models import DocumentType
 
 
+class PageImageAPIViewMixin:
+    """
+    Serve page images directly from the cache partition. On a cache miss
+    the image generation task is dispatched and a 202 response is returned
+    pointing the client to the same URL, without waiting on the task
+    result. The task is dispatched once per image while it is pending,
+    the polls that follow only receive the 202 response.
+    """
+    image_cache_time_setting = None
+    image_task = None
+    image_task_object_kwarg = None
+
+    def get_image_kwargs(self):
+        width = self.request.GET.get('width')
+        height = self.request.GET.get('height')
+        zoom = self.request.GET.get('zoom')
+
+        if zoom:
+            zoom = int(zoom)
+
+        rotation = self.request.GET.get('rotation')
+
+        if rotation:
+            rotation = int(rotation)
+
+        maximum_layer_order = self.request.GET.get('maximum_layer_order')
+        if maximum_layer_order:
+            maximum_layer_order = int(maximum_layer_order)
+
+        return {
+            'height': height,
+            'maximum_layer_order': maximum_layer_order,
+            'rotation': rotation,
+            'width': width,
+            'zoom': zoom
+        }
+
+    def get_image_cache_filename(self, obj, image_kwargs):
+        # Use the same cache filename calculation as the object's
+        # .generate_image() method.
+        transformation_list = obj.get_combined_transformation_list(
+            user=self.request.user, **image_kwargs
+        )
+        return obj.get_combined_cache_filename(
+            _transformation_list=transformation_list
+        )
+
+    def get_image_cache_file(self, obj, cache_filename):
+        try:
+            return obj.cache_partition.get_file(filename=cache_filename)
+        except CachePartitionFile.DoesNotExist:
+            return None
+
+    def get_image_pending_response(self):
+        response = Response(
+            data={'url': self.request.build_absolute_uri()},
+            status=status.HTTP_202_ACCEPTED
+        )
+        response['Location'] = self.request.get_full_path()
+        response['Retry-After'] = DOCUMENT_IMAGE_API_RETRY_AFTER
+        add_never_cache_headers(response=response)
+        return response
+
+    def get_image_response(self, cache_file):
+        try:
+            with cache_file.open() as file_object:
+                response = HttpResponse(
+                    file_object.read(), content_type='image'
+                )
+        except LockError:
+            # The image is still being written by the generation task.
+            return self.get_image_pending_response()
+
+        if '_hash' in self.request.GET:
+            patch_cache_control(
+                response=response,
+                max_age=self.image_cache_time_setting.value
+            )
+        return response
+
+    def get_serializer(self, *args, **kwargs):
+        return None
+
+    def get_serializer_class(self):
+        return None
+
+    def image_task_dispatch(self, obj, cache_filename, image_kwargs):
+        """
+        Dispatch the image generation task unless another request did it
+        already. The dispatch lock is never released, it expires after the
+        task timeout to allow dispatching again if the task was lost.
+        """
+        lock_name = '{}{}'.format(
+            DOCUMENT_IMAGE_TASK_DISPATCH_LOCK_PREFIX, hashlib.sha256(
+                '{}:{}'.format(
+                    obj.cache_partition.pk, cache_filename
+                ).encode()
+            ).hexdigest()
+        )
+
+        try:
+            LockingBackend.get_backend().acquire_lock(
+                name=lock_name, timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+            )
+        except LockError:
+            return
+
+        task_kwargs = image_kwargs.copy()
+        task_kwargs.update(
+            {
+                self.image_task_object_kwarg: obj.pk,
+                'user_id': self.request.user.pk
+            }
+        )
+        self.image_task.apply_async(kwargs=task_kwargs)
+
+    @cache_control(private=True)
+    def retrieve(self, request, *args, **kwargs):
+        obj = self.get_object()
+        image_kwargs = self.get_image_kwargs()
+
+        cache_filename = self.get_image_cache_filename(
+            obj=obj, image_kwargs=image_kwargs
+        )
+        cache_file = self.get_image_cache_file(
+            cache_filename=cache_filename, obj=obj
+        )
+
+        if not cache_file:
+            self.image_task_dispatch(
+                cache_filename=cache_filename, image_kwargs=image_kwargs,
+                obj=obj
+            )
+
+            # Check the cache again in case the task ran synchronously
+            # (eager mode) or finished already. The task result is never
+            # waited on.
+            cache_file = self.get_image_cache_file(
+                cache_filename=cache_filename, obj=obj
+            )
+
+            if not cache_file:
+                return self.get_image_pending_response()
+
+        return self.get_image_response(cache_file=cache_file)
+
+
 class ParentObjectDocumentAPIViewMixin:
     def get_document(self, permission=None):
         queryset = Document.objects.all()
@@ -75,7 +75,8 @@ from .events import (
 from .handlers import (
     handler_create_default_document_type,
     handler_create_document_file_page_image_cache,
-    handler_create_document_version_page_image_cache
+    handler_create_document_version_page_image_cache,
+    handler_document_file_page_images_pregenerate
 )
 from .html_widgets import ThumbnailWidget
 from .links.document_links import (
@@ -197,6 +198,7 @@ from .permissions import (
     permission_trashed_document_delete, permission_trashed_document_restore
 )
 
+from .signals import signal_post_document_file_upload
 from .statistics import *  # NOQA
 
 
@@ -303,7 +305,9 @@ class DocumentsApp(MayanAppConfig):
         ).add_fields(
             field_names=(
                 'label', 'trash_time_period', 'trash_time_unit',
-                'delete_time_period', 'delete_time_unit', 'filenames'
+                'delete_time_period', 'delete_time_unit', 'filenames',
+                'page_image_pregeneration',
+                'page_image_pregeneration_page_count'
             )
         )
         ModelCopy(
@@ -968,6 +972,11 @@ class DocumentsApp(MayanAppConfig):
             dispatch_uid='documents_handler_create_document_version_page_image_cache',
             receiver=handler_create_document_version_page_image_cache,
         )
+        signal_post_document_file_upload.connect(
+            dispatch_uid='documents_handler_document_file_page_images_pregenerate',
+            receiver=handler_document_file_page_images_pregenerate,
+            sender=DocumentFile
+        )
         signal_post_initial_setup.connect(
             dispatch_uid='documents_handler_create_default_document_type',
             receiver=handler_create_default_document_type
@@ -8,6 +8,7 @@ from mayan.apps.common.literals import TIME_DELTA_UNIT_DAYS
 CHECK_DELETE_PERIOD_INTERVAL = 60
 CHECK_TRASH_PERIOD_INTERVAL = 60
 DELETE_STALE_STUBS_INTERVAL = 60 * 10  # 10 minutes
+DEFAULT_BENCHMARK_PAGES = 10
 DEFAULT_DELETE_PERIOD = 30
 DEFAULT_DELETE_TIME_UNIT = TIME_DELTA_UNIT_DAYS
 DEFAULT_DOCUMENT_TYPE_LABEL = _('Default')
@@ -84,7 +85,12 @@ DOCUMENT_FILE_ACTION_PAGE_CHOICES = (
     (DOCUMENT_FILE_ACTION_PAGES_APPEND, _('Append. Create a new version and append the new file pages.')),
     (DOCUMENT_FILE_ACTION_PAGES_KEEP, _('Keep. Do not create a new version and keep the current version pages.')),
 )
+DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME = 'base_image'
+DOCUMENT_IMAGE_API_RETRY_AFTER = 2
+DOCUMENT_IMAGE_TASK_DISPATCH_LOCK_PREFIX = 'document_image_task_dispatch_'
 DOCUMENT_IMAGE_TASK_TIMEOUT = 120
+DOCUMENT_PAGE_IMAGE_PREGENERATION_MAXIMUM_RETRIES = 8
+DOCUMENT_PAGE_IMAGE_PREGENERATION_RETRY_DELAY = 60
 
 IMAGE_ERROR_NO_ACTIVE_VERSION = 'document_no_active_version'
 IMAGE_ERROR_NO_VERSION_PAGES = 'document_no_version_pages'
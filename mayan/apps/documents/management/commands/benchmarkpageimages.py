@@ -0,0 +1,97 @@
+import time
+from io import BytesIO
+
+from django.apps import apps
+from django.core import management
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.converter.classes import ConverterBase
+
+from ...literals import (
+    DEFAULT_BENCHMARK_PAGES, DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+)
+from ...utils import get_page_image_sizes
+
+PAGE_IMAGE_SIZE_LABELS = ('display', 'preview', 'thumbnail')
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Measure the time to produce the display, preview and thumbnail '
+        'images of document file pages from their cached base images, '
+        'executing the transformations one at a time and as a single plan.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pages', action='store', default=DEFAULT_BENCHMARK_PAGES,
+            dest='pages', type=int,
+            help=_('Number of document file pages to process.')
+        )
+
+    def get_base_images(self, pages):
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
+
+        result = []
+        queryset = DocumentFilePage.objects.order_by('pk')[:pages]
+
+        for document_file_page in queryset:
+            # Renders and caches the base image if missing.
+            document_file_page.generate_image()
+
+            cache_file = document_file_page.cache_partition.get_file(
+                filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+            )
+            with cache_file.open() as file_object:
+                result.append((document_file_page, file_object.read()))
+
+        return result
+
+    def handle(self, *args, **options):
+        base_images = self.get_base_images(pages=options['pages'])
+
+        if not base_images:
+            self.stderr.write('No document file pages to process.')
+            return
+
+        converter_class = ConverterBase.get_converter_class()
+
+        for label, (width, height) in zip(PAGE_IMAGE_SIZE_LABELS, get_page_image_sizes()):
+            elapsed_sequential = 0
+            elapsed_plan = 0
+
+            for document_file_page, image_data in base_images:
+                transformations = document_file_page.get_combined_transformation_list(
+                    height=height, width=width
+                )
+
+                start = time.time()
+                converter = converter_class(file_object=BytesIO(image_data))
+                converter.seek_page(page_number=0)
+                for transformation in transformations:
+                    converter.transform(transformation=transformation)
+                converter.get_page()
+                elapsed_sequential += time.time() - start
+
+                start = time.time()
+                converter = converter_class(file_object=BytesIO(image_data))
+                converter.transform_many(transformations=transformations)
+                converter.get_page()
+                elapsed_plan += time.time() - start
+
+            if elapsed_plan:
+                speedup = '{:.2f}x'.format(elapsed_sequential / elapsed_plan)
+            else:
+                # Too fast to be measured by the clock.
+                speedup = '-'
+
+            self.stdout.write(
+                '{} ({}x{}): sequential {:.1f} ms/page, plan {:.1f} ms/page, '
+                '{}'.format(
+                    label, width, height or '-',
+                    elapsed_sequential * 1000 / len(base_images),
+                    elapsed_plan * 1000 / len(base_images), speedup
+                )
+            )
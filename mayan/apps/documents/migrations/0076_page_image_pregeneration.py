@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0075_delete_duplicateddocumentold'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttype',
+            name='page_image_pregeneration',
+            field=models.BooleanField(
+                default=False, help_text='Generate the page images of the '
+                'files uploaded for documents of this type in the '
+                'background, before they are first viewed.',
+                verbose_name='Page image pre-generation'
+            ),
+        ),
+        migrations.AddField(
+            model_name='documenttype',
+            name='page_image_pregeneration_page_count',
+            field=models.PositiveIntegerField(
+                blank=True, help_text='Number of pages from the start of '
+                'each file for which to generate the images. Leave empty '
+                'for all the pages.', null=True,
+                verbose_name='Page image pre-generation page count'
+            ),
+        ),
+    ]
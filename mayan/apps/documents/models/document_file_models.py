@@ -1,8 +1,11 @@
 import hashlib
 import logging
 import shutil
+from itertools import chain
 
 from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.storage import FileSystemStorage
 from django.db import models, transaction
 from django.urls import reverse
 from django.utils.encoding import force_text
@@ -19,8 +22,9 @@ from mayan.apps.converter.exceptions import (
 from mayan.apps.events.classes import EventManagerMethodAfter
 from mayan.apps.events.decorators import method_event
 from mayan.apps.file_caching.models import CachePartitionFile
-from mayan.apps.mimetype.api import get_mimetype
-from mayan.apps.storage.classes import DefinedStorageLazy
+from mayan.apps.mimetype.api import get_mimetype, get_mimetype_from_path
+from mayan.apps.storage.classes import DefinedStorage, DefinedStorageLazy
+from mayan.apps.storage.utils import TeeFile
 
 from ..events import (
     event_document_file_created, event_document_file_deleted,
@@ -35,6 +39,8 @@ from ..signals import (
     signal_post_document_created, signal_post_document_file_upload
 )
 
+from ..utils import get_page_image_sizes
+
 from .document_models import Document
 from .mixins import HooksModelMixin
 
@@ -68,6 +74,7 @@ class DocumentFile(
     """
     _hooks_pre_create = []
     _pre_open_hooks = []
+    _pre_open_hook_checks = []
     _pre_save_hooks = []
     _post_save_hooks = []
 
@@ -150,11 +157,22 @@ class DocumentFile(
         )
 
     @classmethod
-    def register_pre_open_hook(cls, func, order=None):
+    def register_pre_open_hook(cls, func, order=None, check=None):
+        """
+        The optional `check` function receives a document file and returns
+        True when the hook modifies the content of that file. Hooks without
+        a check are assumed to modify every file.
+        """
         cls._insert_hook_entry(
             hook_list=cls._pre_open_hooks, func=func, order=order
         )
 
+        if not check:
+            def check(instance):
+                return True
+
+        cls._pre_open_hook_checks.append(check)
+
     @classmethod
     def register_pre_save_hook(cls, func, order=None):
         cls._insert_hook_entry(
@@ -178,7 +196,57 @@ class DocumentFile(
         )
         return partition
 
-    def checksum_update(self, save=True):
+    def _execute_pre_open_hooks(self, file_object):
+        result = DocumentFile._execute_hooks(
+            hook_list=DocumentFile._pre_open_hooks,
+            instance=self, file_object=file_object
+        )
+
+        if result:
+            return result['file_object']
+        else:
+            return file_object
+
+    def _ingestion_update(self, hash_object, tee_file):
+        """
+        Update the checksum and mimetype from the local copy of the
+        uploaded file made while it was being saved to the storage.
+        Returns a file object for the page count update or None if the
+        local copy could not be used.
+        """
+        local_file_object = tee_file.finish()
+
+        if not local_file_object:
+            logger.debug('Local copy of the new file is not available.')
+            return
+
+        file_object = self._execute_pre_open_hooks(
+            file_object=local_file_object
+        )
+
+        if file_object is local_file_object:
+            # The stored file is read as is, reuse the checksum calculated
+            # during the copy and inspect the local copy directly.
+            self.checksum = force_text(s=hash_object.hexdigest())
+
+            try:
+                self.mimetype, self.encoding = get_mimetype_from_path(
+                    path=local_file_object.name
+                )
+            except Exception:
+                self.mimetype = ''
+                self.encoding = ''
+        else:
+            try:
+                self.checksum_update(file_object=file_object, save=False)
+                self.mimetype_update(file_object=file_object, save=False)
+            except Exception:
+                file_object.close()
+                raise
+
+        return file_object
+
+    def checksum_update(self, file_object=None, save=True):
         """
         Open a document file's file and update the checksum field using
         the user provided checksum function
@@ -191,21 +259,26 @@ class DocumentFile(
             # https://docs.python.org/2/tutorial/inputoutput.html#methods-of-file-objects
             block_size = -1
 
-        if self.exists():
+        if file_object:
+            file_object.seek(0)
             hash_object = DocumentFile.hash_function()
-            with self.open() as file_object:
-                while (True):
-                    data = file_object.read(block_size)
-                    if not data:
-                        break
+            while (True):
+                data = file_object.read(block_size)
+                if not data:
+                    break
 
-                    hash_object.update(data)
+                hash_object.update(data)
 
             self.checksum = force_text(s=hash_object.hexdigest())
             if save:
                 self.save()
 
             return self.checksum
+        elif self.exists():
+            with self.open() as file_object:
+                return self.checksum_update(
+                    file_object=file_object, save=save
+                )
 
     @method_event(
         event_manager_class=EventManagerMethodAfter,
@@ -254,6 +327,113 @@ class DocumentFile(
             }
         )
 
+    def generate_page_images(
+        self, page_number_first=None, page_number_last=None,
+        render_base_image=False, user=None, **kwargs
+    ):
+        """
+        Generate and cache the images of a range of pages using a single
+        converter render session. The file is opened and copied once and
+        the missing pages are rendered together. When the transformations
+        of all the pages only resize the page, the pages are rendered
+        directly at the final width unless render_base_image is True.
+        """
+        queryset = self.pages.all()
+        if page_number_first:
+            queryset = queryset.filter(page_number__gte=page_number_first)
+        if page_number_last:
+            queryset = queryset.filter(page_number__lte=page_number_last)
+
+        pending_pages = {}
+        render_widths = set()
+
+        for document_file_page in queryset:
+            transformation_list = document_file_page.get_combined_transformation_list(
+                user=user, **kwargs
+            )
+            combined_cache_filename = document_file_page.get_combined_cache_filename(
+                _transformation_list=transformation_list
+            )
+
+            try:
+                document_file_page.cache_partition.get_file(
+                    filename=combined_cache_filename
+                )
+            except CachePartitionFile.DoesNotExist:
+                pending_pages[document_file_page.page_number - 1] = (
+                    document_file_page, transformation_list,
+                    combined_cache_filename
+                )
+                render_widths.add(
+                    document_file_page.get_render_width(
+                        transformations=transformation_list
+                    )
+                )
+
+        if not pending_pages:
+            return
+
+        if len(render_widths) == 1 and not render_base_image:
+            render_width = render_widths.pop()
+        else:
+            render_width = None
+
+        with self.get_intermediate_file() as file_object:
+            with ConverterBase.get_converter_class()(file_object=file_object) as converter:
+                page_images = converter.render_pages(
+                    page_number_first=min(pending_pages),
+                    page_number_last=max(pending_pages), width=render_width
+                )
+
+                for page_number, image in page_images:
+                    try:
+                        document_file_page, transformation_list, combined_cache_filename = pending_pages[page_number]
+                    except KeyError:
+                        # Page in the range that was already cached.
+                        continue
+
+                    document_file_page.cache_rendered_image(
+                        combined_cache_filename=combined_cache_filename,
+                        converter=converter, image=image,
+                        is_base_image=render_width is None,
+                        transformation_list=transformation_list
+                    )
+
+    def pregenerate_page_images(self):
+        """
+        Render the base image of the pages selected by the document type
+        and cache the display, preview and thumbnail sizes of the file
+        pages and of the version pages that use them.
+        """
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
+        DocumentVersionPage = apps.get_model(
+            app_label='documents', model_name='DocumentVersionPage'
+        )
+
+        page_number_last = self.document.document_type.page_image_pregeneration_page_count
+
+        self.generate_page_images(
+            page_number_last=page_number_last, render_base_image=True
+        )
+
+        document_file_pages = self.pages.all()
+        if page_number_last:
+            document_file_pages = document_file_pages.filter(
+                page_number__lte=page_number_last
+            )
+
+        document_version_pages = DocumentVersionPage.objects.filter(
+            content_type=ContentType.objects.get_for_model(
+                model=DocumentFilePage
+            ), object_id__in=document_file_pages.values('pk')
+        )
+
+        for page in chain(document_file_pages, document_version_pages):
+            for width, height in get_page_image_sizes():
+                page.generate_image(height=height, width=width)
+
     def get_api_image_url(self, *args, **kwargs):
         first_page = self.pages.first()
         if first_page:
@@ -276,6 +456,24 @@ class DocumentFile(
         # then download event in the same way.
         return self.open()
 
+    def get_file_path(self):
+        """
+        Return the filesystem path of the document file when it is stored
+        in the local filesystem and is not modified when opened. Used to
+        allow the web server to send the file directly. Returns None
+        otherwise.
+        """
+        for check in DocumentFile._pre_open_hook_checks:
+            if check(instance=self):
+                return None
+
+        storage_instance = DefinedStorage.get(
+            name=STORAGE_NAME_DOCUMENT_FILES
+        ).get_storage_instance()
+
+        if isinstance(storage_instance, FileSystemStorage):
+            return storage_instance.path(name=self.file.name)
+
     def get_intermediate_file(self):
         cache_filename = 'intermediate_file'
 
@@ -320,17 +518,26 @@ class DocumentFile(
         return self.filename
     get_label.short_description = _('Label')
 
-    def mimetype_update(self, save=True):
+    def mimetype_update(self, file_object=None, save=True):
         """
         Read a document verions's file and determine the mimetype by calling
         the get_mimetype wrapper
         """
-        if self.exists():
+        if file_object:
+            try:
+                self.mimetype, self.encoding = get_mimetype(
+                    file_object=file_object
+                )
+            except Exception:
+                self.mimetype = ''
+                self.encoding = ''
+            finally:
+                if save:
+                    self.save()
+        elif self.exists():
             try:
                 with self.open() as file_object:
-                    self.mimetype, self.encoding = get_mimetype(
-                        file_object=file_object
-                    )
+                    self.mimetype_update(file_object=file_object, save=False)
             except Exception:
                 self.mimetype = ''
                 self.encoding = ''
@@ -354,25 +561,24 @@ class DocumentFile(
         if raw:
             return self.file.storage.open(name=self.file.name)
         else:
-            file_object = self.file.storage.open(name=self.file.name)
-
-            result = DocumentFile._execute_hooks(
-                hook_list=DocumentFile._pre_open_hooks,
-                instance=self, file_object=file_object
+            return self._execute_pre_open_hooks(
+                file_object=self.file.storage.open(name=self.file.name)
             )
 
-            if result:
-                return result['file_object']
-            else:
-                return file_object
-
-    def page_count_update(self, save=True):
+    def page_count_update(self, file_object=None, save=True):
         try:
-            with self.open() as file_object:
+            if file_object:
+                file_object.seek(0)
                 converter = ConverterBase.get_converter_class()(
                     file_object=file_object, mime_type=self.mimetype
                 )
                 detected_pages = converter.get_page_count()
+            else:
+                with self.open() as file_object:
+                    converter = ConverterBase.get_converter_class()(
+                        file_object=file_object, mime_type=self.mimetype
+                    )
+                    detected_pages = converter.get_page_count()
         except PageCountError:
             """Converter backend doesn't understand the format."""
         else:
@@ -407,6 +613,8 @@ class DocumentFile(
         """
         user = kwargs.pop('_user', self.__dict__.pop('_event_actor', None))
         new_document_file = not self.pk
+        ingestion_file_object = None
+        tee_file = None
 
         if new_document_file:
             logger.info('Creating new file for document: %s', self.document)
@@ -418,6 +626,16 @@ class DocumentFile(
                 }
             )
 
+            if self.file and not self.file._committed:
+                # Calculate the checksum and make a local copy of the file
+                # while it is written to the storage to avoid reading it
+                # back multiple times.
+                hash_object = DocumentFile.hash_function()
+                tee_file = TeeFile(
+                    consumers=(hash_object,), file=self.file.file
+                )
+                self.file.file = tee_file
+
         try:
             with transaction.atomic():
                 self.execute_pre_save_hooks()
@@ -438,11 +656,20 @@ class DocumentFile(
                     event_document_file_created.commit(
                         actor=user, target=self, action_object=self.document
                     )
-                    self.checksum_update(save=False)
-                    self.mimetype_update(save=False)
+                    if tee_file:
+                        ingestion_file_object = self._ingestion_update(
+                            hash_object=hash_object, tee_file=tee_file
+                        )
+
+                    if not ingestion_file_object:
+                        self.checksum_update(save=False)
+                        self.mimetype_update(save=False)
+
                     self._event_actor = user
                     self.save()
-                    self.page_count_update(save=False)
+                    self.page_count_update(
+                        file_object=ingestion_file_object, save=False
+                    )
 
                     logger.info(
                         'New document file "%s" created for document: %s',
@@ -475,6 +702,14 @@ class DocumentFile(
                     signal_post_document_created.send(
                         instance=self.document, sender=Document
                     )
+        finally:
+            if tee_file:
+                # The pre open hooks can return a new file object, like a
+                # decrypted copy of the local copy.
+                if ingestion_file_object is not None and ingestion_file_object is not tee_file.local_file_object:
+                    ingestion_file_object.close()
+
+                tee_file.local_file_object.close()
 
     def save_to_file(self, file_object):
         """
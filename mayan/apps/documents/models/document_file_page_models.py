@@ -17,7 +17,9 @@ from mayan.apps.converter.transformations import (
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
 
-from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
+from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, DOCUMENT_IMAGE_TASK_TIMEOUT
+)
 from ..managers import DocumentFilePageManager, ValidDocumentFilePageManager
 from ..settings import (
     setting_display_width, setting_display_height, setting_zoom_max_level,
@@ -66,6 +68,43 @@ class DocumentFilePage(PagedModelMixin, models.Model):
         )
         return partition
 
+    def cache_rendered_image(
+        self, combined_cache_filename, converter, image, transformation_list,
+        is_base_image=True
+    ):
+        """
+        Store an image of the page rendered by a converter render session.
+        Images rendered at the default resolution are also stored as the
+        base image of the page.
+        """
+        lock = LockingBackend.get_backend().acquire_lock(
+            blocking=True, name=self.get_lock_name(
+                _combined_cache_filename=combined_cache_filename
+            ), timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+        )
+        try:
+            converter.image = image
+
+            if is_base_image:
+                try:
+                    self.cache_partition.get_file(
+                        filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+                    )
+                except CachePartitionFile.DoesNotExist:
+                    with self.cache_partition.create_file(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME) as file_object:
+                        file_object.write(converter.get_page().getvalue())
+
+            try:
+                self.cache_partition.get_file(
+                    filename=combined_cache_filename
+                )
+            except CachePartitionFile.DoesNotExist:
+                converter.transform_many(transformations=transformation_list)
+                with self.cache_partition.create_file(filename=combined_cache_filename) as file_object:
+                    file_object.write(converter.get_page().getvalue())
+        finally:
+            lock.release()
+
     def delete(self, *args, **kwargs):
         self.cache_partition.delete()
         super().delete(*args, **kwargs)
@@ -88,7 +127,8 @@ class DocumentFilePage(PagedModelMixin, models.Model):
                     _combined_cache_filename=combined_cache_filename
                 )
                 lock = LockingBackend.get_backend().acquire_lock(
-                    name=lock_name, timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+                    blocking=True, name=lock_name,
+                    timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
                 )
         except Exception:
             raise
@@ -214,7 +254,7 @@ class DocumentFilePage(PagedModelMixin, models.Model):
         return transformation_list
 
     def get_image(self, transformations=None):
-        cache_filename = 'base_image'
+        cache_filename = DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
         logger.debug('Page cache filename: %s', cache_filename)
 
         try:
@@ -223,10 +263,7 @@ class DocumentFilePage(PagedModelMixin, models.Model):
             logger.debug('Page cache file "%s" not found', cache_filename)
 
             try:
-                with self.document_file.get_intermediate_file() as file_object:
-                    converter = ConverterBase.get_converter_class()(
-                        file_object=file_object
-                    )
+                with self.document_file.get_intermediate_file() as file_object, ConverterBase.get_converter_class()(file_object=file_object) as converter:
                     converter.seek_page(page_number=self.page_number - 1)
 
                     page_image = converter.get_page()
@@ -236,8 +273,9 @@ class DocumentFilePage(PagedModelMixin, models.Model):
                         file_object.write(page_image.getvalue())
 
                     # Apply runtime transformations
-                    for transformation in transformations or ():
-                        converter.transform(transformation=transformation)
+                    converter.transform_many(
+                        transformations=transformations or ()
+                    )
 
                     return converter.get_page()
             except Exception as exception:
@@ -256,13 +294,13 @@ class DocumentFilePage(PagedModelMixin, models.Model):
                     file_object=file_object
                 )
 
-                converter.seek_page(page_number=0)
-
                 # This code is also repeated below to allow using a context
                 # manager with cache_file.open and close it automatically.
-                # Apply runtime transformations
-                for transformation in transformations or ():
-                    converter.transform(transformation=transformation)
+                # Apply runtime transformations. The page is decoded by the
+                # transformation plan at the size it needs.
+                converter.transform_many(
+                    transformations=transformations or ()
+                )
 
                 return converter.get_page()
 
@@ -292,6 +330,18 @@ class DocumentFilePage(PagedModelMixin, models.Model):
             self.pk, combined_cache_filename
         )
 
+    def get_render_width(self, transformations):
+        """
+        Return the width at which the page can be rendered directly when
+        the transformations only resize and zoom the page, None otherwise.
+        """
+        if transformations and isinstance(transformations[0], TransformationResize):
+            for transformation in transformations[1:]:
+                if not isinstance(transformation, TransformationZoom):
+                    return None
+
+            return int(transformations[0].width)
+
     @property
     def is_in_trash(self):
         return self.document_file.document.is_in_trash
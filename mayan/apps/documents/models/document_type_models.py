@@ -75,6 +75,18 @@ class DocumentType(ExtraDataModelMixin, models.Model):
             'Filename generator backend arguments'
         )
     )
+    page_image_pregeneration = models.BooleanField(
+        default=False, help_text=_(
+            'Generate the page images of the files uploaded for documents '
+            'of this type in the background, before they are first viewed.'
+        ), verbose_name=_('Page image pre-generation')
+    )
+    page_image_pregeneration_page_count = models.PositiveIntegerField(
+        blank=True, help_text=_(
+            'Number of pages from the start of each file for which to '
+            'generate the images. Leave empty for all the pages.'
+        ), null=True, verbose_name=_('Page image pre-generation page count')
+    )
 
     objects = DocumentTypeManager()
 
@@ -1,4 +1,5 @@
 import logging
+import shutil
 
 from furl import furl
 from PIL import Image
@@ -122,7 +123,7 @@ class DocumentVersionPage(
         content_object_lock_name = self.content_object.get_lock_name(user=user)
         try:
             content_object_lock = LockingBackend.get_backend().acquire_lock(
-                name=content_object_lock_name,
+                blocking=True, name=content_object_lock_name,
                 timeout=DOCUMENT_IMAGE_TASK_TIMEOUT * 2
             )
         except Exception:
@@ -134,7 +135,8 @@ class DocumentVersionPage(
             try:
                 if _acquire_lock:
                     lock = LockingBackend.get_backend().acquire_lock(
-                        name=lock_name, timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+                        blocking=True, name=lock_name,
+                        timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
                     )
             except Exception:
                 raise
@@ -297,21 +299,24 @@ class DocumentVersionPage(
                 )
 
                 with content_object_cache_file.open() as file_object:
+                    # The content object image is already encoded, store a
+                    # copy instead of decoding and encoding it again.
+                    # Since open "wb+" doesn't create versions, create it
+                    # explicitly.
+                    with self.cache_partition.create_file(filename=cache_filename) as cache_file_object:
+                        shutil.copyfileobj(
+                            fsrc=file_object, fdst=cache_file_object
+                        )
+
+                    file_object.seek(0)
                     converter = ConverterBase.get_converter_class()(
                         file_object=file_object
                     )
-                    converter.seek_page(page_number=0)
-
-                    page_image = converter.get_page()
-
-                    # Since open "wb+" doesn't create versions, create it
-                    # explicitly.
-                    with self.cache_partition.create_file(filename=cache_filename) as file_object:
-                        file_object.write(page_image.getvalue())
 
                     # Apply runtime transformations.
-                    for transformation in transformations or ():
-                        converter.transform(transformation=transformation)
+                    converter.transform_many(
+                        transformations=transformations or ()
+                    )
 
                     return converter.get_page()
             except Exception as exception:
@@ -330,13 +335,12 @@ class DocumentVersionPage(
                     file_object=file_object
                 )
 
-                converter.seek_page(page_number=0)
-
                 # This code is also repeated below to allow using a context
                 # manager with cache_version.open and close it automatically.
                 # Apply runtime transformations.
-                for transformation in transformations or ():
-                    converter.transform(transformation=transformation)
+                converter.transform_many(
+                    transformations=transformations or ()
+                )
 
                 return converter.get_page()
 
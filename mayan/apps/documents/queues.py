@@ -4,7 +4,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.converter.queues import queue_converter
 from mayan.apps.task_manager.classes import CeleryQueue
-from mayan.apps.task_manager.workers import worker_b, worker_c
+from mayan.apps.task_manager.workers import worker_b, worker_c, worker_d
 
 from .literals import (
     CHECK_DELETE_PERIOD_INTERVAL, CHECK_TRASH_PERIOD_INTERVAL,
@@ -21,6 +21,10 @@ queue_uploads = CeleryQueue(
 queue_documents = CeleryQueue(
     name='documents', label=_('Documents'), worker=worker_c
 )
+queue_document_page_images = CeleryQueue(
+    name='document_page_images', label=_('Document page images'),
+    worker=worker_d
+)
 
 queue_converter.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_file_page_image_generate',
@@ -31,6 +35,11 @@ queue_converter.add_task_type(
     label=_('Generate document version page image')
 )
 
+queue_document_page_images.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_file_page_images_pregenerate',
+    label=_('Pregenerate document file page images')
+)
+
 queue_documents.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_trash_can_empty',
     label=_('Empty the trash can')
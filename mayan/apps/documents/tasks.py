@@ -1,5 +1,7 @@
 import logging
 
+from celery.exceptions import MaxRetriesExceededError
+
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.db import OperationalError
@@ -8,6 +10,10 @@ from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
 from .literals import (
+    DOCUMENT_PAGE_IMAGE_PREGENERATION_MAXIMUM_RETRIES,
+    DOCUMENT_PAGE_IMAGE_PREGENERATION_RETRY_DELAY,
+    STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE,
+    STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE,
     UPDATE_PAGE_COUNT_RETRY_DELAY, UPLOAD_NEW_VERSION_RETRY_DELAY
 )
 from .settings import (
@@ -86,6 +92,63 @@ def task_document_file_page_image_generate(
         raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True,
+    default_retry_delay=DOCUMENT_PAGE_IMAGE_PREGENERATION_RETRY_DELAY,
+    ignore_result=True,
+    max_retries=DOCUMENT_PAGE_IMAGE_PREGENERATION_MAXIMUM_RETRIES
+)
+def task_document_file_page_images_pregenerate(self, document_file_id):
+    Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    try:
+        document_file = DocumentFile.objects.get(pk=document_file_id)
+    except DocumentFile.DoesNotExist:
+        # File deleted before the worker got to it.
+        return
+
+    caches = Cache.objects.filter(
+        defined_storage_name__in=(
+            STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE,
+            STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE
+        )
+    )
+
+    try:
+        for cache in caches:
+            if cache.get_total_size() > cache.get_prune_high_watermark():
+                # Do not evict images that are being used to make room for
+                # images that might never be requested.
+                logger.debug(
+                    'Cache "%s" is near its maximum size, delaying the page '
+                    'image pregeneration of document file id: %d.',
+                    cache, document_file_id
+                )
+                raise self.retry(
+                    countdown=DOCUMENT_PAGE_IMAGE_PREGENERATION_RETRY_DELAY * 2 ** self.request.retries
+                )
+
+        try:
+            document_file.pregenerate_page_images()
+        except (LockError, OperationalError) as exception:
+            logger.warning(
+                'Error during attempt to pregenerate page images for '
+                'document file id: %d; %s. Retrying.', document_file_id,
+                exception
+            )
+            raise self.retry(
+                countdown=DOCUMENT_PAGE_IMAGE_PREGENERATION_RETRY_DELAY * 2 ** self.request.retries
+            )
+    except MaxRetriesExceededError:
+        logger.info(
+            'Giving up the page image pregeneration of document file '
+            'id: %d.', document_file_id
+        )
+
+
 @app.task(
     bind=True, default_retry_delay=UPLOAD_NEW_VERSION_RETRY_DELAY,
     ignore_result=True
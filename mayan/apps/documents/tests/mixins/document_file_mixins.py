@@ -98,12 +98,14 @@ class DocumentFileViewTestMixin:
             }
         )
 
-    def _request_test_document_file_download_view(self, data=None):
+    def _request_test_document_file_download_view(
+        self, data=None, headers=None
+    ):
         data = data or {}
         return self.get(
             viewname='documents:document_file_download', kwargs={
                 'document_file_id': self.test_document.file_latest.pk
-            }, data=data
+            }, data=data, headers=headers
         )
 
     def _request_test_document_file_edit_view(self):
@@ -1,7 +1,19 @@
 from pathlib import Path
+import shutil
+
+import mock
+from PIL import Image
+
+from mayan.apps.converter.transformations import (
+    TransformationResize, TransformationRotate, TransformationZoom
+)
+from mayan.apps.storage.utils import NamedTemporaryFile
+
+from ..models.document_file_models import DocumentFile
+from ..settings import setting_thumbnail_height, setting_thumbnail_width
 
 from .base import GenericDocumentTestCase
-from .literals import TEST_SMALL_DOCUMENT_CHECKSUM
+from .literals import TEST_PDF_DOCUMENT_FILENAME, TEST_SMALL_DOCUMENT_CHECKSUM
 
 
 class DocumentFileTestCase(GenericDocumentTestCase):
@@ -18,6 +30,25 @@ class DocumentFileTestCase(GenericDocumentTestCase):
             TEST_SMALL_DOCUMENT_CHECKSUM
         )
 
+    def test_file_create_pre_open_hook_file_close(self):
+        hook_file_objects = []
+
+        def execute_pre_open_hooks(instance, file_object):
+            hook_file_object = NamedTemporaryFile()
+            file_object.seek(0)
+            shutil.copyfileobj(fsrc=file_object, fdst=hook_file_object)
+            hook_file_object.seek(0)
+            hook_file_objects.append(hook_file_object)
+            return hook_file_object
+
+        with mock.patch.object(
+            DocumentFile, '_execute_pre_open_hooks', autospec=True,
+            side_effect=execute_pre_open_hooks
+        ):
+            self._upload_test_document_file()
+
+        self.assertTrue(hook_file_objects[0].closed)
+
     def test_document_file_delete(self):
         document_file_count = self.test_document.files.count()
 
@@ -48,3 +79,72 @@ class DocumentFileTestCase(GenericDocumentTestCase):
 
     def test_method_get_absolute_url(self):
         self.assertTrue(self.test_document.file_latest.get_absolute_url())
+
+
+class DocumentFilePageImageTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_PDF_DOCUMENT_FILENAME
+
+    def test_generate_page_images(self):
+        self.test_document_file.generate_page_images()
+
+        for document_file_page in self.test_document_file.pages.all():
+            document_file_page.cache_partition.get_file(
+                filename=document_file_page.get_combined_cache_filename()
+            )
+
+    def test_generate_page_images_base_image(self):
+        self.test_document_file.generate_page_images(rotation=90)
+
+        for document_file_page in self.test_document_file.pages.all():
+            document_file_page.cache_partition.get_file(
+                filename=document_file_page.get_combined_cache_filename(
+                    rotation=90
+                )
+            )
+            document_file_page.cache_partition.get_file(filename='base_image')
+
+    def test_page_images_pregeneration(self):
+        self.test_document_type.page_image_pregeneration = True
+        self.test_document_type.page_image_pregeneration_page_count = 1
+        self.test_document_type.save()
+
+        self._upload_test_document_file()
+
+        document_file_page = self.test_document.file_latest.pages.first()
+        document_file_page.cache_partition.get_file(filename='base_image')
+        document_file_page.cache_partition.get_file(
+            filename=document_file_page.get_combined_cache_filename(
+                height=setting_thumbnail_height.value,
+                width=setting_thumbnail_width.value
+            )
+        )
+
+    def test_generate_page_images_width_above_base_resolution(self):
+        self.test_document_file.generate_page_images(width=100000)
+
+        document_file_page = self.test_document_file.pages.first()
+        with document_file_page.cache_partition.get_file(filename=document_file_page.get_combined_cache_filename(width=100000)).open() as file_object:
+            image = Image.open(fp=file_object)
+            image.load()
+
+        self.assertTrue(image.size[0] < 100000)
+
+    def test_render_width(self):
+        document_file_page = self.test_document_file.pages.first()
+
+        self.assertEqual(
+            document_file_page.get_render_width(
+                transformations=(
+                    TransformationResize(width=800),
+                    TransformationZoom(percent=100)
+                )
+            ), 800
+        )
+        self.assertEqual(
+            document_file_page.get_render_width(
+                transformations=(
+                    TransformationRotate(degrees=90),
+                    TransformationResize(width=800)
+                )
+            ), None
+        )
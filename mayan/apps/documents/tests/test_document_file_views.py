@@ -436,6 +436,59 @@ class DocumentFileDownloadViewTestCase(
         self.assertEqual(events[0].target, self.test_document_file)
         self.assertEqual(events[0].verb, event_document_file_downloaded.id)
 
+    def test_document_file_download_view_range_with_permission(self):
+        self.expected_content_types = (
+            self.test_document.file_latest.mimetype,
+        )
+
+        self.grant_access(
+            obj=self.test_document,
+            permission=permission_document_file_download
+        )
+
+        response = self._request_test_document_file_download_view(
+            headers={'HTTP_RANGE': 'bytes=10-19'}
+        )
+        self.assertEqual(response.status_code, 206)
+
+        with self.test_document.file_latest.open() as file_object:
+            content = file_object.read()
+
+        self.assertEqual(b''.join(response), content[10:20])
+        self.assertEqual(
+            response['Content-Range'], 'bytes 10-19/{}'.format(len(content))
+        )
+        self.assertEqual(response['Content-Length'], '10')
+
+    def test_document_file_download_view_range_if_range_mismatch_with_permission(self):
+        self.expected_content_types = (
+            self.test_document.file_latest.mimetype,
+        )
+
+        self.grant_access(
+            obj=self.test_document,
+            permission=permission_document_file_download
+        )
+
+        response = self._request_test_document_file_download_view(
+            headers={'HTTP_IF_RANGE': '"stale"', 'HTTP_RANGE': 'bytes=10-19'}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        with self.test_document.file_latest.open() as file_object:
+            self.assertEqual(b''.join(response), file_object.read())
+
+    def test_document_file_download_view_range_unsatisfiable_with_permission(self):
+        self.grant_access(
+            obj=self.test_document,
+            permission=permission_document_file_download
+        )
+
+        response = self._request_test_document_file_download_view(
+            headers={'HTTP_RANGE': 'bytes=999999999-'}
+        )
+        self.assertEqual(response.status_code, 416)
+
     def test_trashed_document_file_download_view_with_permission(self):
         self.grant_access(
             obj=self.test_document,
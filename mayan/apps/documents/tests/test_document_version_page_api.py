@@ -1,5 +1,9 @@
+import mock
+
 from rest_framework import status
 
+from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
 
 from ..events import (
@@ -233,6 +237,94 @@ class DocumentVersionPageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    @mock.patch(
+        'mayan.apps.documents.tasks.task_document_version_page_image_generate.apply_async'
+    )
+    def test_document_version_page_image_api_view_cache_miss_with_access(
+        self, mock_apply_async
+    ):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertTrue(mock_apply_async.called)
+        self.assertTrue('Retry-After' in response)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    @mock.patch(
+        'mayan.apps.documents.tasks.task_document_version_page_image_generate.apply_async'
+    )
+    def test_document_version_page_image_api_view_cache_miss_poll_with_access(
+        self, mock_apply_async
+    ):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        response = self._request_test_document_version_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        self.assertEqual(mock_apply_async.call_count, 1)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    @mock.patch(
+        'mayan.apps.documents.tasks.task_document_version_page_image_generate.apply_async'
+    )
+    def test_document_version_page_image_api_view_cache_hit_with_access(
+        self, mock_apply_async
+    ):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+        self.test_document_version_page.generate_image(user=self._test_case_user)
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(mock_apply_async.called)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_api_view_cache_locked_with_access(
+        self
+    ):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+        self.test_document_version_page.generate_image(user=self._test_case_user)
+
+        self._clear_events()
+
+        with mock.patch.object(
+            CachePartitionFile, 'open', side_effect=LockError
+        ):
+            response = self._request_test_document_version_page_image_api_view()
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertTrue('Retry-After' in response)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_version_page_list_api_view_no_permission(self):
         self._clear_events()
 
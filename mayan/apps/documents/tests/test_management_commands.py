@@ -0,0 +1,33 @@
+from io import StringIO
+
+import mock
+
+from django.core import management
+
+from .base import GenericDocumentTestCase
+
+
+class BenchmarkPageImagesManagementCommandTestCase(GenericDocumentTestCase):
+    def _call_command(self):
+        stdout = StringIO()
+
+        management.call_command(
+            command_name='benchmarkpageimages', pages=1, stdout=stdout
+        )
+
+        return stdout.getvalue()
+
+    def test_benchmarkpageimages_command(self):
+        output = self._call_command()
+
+        for label in ('display', 'preview', 'thumbnail'):
+            self.assertTrue(label in output)
+
+    def test_benchmarkpageimages_command_unmeasurable_time(self):
+        with mock.patch(
+            'mayan.apps.documents.management.commands.benchmarkpageimages.time'
+        ) as mock_time:
+            mock_time.time.return_value = 0
+            output = self._call_command()
+
+        self.assertTrue('plan 0.0 ms/page, -' in output)
@@ -4,7 +4,11 @@ import pycountry
 
 from django.utils.translation import ugettext_lazy as _
 
-from .settings import setting_language_codes
+from .settings import (
+    setting_display_height, setting_display_width, setting_language_codes,
+    setting_preview_height, setting_preview_width, setting_thumbnail_height,
+    setting_thumbnail_width
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -36,6 +40,18 @@ def get_language_choices():
     return sorted(result, key=lambda x: x[1])
 
 
+def get_page_image_sizes():
+    """
+    Return the (width, height) pairs the user interface requests for page
+    images: display, preview and thumbnail.
+    """
+    return (
+        (setting_display_width.value, setting_display_height.value),
+        (setting_preview_width.value, setting_preview_height.value),
+        (setting_thumbnail_width.value, setting_thumbnail_height.value)
+    )
+
+
 def parse_range(astr):
     # http://stackoverflow.com/questions/4248399/
     # page-range-for-printing-algorithm
@@ -92,6 +92,7 @@ class DocumentFileDeleteView(MultipleObjectDeleteView):
 
 
 class DocumentFileDownloadView(SingleObjectDownloadView):
+    download_accept_ranges = True
     object_permission = permission_document_file_download
     pk_url_kwarg = 'document_file_id'
     source_queryset = DocumentFile.valid
@@ -102,9 +103,20 @@ class DocumentFileDownloadView(SingleObjectDownloadView):
         instance._event_actor = self.request.user
         return instance.get_download_file_object()
 
+    def get_download_etag(self):
+        checksum = self.object.checksum
+        if checksum:
+            return '"{}"'.format(checksum)
+
+    def get_download_file_path(self):
+        return self.object.get_file_path()
+
     def get_download_filename(self):
         return self.object.filename
 
+    def get_download_mime_type(self):
+        return self.object.mimetype or None
+
 
 class DocumentFileEditView(SingleObjectEditView):
     form_class = DocumentFileForm
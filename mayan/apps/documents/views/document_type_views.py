@@ -81,7 +81,10 @@ class DocumentTypeListView(SingleObjectListView):
 
 
 class DocumentTypeCreateView(SingleObjectCreateView):
-    fields = ('label',)
+    fields = (
+        'label', 'page_image_pregeneration',
+        'page_image_pregeneration_page_count'
+    )
     model = DocumentType
     post_action_redirect = reverse_lazy(
         viewname='documents:document_type_list'
@@ -116,7 +119,10 @@ class DocumentTypeDeleteView(SingleObjectDeleteView):
 
 
 class DocumentTypeEditView(SingleObjectEditView):
-    fields = ('label',)
+    fields = (
+        'label', 'page_image_pregeneration',
+        'page_image_pregeneration_page_count'
+    )
     model = DocumentType
     object_permission = permission_document_type_edit
     pk_url_kwarg = 'document_type_id'
@@ -6,10 +6,14 @@ from mayan.apps.common.apps import MayanAppConfig
 from mayan.apps.common.menus import (
     menu_facet, menu_multi_item, menu_tools
 )
+from mayan.apps.document_parsing.signals import (
+    signal_post_document_file_parsing
+)
 from mayan.apps.documents.menus import menu_documents
 from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.documents.signals import signal_post_document_file_upload
 from mayan.apps.navigation.classes import SourceColumn
+from mayan.apps.ocr.signals import signal_post_document_version_ocr
 
 from .classes import DuplicateBackend
 from .handlers import (
@@ -87,7 +91,15 @@ class DuplicatesApp(MayanAppConfig):
             receiver=handler_remove_empty_duplicates_lists,
             sender=Document
         )
+        signal_post_document_file_parsing.connect(
+            dispatch_uid='duplicates_handler_scan_duplicates_for_parsing',
+            receiver=handler_scan_duplicates_for
+        )
         signal_post_document_file_upload.connect(
             dispatch_uid='duplicates_handler_scan_duplicates_for',
             receiver=handler_scan_duplicates_for
         )
+        signal_post_document_version_ocr.connect(
+            dispatch_uid='duplicates_handler_scan_duplicates_for_ocr',
+            receiver=handler_scan_duplicates_for
+        )
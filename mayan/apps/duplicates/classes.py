@@ -67,6 +67,15 @@ class DuplicateBackend(
         self.model_instance_id = model_instance_id
         self.kwargs = kwargs
 
+    def get_duplicate_groups(self):
+        """
+        Return the lists of primary keys of the documents that are
+        duplicates of each other. Backends that can't find the duplicates
+        of all the documents at once return None and are scanned one
+        document at a time.
+        """
+        return None
+
     def get_model_instance(self):
         StoredDuplicateBackend = apps.get_model(
             app_label='duplicated', model_name='StoredDuplicateBackend'
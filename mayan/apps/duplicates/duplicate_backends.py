@@ -1,8 +1,22 @@
+import logging
+
+from PIL import Image
+
 from django.apps import apps
-from django.db.models import F, Max
 from django.utils.translation import ugettext_lazy as _
 
+from mayan.apps.documents.settings import (
+    setting_thumbnail_height, setting_thumbnail_width
+)
+
 from .classes import DuplicateBackend
+from .settings import (
+    setting_near_duplicate_image_distance,
+    setting_near_duplicate_text_similarity
+)
+from .utils import get_duplicate_groups, get_image_hash, get_text_signature
+
+logger = logging.getLogger(name=__name__)
 
 
 class DuplicateBackendFileChecksum(DuplicateBackend):
@@ -12,25 +26,50 @@ class DuplicateBackendFileChecksum(DuplicateBackend):
     def verify(cls, document):
         return document.file_latest
 
+    def get_duplicate_groups(self):
+        LatestDocumentFileChecksum = apps.get_model(
+            app_label='duplicates', model_name='LatestDocumentFileChecksum'
+        )
+
+        LatestDocumentFileChecksum.objects.rebuild()
+
+        return get_duplicate_groups(
+            document_field_name='document_id', field_name='checksum',
+            queryset=LatestDocumentFileChecksum.objects.all()
+        )
+
     def process(self, document):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
         )
+        LatestDocumentFileChecksum = apps.get_model(
+            app_label='duplicates', model_name='LatestDocumentFileChecksum'
+        )
+
+        checksum = LatestDocumentFileChecksum.objects.update_for(
+            document=document
+        )
 
         # Get the documents whose latest file matches the checksum
         # of the current document and exclude the current document
 
-        return Document.objects.annotate(
-            max_timestamp=Max('files__timestamp')
-        ).filter(
-            files__timestamp=F('max_timestamp'),
-            files__checksum=document.file_latest.checksum
+        return Document.objects.filter(
+            latest_file_checksum__checksum=checksum
         ).exclude(pk=document.pk)
 
 
 class DuplicateBackendLabel(DuplicateBackend):
     label = _('Exact document label')
 
+    def get_duplicate_groups(self):
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+
+        return get_duplicate_groups(
+            field_name='label', queryset=Document.valid.all()
+        )
+
     def process(self, document):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
@@ -38,3 +77,105 @@ class DuplicateBackendLabel(DuplicateBackend):
         return Document.objects.filter(
             label=document.label
         ).exclude(pk=document.pk)
+
+
+class DuplicateBackendNearDuplicate(DuplicateBackend):
+    """
+    Find rescans and other near duplicates by the hash of the first page
+    image and the MinHash signature of the text of the documents.
+    Candidates are looked up in a locality sensitive hashing table instead
+    of being compared against every document.
+    """
+    label = _('Similar first page image or text')
+
+    @classmethod
+    def verify(cls, document):
+        return document.file_latest
+
+    def get_image_hash(self, document):
+        document_version = document.version_active
+        page = None
+
+        if document_version:
+            page = document_version.pages.first()
+
+        # Version pages are created after the file upload.
+        if not page:
+            page = document.file_latest.pages.first()
+
+        if not page:
+            return None
+
+        try:
+            cache_filename = page.generate_image(
+                height=setting_thumbnail_height.value,
+                width=setting_thumbnail_width.value
+            )
+
+            with page.cache_partition.get_file(filename=cache_filename).open() as file_object:
+                return get_image_hash(image=Image.open(fp=file_object))
+        except Exception as exception:
+            logger.warning(
+                'Unable to get the first page image of document: %s; %s',
+                document, exception
+            )
+
+    def get_text(self, document):
+        """
+        Return the OCR content of the active version or the parsed content
+        of the latest file when there is no OCR content.
+        """
+        content = ()
+
+        try:
+            DocumentVersionPageOCRContent = apps.get_model(
+                app_label='ocr', model_name='DocumentVersionPageOCRContent'
+            )
+        except LookupError:
+            """OCR app not installed."""
+        else:
+            content = DocumentVersionPageOCRContent.objects.filter(
+                document_version_page__document_version=document.version_active
+            ).order_by('document_version_page__page_number').values_list(
+                'content', flat=True
+            )
+
+        if not content:
+            try:
+                DocumentFilePageContent = apps.get_model(
+                    app_label='document_parsing',
+                    model_name='DocumentFilePageContent'
+                )
+            except LookupError:
+                """Parsing app not installed."""
+            else:
+                content = DocumentFilePageContent.objects.filter(
+                    document_file_page__document_file=document.file_latest
+                ).order_by('document_file_page__page_number').values_list(
+                    'content', flat=True
+                )
+
+        return '\n'.join(content)
+
+    def process(self, document):
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        NearDuplicateSignature = apps.get_model(
+            app_label='duplicates', model_name='NearDuplicateSignature'
+        )
+
+        signature = NearDuplicateSignature.objects.update_for(
+            document=document,
+            image_hash=self.get_image_hash(document=document),
+            text_signature=get_text_signature(
+                text=self.get_text(document=document)
+            )
+        )
+
+        return Document.objects.filter(
+            pk__in=signature.get_near_duplicate_ids(
+                image_distance=setting_near_duplicate_image_distance.value,
+                text_similarity=setting_near_duplicate_text_similarity.value
+            )
+        )
@@ -0,0 +1,22 @@
+DEFAULT_DUPLICATES_NEAR_DUPLICATE_IMAGE_DISTANCE = 3
+DEFAULT_DUPLICATES_NEAR_DUPLICATE_TEXT_SIMILARITY = 0.8
+
+DUPLICATES_BATCH_SIZE = 1000
+DUPLICATES_SCAN_ALL_LOCK_NAME = 'duplicates__scan_all'
+# Seconds allowed to each backend for each batch of documents while
+# scanning all documents.
+DUPLICATES_SCAN_ALL_LOCK_TIMEOUT_PER_BATCH = 60
+
+# The image hash compares the brightness of the horizontally adjacent
+# pixels of the page reduced to 9 x 8 pixels, giving 64 bits.
+NEAR_DUPLICATE_IMAGE_HASH_BANDS = 4
+NEAR_DUPLICATE_IMAGE_HASH_SIZE = 8
+# Bands of blank page regions have almost all their bits unset and are
+# shared by most documents. They are not used as buckets.
+NEAR_DUPLICATE_IMAGE_HASH_BAND_MINIMUM_BITS = 3
+
+NEAR_DUPLICATE_TEXT_MINIMUM_SHINGLES = 8
+NEAR_DUPLICATE_TEXT_PERMUTATIONS = 64
+NEAR_DUPLICATE_TEXT_PRIME = 2 ** 61 - 1
+NEAR_DUPLICATE_TEXT_ROWS_PER_BAND = 4
+NEAR_DUPLICATE_TEXT_SHINGLE_SIZE = 3
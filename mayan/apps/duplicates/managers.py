@@ -1,23 +1,185 @@
 import logging
 
 from django.apps import apps
-from django.db import models
-from django.db.models import Q, Value
+from django.db import models, transaction
+from django.db.models import OuterRef, Q, Subquery, Value
 
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 
 from .classes import DuplicateBackend
+from .literals import (
+    DUPLICATES_BATCH_SIZE, DUPLICATES_SCAN_ALL_LOCK_NAME,
+    DUPLICATES_SCAN_ALL_LOCK_TIMEOUT_PER_BATCH,
+    NEAR_DUPLICATE_IMAGE_HASH_BANDS
+)
+from .utils import (
+    get_image_hash_bands, get_signed_image_hash, get_text_signature_bands,
+    pack_text_signature
+)
 
 logger = logging.getLogger(name=__name__)
 
 
+class LatestDocumentFileChecksumManager(models.Manager):
+    def rebuild(self):
+        """
+        Store the checksum of the latest file of every valid document with
+        a single query and bulk insert. Rows stored meanwhile by a document
+        scan are kept.
+        """
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
+
+        latest_file_checksum = DocumentFile.objects.filter(
+            document=OuterRef('pk')
+        ).order_by('-timestamp', '-pk').values('checksum')[:1]
+
+        queryset = Document.valid.order_by().annotate(
+            latest_checksum=Subquery(latest_file_checksum)
+        ).exclude(latest_checksum=None).values_list('pk', 'latest_checksum')
+
+        with transaction.atomic():
+            self.all().delete()
+            self.bulk_create(
+                batch_size=DUPLICATES_BATCH_SIZE, ignore_conflicts=True,
+                objs=[
+                    self.model(checksum=checksum, document_id=document_id)
+                    for document_id, checksum in queryset.iterator()
+                ]
+            )
+
+    def update_for(self, document):
+        """
+        Store the checksum of the latest file of a document and return it.
+        """
+        document_file = document.file_latest
+
+        if document_file and document_file.checksum:
+            self.update_or_create(
+                defaults={'checksum': document_file.checksum},
+                document=document
+            )
+            return document_file.checksum
+        else:
+            self.filter(document=document).delete()
+
+
+class NearDuplicateSignatureManager(models.Manager):
+    def update_for(self, document, image_hash, text_signature):
+        """
+        Store the near duplicate signature of a document and replace its
+        locality sensitive hashing buckets.
+        """
+        NearDuplicateBucket = apps.get_model(
+            app_label='duplicates', model_name='NearDuplicateBucket'
+        )
+
+        band_values = []
+
+        if image_hash is None:
+            stored_image_hash = None
+        else:
+            stored_image_hash = get_signed_image_hash(image_hash=image_hash)
+            band_values.extend(get_image_hash_bands(image_hash=image_hash))
+
+        if text_signature is None:
+            stored_text_signature = None
+        else:
+            stored_text_signature = pack_text_signature(
+                text_signature=text_signature
+            )
+            band_values.extend(
+                enumerate(
+                    get_text_signature_bands(text_signature=text_signature),
+                    start=NEAR_DUPLICATE_IMAGE_HASH_BANDS
+                )
+            )
+
+        with transaction.atomic():
+            signature, created = self.update_or_create(
+                defaults={
+                    'image_hash': stored_image_hash,
+                    'text_signature': stored_text_signature
+                }, document=document
+            )
+
+            signature.buckets.all().delete()
+            NearDuplicateBucket.objects.bulk_create(
+                objs=[
+                    NearDuplicateBucket(
+                        band=band, signature=signature, value=value
+                    ) for band, value in band_values
+                ]
+            )
+
+        return signature
+
+
 class StoredDuplicateBackendManager(models.Manager):
-    def scan_document(self, document):
+    def scan_all(self):
+        """
+        Find the duplicates of all documents with the backends that can
+        return all their duplicate groups at once. Returns the paths of
+        the backends that must be scanned one document at a time. The lock
+        timeout grows with the number of documents to outlast the scan.
+        """
+        Document = apps.get_model(
+            app_label='documents', model_name='Document'
+        )
+
+        lock_name = DUPLICATES_SCAN_ALL_LOCK_NAME
+        lock_timeout = DUPLICATES_SCAN_ALL_LOCK_TIMEOUT_PER_BATCH * len(
+            DuplicateBackend.get_all()
+        ) * (Document.valid.count() // DUPLICATES_BATCH_SIZE + 1)
+
+        try:
+            logger.debug('trying to acquire lock: %s', lock_name)
+            lock = LockingBackend.get_backend().acquire_lock(
+                name=lock_name, timeout=lock_timeout
+            )
+            logger.debug('acquired lock: %s', lock_name)
+            try:
+                backend_paths = []
+
+                for backend_path, backend_class in DuplicateBackend.get_all():
+                    stored_backend, created = self.get_or_create(
+                        backend_path=backend_path
+                    )
+                    duplicate_groups = stored_backend.get_backend_instance().get_duplicate_groups()
+
+                    if duplicate_groups is None:
+                        backend_paths.append(backend_path)
+                    else:
+                        stored_backend.duplicate_entries_update(
+                            duplicate_groups=duplicate_groups
+                        )
+
+                return backend_paths
+            finally:
+                lock.release()
+        except LockError:
+            logger.debug('unable to obtain lock: %s' % lock_name)
+            raise
+
+    def scan_document(self, document, backend_paths=None):
         """
         Find duplicates of document based on each registered backend's logic.
+        When `backend_paths` is provided, only those backends are used.
+        Raises LockError while all documents are being scanned, as that
+        scan replaces the stored entries.
         """
+        # Fail early instead of holding the lock for the duration of the
+        # scan to allow several documents to be scanned at the same time.
+        LockingBackend.get_backend().acquire_lock(
+            name=DUPLICATES_SCAN_ALL_LOCK_NAME
+        ).release()
+
         lock_name = 'duplicates__scan_document-{}'.format(document.pk)
         try:
             logger.debug('trying to acquire lock: %s', lock_name)
@@ -29,6 +191,9 @@ class StoredDuplicateBackendManager(models.Manager):
                 )
 
                 for backend_path, backend_class in DuplicateBackend.get_all():
+                    if backend_paths is not None and backend_path not in backend_paths:
+                        continue
+
                     if backend_class.verify(document=document):
 
                         stored_backend, created = self.get_or_create(
@@ -0,0 +1,63 @@
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 1000
+
+
+def code_populate_latest_document_file_checksums(apps, schema_editor):
+    Document = apps.get_model(app_label='documents', model_name='Document')
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+    LatestDocumentFileChecksum = apps.get_model(
+        app_label='duplicates', model_name='LatestDocumentFileChecksum'
+    )
+
+    latest_file_checksum = DocumentFile.objects.using(
+        alias=schema_editor.connection.alias
+    ).filter(document=OuterRef('pk')).order_by(
+        '-timestamp', '-pk'
+    ).values('checksum')[:1]
+
+    queryset = Document.objects.using(
+        alias=schema_editor.connection.alias
+    ).order_by().annotate(
+        latest_checksum=Subquery(latest_file_checksum)
+    ).exclude(latest_checksum=None).values_list('pk', 'latest_checksum')
+
+    LatestDocumentFileChecksum.objects.using(
+        alias=schema_editor.connection.alias
+    ).bulk_create(
+        batch_size=BATCH_SIZE, objs=[
+            LatestDocumentFileChecksum(
+                checksum=checksum, document_id=document_id
+            ) for document_id, checksum in queryset.iterator()
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0076_page_image_pregeneration'),
+        ('duplicates', '0010_auto_20210419_0709'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LatestDocumentFileChecksum',
+            fields=[
+                ('document', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='latest_file_checksum', serialize=False, to='documents.Document', verbose_name='Document')),
+                ('checksum', models.CharField(db_index=True, max_length=64, verbose_name='Checksum')),
+            ],
+            options={
+                'verbose_name': 'Latest document file checksum',
+                'verbose_name_plural': 'Latest document file checksums',
+            },
+        ),
+        migrations.RunPython(
+            code=code_populate_latest_document_file_checksums,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
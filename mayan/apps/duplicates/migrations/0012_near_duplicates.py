@@ -0,0 +1,39 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0076_page_image_pregeneration'),
+        ('duplicates', '0011_latestdocumentfilechecksum'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NearDuplicateSignature',
+            fields=[
+                ('document', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='near_duplicate_signature', serialize=False, to='documents.Document', verbose_name='Document')),
+                ('image_hash', models.BigIntegerField(blank=True, null=True, verbose_name='Image hash')),
+                ('text_signature', models.BinaryField(blank=True, null=True, verbose_name='Text signature')),
+            ],
+            options={
+                'verbose_name': 'Near duplicate signature',
+                'verbose_name_plural': 'Near duplicate signatures',
+            },
+        ),
+        migrations.CreateModel(
+            name='NearDuplicateBucket',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band', models.PositiveSmallIntegerField(verbose_name='Band')),
+                ('value', models.BigIntegerField(verbose_name='Value')),
+                ('signature', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='buckets', to='duplicates.NearDuplicateSignature', verbose_name='Signature')),
+            ],
+            options={
+                'verbose_name': 'Near duplicate bucket',
+                'verbose_name_plural': 'Near duplicate buckets',
+                'index_together': {('band', 'value')},
+            },
+        ),
+    ]
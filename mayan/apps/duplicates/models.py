@@ -1,14 +1,23 @@
+from functools import reduce
 import logging
+from operator import or_
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.databases.model_mixins import BackendModelMixin
 from mayan.apps.documents.models.document_models import Document
 
 from .classes import NullBackend
+from .literals import DUPLICATES_BATCH_SIZE
 from .managers import (
-    DuplicateBackendEntryManager, StoredDuplicateBackendManager
+    DuplicateBackendEntryManager, LatestDocumentFileChecksumManager,
+    NearDuplicateSignatureManager, StoredDuplicateBackendManager
+)
+from .utils import (
+    get_image_hash_distance, get_text_signature_similarity,
+    unpack_text_signature
 )
 
 logger = logging.getLogger(name=__name__)
@@ -26,6 +35,46 @@ class StoredDuplicateBackend(BackendModelMixin, models.Model):
     def __str__(self):
         return str(self.get_backend_label())
 
+    def duplicate_entries_update(self, duplicate_groups):
+        """
+        Replace the duplicate entries of the backend with those of the
+        lists of duplicated document primary keys. The entries and their
+        documents are inserted in bulk, keeping those stored meanwhile by a
+        document scan.
+        """
+        DuplicateBackendEntryDocument = DuplicateBackendEntry.documents.through
+
+        document_groups = {}
+        for duplicate_group in duplicate_groups:
+            for document_id in duplicate_group:
+                document_groups[document_id] = duplicate_group
+
+        with transaction.atomic():
+            self.duplicate_entries.all().delete()
+
+            DuplicateBackendEntry.objects.bulk_create(
+                batch_size=DUPLICATES_BATCH_SIZE, ignore_conflicts=True,
+                objs=[
+                    DuplicateBackendEntry(
+                        document_id=document_id, stored_backend=self
+                    ) for document_id in document_groups
+                ]
+            )
+
+            queryset = self.duplicate_entries.values_list('pk', 'document_id')
+
+            DuplicateBackendEntryDocument.objects.bulk_create(
+                batch_size=DUPLICATES_BATCH_SIZE, ignore_conflicts=True,
+                objs=[
+                    DuplicateBackendEntryDocument(
+                        document_id=duplicate_id,
+                        duplicatebackendentry_id=entry_id
+                    ) for entry_id, document_id in queryset.iterator()
+                    for duplicate_id in document_groups.get(document_id, ())
+                    if duplicate_id != document_id
+                ]
+            )
+
 
 class DuplicateBackendEntry(models.Model):
     stored_backend = models.ForeignKey(
@@ -50,6 +99,126 @@ class DuplicateBackendEntry(models.Model):
         verbose_name_plural = _('Duplicated backend entries')
 
 
+class LatestDocumentFileChecksum(models.Model):
+    """
+    Indexed copy of the checksum of the latest file of each document.
+    Allows finding documents with the same file without computing the
+    latest file of every document.
+    """
+    document = models.OneToOneField(
+        on_delete=models.CASCADE, primary_key=True,
+        related_name='latest_file_checksum', to=Document,
+        verbose_name=_('Document')
+    )
+    checksum = models.CharField(
+        db_index=True, max_length=64, verbose_name=_('Checksum')
+    )
+
+    objects = LatestDocumentFileChecksumManager()
+
+    class Meta:
+        verbose_name = _('Latest document file checksum')
+        verbose_name_plural = _('Latest document file checksums')
+
+
+class NearDuplicateSignature(models.Model):
+    """
+    Compact signatures of the appearance and text of a document: the
+    difference hash of its first page image and the MinHash signature of
+    its text, stored as an array of 32 bit integers.
+    """
+    document = models.OneToOneField(
+        on_delete=models.CASCADE, primary_key=True,
+        related_name='near_duplicate_signature', to=Document,
+        verbose_name=_('Document')
+    )
+    image_hash = models.BigIntegerField(
+        blank=True, null=True, verbose_name=_('Image hash')
+    )
+    text_signature = models.BinaryField(
+        blank=True, null=True, verbose_name=_('Text signature')
+    )
+
+    objects = NearDuplicateSignatureManager()
+
+    class Meta:
+        verbose_name = _('Near duplicate signature')
+        verbose_name_plural = _('Near duplicate signatures')
+
+    def get_near_duplicate_ids(self, image_distance, text_similarity):
+        """
+        Return the primary keys of the documents whose signatures share a
+        bucket with this one and are close enough to be near duplicates.
+        Every signal available for both documents must be close enough,
+        so documents that only share a letterhead or a form template are
+        not near duplicates.
+        """
+        bucket_values = self.buckets.values_list('band', 'value')
+
+        if not bucket_values:
+            return []
+
+        candidate_ids = NearDuplicateBucket.objects.filter(
+            reduce(
+                or_, (
+                    Q(band=band, value=value) for band, value in bucket_values
+                )
+            )
+        ).exclude(signature=self).values('signature_id')
+
+        if self.text_signature is None:
+            text_signature = None
+        else:
+            text_signature = unpack_text_signature(value=self.text_signature)
+
+        result = []
+
+        for candidate in NearDuplicateSignature.objects.filter(pk__in=candidate_ids).iterator():
+            matches = []
+
+            if self.image_hash is not None and candidate.image_hash is not None:
+                matches.append(
+                    get_image_hash_distance(
+                        image_hash=self.image_hash,
+                        other_image_hash=candidate.image_hash
+                    ) <= image_distance
+                )
+
+            if text_signature is not None and candidate.text_signature is not None:
+                matches.append(
+                    get_text_signature_similarity(
+                        text_signature=text_signature,
+                        other_text_signature=unpack_text_signature(
+                            value=candidate.text_signature
+                        )
+                    ) >= text_similarity
+                )
+
+            if matches and all(matches):
+                result.append(candidate.pk)
+
+        return result
+
+
+class NearDuplicateBucket(models.Model):
+    """
+    Locality sensitive hashing table. Each band of the signature of a
+    document is a bucket, documents with similar signatures are likely to
+    share a bucket.
+    """
+    signature = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='buckets',
+        to=NearDuplicateSignature, verbose_name=_('Signature')
+    )
+    band = models.PositiveSmallIntegerField(verbose_name=_('Band'))
+    value = models.BigIntegerField(verbose_name=_('Value'))
+
+    class Meta:
+        index_together = (('band', 'value'),)
+        verbose_name = _('Near duplicate bucket')
+        verbose_name_plural = _('Near duplicate buckets')
+
+
 class DuplicateSourceDocument(Document):
     class Meta:
         proxy = True
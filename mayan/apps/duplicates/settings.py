@@ -0,0 +1,30 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from .literals import (
+    DEFAULT_DUPLICATES_NEAR_DUPLICATE_IMAGE_DISTANCE,
+    DEFAULT_DUPLICATES_NEAR_DUPLICATE_TEXT_SIMILARITY
+)
+
+namespace = SettingNamespace(label=_('Duplicates'), name='duplicates')
+
+setting_near_duplicate_image_distance = namespace.add_setting(
+    default=DEFAULT_DUPLICATES_NEAR_DUPLICATE_IMAGE_DISTANCE,
+    global_name='DUPLICATES_NEAR_DUPLICATE_IMAGE_DISTANCE',
+    help_text=_(
+        'Maximum number of different bits between the hashes of the first '
+        'page images of two documents for them to be near duplicates. '
+        'Distances lower than the 4 hash bands are always found, except '
+        'for the bands of blank page regions, which are not compared. When '
+        'both documents have text, the text must also be similar.'
+    )
+)
+setting_near_duplicate_text_similarity = namespace.add_setting(
+    default=DEFAULT_DUPLICATES_NEAR_DUPLICATE_TEXT_SIMILARITY,
+    global_name='DUPLICATES_NEAR_DUPLICATE_TEXT_SIMILARITY',
+    help_text=_(
+        'Minimum estimated similarity, from 0 to 1, between the text of '
+        'two documents for them to be near duplicates.'
+    )
+)
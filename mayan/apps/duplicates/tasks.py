@@ -12,22 +12,34 @@ def task_duplicates_clean_empty_lists():
     DuplicateBackendEntry.objects.clean_empty_duplicate_lists()
 
 
-@app.task(ignore_result=True)
-def task_duplicates_scan_all():
+@app.task(bind=True, ignore_result=True)
+def task_duplicates_scan_all(self):
     Document = apps.get_model(
         app_label='documents', model_name='Document'
     )
+    StoredDuplicateBackend = apps.get_model(
+        app_label='duplicates', model_name='StoredDuplicateBackend'
+    )
+
+    try:
+        backend_paths = StoredDuplicateBackend.objects.scan_all()
+    except LockError as exception:
+        raise self.retry(exc=exception)
+
+    if not backend_paths:
+        return
 
-    for document in Document.valid.all():
+    # Some backends can only be scanned one document at a time.
+    for document_id in Document.valid.values_list('pk', flat=True):
         task_duplicates_scan_for.apply_async(
             kwargs={
-                'document_id': document.pk
+                'backend_paths': backend_paths, 'document_id': document_id
             }
         )
 
 
 @app.task(bind=True, ignore_result=True)
-def task_duplicates_scan_for(self, document_id):
+def task_duplicates_scan_for(self, document_id, backend_paths=None):
     Document = apps.get_model(
         app_label='documents', model_name='Document'
     )
@@ -39,7 +51,7 @@ def task_duplicates_scan_for(self, document_id):
 
     try:
         StoredDuplicateBackend.objects.scan_document(
-            document=document
+            backend_paths=backend_paths, document=document
         )
     except LockError as exception:
         raise self.retry(exc=exception)
@@ -0,0 +1,21 @@
+TEST_FILE_CHECKSUM_BACKEND_PATH = 'mayan.apps.duplicates.duplicate_backends.DuplicateBackendFileChecksum'
+TEST_LABEL_BACKEND_PATH = 'mayan.apps.duplicates.duplicate_backends.DuplicateBackendLabel'
+TEST_NEAR_DUPLICATE_BACKEND_PATH = 'mayan.apps.duplicates.duplicate_backends.DuplicateBackendNearDuplicate'
+TEST_NEAR_DUPLICATE_IMAGE_HASH = 0x0f0f0f0f0f0f0f0f
+TEST_NEAR_DUPLICATE_TEXT = (
+    'Invoice number 1234 for the consulting services rendered during the '
+    'month of March. The total amount due is one thousand dollars, payable '
+    'within thirty days to the account listed below. Thank you for your '
+    'business.'
+)
+TEST_NEAR_DUPLICATE_TEXT_EDITED = (
+    'Invoice number 1234 for the consulting services rendered during the '
+    'month of March. The total amount due is one thousand dollars, payable '
+    'within thirty days to the account listed below. Thank you for your '
+    'order.'
+)
+TEST_NEAR_DUPLICATE_TEXT_UNRELATED = (
+    'Minutes of the annual meeting of the board of directors held at the '
+    'main office with all members present and the quorum confirmed by the '
+    'secretary.'
+)
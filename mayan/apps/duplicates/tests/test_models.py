@@ -1,7 +1,17 @@
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 
-from ..models import DuplicateBackendEntry, StoredDuplicateBackend
+from ..literals import DUPLICATES_SCAN_ALL_LOCK_NAME
+from ..models import (
+    DuplicateBackendEntry, NearDuplicateSignature, StoredDuplicateBackend
+)
+from ..utils import get_text_signature
 
+from .literals import (
+    TEST_NEAR_DUPLICATE_BACKEND_PATH, TEST_NEAR_DUPLICATE_IMAGE_HASH,
+    TEST_NEAR_DUPLICATE_TEXT, TEST_NEAR_DUPLICATE_TEXT_UNRELATED
+)
 from .mixins import DuplicatedDocumentTestMixin
 
 
@@ -50,3 +60,83 @@ class DuplicatedDocumentModelTestCase(
         StoredDuplicateBackend.objects.scan_document(
             document=self.test_documents[0]
         )
+
+    def test_scan_document_during_scan_all(self):
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=DUPLICATES_SCAN_ALL_LOCK_NAME
+        )
+
+        try:
+            with self.assertRaises(expected_exception=LockError):
+                StoredDuplicateBackend.objects.scan_document(
+                    document=self.test_documents[0]
+                )
+        finally:
+            lock.release()
+
+    def test_scan_document_backend_paths(self):
+        self._upload_duplicate_document()
+        DuplicateBackendEntry.objects.all().delete()
+
+        StoredDuplicateBackend.objects.scan_document(
+            backend_paths=(), document=self.test_documents[0]
+        )
+
+        self.assertEqual(DuplicateBackendEntry.objects.count(), 0)
+
+
+class NearDuplicateBackendTestCase(GenericDocumentTestCase):
+    def test_near_duplicate_scan_after_upload(self):
+        self._upload_test_document()
+
+        self.assertTrue(
+            NearDuplicateSignature.objects.get(
+                document=self.test_documents[1]
+            ).buckets.exists()
+        )
+        self.assertTrue(
+            self.test_documents[0] in DuplicateBackendEntry.objects.get(
+                document=self.test_documents[1],
+                stored_backend__backend_path=TEST_NEAR_DUPLICATE_BACKEND_PATH
+            ).documents.all()
+        )
+
+    def test_near_duplicate_text_mismatch(self):
+        self._upload_test_document()
+
+        NearDuplicateSignature.objects.update_for(
+            document=self.test_documents[0],
+            image_hash=TEST_NEAR_DUPLICATE_IMAGE_HASH,
+            text_signature=get_text_signature(text=TEST_NEAR_DUPLICATE_TEXT)
+        )
+        signature = NearDuplicateSignature.objects.update_for(
+            document=self.test_documents[1],
+            image_hash=TEST_NEAR_DUPLICATE_IMAGE_HASH,
+            text_signature=get_text_signature(
+                text=TEST_NEAR_DUPLICATE_TEXT_UNRELATED
+            )
+        )
+
+        self.assertEqual(
+            signature.get_near_duplicate_ids(
+                image_distance=0, text_similarity=1
+            ), []
+        )
+
+    def test_near_duplicate_text_match(self):
+        self._upload_test_document()
+
+        for test_document in self.test_documents:
+            signature = NearDuplicateSignature.objects.update_for(
+                document=test_document,
+                image_hash=TEST_NEAR_DUPLICATE_IMAGE_HASH,
+                text_signature=get_text_signature(
+                    text=TEST_NEAR_DUPLICATE_TEXT
+                )
+            )
+
+        self.assertEqual(
+            signature.get_near_duplicate_ids(
+                image_distance=0, text_similarity=1
+            ), [self.test_documents[0].pk]
+        )
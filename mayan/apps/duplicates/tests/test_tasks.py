@@ -1,7 +1,10 @@
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 
-from ..models import DuplicateBackendEntry
+from ..models import DuplicateBackendEntry, LatestDocumentFileChecksum
 
+from .literals import (
+    TEST_FILE_CHECKSUM_BACKEND_PATH, TEST_LABEL_BACKEND_PATH
+)
 from .mixins import DuplicatedDocumentTaskTestMixin
 
 
@@ -61,3 +64,39 @@ class DuplicatedDocumentTaskTestCase(
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+    def test_task_duplicates_scan_all_stale_entries(self):
+        self._execute_task_duplicates_scan_all()
+
+        self.test_documents[1].label = 'non duplicated label'
+        self.test_documents[1].save()
+        self.test_documents[1].files.update(
+            checksum='non duplicated checksum'
+        )
+
+        self._execute_task_duplicates_scan_all()
+
+        self.assertEqual(DuplicateBackendEntry.objects.count(), 0)
+        self.assertEqual(
+            LatestDocumentFileChecksum.objects.get(
+                document=self.test_documents[1]
+            ).checksum, 'non duplicated checksum'
+        )
+
+    def test_task_duplicates_scan_all_trashed_document(self):
+        self.test_documents[1].delete()
+
+        self._execute_task_duplicates_scan_all()
+
+        self.assertFalse(
+            DuplicateBackendEntry.objects.filter(
+                stored_backend__backend_path__in=(
+                    TEST_FILE_CHECKSUM_BACKEND_PATH, TEST_LABEL_BACKEND_PATH
+                )
+            ).exists()
+        )
+        self.assertFalse(
+            LatestDocumentFileChecksum.objects.filter(
+                document=self.test_documents[1]
+            ).exists()
+        )
@@ -0,0 +1,106 @@
+from PIL import Image, ImageDraw
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..utils import (
+    get_image_hash, get_image_hash_bands, get_image_hash_distance,
+    get_text_signature, get_text_signature_bands,
+    get_text_signature_similarity, pack_text_signature,
+    unpack_text_signature
+)
+
+from .literals import (
+    TEST_NEAR_DUPLICATE_TEXT, TEST_NEAR_DUPLICATE_TEXT_EDITED,
+    TEST_NEAR_DUPLICATE_TEXT_UNRELATED
+)
+
+
+class NearDuplicateImageHashTestCase(BaseTestCase):
+    def _create_test_image(self):
+        image = Image.new(mode='L', size=(600, 800), color=255)
+        draw = ImageDraw.Draw(im=image)
+        for line in range(20):
+            draw.rectangle(
+                xy=(50, 40 + line * 35, 100 + line * 20, 55 + line * 35),
+                fill=0
+            )
+
+        return image
+
+    def test_blank_image(self):
+        self.assertEqual(
+            get_image_hash(
+                image=Image.new(mode='L', size=(600, 800), color=255)
+            ), None
+        )
+
+    def test_image_hash_bands_blank_region(self):
+        image = Image.new(mode='L', size=(600, 800), color=255)
+        draw = ImageDraw.Draw(im=image)
+        draw.rectangle(xy=(50, 30, 550, 90), fill=0)
+
+        self.assertEqual(
+            get_image_hash_bands(image_hash=get_image_hash(image=image)), []
+        )
+
+    def test_resized_image(self):
+        image = self._create_test_image()
+
+        image_hash = get_image_hash(image=image)
+        resized_image_hash = get_image_hash(
+            image=image.resize(size=(300, 400))
+        )
+
+        self.assertTrue(
+            get_image_hash_distance(
+                image_hash=image_hash, other_image_hash=resized_image_hash
+            ) < 4
+        )
+        self.assertTrue(
+            set(get_image_hash_bands(image_hash=image_hash)) & set(
+                get_image_hash_bands(image_hash=resized_image_hash)
+            )
+        )
+
+
+class NearDuplicateTextSignatureTestCase(BaseTestCase):
+    def test_edited_text(self):
+        text_signature = get_text_signature(text=TEST_NEAR_DUPLICATE_TEXT)
+        edited_text_signature = get_text_signature(
+            text=TEST_NEAR_DUPLICATE_TEXT_EDITED
+        )
+
+        self.assertTrue(
+            get_text_signature_similarity(
+                text_signature=text_signature,
+                other_text_signature=edited_text_signature
+            ) > 0.7
+        )
+        self.assertTrue(
+            set(get_text_signature_bands(text_signature=text_signature)) & set(
+                get_text_signature_bands(text_signature=edited_text_signature)
+            )
+        )
+
+    def test_pack_text_signature(self):
+        text_signature = get_text_signature(text=TEST_NEAR_DUPLICATE_TEXT)
+
+        self.assertEqual(
+            unpack_text_signature(
+                value=pack_text_signature(text_signature=text_signature)
+            ), text_signature
+        )
+
+    def test_short_text(self):
+        self.assertEqual(get_text_signature(text='short text'), None)
+
+    def test_unrelated_text(self):
+        self.assertTrue(
+            get_text_signature_similarity(
+                text_signature=get_text_signature(
+                    text=TEST_NEAR_DUPLICATE_TEXT
+                ), other_text_signature=get_text_signature(
+                    text=TEST_NEAR_DUPLICATE_TEXT_UNRELATED
+                )
+            ) < 0.2
+        )
@@ -0,0 +1,184 @@
+import hashlib
+from itertools import groupby
+from operator import itemgetter
+import re
+import struct
+
+from PIL import Image
+
+from django.db.models import Count
+
+from .literals import (
+    NEAR_DUPLICATE_IMAGE_HASH_BAND_MINIMUM_BITS,
+    NEAR_DUPLICATE_IMAGE_HASH_BANDS, NEAR_DUPLICATE_IMAGE_HASH_SIZE,
+    NEAR_DUPLICATE_TEXT_MINIMUM_SHINGLES, NEAR_DUPLICATE_TEXT_PERMUTATIONS,
+    NEAR_DUPLICATE_TEXT_PRIME, NEAR_DUPLICATE_TEXT_ROWS_PER_BAND,
+    NEAR_DUPLICATE_TEXT_SHINGLE_SIZE
+)
+
+TEXT_SIGNATURE_FORMAT = '<{}I'.format(NEAR_DUPLICATE_TEXT_PERMUTATIONS)
+
+
+def _get_hash(value):
+    return int.from_bytes(
+        hashlib.blake2b(value, digest_size=8).digest(), byteorder='little'
+    )
+
+
+def _get_permutations():
+    # Derived from a hash instead of a random generator to keep the
+    # signatures stable across processes and Python versions.
+    return [
+        (
+            _get_hash(
+                value='a{}'.format(index).encode()
+            ) % (NEAR_DUPLICATE_TEXT_PRIME - 1) + 1,
+            _get_hash(
+                value='b{}'.format(index).encode()
+            ) % NEAR_DUPLICATE_TEXT_PRIME
+        ) for index in range(NEAR_DUPLICATE_TEXT_PERMUTATIONS)
+    ]
+
+
+TEXT_PERMUTATIONS = _get_permutations()
+
+
+def get_duplicate_groups(queryset, field_name, document_field_name='pk'):
+    """
+    Return the lists of document primary keys of the queryset rows that
+    share the same value of `field_name`. The duplicated values are found
+    with a single GROUP BY ... HAVING COUNT > 1 subquery.
+    """
+    duplicated_values = queryset.order_by().values(field_name).annotate(
+        count=Count(document_field_name)
+    ).filter(count__gt=1).values(field_name)
+
+    rows = queryset.filter(
+        **{'{}__in'.format(field_name): duplicated_values}
+    ).order_by(field_name, document_field_name).values_list(
+        field_name, document_field_name
+    )
+
+    return [
+        [document_id for value, document_id in group]
+        for value, group in groupby(rows.iterator(), key=itemgetter(0))
+    ]
+
+
+def get_image_hash(image):
+    """
+    Return the 64 bit difference hash of an image or None for images
+    without detail, like blank pages. Similar images have hashes with a
+    small Hamming distance.
+    """
+    image = image.convert('L').resize(
+        (NEAR_DUPLICATE_IMAGE_HASH_SIZE + 1, NEAR_DUPLICATE_IMAGE_HASH_SIZE),
+        Image.LANCZOS
+    )
+    pixels = list(image.getdata())
+
+    image_hash = 0
+    for row in range(NEAR_DUPLICATE_IMAGE_HASH_SIZE):
+        offset = row * (NEAR_DUPLICATE_IMAGE_HASH_SIZE + 1)
+        for column in range(NEAR_DUPLICATE_IMAGE_HASH_SIZE):
+            image_hash = (image_hash << 1) | (
+                pixels[offset + column] > pixels[offset + column + 1]
+            )
+
+    return image_hash or None
+
+
+def get_image_hash_bands(image_hash):
+    """
+    Split the image hash in bands of bits and return the band number and
+    value pairs of the bands with enough set and unset bits. Hashes with a
+    Hamming distance lower than the number of bands share at least one
+    band, unless it is one of the skipped low detail bands.
+    """
+    band_bits = NEAR_DUPLICATE_IMAGE_HASH_SIZE ** 2 // NEAR_DUPLICATE_IMAGE_HASH_BANDS
+
+    result = []
+    for band in range(NEAR_DUPLICATE_IMAGE_HASH_BANDS):
+        value = (image_hash >> (band * band_bits)) & ((1 << band_bits) - 1)
+        set_bits = bin(value).count('1')
+
+        if min(set_bits, band_bits - set_bits) >= NEAR_DUPLICATE_IMAGE_HASH_BAND_MINIMUM_BITS:
+            result.append((band, value))
+
+    return result
+
+
+def get_image_hash_distance(image_hash, other_image_hash):
+    return bin(
+        (image_hash ^ other_image_hash) & 0xffffffffffffffff
+    ).count('1')
+
+
+def get_signed_image_hash(image_hash):
+    # Database big integers are signed.
+    if image_hash >= 1 << 63:
+        return image_hash - (1 << 64)
+    else:
+        return image_hash
+
+
+def get_text_signature(text):
+    """
+    Return the MinHash signature of the word shingles of a text as a list
+    of 32 bit integers, or None for texts that are too short to compare.
+    The fraction of equal values of two signatures estimates the Jaccard
+    similarity of their shingles.
+    """
+    words = re.findall(r'\w+', text.lower())
+
+    shingles = {
+        _get_hash(
+            value=' '.join(
+                words[index:index + NEAR_DUPLICATE_TEXT_SHINGLE_SIZE]
+            ).encode()
+        ) for index in range(len(words) - NEAR_DUPLICATE_TEXT_SHINGLE_SIZE + 1)
+    }
+
+    if len(shingles) < NEAR_DUPLICATE_TEXT_MINIMUM_SHINGLES:
+        return None
+
+    return [
+        min(
+            (a * shingle + b) % NEAR_DUPLICATE_TEXT_PRIME for shingle in shingles
+        ) & 0xffffffff for a, b in TEXT_PERMUTATIONS
+    ]
+
+
+def get_text_signature_bands(text_signature):
+    """
+    Hash the rows of each band of a text signature to 63 bit integers.
+    Texts share a band with a probability that grows quickly with their
+    similarity.
+    """
+    return [
+        _get_hash(
+            value=struct.pack(
+                '<{}I'.format(NEAR_DUPLICATE_TEXT_ROWS_PER_BAND),
+                *text_signature[index:index + NEAR_DUPLICATE_TEXT_ROWS_PER_BAND]
+            )
+        ) >> 1 for index in range(
+            0, NEAR_DUPLICATE_TEXT_PERMUTATIONS,
+            NEAR_DUPLICATE_TEXT_ROWS_PER_BAND
+        )
+    ]
+
+
+def get_text_signature_similarity(text_signature, other_text_signature):
+    return sum(
+        value == other_value for value, other_value in zip(
+            text_signature, other_text_signature
+        )
+    ) / NEAR_DUPLICATE_TEXT_PERMUTATIONS
+
+
+def pack_text_signature(text_signature):
+    return struct.pack(TEXT_SIGNATURE_FORMAT, *text_signature)
+
+
+def unpack_text_signature(value):
+    return list(struct.unpack(TEXT_SIGNATURE_FORMAT, bytes(value)))
@@ -28,7 +28,13 @@ class DjangoSearchBackend(SearchBackend):
     def deindex_instance(self, instance):
         """This backend doesn't remove instances."""
 
-    def index_instance(self, instance):
+    def index_instance(self, instance, exclude_set=None):
+        """
+        This backend doesn't index instances. Searches query the
+        database directly.
+        """
+
+    def index_instances(self, search_model, id_list):
         """
         This backend doesn't index instances. Searches query the
         database directly.
@@ -12,7 +12,9 @@ from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 
 from ..classes import SearchBackend, SearchField, SearchModel
-from ..settings import setting_results_limit
+from ..settings import (
+    setting_indexing_chunk_size, setting_results_limit
+)
 
 from .literals import DJANGO_TO_WHOOSH_FIELD_MAP, WHOOSH_INDEX_DIRECTORY_NAME
 logger = logging.getLogger(name=__name__)
@@ -77,17 +79,27 @@ class WhooshSearchBackend(SearchBackend):
         return SearchBackend.limit_queryset(queryset=queryset)
 
     def clear_search_model_index(self, search_model):
-        index = self.get_index(search_model=search_model)
+        try:
+            lock = LockingBackend.get_backend().acquire_lock(
+                blocking=True, name='dynamic_search_whoosh_index_instance'
+            )
+        except LockError:
+            raise
+        else:
+            try:
+                index = self.get_index(search_model=search_model)
 
-        # Clear the model index
-        self.get_storage().create_index(
-            index.schema, indexname=search_model.get_full_name()
-        )
+                # Clear the model index
+                self.get_storage().create_index(
+                    index.schema, indexname=search_model.get_full_name()
+                )
+            finally:
+                lock.release()
 
     def deindex_instance(self, instance):
         try:
             lock = LockingBackend.get_backend().acquire_lock(
-                name='dynamic_search_whoosh_deindex_instance'
+                blocking=True, name='dynamic_search_whoosh_deindex_instance'
             )
         except LockError:
             raise
@@ -157,7 +169,7 @@ class WhooshSearchBackend(SearchBackend):
     def index_instance(self, instance, exclude_set=None):
         try:
             lock = LockingBackend.get_backend().acquire_lock(
-                name='dynamic_search_whoosh_index_instance'
+                blocking=True, name='dynamic_search_whoosh_index_instance'
             )
         except LockError:
             raise
@@ -236,13 +248,79 @@ class WhooshSearchBackend(SearchBackend):
                             instance=instance, exclude_set=exclude_set
                         )
 
-    def index_search_model(self, search_model):
+    def index_instances(self, search_model, id_list):
+        try:
+            lock = LockingBackend.get_backend().acquire_lock(
+                blocking=True, name='dynamic_search_whoosh_index_instance'
+            )
+        except LockError:
+            raise
+        else:
+            try:
+                self._index_instances(
+                    search_model=search_model,
+                    queryset=search_model.model._meta.default_manager.filter(
+                        pk__in=id_list
+                    )
+                )
+            finally:
+                lock.release()
+
+    def _index_instances(self, search_model, queryset):
+        """
+        Index a queryset using a single writer and a single commit for the
+        entire batch.
+        """
+        field_map = self.get_resolved_field_map(search_model=search_model)
         index = self.get_index(search_model=search_model)
 
-        # Clear the model index
-        self.get_storage().create_index(
-            index.schema, indexname=search_model.get_full_name()
-        )
+        writer = index.writer()
+        try:
+            for instance in queryset.iterator(
+                chunk_size=setting_indexing_chunk_size.value
+            ):
+                kwargs = search_model.sieve(
+                    field_map=field_map, instance=instance
+                )
+                writer.delete_by_term('id', str(instance.pk))
+                try:
+                    writer.add_document(**kwargs)
+                except Exception as exception:
+                    logger.error(
+                        'Unexpected exception while indexing object id: %s, '
+                        'search model: %s, index data: %s, raw data: %s, '
+                        'field map: %s; %s', instance.pk,
+                        search_model.get_full_name(), kwargs,
+                        instance.__dict__, field_map, exception,
+                        exc_info=True
+                    )
+                    raise
+        except Exception:
+            writer.cancel()
+            raise
+        else:
+            writer.commit()
+
+    def index_search_model(self, search_model):
+        self.clear_search_model_index(search_model=search_model)
 
-        for instance in search_model.model._meta.default_manager.all():
-            self.index_instance(instance=instance)
+        for id_list in search_model.get_id_list_chunks(
+            chunk_size=setting_indexing_chunk_size.value
+        ):
+            self.index_instances(search_model=search_model, id_list=id_list)
+
+        self.index_search_model_finish(search_model=search_model)
+
+    def index_search_model_finish(self, search_model):
+        try:
+            lock = LockingBackend.get_backend().acquire_lock(
+                blocking=True, name='dynamic_search_whoosh_index_instance'
+            )
+        except LockError:
+            raise
+        else:
+            try:
+                # Merge all the segments created by the batches.
+                self.get_index(search_model=search_model).optimize()
+            finally:
+                lock.release()
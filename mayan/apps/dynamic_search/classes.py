@@ -45,12 +45,37 @@ class SearchBackend:
     def _search(self, global_and_search, search_model, query_string, user):
         raise NotImplementedError
 
+    def clear_search_model_index(self, search_model):
+        """
+        Optional method to remove all the instances of a search model from
+        the backend's index.
+        """
+
     def deindex_instance(self, instance):
         raise NotImplementedError
 
-    def index_instance(self, instance):
+    def index_instance(self, instance, exclude_set=None):
         raise NotImplementedError
 
+    def index_instances(self, search_model, id_list):
+        """
+        Index a batch of instances of a search model. Backends that support
+        bulk writes should override this method. The default implementation
+        indexes one instance at a time.
+        """
+        queryset = search_model.model._meta.default_manager.filter(
+            pk__in=id_list
+        )
+
+        for instance in queryset:
+            self.index_instance(instance=instance)
+
+    def index_search_model_finish(self, search_model):
+        """
+        Optional method called after all the batches of a search model
+        have been indexed.
+        """
+
     def search(
         self, search_model, query_string, user, global_and_search=False
     ):
@@ -359,6 +384,25 @@ class SearchModel(AppsModuleLoaderMixin):
     def get_full_name(self):
         return '{}.{}'.format(self.app_label, self.model_name)
 
+    def get_id_list_chunks(self, chunk_size):
+        """
+        Stream the primary keys of all the instances of the model from the
+        database and return them in lists of up to chunk_size elements.
+        """
+        id_list = []
+        queryset = self.model._meta.default_manager.order_by('pk').values_list(
+            'pk', flat=True
+        )
+
+        for pk in queryset.iterator(chunk_size=chunk_size):
+            id_list.append(pk)
+            if len(id_list) >= chunk_size:
+                yield id_list
+                id_list = []
+
+        if id_list:
+            yield id_list
+
     def get_queryset(self):
         if self.queryset:
             return self.queryset()
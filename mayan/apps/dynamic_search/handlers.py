@@ -1,4 +1,7 @@
-from .tasks import task_deindex_instance, task_index_instance
+from django.apps import apps
+
+from .literals import INDEX_INSTANCE_QUEUE_FLUSH_DELAY
+from .tasks import task_deindex_instance, task_index_instance_queue_flush
 
 
 def handler_factory_deindex_instance(search_model):
@@ -18,12 +21,15 @@ def handler_factory_deindex_instance(search_model):
 
 
 def handler_index_instance(sender, **kwargs):
+    IndexInstanceQueueEntry = apps.get_model(
+        app_label='dynamic_search', model_name='IndexInstanceQueueEntry'
+    )
+
     instance = kwargs['instance']
 
-    task_index_instance.apply_async(
-        kwargs={
-            'app_label': instance._meta.app_label,
-            'model_name': instance._meta.model_name,
-            'object_id': instance.pk
-        }
-    )
+    # Only schedule a queue flush when the instance was not already
+    # queued. Repeated saves of the same instance are coalesced.
+    if IndexInstanceQueueEntry.objects.add(instance=instance):
+        task_index_instance_queue_flush.apply_async(
+            countdown=INDEX_INSTANCE_QUEUE_FLUSH_DELAY
+        )
@@ -4,11 +4,18 @@ DEFAULT_RESULTS_LIMIT = 100
 DEFAULT_SEARCH_BACKEND = 'mayan.apps.dynamic_search.backends.django.DjangoSearchBackend'
 DEFAULT_SEARCH_BACKEND_ARGUMENTS = {}
 DEFAULT_SEARCH_DISABLE_SIMPLE_SEARCH = False
+DEFAULT_SEARCH_INDEXING_CHUNK_SIZE = 1000
 DEFAULT_SEARCH_MATCH_ALL_DEFAULT_VALUE = 'false'
 DEFAULT_SEARCH_RESULTS_LIMIT = 100
 
 DELIMITER = '_'
 
+INDEX_INSTANCE_QUEUE_FLUSH_DELAY = 5
+INDEX_INSTANCE_QUEUE_FLUSH_INTERVAL = 60
+INDEX_INSTANCE_QUEUE_FLUSH_LOCK_NAME = 'dynamic_search_index_instance_queue_flush'
+# Seconds allowed to index each queued instance of a batch.
+INDEX_INSTANCE_QUEUE_FLUSH_LOCK_TIMEOUT_PER_ENTRY = 5
+
 SEARCH_MODEL_NAME_KWARG = 'search_model_name'
 TASK_RETRY_DELAY = 5
 
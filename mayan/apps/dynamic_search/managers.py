@@ -0,0 +1,90 @@
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
+
+from .literals import (
+    INDEX_INSTANCE_QUEUE_FLUSH_LOCK_NAME,
+    INDEX_INSTANCE_QUEUE_FLUSH_LOCK_TIMEOUT_PER_ENTRY
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class IndexInstanceQueueEntryManager(models.Manager):
+    def add(self, instance):
+        """
+        Mark an instance as needing to be updated in the search backend.
+        Returns True if the instance was not already in the queue.
+        """
+        content_type = ContentType.objects.get_for_model(
+            for_concrete_model=False, model=instance
+        )
+        entry, created = self.get_or_create(
+            content_type=content_type, object_id=instance.pk
+        )
+        return created
+
+    def flush(self, search_backend, batch_size):
+        """
+        Index all the queued instances in batches. Entries are removed
+        from the queue before being indexed so that saves that happen
+        while a batch is being processed queue the instance again. The
+        lock is acquired for each batch with a timeout that matches the
+        size of the batch.
+        """
+        lock_timeout = batch_size * INDEX_INSTANCE_QUEUE_FLUSH_LOCK_TIMEOUT_PER_ENTRY
+
+        while True:
+            try:
+                lock = LockingBackend.get_backend().acquire_lock(
+                    name=INDEX_INSTANCE_QUEUE_FLUSH_LOCK_NAME,
+                    timeout=lock_timeout
+                )
+            except LockError:
+                logger.debug('Queue flush already in progress.')
+                return
+            else:
+                try:
+                    entries = list(
+                        self.select_related('content_type')[:batch_size]
+                    )
+
+                    if not entries:
+                        return
+
+                    self.filter(
+                        pk__in=[entry.pk for entry in entries]
+                    ).delete()
+
+                    self._index_entries(
+                        entries=entries, search_backend=search_backend
+                    )
+                finally:
+                    lock.release()
+
+    def _index_entries(self, entries, search_backend):
+        # Share the exclusion set between the entries of a batch to
+        # avoid indexing the same related instance more than once.
+        exclude_set = set()
+
+        for index, entry in enumerate(entries):
+            instance = entry.content_object
+
+            if not instance:
+                # The instance was deleted after being queued.
+                continue
+
+            try:
+                search_backend.index_instance(
+                    exclude_set=exclude_set, instance=instance
+                )
+            except Exception:
+                # Queue the unprocessed instances again before erroring.
+                for pending_entry in entries[index:]:
+                    if pending_entry.content_object:
+                        self.add(instance=pending_entry.content_object)
+                raise
@@ -0,0 +1,35 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+from .managers import IndexInstanceQueueEntryManager
+
+
+class IndexInstanceQueueEntry(models.Model):
+    """
+    Model to keep track of the model instances that need to be updated in
+    the search backend. Multiple saves of the same instance are coalesced
+    into a single entry that is processed in batches.
+    """
+    content_type = models.ForeignKey(
+        on_delete=models.CASCADE, to=ContentType
+    )
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey(
+        ct_field='content_type', fk_field='object_id',
+    )
+    datetime = models.DateTimeField(
+        auto_now_add=True, db_index=True, verbose_name=_('Date time')
+    )
+
+    objects = IndexInstanceQueueEntryManager()
+
+    class Meta:
+        ordering = ('datetime',)
+        unique_together = ('content_type', 'object_id')
+        verbose_name = _('Index instance queue entry')
+        verbose_name_plural = _('Index instance queue entries')
+
+    def __str__(self):
+        return '{}.{}'.format(self.content_type, self.object_id)
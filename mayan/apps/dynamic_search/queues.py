@@ -1,9 +1,13 @@
+from datetime import timedelta
+
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.queues import queue_tools
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_b
 
+from .literals import INDEX_INSTANCE_QUEUE_FLUSH_INTERVAL
+
 queue_search = CeleryQueue(
     label=_('Search'), name='search', worker=worker_b
 )
@@ -18,9 +22,25 @@ queue_search.add_task_type(
     label=_('Index a model instance to the search engine.'),
     name='task_index_instance',
 )
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_instance_queue_flush',
+    label=_('Index the queued model instances to the search engine.'),
+    name='task_index_instance_queue_flush',
+    schedule=timedelta(seconds=INDEX_INSTANCE_QUEUE_FLUSH_INTERVAL),
+)
 
+queue_tools.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_instances',
+    label=_('Index a batch of model instances to the search engine.'),
+    name='task_index_instances',
+)
 queue_tools.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_index_search_model',
     label=_('Index all instances of a search model to the search engine.'),
     name='task_index_search_model',
 )
+queue_tools.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_search_model_finish',
+    label=_('Finish indexing all instances of a search model.'),
+    name='task_index_search_model_finish',
+)
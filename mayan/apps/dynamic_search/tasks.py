@@ -1,5 +1,7 @@
 import logging
 
+from celery import chord
+
 from django.apps import apps
 
 from mayan.apps.lock_manager.exceptions import LockError
@@ -7,6 +9,7 @@ from mayan.celery import app
 
 from .classes import SearchBackend, SearchModel
 from .literals import TASK_RETRY_DELAY
+from .settings import setting_indexing_chunk_size
 
 logger = logging.getLogger(name=__name__)
 
@@ -36,16 +39,47 @@ def task_deindex_instance(self, app_label, model_name, object_id):
 def task_index_search_model(self, search_model_full_name):
     search_model = SearchModel.get(name=search_model_full_name)
 
-    for instance in search_model.model._meta.default_manager.all():
-        task_index_instance.apply_async(
-            kwargs={
-                'app_label': instance._meta.app_label,
-                'model_name': instance._meta.model_name,
-                'object_id': instance.pk
-            }
+    try:
+        SearchBackend.get_instance().clear_search_model_index(
+            search_model=search_model
+        )
+    except LockError as exception:
+        raise self.retry(exc=exception)
+
+    index_instances_tasks = []
+    for id_list in search_model.get_id_list_chunks(
+        chunk_size=setting_indexing_chunk_size.value
+    ):
+        index_instances_tasks.append(
+            task_index_instances.s(
+                search_model_full_name=search_model_full_name,
+                id_list=id_list
+            )
+        )
+
+    if index_instances_tasks:
+        chord(index_instances_tasks)(
+            task_index_search_model_finish.s(
+                search_model_full_name=search_model_full_name
+            )
         )
 
 
+@app.task(
+    bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
+    ignore_result=True
+)
+def task_index_search_model_finish(self, results, search_model_full_name):
+    search_model = SearchModel.get(name=search_model_full_name)
+
+    try:
+        SearchBackend.get_instance().index_search_model_finish(
+            search_model=search_model
+        )
+    except LockError as exception:
+        raise self.retry(exc=exception)
+
+
 @app.task(
     bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
     ignore_result=True
@@ -75,3 +109,35 @@ def task_index_instance(self, app_label, model_name, object_id):
                 raise self.retry(exc=exception)
 
     logger.info('Finished')
+
+
+@app.task(
+    bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
+    ignore_result=True
+)
+def task_index_instance_queue_flush(self):
+    IndexInstanceQueueEntry = apps.get_model(
+        app_label='dynamic_search', model_name='IndexInstanceQueueEntry'
+    )
+
+    try:
+        IndexInstanceQueueEntry.objects.flush(
+            batch_size=setting_indexing_chunk_size.value,
+            search_backend=SearchBackend.get_instance()
+        )
+    except LockError as exception:
+        raise self.retry(exc=exception)
+
+
+@app.task(
+    bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None
+)
+def task_index_instances(self, search_model_full_name, id_list):
+    search_model = SearchModel.get(name=search_model_full_name)
+
+    try:
+        SearchBackend.get_instance().index_instances(
+            search_model=search_model, id_list=id_list
+        )
+    except LockError as exception:
+        raise self.retry(exc=exception)
@@ -348,3 +348,29 @@ class WhooshSearchBackendDocumentSearchTestCase(
             user=self._test_case_user
         )
         self.assertEqual(queryset.count(), 1)
+
+    def test_search_model_reindex(self):
+        self._upload_test_document(label='first_doc')
+
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        self.search_backend.clear_search_model_index(
+            search_model=document_search
+        )
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 0)
+
+        self.search_backend.index_search_model(search_model=document_search)
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query_string={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 1)
+        self.assertTrue(self.test_document in queryset)
@@ -0,0 +1,67 @@
+from django.test import override_settings
+
+from mayan.apps.documents.permissions import permission_document_view
+from mayan.apps.documents.search import document_search
+from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
+from mayan.apps.storage.utils import fs_cleanup, mkdtemp
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import SearchBackend
+from ..models import IndexInstanceQueueEntry
+from ..settings import setting_backend_arguments
+
+
+@override_settings(SEARCH_BACKEND='mayan.apps.dynamic_search.backends.whoosh.WhooshSearchBackend')
+class IndexInstanceQueueEntryTestCase(DocumentTestMixin, BaseTestCase):
+    def setUp(self):
+        self.old_value = setting_backend_arguments.value
+        super().setUp()
+        setting_backend_arguments.set(
+            value={'index_path': mkdtemp()}
+        )
+        self.search_backend = SearchBackend.get_instance()
+        IndexInstanceQueueEntry.objects.all().delete()
+
+    def tearDown(self):
+        fs_cleanup(
+            filename=setting_backend_arguments.value['index_path']
+        )
+        setting_backend_arguments.set(value=self.old_value)
+        super().tearDown()
+
+    def _search_test_document(self):
+        return self.search_backend.search(
+            search_model=document_search,
+            query_string={'label': self.test_document.label},
+            user=self._test_case_user
+        )
+
+    def test_queue_entry_coalescing(self):
+        self.assertTrue(
+            IndexInstanceQueueEntry.objects.add(instance=self.test_document)
+        )
+        self.assertFalse(
+            IndexInstanceQueueEntry.objects.add(instance=self.test_document)
+        )
+
+        self.assertEqual(IndexInstanceQueueEntry.objects.count(), 1)
+
+    def test_queue_flush(self):
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        # The test document was uploaded before the index was created.
+        self.assertFalse(self.test_document in self._search_test_document())
+
+        IndexInstanceQueueEntry.objects.add(instance=self.test_document)
+        IndexInstanceQueueEntry.objects.add(
+            instance=self.test_document.document_type
+        )
+
+        IndexInstanceQueueEntry.objects.flush(
+            batch_size=1, search_backend=self.search_backend
+        )
+
+        self.assertEqual(IndexInstanceQueueEntry.objects.count(), 0)
+        self.assertTrue(self.test_document in self._search_test_document())
@@ -1,2 +1,6 @@
+CACHE_PRUNE_BATCH_SIZE = 100
+
 DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS = 100
 DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS = 100
+DEFAULT_PRUNE_HIGH_WATERMARK = 100
+DEFAULT_PRUNE_LOW_WATERMARK = 90
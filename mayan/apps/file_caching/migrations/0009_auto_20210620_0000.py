@@ -0,0 +1,64 @@
+from django.db import migrations, models
+from django.db.models import F, Sum
+import django.utils.timezone
+
+
+def operation_cache_total_size_update(apps, schema_editor):
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    for cache in Cache.objects.using(alias=schema_editor.connection.alias).all():
+        cache.total_size = CachePartitionFile.objects.using(
+            alias=schema_editor.connection.alias
+        ).filter(partition__cache_id=cache.pk).aggregate(
+            file_size__sum=Sum('file_size')
+        )['file_size__sum'] or 0
+        cache.save(update_fields=('total_size',))
+
+
+def operation_cache_partition_file_datetime_accessed_update(apps, schema_editor):
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    CachePartitionFile.objects.using(
+        alias=schema_editor.connection.alias
+    ).update(datetime_accessed=F('datetime'))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0008_auto_20210426_0717'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cache',
+            name='total_size',
+            field=models.BigIntegerField(
+                default=0, editable=False, help_text='Sum of the size of '
+                'the files of the cache in bytes.', verbose_name='Total size'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cachepartitionfile',
+            name='datetime_accessed',
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now,
+                help_text='Date and time this cache partition file was '
+                'last accessed.', verbose_name='Date time accessed'
+            ),
+        ),
+        migrations.RunPython(
+            code=operation_cache_total_size_update,
+            reverse_code=migrations.RunPython.noop
+        ),
+        migrations.RunPython(
+            code=operation_cache_partition_file_datetime_accessed_update,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -3,10 +3,11 @@ import logging
 
 from django.core import validators
 from django.core.files.base import ContentFile
-from django.db import models
-from django.db.models import F, Sum
+from django.db import models, transaction
+from django.db.models import F
 from django.template.defaultfilters import filesizeformat
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.encoding import force_text
 from django.utils.functional import cached_property
 from django.utils.text import format_lazy
@@ -27,10 +28,13 @@ from .events import (
     event_cache_purged
 )
 from .exceptions import FileCachingException
+from .literals import CACHE_PRUNE_BATCH_SIZE
 from .settings import (
     setting_maximum_failed_prune_attempts,
-    setting_maximum_normal_prune_attempts
+    setting_maximum_normal_prune_attempts, setting_prune_high_watermark,
+    setting_prune_low_watermark
 )
+from .tasks import task_cache_prune
 
 logger = logging.getLogger(name=__name__)
 
@@ -46,6 +50,11 @@ class Cache(ValueChangeModelMixin, models.Model):
             validators.MinValueValidator(limit_value=1)
         ], verbose_name=_('Maximum size')
     )
+    total_size = models.BigIntegerField(
+        default=0, editable=False, help_text=_(
+            'Sum of the size of the files of the cache in bytes.'
+        ), verbose_name=_('Total size')
+    )
 
     class Meta:
         verbose_name = _('Cache')
@@ -54,6 +63,56 @@ class Cache(ValueChangeModelMixin, models.Model):
     def __str__(self):
         return force_text(s=self.label)
 
+    def _prune(self):
+        failed_attempts = 0
+        normal_attempts = 0
+        excluded_id_list = []
+        low_watermark = self.get_prune_low_watermark()
+        total_size = self.get_total_size()
+
+        while total_size > low_watermark:
+            cache_partition_files = list(
+                self.get_files().exclude(pk__in=excluded_id_list).order_by(
+                    'datetime_accessed', 'datetime'
+                )[:CACHE_PRUNE_BATCH_SIZE]
+            )
+
+            if not cache_partition_files:
+                break
+
+            for cache_partition_file in cache_partition_files:
+                try:
+                    cache_partition_file.delete()
+                except CachePartitionFile.DoesNotExist:
+                    # The file selected from deletion was deleted by another
+                    # process before the lock was acquired.
+                    pass
+                except LockError:
+                    logger.debug(
+                        'Lock error trying to delete file "%s" for prune. '
+                        'Skipping and attempting next file.',
+                        cache_partition_file
+                    )
+                    excluded_id_list.append(cache_partition_file.pk)
+                    failed_attempts += 1
+
+                    if failed_attempts > setting_maximum_failed_prune_attempts.value:
+                        raise FileCachingException(
+                            'Too many cache prune attempts failed.'
+                        )
+                else:
+                    total_size -= cache_partition_file.file_size
+                    if total_size <= low_watermark:
+                        break
+
+            normal_attempts += 1
+            if normal_attempts > setting_maximum_normal_prune_attempts.value:
+                raise FileCachingException(
+                    'Too many cache prune batches trying to free space.'
+                )
+
+            total_size = self.get_total_size()
+
     def get_absolute_url(self):
         return reverse(
             viewname='file_caching:cache_detail', kwargs={
@@ -80,13 +139,19 @@ class Cache(ValueChangeModelMixin, models.Model):
                 dotted_path='', label=_('Unknown'), name='unknown'
             )
 
+    def get_prune_high_watermark(self):
+        return self.maximum_size * setting_prune_high_watermark.value / 100
+
+    def get_prune_low_watermark(self):
+        return self.maximum_size * setting_prune_low_watermark.value / 100
+
     def get_total_size(self):
         """
         Return the actual usage of the cache.
         """
-        return self.get_files().aggregate(
-            file_size__sum=Sum('file_size')
-        )['file_size__sum'] or 0
+        return Cache.objects.filter(pk=self.pk).values_list(
+            'total_size', flat=True
+        ).first() or 0
 
     def get_total_size_display(self):
         return format_lazy(
@@ -103,52 +168,30 @@ class Cache(ValueChangeModelMixin, models.Model):
 
     def prune(self):
         """
-        Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        Deletes the least recently used files in batches until the total
+        size of the cache is below the low watermark. Only one prune runs
+        at a time per cache.
         """
-        failed_attempts = 0
-        normal_attempts = 0
-        file_index = 0
-
-        while self.get_total_size() >= self.maximum_size:
-            cache_partition_file_queryset = self.get_files().order_by(
-                'hits', 'datetime'
+        try:
+            lock = LockingBackend.get_backend().acquire_lock(
+                name='file_caching-cache-prune-{}'.format(self.pk)
             )
+        except LockError:
+            logger.debug('Cache %s prune already in progress.', self)
+            return
 
-            try:
-                cache_partition_file = cache_partition_file_queryset[file_index]
-            except IndexError:
-                # Attempted to get a file beyond what the queryset provided.
-                file_index = 0
-            else:
-                try:
-                    cache_partition_file.delete()
-                except CachePartitionFile.DoesNotExist:
-                    # The file selected from deletion was deleted by another
-                    # process before the lock was acquired.
-                    file_index += 1
-                except LockError:
-                    logger.debug(
-                        'Lock error trying to delete file "%s" for prune. '
-                        'Skipping and attempting next file.',
-                        cache_partition_file
-                    )
-                    failed_attempts += 1
-                    file_index += 1
-
-                    if failed_attempts > setting_maximum_failed_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prune attempts failed.'
-                        )
-                else:
-                    file_index = 0
-                    normal_attempts += 1
+        try:
+            self._prune()
+        finally:
+            lock.release()
 
-                    if normal_attempts > setting_maximum_normal_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prunes trying to create a '
-                            'single new file.'
-                        )
+    def prune_if_needed(self):
+        """
+        Queue a prune of the cache if the total size is above the high
+        watermark.
+        """
+        if self.get_total_size() > self.get_prune_high_watermark():
+            task_cache_prune.apply_async(kwargs={'cache_id': self.pk})
 
     @method_event(
         event=event_cache_purged,
@@ -188,6 +231,14 @@ class Cache(ValueChangeModelMixin, models.Model):
             field='maximum_size'
         )
 
+        if not self._state.adding and 'update_fields' not in kwargs:
+            # The total size is updated atomically by the cache files.
+            # Avoid overwriting it with the value loaded by this instance.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'total_size'
+            ]
+
         result = super().save(*args, **kwargs)
 
         if self.maximum_size < old_maximum_size:
@@ -229,8 +280,6 @@ class CachePartition(models.Model):
             lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
             logger.debug('acquired lock: %s', lock_name)
             try:
-                self.cache.prune()
-
                 # Since open "wb+" doesn't create files, force the creation
                 # of an empty file.
                 self.cache.storage.delete(
@@ -266,6 +315,8 @@ class CachePartition(models.Model):
                     partition_file._update_size(_acquire_lock=False)
             finally:
                 lock.release()
+
+            self.cache.prune_if_needed()
         except LockError:
             logger.debug('unable to obtain lock: %s' % lock_name)
             raise
@@ -307,6 +358,11 @@ class CachePartitionFile(models.Model):
     datetime = models.DateTimeField(
         auto_now_add=True, db_index=True, verbose_name=_('Date time')
     )
+    datetime_accessed = models.DateTimeField(
+        db_index=True, default=timezone.now, help_text=_(
+            'Date and time this cache partition file was last accessed.'
+        ), verbose_name=_('Date time accessed')
+    )
     filename = models.CharField(max_length=255, verbose_name=_('Filename'))
     file_size = models.PositiveIntegerField(
         default=0, verbose_name=_('File size')
@@ -349,10 +405,17 @@ class CachePartitionFile(models.Model):
         """
         Called after creation and initial write only.
         """
+        old_file_size = self.file_size
         self.file_size = self.partition.cache.storage.size(
             name=self.full_filename
         )
-        self.save()
+
+        with transaction.atomic():
+            self.save()
+            Cache.objects.filter(pk=self.partition.cache_id).update(
+                total_size=F('total_size') + self.file_size - old_file_size
+            )
+
         if self.file_size > self.partition.cache.maximum_size:
             raise FileCachingException(
                 'Cache partition file %s is bigger than the maximum cache '
@@ -368,7 +431,14 @@ class CachePartitionFile(models.Model):
     @locked_class_method
     def delete(self, *args, **kwargs):
         self.partition.cache.storage.delete(name=self.full_filename)
-        return super().delete(*args, **kwargs)
+
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            Cache.objects.filter(pk=self.partition.cache_id).update(
+                total_size=F('total_size') - self.file_size
+            )
+
+        return result
 
     @cached_property
     def full_filename(self):
@@ -385,7 +455,9 @@ class CachePartitionFile(models.Model):
         try:
             logger.debug('trying to acquire lock: %s', lock_name)
             self._lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
-            CachePartitionFile.objects.filter(pk=self.pk).update(hits=F('hits') + 1)
+            CachePartitionFile.objects.filter(pk=self.pk).update(
+                datetime_accessed=timezone.now(), hits=F('hits') + 1
+            )
             logger.debug('acquired lock: %s', lock_name)
             self._storage_object = None
             try:
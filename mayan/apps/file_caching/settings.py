@@ -4,7 +4,8 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
     DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
-    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS
+    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS, DEFAULT_PRUNE_HIGH_WATERMARK,
+    DEFAULT_PRUNE_LOW_WATERMARK
 )
 
 namespace = SettingNamespace(label=_('File caching'), name='file_caching')
@@ -20,7 +21,21 @@ setting_maximum_failed_prune_attempts = namespace.add_setting(
 setting_maximum_normal_prune_attempts = namespace.add_setting(
     default=DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS,
     global_name='FILE_CACHING_MAXIMUM_NORMAL_PRUNE_ATTEMPTS', help_text=_(
-        'Number of times a cache will attempt to prune files to free up '
-        'space for new a file being requested, before giving up.'
+        'Number of batches of files a cache will attempt to prune to free '
+        'up space, before giving up.'
+    )
+)
+setting_prune_high_watermark = namespace.add_setting(
+    default=DEFAULT_PRUNE_HIGH_WATERMARK,
+    global_name='FILE_CACHING_PRUNE_HIGH_WATERMARK', help_text=_(
+        'Percentage of the maximum size of a cache that when exceeded '
+        'will trigger a background prune of the cache.'
+    )
+)
+setting_prune_low_watermark = namespace.add_setting(
+    default=DEFAULT_PRUNE_LOW_WATERMARK,
+    global_name='FILE_CACHING_PRUNE_LOW_WATERMARK', help_text=_(
+        'Percentage of the maximum size of a cache down to which the least '
+        'recently used files will be deleted when the cache is pruned.'
     )
 )
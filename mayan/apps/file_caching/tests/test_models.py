@@ -4,6 +4,7 @@ from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..exceptions import FileCachingException
 from ..models import CachePartitionFile
+from ..settings import setting_prune_low_watermark
 
 from .literals import TEST_CACHE_PARTITION_FILE_FILENAME
 from .mixins import CacheTestMixin
@@ -21,6 +22,23 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
 
         self.test_cache.get_absolute_url()
 
+    def test_cache_total_size(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=2)
+        self._create_test_cache_partition_file(file_size=3)
+
+        self.assertEqual(self.test_cache.get_total_size(), 5)
+
+        self.test_cache_partition_files[0].delete()
+
+        self.assertEqual(self.test_cache.get_total_size(), 3)
+
+        self.test_cache.maximum_size = self.test_cache.maximum_size + 1
+        self.test_cache.save()
+
+        self.assertEqual(self.test_cache.get_total_size(), 3)
+
     def test_cache_purge(self):
         self._create_test_cache()
         self._create_test_cache_partition()
@@ -108,6 +126,8 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         )
 
     def test_cache_partition_file_lru_eviction(self):
+        setting_prune_low_watermark.set(value=100)
+
         self._create_test_cache(
             extra_data={
                 'maximum_size': 2
@@ -132,6 +152,26 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
             self.test_cache_partition_files[1] not in CachePartitionFile.objects.all()
         )
 
+    def test_cache_partition_file_prune_low_watermark(self):
+        setting_prune_low_watermark.set(value=50)
+
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 4
+            }
+        )
+
+        self._create_test_cache_partition()
+        for index in range(5):
+            self._create_test_cache_partition_file(file_size=1)
+
+        # Exceeding the maximum size prunes down to the low watermark.
+        self.assertEqual(self.test_cache.get_total_size(), 2)
+        self.assertEqual(
+            list(CachePartitionFile.objects.order_by('pk')),
+            sorted(self.test_cache_partition_files[3:], key=lambda item: item.pk)
+        )
+
     def test_cache_partition_file_size_protection(self):
         self._create_test_cache(
             extra_data={
@@ -161,6 +201,8 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         self.assertTrue(mock_cache_prune_method.called)
 
     def test_incremental_file_index_cache_prune(self):
+        setting_prune_low_watermark.set(value=100)
+
         self._create_test_cache(
             extra_data={
                 'maximum_size': 2
@@ -1,8 +1,17 @@
+from contextlib import contextmanager
 import logging
+import random
+import time
 
 from django.utils.module_loading import import_string
 
-from ..settings import setting_backend, setting_default_lock_timeout
+from ..exceptions import LockError
+from ..settings import (
+    setting_backend, setting_default_blocking_timeout,
+    setting_default_lock_timeout
+)
+
+from .literals import BLOCKING_BACKOFF_INITIAL, BLOCKING_BACKOFF_MAXIMUM
 
 logger = logging.getLogger(name=__name__)
 
@@ -14,6 +23,35 @@ class LockingBackend:
     """
     _is_initialized = False
 
+    @classmethod
+    def _acquire_lock_blocking(cls, name, timeout, blocking_timeout):
+        """
+        Try to acquire the lock until it succeeds or the blocking timeout
+        expires. Waits between attempts use an exponential backoff with
+        full jitter to spread the waiters. The release waiter is only
+        set up when the first attempt fails, the attempt made after
+        setting it up catches a release that happened in between.
+        """
+        deadline = time.time() + blocking_timeout
+        delay = BLOCKING_BACKOFF_INITIAL
+
+        try:
+            return cls._acquire_lock(name=name, timeout=timeout)
+        except LockError:
+            logger.debug('lock busy, waiting for release: %s', name)
+
+        with cls._release_waiter(name=name) as wait:
+            while True:
+                try:
+                    return cls._acquire_lock(name=name, timeout=timeout)
+                except LockError:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise
+
+                    wait(min(random.uniform(0, delay), remaining))
+                    delay = min(delay * 2, BLOCKING_BACKOFF_MAXIMUM)
+
     @classmethod
     def _initialize(cls):
         """
@@ -26,10 +64,37 @@ class LockingBackend:
         return import_string(dotted_path=setting_backend.value)
 
     @classmethod
-    def acquire_lock(cls, name, timeout=None):
+    @contextmanager
+    def _release_waiter(cls, name):
+        """
+        Context manager that provides the function used to wait between
+        blocking acquire attempts. The function receives the maximum
+        number of seconds to wait. Backends that can be notified of lock
+        releases can overload this method to wake up the waiters earlier.
+        """
+        yield time.sleep
+
+    @classmethod
+    def acquire_lock(
+        cls, name, timeout=None, blocking=False, blocking_timeout=None
+    ):
+        """
+        Acquire the lock or raise LockError. With blocking, keep trying
+        for up to blocking_timeout seconds or the default blocking timeout.
+        """
         timeout = timeout or setting_default_lock_timeout.value
         logger.debug('acquiring lock: %s, timeout: %s', name, timeout)
-        return cls._acquire_lock(name=name, timeout=timeout)
+
+        if blocking and blocking_timeout is None:
+            blocking_timeout = setting_default_blocking_timeout.value
+
+        if blocking and blocking_timeout:
+            return cls._acquire_lock_blocking(
+                blocking_timeout=blocking_timeout, name=name,
+                timeout=timeout
+            )
+        else:
+            return cls._acquire_lock(name=name, timeout=timeout)
 
     @classmethod
     def purge_locks(cls):
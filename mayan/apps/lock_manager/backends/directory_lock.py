@@ -0,0 +1,156 @@
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import time
+import uuid
+
+from django.conf import settings
+from django.core.files import locks
+from django.utils.encoding import force_bytes, force_text
+
+from mayan.apps.storage.settings import setting_temporary_directory
+
+from ..exceptions import LockError
+
+from .base import LockingBackend
+from .literals import (
+    DIRECTORY_LOCK_ACQUIRE_ATTEMPTS, DIRECTORY_LOCK_DIRECTORY_SUFFIX
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class DirectoryLock(LockingBackend):
+    """
+    Local lock backend that stores each lock in its own file inside a lock
+    directory. The file name is the hash of the lock name. Creating the
+    file with O_EXCL acquires a free lock and an exclusive flock on the
+    file guards the takeover of expired locks and the release. Operations
+    only touch the file of the lock involved and do not block operations
+    on other locks.
+    """
+    @classmethod
+    def _acquire_lock(cls, name, timeout):
+        return DirectoryLock(name=name, timeout=timeout)
+
+    @classmethod
+    def _initialize(cls):
+        cls.lock_directory = os.path.join(
+            setting_temporary_directory.value, '{}{}'.format(
+                hashlib.sha256(
+                    force_bytes(s=settings.SECRET_KEY)
+                ).hexdigest(), DIRECTORY_LOCK_DIRECTORY_SUFFIX
+            )
+        )
+        os.makedirs(name=cls.lock_directory, exist_ok=True)
+        logger.debug('lock_directory: %s', cls.lock_directory)
+
+    @classmethod
+    def _purge_locks(cls):
+        shutil.rmtree(path=cls.lock_directory, ignore_errors=True)
+        os.makedirs(name=cls.lock_directory, exist_ok=True)
+
+    @staticmethod
+    def _is_expired(data):
+        try:
+            expiration = float(data.split(' ')[0])
+        except ValueError:
+            # Lock file being written by the process that just created it.
+            return False
+        else:
+            return expiration and time.time() > expiration
+
+    def _get_lock_data(self):
+        if self.timeout:
+            expiration = time.time() + self.timeout
+        else:
+            expiration = 0
+
+        return '{} {}'.format(expiration, self.uuid)
+
+    def _init(self, name, timeout):
+        self.name = name
+        self.timeout = timeout
+        self.uuid = force_text(s=uuid.uuid4())
+        self.path = os.path.join(
+            self.__class__.lock_directory, hashlib.sha256(
+                force_bytes(s=name)
+            ).hexdigest()
+        )
+
+        for attempt in range(DIRECTORY_LOCK_ACQUIRE_ATTEMPTS):
+            try:
+                file_descriptor = os.open(
+                    self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY
+                )
+            except FileExistsError:
+                if self._take_over():
+                    return
+            except FileNotFoundError:
+                # The lock directory was purged.
+                os.makedirs(name=self.__class__.lock_directory, exist_ok=True)
+            else:
+                with os.fdopen(file_descriptor, mode='w') as file_object:
+                    # Keep others from reading a partially written file.
+                    locks.lock(f=file_object, flags=locks.LOCK_EX)
+                    file_object.write(self._get_lock_data())
+                return
+
+        raise LockError
+
+    def _open_locked(self):
+        """
+        Open the lock file and hold an exclusive flock on it. Returns None
+        if the file does not exist or was removed while waiting for the
+        flock.
+        """
+        try:
+            file_object = open(file=self.path, mode='r+')
+        except FileNotFoundError:
+            return None
+
+        locks.lock(f=file_object, flags=locks.LOCK_EX)
+
+        if os.fstat(file_object.fileno()).st_nlink == 0:
+            # Released and removed while waiting.
+            file_object.close()
+            return None
+
+        return file_object
+
+    def _release(self):
+        file_object = self._open_locked()
+
+        if file_object:
+            with file_object:
+                if file_object.read().split(' ')[-1] == self.uuid:
+                    try:
+                        os.unlink(self.path)
+                    except OSError as exception:
+                        if exception.errno != errno.ENOENT:
+                            raise
+                else:
+                    # Lock expired and someone else acquired it.
+                    pass
+
+    def _take_over(self):
+        """
+        Acquire an existing lock file if the lock it holds has expired.
+        Raises LockError if the lock is held. Returns False if the lock
+        file disappeared and the acquisition must be tried again.
+        """
+        file_object = self._open_locked()
+
+        if not file_object:
+            return False
+
+        with file_object:
+            if self._is_expired(data=file_object.read()):
+                file_object.seek(0)
+                file_object.truncate()
+                file_object.write(self._get_lock_data())
+                return True
+            else:
+                raise LockError
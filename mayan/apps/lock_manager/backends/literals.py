@@ -1,4 +1,12 @@
+BLOCKING_BACKOFF_INITIAL = 0.01
+BLOCKING_BACKOFF_MAXIMUM = 0.5
+
+# Attempts to create the lock file when it is removed while acquiring.
+DIRECTORY_LOCK_ACQUIRE_ATTEMPTS = 3
+DIRECTORY_LOCK_DIRECTORY_SUFFIX = '_locks'
+
 REDIS_LOCK_NAME_PREFIX = '_mayan_lock:'
+REDIS_LOCK_RELEASE_CHANNEL_PREFIX = '_mayan_lock_release:'
 REDIS_LOCK_VERSION_REQUIRED = (3, 3)
 REDIS_SCAN_KEYS_COUNT = 5000
 REDIS_USE_CONNECTION_POOL = True
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import redis
 
 from django.utils.encoding import force_text
@@ -9,8 +11,9 @@ from ..settings import setting_backend_arguments
 
 from .base import LockingBackend
 from .literals import (
-    REDIS_LOCK_NAME_PREFIX, REDIS_LOCK_VERSION_REQUIRED,
-    REDIS_SCAN_KEYS_COUNT, REDIS_USE_CONNECTION_POOL
+    REDIS_LOCK_NAME_PREFIX, REDIS_LOCK_RELEASE_CHANNEL_PREFIX,
+    REDIS_LOCK_VERSION_REQUIRED, REDIS_SCAN_KEYS_COUNT,
+    REDIS_USE_CONNECTION_POOL
 )
 
 
@@ -19,6 +22,10 @@ class RedisLock(LockingBackend):
     def _acquire_lock(cls, name, timeout):
         return RedisLock(name=name, timeout=timeout)
 
+    @staticmethod
+    def _get_release_channel(name):
+        return '{}{}'.format(REDIS_LOCK_RELEASE_CHANNEL_PREFIX, name)
+
     @classmethod
     def _initialize(cls):
         if REDIS_USE_CONNECTION_POOL:
@@ -53,6 +60,27 @@ class RedisLock(LockingBackend):
             if cursor == 0:
                 break
 
+    @classmethod
+    @contextmanager
+    def _release_waiter(cls, name):
+        """
+        Subscribe to the release channel of the lock before the next
+        attempt so that a release between that attempt and the wait is not
+        missed. The wait returns as soon as the lock is released.
+        """
+        pubsub = cls.get_redis_connection().pubsub(
+            ignore_subscribe_messages=True
+        )
+        pubsub.subscribe(cls._get_release_channel(name=name))
+
+        def wait(seconds):
+            pubsub.get_message(timeout=seconds)
+
+        try:
+            yield wait
+        finally:
+            pubsub.close()
+
     def _init(self, name, timeout):
         if redis.VERSION < REDIS_LOCK_VERSION_REQUIRED:
             raise DependenciesException(
@@ -77,3 +105,7 @@ class RedisLock(LockingBackend):
             self._redis_lock_instance.release()
         except redis.exceptions.LockNotOwnedError:
             return
+        else:
+            self.__class__.get_redis_connection().publish(
+                self._get_release_channel(name=self.name), self.name
+            )
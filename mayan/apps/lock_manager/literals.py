@@ -1,5 +1,18 @@
-DEFAULT_LOCK_MANAGER_BACKEND = 'mayan.apps.lock_manager.backends.file_lock.FileLock'
+BENCHMARK_LOCK_NAME_PREFIX = '_mayan_benchmark_lock_'
+
+DEFAULT_BENCHMARK_BACKENDS = (
+    'mayan.apps.lock_manager.backends.directory_lock.DirectoryLock',
+    'mayan.apps.lock_manager.backends.file_lock.FileLock',
+    'mayan.apps.lock_manager.backends.model_lock.ModelLock',
+)
+DEFAULT_BENCHMARK_HELD_LOCKS = 1000
+DEFAULT_BENCHMARK_ITERATIONS = 500
+DEFAULT_BENCHMARK_NAMES = 16
+DEFAULT_BENCHMARK_THREADS = 8
+
+DEFAULT_LOCK_MANAGER_BACKEND = 'mayan.apps.lock_manager.backends.directory_lock.DirectoryLock'
 DEFAULT_LOCK_MANAGER_BACKEND_ARGUMENTS = {}
+DEFAULT_LOCK_MANAGER_DEFAULT_BLOCKING_TIMEOUT = 5
 DEFAULT_LOCK_MANAGER_DEFAULT_LOCK_TIMEOUT = 30
 
 PURGE_LOCKS_COMMAND = 'purgelocks'
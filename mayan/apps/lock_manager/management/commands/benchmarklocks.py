@@ -0,0 +1,118 @@
+import random
+import threading
+import time
+
+from django.core import management
+from django.db import connection
+from django.utils.module_loading import import_string
+from django.utils.translation import ugettext_lazy as _
+
+from ...exceptions import LockError
+from ...literals import (
+    BENCHMARK_LOCK_NAME_PREFIX, DEFAULT_BENCHMARK_BACKENDS,
+    DEFAULT_BENCHMARK_HELD_LOCKS, DEFAULT_BENCHMARK_ITERATIONS,
+    DEFAULT_BENCHMARK_NAMES, DEFAULT_BENCHMARK_THREADS
+)
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Measure the acquire and release throughput of lock backends '
+        'under concurrent contention.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backend', action='append', dest='backends',
+            help=_(
+                'Dotted path of a lock backend to measure. Can be '
+                'specified multiple times. Defaults to the local backends.'
+            )
+        )
+        parser.add_argument(
+            '--held', action='store', default=DEFAULT_BENCHMARK_HELD_LOCKS,
+            dest='held', type=int,
+            help=_('Number of unrelated locks held during the measurement.')
+        )
+        parser.add_argument(
+            '--iterations', action='store',
+            default=DEFAULT_BENCHMARK_ITERATIONS, dest='iterations',
+            type=int, help=_('Acquire attempts per thread.')
+        )
+        parser.add_argument(
+            '--names', action='store', default=DEFAULT_BENCHMARK_NAMES,
+            dest='names', type=int,
+            help=_('Number of distinct lock names the threads contend for.')
+        )
+        parser.add_argument(
+            '--threads', action='store', default=DEFAULT_BENCHMARK_THREADS,
+            dest='threads', type=int, help=_('Number of concurrent threads.')
+        )
+
+    def benchmark(self, backend, held, iterations, names, threads):
+        held_locks = [
+            backend.acquire_lock(
+                name='{}held_{}'.format(BENCHMARK_LOCK_NAME_PREFIX, index)
+            ) for index in range(held)
+        ]
+
+        counters = {'acquired': 0, 'contended': 0}
+        counters_lock = threading.Lock()
+
+        def worker():
+            acquired = 0
+            contended = 0
+
+            try:
+                for iteration in range(iterations):
+                    name = '{}{}'.format(
+                        BENCHMARK_LOCK_NAME_PREFIX, random.randrange(names)
+                    )
+                    try:
+                        lock = backend.acquire_lock(name=name)
+                    except LockError:
+                        contended += 1
+                    else:
+                        acquired += 1
+                        lock.release()
+            finally:
+                connection.close()
+
+            with counters_lock:
+                counters['acquired'] += acquired
+                counters['contended'] += contended
+
+        thread_list = [
+            threading.Thread(target=worker) for index in range(threads)
+        ]
+
+        start = time.time()
+        for thread in thread_list:
+            thread.start()
+
+        for thread in thread_list:
+            thread.join()
+        elapsed = time.time() - start
+
+        for lock in held_locks:
+            lock.release()
+
+        return counters['acquired'], counters['contended'], elapsed
+
+    def handle(self, *args, **options):
+        for dotted_path in options['backends'] or DEFAULT_BENCHMARK_BACKENDS:
+            backend = import_string(dotted_path=dotted_path)
+
+            acquired, contended, elapsed = self.benchmark(
+                backend=backend, held=options['held'],
+                iterations=options['iterations'], names=options['names'],
+                threads=options['threads']
+            )
+
+            self.stdout.write(
+                '{}: {:.0f} operations/s, {} acquired, {} contended, '
+                '{:.2f} s'.format(
+                    dotted_path, (acquired + contended) / elapsed, acquired,
+                    contended, elapsed
+                )
+            )
@@ -4,6 +4,7 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
     DEFAULT_LOCK_MANAGER_BACKEND, DEFAULT_LOCK_MANAGER_BACKEND_ARGUMENTS,
+    DEFAULT_LOCK_MANAGER_DEFAULT_BLOCKING_TIMEOUT,
     DEFAULT_LOCK_MANAGER_DEFAULT_LOCK_TIMEOUT
 )
 
@@ -22,6 +23,14 @@ setting_backend_arguments = namespace.add_setting(
         'Arguments to pass to the LOCK_MANAGER_BACKEND.'
     )
 )
+setting_default_blocking_timeout = namespace.add_setting(
+    default=DEFAULT_LOCK_MANAGER_DEFAULT_BLOCKING_TIMEOUT,
+    global_name='LOCK_MANAGER_DEFAULT_BLOCKING_TIMEOUT', help_text=_(
+        'Default amount of time in seconds to wait for a busy lock to be '
+        'released when a lock is requested in blocking mode. Tasks wait for '
+        'busy locks before being retried. Set to 0 to disable waiting.'
+    )
+)
 setting_default_lock_timeout = namespace.add_setting(
     default=DEFAULT_LOCK_MANAGER_DEFAULT_LOCK_TIMEOUT,
     global_name='LOCK_MANAGER_DEFAULT_LOCK_TIMEOUT', help_text=_(
@@ -1,5 +1,7 @@
 import os
 
+import mock
+
 from django.core import management
 from django.utils.module_loading import import_string
 
@@ -34,6 +36,44 @@ class LockBackendTestMixin:
 
 
 class LockBackendTestCaseMixin:
+    def test_blocking_acquire(self):
+        self.locking_backend.acquire_lock(name=TEST_LOCK_1, timeout=1)
+
+        # lock_1 expires while waiting, should not raise LockError
+        lock_2 = self.locking_backend.acquire_lock(
+            blocking=True, blocking_timeout=5, name=TEST_LOCK_1
+        )
+
+        # Cleanup
+        lock_2.release()
+
+    def test_blocking_acquire_free_lock(self):
+        with mock.patch.object(
+            self.locking_backend, '_release_waiter'
+        ) as release_waiter:
+            lock_1 = self.locking_backend.acquire_lock(
+                blocking=True, name=TEST_LOCK_1
+            )
+
+        # A free lock is acquired without waiting for its release.
+        self.assertFalse(release_waiter.called)
+
+        # Cleanup
+        lock_1.release()
+
+    def test_blocking_acquire_timeout(self):
+        lock_1 = self.locking_backend.acquire_lock(name=TEST_LOCK_1, timeout=30)
+
+        # lock_1 not released before the blocking timeout, should raise
+        # LockError
+        with self.assertRaises(expected_exception=LockError):
+            self.locking_backend.acquire_lock(
+                blocking=True, blocking_timeout=0.1, name=TEST_LOCK_1
+            )
+
+        # Cleanup
+        lock_1.release()
+
     def test_exclusive(self):
         lock_1 = self.locking_backend.acquire_lock(name=TEST_LOCK_1)
         with self.assertRaises(expected_exception=LockError):
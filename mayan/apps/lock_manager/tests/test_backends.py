@@ -9,6 +9,13 @@ from .mixins import (
 )
 
 
+class DirectoryLockBackendTestCase(
+    LockBackendTestMixin, LockBackendTestCaseMixin, DefaultTimeoutTestMixin,
+    BaseTestCase
+):
+    backend_string = 'mayan.apps.lock_manager.backends.directory_lock.DirectoryLock'
+
+
 class FileLockBackendTestCase(
     LockBackendTestMixin, LockBackendTestCaseMixin, DefaultTimeoutTestMixin,
     BaseTestCase
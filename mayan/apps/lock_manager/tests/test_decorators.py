@@ -61,6 +61,10 @@ class FileLockDecoratorTestCase(BaseTestCase):
             test_object_1.method_1()
 
 
+class DirectoryLockTestCase(FileLockDecoratorTestCase):
+    backend_string = 'mayan.apps.lock_manager.backends.directory_lock.DirectoryLock'
+
+
 class ModelLockTestCase(FileLockDecoratorTestCase):
     backend_string = 'mayan.apps.lock_manager.backends.model_lock.ModelLock'
 
@@ -1,5 +1,7 @@
+from io import StringIO
 from unittest import skip
 
+from django.core import management
 from django.test import override_settings
 
 from mayan.apps.testing.tests.base import BaseTestCase
@@ -9,6 +11,26 @@ from .mixins import (
 )
 
 
+class BenchmarkLocksManagementCommandTestCase(BaseTestCase):
+    def test_benchmarklocks_command(self):
+        backend_string = 'mayan.apps.lock_manager.backends.directory_lock.DirectoryLock'
+        stdout = StringIO()
+
+        management.call_command(
+            command_name='benchmarklocks', backends=[backend_string], held=10,
+            iterations=10, names=2, stdout=stdout, threads=2
+        )
+
+        self.assertTrue(backend_string in stdout.getvalue())
+
+
+class DirectoryLockBackendManagementCommandTestCase(
+    LockBackendTestMixin, LockBackendManagementCommandTestCaseMixin,
+    BaseTestCase
+):
+    backend_string = 'mayan.apps.lock_manager.backends.directory_lock.DirectoryLock'
+
+
 class FileLockBackendManagementCommandTestCase(
     LockBackendTestMixin, LockBackendManagementCommandTestCaseMixin,
     BaseTestCase
@@ -10,30 +10,40 @@ def get_mimetype(file_object, mimetype_only=False):
     Determine a file's mimetype by calling the system's libmagic
     library via python-magic.
     """
-    file_mimetype = None
-    file_mime_encoding = None
-
     temporary_file_object = NamedTemporaryFile()
     file_object.seek(0)
     copyfileobj(fsrc=file_object, fdst=temporary_file_object)
     file_object.seek(0)
     temporary_file_object.seek(0)
 
+    try:
+        return get_mimetype_from_path(
+            mimetype_only=mimetype_only, path=temporary_file_object.name
+        )
+    finally:
+        temporary_file_object.close()
+
+
+def get_mimetype_from_path(path, mimetype_only=False):
+    """
+    Same as get_mimetype but for files that are already available in the
+    local filesystem. Avoids making a temporary copy of the file.
+    """
+    file_mimetype = None
+    file_mime_encoding = None
+
     kwargs = {'mime': True}
 
     if not mimetype_only:
         kwargs['mime_encoding'] = True
 
-    try:
-        mime = magic.Magic(**kwargs)
-
-        if mimetype_only:
-            file_mimetype = mime.from_file(filename=temporary_file_object.name)
-        else:
-            file_mimetype, file_mime_encoding = mime.from_file(
-                filename=temporary_file_object.name
-            ).split('; charset=')
-    finally:
-        temporary_file_object.close()
+    mime = magic.Magic(**kwargs)
+
+    if mimetype_only:
+        file_mimetype = mime.from_file(filename=path)
+    else:
+        file_mimetype, file_mime_encoding = mime.from_file(
+            filename=path
+        ).split('; charset=')
 
     return file_mimetype, file_mime_encoding
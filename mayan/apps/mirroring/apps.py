@@ -1,10 +1,15 @@
 from django.apps import apps
-from django.db.models.signals import pre_delete, pre_save
+from django.db.models.signals import m2m_changed, post_save, pre_delete
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.apps import MayanAppConfig
 
-from .handlers import handler_document_cache_delete, handler_node_cache_delete
+from .handlers import (
+    handler_document_file_snapshot_cache_delete,
+    handler_document_snapshot_cache_delete,
+    handler_node_documents_snapshot_cache_delete,
+    handler_node_snapshot_cache_delete
+)
 
 
 class MirroringApp(MayanAppConfig):
@@ -16,27 +21,48 @@ class MirroringApp(MayanAppConfig):
         super().ready()
 
         Document = apps.get_model(app_label='documents', model_name='Document')
+        DocumentFile = apps.get_model(
+            app_label='documents', model_name='DocumentFile'
+        )
         IndexInstanceNode = apps.get_model(
             app_label='document_indexing', model_name='IndexInstanceNode'
         )
 
-        pre_delete.connect(
-            handler_document_cache_delete,
-            dispatch_uid='mirroring_handler_document_cache_delete',
+        # The snapshots are loaded again when the transaction commits. The
+        # deletions are handled before the related rows are removed to find
+        # the indexes of the documents.
+        m2m_changed.connect(
+            handler_node_documents_snapshot_cache_delete,
+            dispatch_uid='mirroring_handler_node_documents_snapshot_cache_delete',
+            sender=IndexInstanceNode.documents.through
+        )
+        post_save.connect(
+            handler_document_snapshot_cache_delete,
+            dispatch_uid='mirroring_handler_document_snapshot_cache_delete',
             sender=Document
         )
-        pre_delete.connect(
-            handler_node_cache_delete,
-            dispatch_uid='mirroring_handler_node_cache_delete',
+        post_save.connect(
+            handler_document_file_snapshot_cache_delete,
+            dispatch_uid='mirroring_handler_document_file_snapshot_cache_delete',
+            sender=DocumentFile
+        )
+        post_save.connect(
+            handler_node_snapshot_cache_delete,
+            dispatch_uid='mirroring_handler_node_snapshot_cache_delete',
             sender=IndexInstanceNode
         )
-        pre_save.connect(
-            handler_document_cache_delete,
-            dispatch_uid='mirroring_handler_document_cache_delete',
+        pre_delete.connect(
+            handler_document_snapshot_cache_delete,
+            dispatch_uid='mirroring_handler_document_snapshot_cache_delete',
             sender=Document
         )
-        pre_save.connect(
-            handler_node_cache_delete,
-            dispatch_uid='mirroring_handler_node_cache_delete',
+        pre_delete.connect(
+            handler_document_file_snapshot_cache_delete,
+            dispatch_uid='mirroring_handler_document_file_snapshot_cache_delete',
+            sender=DocumentFile
+        )
+        pre_delete.connect(
+            handler_node_snapshot_cache_delete,
+            dispatch_uid='mirroring_handler_node_snapshot_cache_delete',
             sender=IndexInstanceNode
         )
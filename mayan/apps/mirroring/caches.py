@@ -1,12 +1,11 @@
 import hashlib
+import threading
+import uuid
 
 from django.core.cache import caches
+from django.db import transaction
 from django.utils.encoding import force_bytes
 
-from .settings import (
-    setting_document_lookup_cache_timeout, setting_node_lookup_cache_timeout
-)
-
 
 class IndexFilesystemCache:
     @staticmethod
@@ -14,80 +13,66 @@ class IndexFilesystemCache:
         return hashlib.sha256(force_bytes(s=key)).hexdigest()
 
     @staticmethod
-    def get_document_key(document):
-        return IndexFilesystemCache.get_key_hash(
-            key='document_pk_{}'.format(document.pk)
-        )
-
-    @staticmethod
-    def get_node_key(node):
+    def get_snapshot_key(index_template_id):
         return IndexFilesystemCache.get_key_hash(
-            key='node_pk_{}'.format(node.pk)
-        )
-
-    @staticmethod
-    def get_path_key(path):
-        return IndexFilesystemCache.get_key_hash(
-            key='path_{}'.format(path)
+            key='snapshot_generation_{}'.format(index_template_id)
         )
 
     def __init__(self, name='default'):
         self.cache = caches[name]
+        self.pending = threading.local()
 
-    def clear_node(self, node):
-        node_key = IndexFilesystemCache.get_node_key(node=node)
-        path_cache = self.cache.get(key=node_key)
-        if path_cache:
-            path = path_cache.get('path')
-            if path:
-                self.clean_path(path=path)
+    def _get_pending(self):
+        if not hasattr(self.pending, 'index_template_ids'):
+            self.pending.index_template_ids = set()
+            self.pending.index_template_node_indexes = {}
 
-        self.cache.delete(key=node_key)
+        return self.pending
 
-    def clear_document(self, document):
-        document_key = IndexFilesystemCache.get_document_key(document=document)
-        path_cache = self.cache.get(key=document_key)
-        if path_cache:
-            path = path_cache.get('path')
-            if path:
-                self.clean_path(path=path)
+    def _update_snapshots(self):
+        pending = self._get_pending()
+        index_template_ids = pending.index_template_ids
+        pending.index_template_ids = set()
+        pending.index_template_node_indexes = {}
 
-        self.cache.delete(key=document_key)
+        for index_template_id in index_template_ids:
+            self.cache.set(
+                key=IndexFilesystemCache.get_snapshot_key(
+                    index_template_id=index_template_id
+                ), value=uuid.uuid4().hex, timeout=None
+            )
 
-    def clean_path(self, path):
-        self.cache.delete(
-            key=IndexFilesystemCache.get_path_key(path=path)
+    def clear_node_snapshot(self, node):
+        """
+        Change the snapshot generation of the index of an index instance
+        node. The index of each index template node is looked up once per
+        transaction to avoid a query per node when a whole tree is deleted.
+        """
+        index_template_node_indexes = self._get_pending().index_template_node_indexes
+
+        if node.index_template_node_id not in index_template_node_indexes:
+            index_template_node_indexes[node.index_template_node_id] = node.index_template_node.index_id
+
+        self.clear_snapshot(
+            index_template_id=index_template_node_indexes[
+                node.index_template_node_id
+            ]
         )
 
-    def get_path(self, path):
-        return self.cache.get(
-            key=IndexFilesystemCache.get_path_key(path=path)
+    def clear_snapshot(self, index_template_id):
+        """
+        Change the snapshot generation of an index to make the mounted
+        filesystems load its snapshot again. The change is made when the
+        current transaction commits so that the snapshot is not loaded
+        again before the changes are visible. Several changes to the same
+        index in one transaction change the generation once.
+        """
+        self._get_pending().index_template_ids.add(index_template_id)
+        transaction.on_commit(func=self._update_snapshots)
+
+    def get_snapshot_generation(self, index_template_id):
+        return self.cache.get_or_set(
+            key=IndexFilesystemCache.get_snapshot_key(
+                index_template_id=index_template_id
+            ), default=lambda: uuid.uuid4().hex, timeout=None
         )
-
-    def set_path(self, path, document=None, node=None):
-        # Must provide a document_pk or a node_pk
-        # Not both
-        # Providing both is also not correct
-
-        if document:
-            self.cache.set(
-                key=IndexFilesystemCache.get_path_key(path=path),
-                value={'document_pk': document.pk},
-                timeout=setting_document_lookup_cache_timeout.value
-            )
-            self.cache.set(
-                key=IndexFilesystemCache.get_document_key(document=document),
-                value={'path': path},
-                timeout=setting_document_lookup_cache_timeout.value
-            )
-        elif node:
-            self.cache.set(
-                key=IndexFilesystemCache.get_path_key(path=path),
-                value={'node_pk': node.pk},
-                timeout=setting_node_lookup_cache_timeout.value
-            )
-            self.cache.set(
-                key=IndexFilesystemCache.get_node_key(node=node),
-                value={'path': path},
-                timeout=setting_node_lookup_cache_timeout.value
-            )
@@ -1,123 +1,202 @@
-import datetime
+from collections import Counter
 from errno import ENOENT
 import logging
 from stat import S_IFDIR, S_IFREG
+import threading
 from time import time
 
 from fuse import FuseOSError, LoggingMixIn, Operations
 
-from django.core.exceptions import MultipleObjectsReturned
-from django.db.models import (
-    Case, CharField, Count, F, Func, Transform, Value, When
-)
-from django.db.models.functions import Concat
-
 from mayan.apps.document_indexing.models import (
     IndexInstanceNode, IndexTemplate
 )
-from mayan.apps.documents.models import Document
+from mayan.apps.documents.models import Document, DocumentFile
 
 from .literals import (
     MAX_FILE_DESCRIPTOR, MIN_FILE_DESCRIPTOR, FILE_MODE, DIRECTORY_MODE
 )
 from .runtime import cache
+from .settings import (
+    setting_read_ahead_size, setting_snapshot_check_interval
+)
 
 logger = logging.getLogger(name=__name__)
 
 
-class Trim(Transform):
-    function = 'TRIM'
-    lookup_name = 'trim'
+class IndexFilesystemFile:
+    """
+    Open document file with a read ahead buffer. The storage is read in
+    blocks of at least `read_ahead_size` bytes and sequential reads are
+    served from the buffer.
+    """
+    def __init__(self, file_object, read_ahead_size):
+        self.buffer = b''
+        self.buffer_offset = 0
+        self.file_object = file_object
+        self.lock = threading.Lock()
+        self.read_ahead_size = read_ahead_size
+
+    def close(self):
+        self.file_object.close()
+
+    def read(self, offset, size):
+        with self.lock:
+            if size < 0:
+                self.file_object.seek(offset)
+                return self.file_object.read()
+
+            start = offset - self.buffer_offset
+            if start >= 0 and start + size <= len(self.buffer):
+                return self.buffer[start:start + size]
+
+            self.file_object.seek(offset)
+            self.buffer = self.file_object.read(
+                max(size, self.read_ahead_size)
+            )
+            self.buffer_offset = offset
 
+            return self.buffer[:size]
+
+
+class IndexFilesystemSnapshot:
+    """
+    In memory copy of the directory tree of an index. Directory paths map
+    to the names of their entries and file paths to the primary key,
+    times and size of the latest file of their document. The snapshot is
+    loaded with a fixed number of queries.
+    """
+    @staticmethod
+    def clean_name(value):
+        # Remove newline carriage returns and the first and last space
+        # to make multiline indexes valid directory names. The slash ('/')
+        # character is replaced with an underscore ('_').
+        return value.replace('\r\n', ' ').strip(' ').replace('/', '_')
 
-class IndexFilesystem(LoggingMixIn, Operations):
     @staticmethod
-    def _clean_queryset(queryset, source_field_name, destination_field_name):
-        queryset = IndexFilesystem._clean_queryset_end_of_lines(
-            queryset=queryset, source_field_name=source_field_name,
-            destination_field_name='_no_newline'
+    def clean_names(entries):
+        """
+        Return the clean names of a list of primary key and value pairs.
+        The primary key is appended inside a parenthesis to the names
+        that are duplicated.
+        """
+        names = [
+            (pk, IndexFilesystemSnapshot.clean_name(value=value)) for pk, value in entries
+        ]
+        name_counts = Counter(name for pk, name in names)
+
+        return [
+            (
+                pk, '{}({})'.format(name, pk) if name_counts[name] > 1 else name
+            ) for pk, name in names
+        ]
+
+    def __init__(self, index_template):
+        self.directories = {}
+        self.files = {}
+
+        instance_root = index_template.instance_root
+
+        node_children = {}
+        node_link_documents = {}
+
+        queryset = IndexInstanceNode.objects.filter(
+            tree_id=instance_root.tree_id
+        ).order_by('lft').values_list(
+            'pk', 'parent_id', 'value', 'index_template_node__link_documents'
         )
 
-        queryset = IndexFilesystem._clean_queryset_slashes(
-            queryset=queryset, source_field_name='_no_newline'
+        for pk, parent_id, value, link_documents in queryset:
+            node_children.setdefault(parent_id, []).append((pk, value))
+            node_link_documents[pk] = link_documents
+
+        node_documents = {}
+
+        queryset = IndexInstanceNode.documents.through.objects.filter(
+            indexinstancenode__tree_id=instance_root.tree_id
+        ).values_list('indexinstancenode_id', 'document_id')
+
+        for node_id, document_id in queryset:
+            node_documents.setdefault(node_id, []).append(document_id)
+
+        document_queryset = Document.valid.filter(
+            pk__in=IndexInstanceNode.documents.through.objects.filter(
+                indexinstancenode__tree_id=instance_root.tree_id
+            ).values('document_id')
         )
 
-        return IndexFilesystem._clean_queryset_duplicates(
-            queryset=queryset, destination_field_name=destination_field_name
+        document_files = {}
+
+        queryset = DocumentFile.objects.filter(
+            document__in=document_queryset.values('pk')
+        ).order_by('timestamp', 'pk').values_list(
+            'document_id', 'pk', 'size', 'timestamp'
         )
 
-    @staticmethod
-    def _clean_queryset_end_of_lines(
-        queryset, source_field_name='value',
-        destination_field_name='clean_value'
-    ):
-        # Remove newline carriage returns and the first and last space
-        # to make multiline indexes valid directoy names
-        return queryset.annotate(
-            **{
-                destination_field_name: Trim(
-                    Func(
-                        F(source_field_name), Value('\r\n'), Value(' '),
-                        function='replace', output_field=CharField()
-                    ),
-                )
-            }
+        # Keep the latest file of each document.
+        for document_id, pk, size, timestamp in queryset:
+            document_files[document_id] = (pk, size, timestamp)
+
+        # Documents in their default order with their file attributes.
+        documents = {}
+
+        queryset = document_queryset.values_list(
+            'pk', 'label', 'datetime_created'
         )
 
-    @staticmethod
-    def _clean_queryset_slashes(
-        queryset, source_field_name, destination_field_name='_no_slashes'
-    ):
-        # This is a conditional expression that is executed only for
-        # items in the queryset that contain a slash ('/') in their source
-        # field. The slash ('/') character is replaced with an
-        # underscore ('_').
-        return queryset.annotate(
-            **{
-                destination_field_name: Case(
-                    When(
-                        **{
-                            '{}__contains'.format(source_field_name): '/',
-                            'then': Func(
-                                F(source_field_name), Value('/'), Value('_'),
-                                function='replace', output_field=CharField()
-                            )
-                        }
-                    ),
-                    default=source_field_name
+        for order, (pk, label, datetime_created) in enumerate(queryset):
+            try:
+                document_file_pk, size, timestamp = document_files[pk]
+            except KeyError:
+                continue
+
+            documents[pk] = (
+                order, label, (
+                    document_file_pk, datetime_created.timestamp(),
+                    timestamp.timestamp(), size or 0
                 )
-            }
-        )
+            )
 
-    @staticmethod
-    def _clean_queryset_duplicates(
-        queryset, source_field_name='_no_slashes', destination_field_name='_deduplicated'
-    ):
-        # Make second queryset of all duplicates
-        repeats = queryset.values(source_field_name).annotate(
-            repeated_count=Count(source_field_name)
-        ).filter(repeated_count__gt=1).values(source_field_name)
-
-        # This is a conditional expression that is executed only for
-        # duplicates. The primary key is appended inside a parethesis to
-        # the source field.
-        return queryset.annotate(
-            **{
-                destination_field_name: Case(
-                    When(
-                        **{
-                            '{}__in'.format(source_field_name): repeats,
-                            'then': Concat(
-                                F(source_field_name), Value('('), F('pk'),
-                                Value(')'), output_field=CharField()
-                            )
-                        }
-                    ),
-                    default=source_field_name
+        pending_nodes = [(instance_root.pk, '/')]
+
+        while pending_nodes:
+            node_id, path = pending_nodes.pop()
+
+            if path.endswith('/'):
+                path_prefix = path
+            else:
+                path_prefix = '{}/'.format(path)
+
+            entry_names = []
+
+            for pk, name in IndexFilesystemSnapshot.clean_names(entries=node_children.get(node_id, ())):
+                entry_names.append(name)
+                pending_nodes.append((pk, '{}{}'.format(path_prefix, name)))
+
+            if node_link_documents.get(node_id):
+                document_ids = sorted(
+                    (
+                        document_id for document_id in node_documents.get(node_id, ()) if document_id in documents
+                    ), key=lambda document_id: documents[document_id][0]
                 )
-            }
-        )
 
+                entries = [
+                    (document_id, documents[document_id][1]) for document_id in document_ids
+                ]
+
+                for pk, name in IndexFilesystemSnapshot.clean_names(entries=entries):
+                    entry_names.append(name)
+                    self.files[
+                        '{}{}'.format(path_prefix, name)
+                    ] = documents[pk][2]
+
+            self.directories[path] = tuple(entry_names)
+
+        # Directories take precedence over files of the same name.
+        for path in self.directories:
+            self.files.pop(path, None)
+
+
+class IndexFilesystem(LoggingMixIn, Operations):
     def _get_next_file_descriptor(self):
         while(True):
             self.file_descriptor_count += 1
@@ -130,87 +209,38 @@ class IndexFilesystem(LoggingMixIn, Operations):
             except KeyError:
                 return self.file_descriptor_count
 
-    def _path_to_node(self, path, access_only=False, directory_only=True):
-        logger.debug('path: %s', path)
-        logger.debug('directory_only: %s', directory_only)
-
-        parts = path.split('/')
-
-        logger.debug('parts: %s', parts)
-
-        node = self.index_template.instance_root
-
-        if len(parts) > 1 and parts[1] != '':
-            path_cache = cache.get_path(path=path)
-
-            if path_cache:
-                node_pk = path_cache.get('node_pk')
-                if node_pk:
-                    if access_only:
-                        return True
-                    else:
-                        return IndexInstanceNode.objects.get(pk=node_pk)
-
-                document_pk = path_cache.get('document_pk')
-                if document_pk:
-                    if access_only:
-                        return True
-                    else:
-                        return Document.valid.get(pk=document_pk)
-
-            for count, part in enumerate(iterable=parts[1:]):
-                try:
-                    node = IndexFilesystem._clean_queryset(
-                        queryset=node.get_children(),
-                        source_field_name='value',
-                        destination_field_name='value_clean'
-                    ).get(value_clean=part)
-                except IndexInstanceNode.DoesNotExist:
-                    logger.debug('%s does not exists', part)
-
-                    if directory_only:
-                        return None
-                    else:
-                        try:
-                            if node.index_template_node.link_documents:
-                                queryset = Document.valid.filter(
-                                    pk__in=node.documents.values('pk')
-                                )
-
-                                document = IndexFilesystem._clean_queryset(
-                                    queryset=queryset,
-                                    source_field_name='label',
-                                    destination_field_name='label_clean'
-                                ).get(label_clean=part)
-
-                                logger.debug(
-                                    'path %s is a valid file path', path
-                                )
-                                cache.set_path(path=path, document=document)
-
-                                return document
-                            else:
-                                return None
-                        except Document.DoesNotExist:
-                            logger.debug(
-                                'path %s is a file, but is not found', path
-                            )
-                            return None
-                        except MultipleObjectsReturned:
-                            return None
-                except MultipleObjectsReturned:
-                    return None
-
-            cache.set_path(path=path, node=node)
-
-        logger.debug('node: %s', node)
-        logger.debug('node is root: %s', node.is_root_node())
-
-        return node
+    def _get_snapshot(self):
+        """
+        Return the snapshot of the index tree. The snapshot is loaded again
+        when the index instance nodes or documents change. Changes are
+        checked at most once every snapshot check interval.
+        """
+        if self.snapshot is None or time() - self.snapshot_time_checked >= setting_snapshot_check_interval.value:
+            with self.snapshot_lock:
+                if self.snapshot is None or time() - self.snapshot_time_checked >= setting_snapshot_check_interval.value:
+                    generation = cache.get_snapshot_generation(
+                        index_template_id=self.index_template.pk
+                    )
+
+                    if self.snapshot is None or generation != self.snapshot_generation:
+                        logger.debug('Loading index snapshot')
+                        self.snapshot = IndexFilesystemSnapshot(
+                            index_template=self.index_template
+                        )
+                        self.snapshot_generation = generation
+
+                    self.snapshot_time_checked = time()
+
+        return self.snapshot
 
     def __init__(self, index_slug):
         self.file_descriptor_count = MIN_FILE_DESCRIPTOR
         self.file_descriptors = {}
+        self.file_descriptors_lock = threading.Lock()
+        self.snapshot = None
+        self.snapshot_generation = None
+        self.snapshot_lock = threading.Lock()
+        self.snapshot_time_checked = 0
 
         try:
             self.index_template = IndexTemplate.objects.get(slug=index_slug)
@@ -219,41 +249,34 @@ class IndexFilesystem(LoggingMixIn, Operations):
             exit(1)
 
     def access(self, path, fh=None):
-        result = self._path_to_node(
-            path=path, access_only=True, directory_only=False
-        )
+        snapshot = self._get_snapshot()
 
-        if not result:
+        if path not in snapshot.directories and path not in snapshot.files:
             raise FuseOSError(ENOENT)
 
     def getattr(self, path, fh=None):
         logger.debug('path: %s, fh: %s', path, fh)
 
         now = time()
-        result = self._path_to_node(path=path, directory_only=False)
-
-        if not result:
-            raise FuseOSError(ENOENT)
+        snapshot = self._get_snapshot()
 
         # st_nlink tracks the number of hard links to a file.
         # Must be 2 for directories and at least 1 for files
         # https://www.gnu.org/software/libc/manual/html_node/Attribute-Meanings.html
-        if isinstance(result, IndexInstanceNode):
+        if path in snapshot.directories:
             function_result = {
                 'st_mode': (S_IFDIR | DIRECTORY_MODE), 'st_ctime': now,
                 'st_mtime': now, 'st_atime': now, 'st_nlink': 2
             }
         else:
+            try:
+                document_file_pk, ctime, mtime, size = snapshot.files[path]
+            except KeyError:
+                raise FuseOSError(ENOENT)
+
             function_result = {
-                'st_mode': (S_IFREG | FILE_MODE),
-                'st_ctime': (
-                    result.datetime_created.replace(tzinfo=None) - result.datetime_created.utcoffset() - datetime.datetime(1970, 1, 1)
-                ).total_seconds(),
-                'st_mtime': (
-                    result.file_latest.timestamp.replace(tzinfo=None) - result.file_latest.timestamp.utcoffset() - datetime.datetime(1970, 1, 1)
-                ).total_seconds(),
-                'st_atime': now,
-                'st_size': result.file_latest.size or 0,
+                'st_mode': (S_IFREG | FILE_MODE), 'st_ctime': ctime,
+                'st_mtime': mtime, 'st_atime': now, 'st_size': size,
                 'st_nlink': 1
             }
 
@@ -261,53 +284,38 @@ class IndexFilesystem(LoggingMixIn, Operations):
         return function_result
 
     def open(self, path, flags):
-        result = self._path_to_node(path=path, directory_only=False)
+        try:
+            document_file_pk = self._get_snapshot().files[path][0]
+            document_file = DocumentFile.objects.get(pk=document_file_pk)
+        except (DocumentFile.DoesNotExist, KeyError):
+            raise FuseOSError(ENOENT)
 
-        if isinstance(result, Document):
+        index_filesystem_file = IndexFilesystemFile(
+            file_object=document_file.open(),
+            read_ahead_size=setting_read_ahead_size.value
+        )
+
+        with self.file_descriptors_lock:
             next_file_descriptor = self._get_next_file_descriptor()
-            self.file_descriptors[next_file_descriptor] = result.file_latest.open()
-            return next_file_descriptor
-        else:
-            raise FuseOSError(ENOENT)
+            self.file_descriptors[next_file_descriptor] = index_filesystem_file
+
+        return next_file_descriptor
 
     def read(self, path, size, offset, fh):
-        self.file_descriptors[fh].seek(offset)
-        return self.file_descriptors[fh].read(size)
+        return self.file_descriptors[fh].read(offset=offset, size=size)
 
     def readdir(self, path, fh):
         logger.debug('path: %s', path)
 
-        node = self._path_to_node(path=path, directory_only=True)
-
-        if not node:
+        try:
+            entry_names = self._get_snapshot().directories[path]
+        except KeyError:
             raise FuseOSError(ENOENT)
 
-        yield '.'
-        yield '..'
-
-        # Index instance nodes to directories
-        queryset = IndexFilesystem._clean_queryset(
-            queryset=node.get_children(), source_field_name='value',
-            destination_field_name='value_clean'
-        )
-
-        for value in queryset.values_list('value_clean', flat=True):
-            yield value
-
-        # Documents
-        if node.index_template_node.link_documents:
-            queryset = Document.valid.filter(
-                pk__in=node.documents.values('pk')
-            )
-
-            queryset = IndexFilesystem._clean_queryset(
-                queryset=queryset, source_field_name='label',
-                destination_field_name='label_clean'
-            )
-
-            for value in queryset.values_list('label_clean', flat=True):
-                yield value
+        return ['.', '..'] + list(entry_names)
 
     def release(self, path, fh):
-        self.file_descriptors[fh] = None
-        del(self.file_descriptors[fh])
+        with self.file_descriptors_lock:
+            index_filesystem_file = self.file_descriptors.pop(fh)
+
+        index_filesystem_file.close()
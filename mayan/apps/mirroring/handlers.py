@@ -1,9 +1,50 @@
+from django.apps import apps
+
 from .runtime import cache
 
 
-def handler_document_cache_delete(sender, **kwargs):
-    cache.clear_document(document=kwargs['instance'])
+def _clear_document_snapshots(document_id):
+    IndexInstanceNode = apps.get_model(
+        app_label='document_indexing', model_name='IndexInstanceNode'
+    )
+
+    queryset = IndexInstanceNode.objects.filter(
+        documents=document_id
+    ).values_list('index_template_node__index_id', flat=True).distinct()
+
+    for index_template_id in queryset:
+        cache.clear_snapshot(index_template_id=index_template_id)
+
+
+def handler_document_snapshot_cache_delete(sender, **kwargs):
+    _clear_document_snapshots(document_id=kwargs['instance'].pk)
+
+
+def handler_document_file_snapshot_cache_delete(sender, **kwargs):
+    _clear_document_snapshots(document_id=kwargs['instance'].document_id)
+
+
+def handler_node_documents_snapshot_cache_delete(sender, **kwargs):
+    IndexInstanceNode = apps.get_model(
+        app_label='document_indexing', model_name='IndexInstanceNode'
+    )
+
+    if kwargs['reverse']:
+        # The documents of the nodes are changed from the document side.
+        if kwargs['pk_set']:
+            queryset = IndexInstanceNode.objects.filter(
+                pk__in=kwargs['pk_set']
+            )
+        else:
+            queryset = IndexInstanceNode.objects.filter(
+                documents=kwargs['instance']
+            )
+
+        for index_template_id in queryset.values_list('index_template_node__index_id', flat=True).distinct():
+            cache.clear_snapshot(index_template_id=index_template_id)
+    else:
+        cache.clear_node_snapshot(node=kwargs['instance'])
 
 
-def handler_node_cache_delete(sender, **kwargs):
-    cache.clear_node(node=kwargs['instance'])
+def handler_node_snapshot_cache_delete(sender, **kwargs):
+    cache.clear_node_snapshot(node=kwargs['instance'])
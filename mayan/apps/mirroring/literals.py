@@ -1,5 +1,5 @@
-DEFAULT_MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT = 10
-DEFAULT_MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT = 10
+DEFAULT_MIRRORING_READ_AHEAD_SIZE = 2 ** 20  # 1 Megabyte
+DEFAULT_MIRRORING_SNAPSHOT_CHECK_INTERVAL = 1
 
 FILE_MODE = DIRECTORY_MODE = 0o555
 
@@ -32,6 +32,12 @@ class Command(management.BaseCommand):
             default=False,
             help='Mounts and serves the index as a background process.'
         )
+        parser.add_argument(
+            '--single-thread', action='store_true', dest='single_thread',
+            default=False,
+            help='Serve the filesystem operations from a single thread '
+            'instead of concurrently.'
+        )
         parser.add_argument(
             '--log-level', action='store', dest='log_level',
             default='ERROR',
@@ -62,7 +68,8 @@ class Command(management.BaseCommand):
         try:
             FUSE(
                 operations=IndexFilesystem(index_slug=options['slug']),
-                mountpoint=options['mount_point'], nothreads=True,
+                mountpoint=options['mount_point'],
+                nothreads=options['single_thread'],
                 foreground=not options['background'],
                 allow_other=options['allow_other'],
                 allow_root=options['allow_root']
@@ -3,19 +3,26 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
-    DEFAULT_MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT,
-    DEFAULT_MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT
+    DEFAULT_MIRRORING_READ_AHEAD_SIZE,
+    DEFAULT_MIRRORING_SNAPSHOT_CHECK_INTERVAL
 )
 
 namespace = SettingNamespace(label=_('Mirroring'), name='mirroring')
 
-setting_document_lookup_cache_timeout = namespace.add_setting(
-    default=DEFAULT_MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT,
-    global_name='MIRRORING_DOCUMENT_CACHE_LOOKUP_TIMEOUT',
-    help_text=_('Time in seconds to cache the path lookup to a document.')
+setting_read_ahead_size = namespace.add_setting(
+    default=DEFAULT_MIRRORING_READ_AHEAD_SIZE,
+    global_name='MIRRORING_READ_AHEAD_SIZE',
+    help_text=_(
+        'Size in bytes of the blocks read from the storage for each open '
+        'file. Sequential reads smaller than this are served from memory.'
+    )
 )
-setting_node_lookup_cache_timeout = namespace.add_setting(
-    default=DEFAULT_MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT,
-    global_name='MIRRORING_NODE_CACHE_LOOKUP_TIMEOUT',
-    help_text=_('Time in seconds to cache the path lookup to an index node.')
+setting_snapshot_check_interval = namespace.add_setting(
+    default=DEFAULT_MIRRORING_SNAPSHOT_CHECK_INTERVAL,
+    global_name='MIRRORING_SNAPSHOT_CHECK_INTERVAL',
+    help_text=_(
+        'Time in seconds between checks for changes of the index tree. '
+        'Mounted indexes load their snapshot of the tree again when it '
+        'changes.'
+    )
 )
@@ -1,56 +1,41 @@
 import warnings
 
-from mayan.apps.testing.tests.base import BaseTestCase
+from mayan.apps.testing.tests.base import BaseTransactionTestCase
 
 from ..caches import IndexFilesystemCache
 
 from .literals import (
-    TEST_CACHE_KEY_BAD_CHARACTERS, TEST_DOCUMENT_PK, TEST_KEY_UNICODE,
-    TEST_KEY_UNICODE_HASH, TEST_NODE_PK, TEST_PATH,
+    TEST_CACHE_KEY_BAD_CHARACTERS, TEST_INDEX_TEMPLATE_ID, TEST_KEY_UNICODE,
+    TEST_KEY_UNICODE_HASH
 )
 
 
-class MockDocument:
-    pk = TEST_DOCUMENT_PK
-
-
-class MockNode:
-    pk = TEST_NODE_PK
-
-
-class IndexFilesystemCacheTestCase(BaseTestCase):
+class IndexFilesystemCacheTestCase(BaseTransactionTestCase):
     def setUp(self):
         super().setUp()
         self.cache = IndexFilesystemCache()
-        self.test_document = MockDocument()
-        self.node = MockNode()
 
-    def test_set_path_document(self):
-        self.cache.set_path(path=TEST_PATH, document=self.test_document)
-        self.assertEqual(
-            {'document_pk': TEST_DOCUMENT_PK},
-            self.cache.get_path(path=TEST_PATH)
+    def test_clear_snapshot(self):
+        generation = self.cache.get_snapshot_generation(
+            index_template_id=TEST_INDEX_TEMPLATE_ID
+        )
+        generation_other = self.cache.get_snapshot_generation(
+            index_template_id=TEST_INDEX_TEMPLATE_ID + 1
         )
 
-    def test_set_path_document_clear_document(self):
-        self.cache.set_path(path=TEST_PATH, document=self.test_document)
-        self.cache.clear_document(document=self.test_document)
-
-        self.assertEqual(None, self.cache.get_path(path=TEST_PATH))
+        self.cache.clear_snapshot(index_template_id=TEST_INDEX_TEMPLATE_ID)
 
-    def test_set_path_node(self):
-        self.cache.set_path(path=TEST_PATH, node=self.node)
+        self.assertNotEqual(
+            self.cache.get_snapshot_generation(
+                index_template_id=TEST_INDEX_TEMPLATE_ID
+            ), generation
+        )
         self.assertEqual(
-            {'node_pk': TEST_NODE_PK},
-            self.cache.get_path(path=TEST_PATH)
+            self.cache.get_snapshot_generation(
+                index_template_id=TEST_INDEX_TEMPLATE_ID + 1
+            ), generation_other
         )
 
-    def test_set_path_node_clear_node(self):
-        self.cache.set_path(path=TEST_PATH, node=self.node)
-        self.cache.clear_node(node=self.node)
-
-        self.assertEqual(None, self.cache.get_path(path=TEST_PATH))
-
     def test_valid_cache_key_characters(self):
         with warnings.catch_warnings(record=True) as warning_list:
             self.cache.cache.validate_key(TEST_CACHE_KEY_BAD_CHARACTERS)
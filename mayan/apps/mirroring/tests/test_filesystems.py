@@ -3,20 +3,24 @@ import unittest
 
 from fuse import FuseOSError
 
-from django.db import connection
+from django.db import connection, transaction
 from django.test import tag
 
 from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
 from mayan.apps.document_indexing.tests.mixins import IndexTemplateTestMixin
-from mayan.apps.testing.tests.base import BaseTestCase
+from mayan.apps.testing.tests.base import (
+    BaseTestCase, BaseTransactionTestCase
+)
 
 from ..filesystems import IndexFilesystem
+from ..runtime import cache
+from ..settings import setting_snapshot_check_interval
 
 from .literals import (
     TEST_NODE_EXPRESSION, TEST_NODE_EXPRESSION_INVALID,
     TEST_NODE_EXPRESSION_MULTILINE, TEST_NODE_EXPRESSION_MULTILINE_EXPECTED,
     TEST_NODE_EXPRESSION_MULTILINE_2,
-    TEST_NODE_EXPRESSION_MULTILINE_2_EXPECTED
+    TEST_NODE_EXPRESSION_MULTILINE_2_EXPECTED, TEST_READ_SIZE
 )
 
 
@@ -131,6 +135,38 @@ class IndexFilesystemTestCase(
             self.test_document.file_latest.checksum
         )
 
+    def test_document_read_sequential(self):
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression=TEST_NODE_EXPRESSION, link_documents=True
+        )
+
+        self._upload_test_document()
+        index_filesystem = IndexFilesystem(index_slug=self.test_index_template.slug)
+
+        file_handle = index_filesystem.open(
+            path='/{}/{}'.format(TEST_NODE_EXPRESSION, self.test_document.label),
+            flags='rb'
+        )
+
+        hash_object = hashlib.sha256()
+        offset = 0
+        while True:
+            data = index_filesystem.read(
+                fh=file_handle, offset=offset, path=None, size=TEST_READ_SIZE
+            )
+            if not data:
+                break
+
+            hash_object.update(data)
+            offset += len(data)
+
+        index_filesystem.release(path=None, fh=file_handle)
+
+        self.assertEqual(
+            hash_object.hexdigest(), self.test_document.file_latest.checksum
+        )
+
     def test_multiline_indexes(self):
         self.test_index_template.node_templates.create(
             parent=self.test_index_template.template_root,
@@ -369,3 +405,96 @@ class IndexFilesystemTestCase(
                 index_filesystem.readdir('/level_1', '')
             )[2], self.test_document.label
         )
+
+
+@tag('mirroring')
+@unittest.skipIf(connection.vendor == 'mysql', 'Known to fail due to unsupported feature of database manager.')
+class IndexFilesystemSnapshotTestCase(
+    IndexTemplateTestMixin, DocumentTestMixin, BaseTransactionTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_index_template(add_test_document_type=True)
+
+        old_value = setting_snapshot_check_interval.value
+        setting_snapshot_check_interval.set(value=0)
+        self.addCleanup(setting_snapshot_check_interval.set, value=old_value)
+
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression=TEST_NODE_EXPRESSION, link_documents=True
+        )
+
+    def test_document_rename_snapshot_reload(self):
+        self._upload_test_document()
+        index_filesystem = IndexFilesystem(index_slug=self.test_index_template.slug)
+
+        self.assertEqual(
+            list(index_filesystem.readdir('/level_1', ''))[2:],
+            [self.test_document.label]
+        )
+
+        self.test_document.label = 'Document of 2019/12'
+        self.test_document.save()
+
+        self.assertEqual(
+            list(index_filesystem.readdir('/level_1', ''))[2:],
+            ['Document of 2019_12']
+        )
+
+    def test_index_rebuild_snapshot_reload(self):
+        self._upload_test_document()
+        index_filesystem = IndexFilesystem(index_slug=self.test_index_template.slug)
+
+        self.assertEqual(
+            list(index_filesystem.readdir('/level_1', ''))[2:],
+            [self.test_document.label]
+        )
+
+        self.test_index_template.node_templates.update(link_documents=False)
+        self.test_index_template.rebuild()
+
+        self.assertEqual(
+            list(index_filesystem.readdir('/level_1', ''))[2:], []
+        )
+
+    def test_snapshot_generation_per_index(self):
+        self._upload_test_document()
+        self._create_test_index_template(add_test_document_type=True)
+
+        generation = cache.get_snapshot_generation(
+            index_template_id=self.test_index_templates[0].pk
+        )
+
+        self.test_index_templates[1].rebuild()
+
+        self.assertEqual(
+            cache.get_snapshot_generation(
+                index_template_id=self.test_index_templates[0].pk
+            ), generation
+        )
+
+    def test_snapshot_generation_transaction(self):
+        self._upload_test_document()
+
+        generation = cache.get_snapshot_generation(
+            index_template_id=self.test_index_template.pk
+        )
+
+        with transaction.atomic():
+            self.test_document.label = 'Document of 2019/12'
+            self.test_document.save()
+
+            self.assertEqual(
+                cache.get_snapshot_generation(
+                    index_template_id=self.test_index_template.pk
+                ), generation
+            )
+
+        self.assertNotEqual(
+            cache.get_snapshot_generation(
+                index_template_id=self.test_index_template.pk
+            ), generation
+        )
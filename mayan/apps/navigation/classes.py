@@ -75,7 +75,10 @@ class Link:
         if name:
             self.__class__._registry[name] = self
 
-    def resolve(self, context=None, request=None, resolved_object=None):
+    def resolve(
+        self, context=None, request=None, resolved_object=None,
+        current_view_name=None
+    ):
         if not context and not request:
             raise ImproperlyConfigured(
                 'Must provide a context or a request in order to resolve the '
@@ -97,8 +100,9 @@ class Link:
             except AttributeError:
                 request = Variable('request').resolve(context=context)
 
-        current_path = request.META['PATH_INFO']
-        current_view_name = resolve(current_path).view_name
+        if not current_view_name:
+            current_path = request.META['PATH_INFO']
+            current_view_name = resolve(current_path).view_name
 
         # ACL is tested agains the resolved_object or just {{ object }} if not
         if not resolved_object:
@@ -111,10 +115,13 @@ class Link:
         # too
         if self.permissions:
             if resolved_object:
+                # Resolve the access of the rest of the objects of a list
+                # view along with this one.
                 try:
-                    AccessControlList.objects.check_access(
-                        obj=resolved_object, permissions=self.permissions,
-                        user=request.user
+                    AccessControlList.objects.check_request_access(
+                        obj=resolved_object,
+                        object_list=context.get('object_list'),
+                        permissions=self.permissions, request=request
                     )
                 except PermissionDenied:
                     return None
@@ -385,6 +392,7 @@ class Menu:
                             for link in links:
                                 resolved_link = link.resolve(
                                     context=context,
+                                    current_view_name=current_view_name,
                                     resolved_object=resolved_navigation_object
                                 )
                                 if resolved_link:
@@ -397,6 +405,7 @@ class Menu:
                             for link in links:
                                 resolved_link = link.resolve(
                                     context=context,
+                                    current_view_name=current_view_name,
                                     resolved_object=resolved_navigation_object
                                 )
                                 if resolved_link:
@@ -432,7 +441,9 @@ class Menu:
         resolved_links = []
         # View links
         for link in self.bound_links.get(current_view_name, []):
-            resolved_link = link.resolve(context=context)
+            resolved_link = link.resolve(
+                context=context, current_view_name=current_view_name
+            )
             if resolved_link:
                 if resolved_link.link not in self.unbound_links.get(current_view_name, ()):
                     resolved_links.append(resolved_link)
@@ -455,7 +466,9 @@ class Menu:
                     resolved_links.append(link)
             else:
                 # "Always show" links
-                resolved_link = link.resolve(context=context)
+                resolved_link = link.resolve(
+                    context=context, current_view_name=current_view_name
+                )
                 if resolved_link:
                     if resolved_link.link not in self.unbound_links.get(None, ()):
                         resolved_links.append(resolved_link)
@@ -857,7 +870,8 @@ class SourceColumn:
         if self.widget:
             if self.check_widget_condition(context=context):
                 widget_instance = self.widget(
-                    column=self, request=context['request']
+                    column=self, object_list=context.get('object_list'),
+                    request=context['request']
                 )
                 return widget_instance.render(value=result)
 
@@ -8,8 +8,9 @@ class SourceColumnWidget:
     template_name = None
     template_string = None
 
-    def __init__(self, column, request):
+    def __init__(self, column, request, object_list=None):
         self.column = column
+        self.object_list = object_list
         self.request = request
 
     def get_extra_context(self):
@@ -8,7 +8,9 @@ from .models import (
 
 @admin.register(DocumentTypeOCRSettings)
 class DocumentTypeOCRSettingsAdmin(admin.ModelAdmin):
-    list_display = ('document_type', 'auto_ocr')
+    list_display = (
+        'document_type', 'auto_ocr', 'text_layer_minimum_characters'
+    )
 
 
 @admin.register(DocumentVersionOCRError)
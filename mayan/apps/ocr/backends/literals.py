@@ -6,3 +6,5 @@ else:
     DEFAULT_TESSERACT_BINARY_PATH = '/usr/bin/tesseract'
 
 DEFAULT_TESSERACT_TIMEOUT = 600  # 600 seconds, 10 minutes
+
+DEFAULT_TESSERACT_LIBRARY_NAME = 'tesseract'
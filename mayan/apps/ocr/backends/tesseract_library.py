@@ -0,0 +1,195 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import threading
+
+from django.utils.encoding import force_bytes, force_text
+from django.utils.translation import ugettext_lazy as _
+
+from ..classes import OCRBackendBase
+from ..exceptions import OCRError
+
+from .literals import DEFAULT_TESSERACT_LIBRARY_NAME
+
+logger = logging.getLogger(name=__name__)
+
+
+class TesseractEngine:
+    """
+    Initialized instance of the Tesseract API for a language. The API is
+    not thread safe, calls are serialized with a lock.
+    """
+    def __init__(self, library, data_path, language):
+        self.library = library
+        self.lock = threading.Lock()
+        self.handle = library.TessBaseAPICreate()
+
+        result = library.TessBaseAPIInit3(
+            self.handle, force_bytes(s=data_path) if data_path else None,
+            force_bytes(s=language) if language else None
+        )
+        if result != 0:
+            library.TessBaseAPIDelete(self.handle)
+            raise OCRError(
+                'Unable to initialize Tesseract with language option: {}. '
+                'The requested OCR language is not available and needs to '
+                'be installed.'.format(language)
+            )
+
+    def recognize(self, image):
+        if image.mode not in ('L', 'RGB'):
+            image = image.convert('RGB')
+
+        bytes_per_pixel = len(image.getbands())
+        width, height = image.size
+        image_data = image.tobytes()
+
+        with self.lock:
+            try:
+                self.library.TessBaseAPISetImage(
+                    self.handle, image_data, width, height, bytes_per_pixel,
+                    width * bytes_per_pixel
+                )
+
+                resolution = image.info.get('dpi')
+                if resolution:
+                    self.library.TessBaseAPISetSourceResolution(
+                        self.handle, int(resolution[0])
+                    )
+
+                text_pointer = self.library.TessBaseAPIGetUTF8Text(
+                    self.handle
+                )
+                if not text_pointer:
+                    raise OCRError('Tesseract did not return a result.')
+
+                try:
+                    return force_text(s=ctypes.string_at(text_pointer))
+                finally:
+                    self.library.TessDeleteText(text_pointer)
+            finally:
+                self.library.TessBaseAPIClear(self.handle)
+
+
+class TesseractLibrary(OCRBackendBase):
+    """
+    Backend that calls the Tesseract library in process instead of
+    executing the binary for each page. The engines are created on first
+    use and kept for the life of the worker process, one per language, so
+    that the language data is loaded once and reused for all pages.
+    """
+    _engines = {}
+    _engines_lock = threading.Lock()
+    _libraries = {}
+
+    @staticmethod
+    def _load_library(library_path):
+        library = ctypes.CDLL(library_path)
+
+        library.TessBaseAPIClear.argtypes = (ctypes.c_void_p,)
+        library.TessBaseAPIClear.restype = None
+        library.TessBaseAPICreate.argtypes = ()
+        library.TessBaseAPICreate.restype = ctypes.c_void_p
+        library.TessBaseAPIDelete.argtypes = (ctypes.c_void_p,)
+        library.TessBaseAPIDelete.restype = None
+        library.TessBaseAPIGetUTF8Text.argtypes = (ctypes.c_void_p,)
+        library.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
+        library.TessBaseAPIInit3.argtypes = (
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p
+        )
+        library.TessBaseAPIInit3.restype = ctypes.c_int
+        library.TessBaseAPISetImage.argtypes = (
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int,
+            ctypes.c_int, ctypes.c_int
+        )
+        library.TessBaseAPISetImage.restype = None
+        library.TessBaseAPISetSourceResolution.argtypes = (
+            ctypes.c_void_p, ctypes.c_int
+        )
+        library.TessBaseAPISetSourceResolution.restype = None
+        library.TessDeleteText.argtypes = (ctypes.c_void_p,)
+        library.TessDeleteText.restype = None
+        library.TessVersion.argtypes = ()
+        library.TessVersion.restype = ctypes.c_char_p
+
+        return library
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read_settings()
+
+        if kwargs.get('auto_initialize', True):
+            self.initialize()
+
+    def execute(self, *args, **kwargs):
+        super().execute(*args, **kwargs)
+
+        if not self.converter.image:
+            self.converter.seek_page(page_number=0)
+
+        try:
+            return self.get_engine(language=self.language).recognize(
+                image=self.converter.image
+            )
+        except OCRError:
+            raise
+        except Exception as exception:
+            error_message = (
+                'Exception calling the Tesseract library with language '
+                'option: {}; {}'
+            ).format(self.language, exception)
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
+
+    def get_engine(self, language):
+        key = (self.library_path, self.data_path, language)
+
+        with self.__class__._engines_lock:
+            try:
+                return self.__class__._engines[key]
+            except KeyError:
+                logger.debug(
+                    'Initializing Tesseract engine for language: %s', language
+                )
+                engine = TesseractEngine(
+                    data_path=self.data_path, language=language,
+                    library=self.library
+                )
+                self.__class__._engines[key] = engine
+                return engine
+
+    def initialize(self):
+        if not self.library_path:
+            raise OCRError(_('Tesseract library not found.'))
+
+        with self.__class__._engines_lock:
+            try:
+                self.library = self.__class__._libraries[self.library_path]
+            except KeyError:
+                # OpenMP reads its settings when the library is loaded.
+                os.environ.update(self.environment)
+
+                try:
+                    self.library = self._load_library(
+                        library_path=self.library_path
+                    )
+                except (AttributeError, OSError, TypeError) as exception:
+                    raise OCRError(
+                        _('Tesseract library not found; %s') % exception
+                    )
+                else:
+                    self.__class__._libraries[self.library_path] = self.library
+                    logger.debug(
+                        'Tesseract library version: %s',
+                        force_text(s=self.library.TessVersion())
+                    )
+
+    def read_settings(self):
+        self.data_path = self.kwargs.get('data_path')
+        self.environment = self.kwargs.get('environment', {})
+        self.library_path = self.kwargs.get(
+            'library_path', ctypes.util.find_library(
+                DEFAULT_TESSERACT_LIBRARY_NAME
+            )
+        )
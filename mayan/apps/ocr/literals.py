@@ -1,6 +1,21 @@
+from django.utils.translation import ugettext_lazy as _
+
+DEFAULT_BENCHMARK_BACKENDS = (
+    'mayan.apps.ocr.backends.tesseract.Tesseract',
+    'mayan.apps.ocr.backends.tesseract_library.TesseractLibrary',
+)
+DEFAULT_BENCHMARK_PAGES = 20
+
 DEFAULT_OCR_AUTO_OCR = True
 DEFAULT_OCR_BACKEND = 'mayan.apps.ocr.backends.tesseract.Tesseract'
 DEFAULT_OCR_BACKEND_ARGUMENTS = {'environment': {'OMP_THREAD_LIMIT': '1'}}
 
+OCR_SKIP_REASON_PARSED_CONTENT = 'parsed_content'
+OCR_SKIP_REASON_TEXT_LAYER = 'text_layer'
+OCR_SKIP_REASON_CHOICES = (
+    (OCR_SKIP_REASON_PARSED_CONTENT, _('Parsed content available')),
+    (OCR_SKIP_REASON_TEXT_LAYER, _('Text layer found'))
+)
+
 TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY = 10
 TASK_DOCUMENT_VERSION_PAGE_OCR_TIMEOUT = 10 * 60  # 10 Minutes per page
@@ -0,0 +1,87 @@
+import time
+from io import BytesIO
+
+from django.apps import apps
+from django.core import management
+from django.utils.module_loading import import_string
+from django.utils.translation import ugettext_lazy as _
+
+from ...exceptions import OCRError
+from ...literals import DEFAULT_BENCHMARK_BACKENDS, DEFAULT_BENCHMARK_PAGES
+from ...settings import setting_ocr_backend_arguments
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Measure the pages per second throughput of OCR backends on the '
+        'images of existing document version pages.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backend', action='append', dest='backends',
+            help=_(
+                'Dotted path of an OCR backend to measure. Can be specified '
+                'multiple times. Defaults to the Tesseract backends.'
+            )
+        )
+        parser.add_argument(
+            '--pages', action='store', default=DEFAULT_BENCHMARK_PAGES,
+            dest='pages', type=int,
+            help=_('Number of document version pages to process.')
+        )
+
+    def get_page_images(self, pages):
+        DocumentVersionPage = apps.get_model(
+            app_label='documents', model_name='DocumentVersionPage'
+        )
+
+        result = []
+        queryset = DocumentVersionPage.objects.select_related(
+            'document_version__document'
+        ).order_by('pk')[:pages]
+
+        for document_version_page in queryset:
+            cache_filename = document_version_page.generate_image()
+            with document_version_page.cache_partition.get_file(filename=cache_filename).open() as file_object:
+                result.append(
+                    (
+                        file_object.read(),
+                        document_version_page.document_version.document.language
+                    )
+                )
+
+        return result
+
+    def handle(self, *args, **options):
+        page_images = self.get_page_images(pages=options['pages'])
+
+        if not page_images:
+            self.stderr.write('No document version pages to process.')
+            return
+
+        for dotted_path in options['backends'] or DEFAULT_BENCHMARK_BACKENDS:
+            try:
+                # Backends are initialized inside the measurement as the
+                # setup cost is part of what is being compared.
+                start = time.time()
+                backend = import_string(dotted_path=dotted_path)(
+                    **setting_ocr_backend_arguments.value
+                )
+
+                for image_data, language in page_images:
+                    backend.execute(
+                        file_object=BytesIO(image_data), language=language
+                    )
+                elapsed = time.time() - start
+            except OCRError as exception:
+                self.stderr.write(
+                    '{}: unavailable; {}'.format(dotted_path, exception)
+                )
+            else:
+                self.stdout.write(
+                    '{}: {:.2f} pages/s, {} pages, {:.2f} s'.format(
+                        dotted_path, len(page_images) / elapsed,
+                        len(page_images), elapsed
+                    )
+                )
@@ -8,6 +8,9 @@ from mayan.apps.lock_manager.backends.base import LockingBackend
 
 from .classes import OCRBackendBase
 from .events import event_ocr_document_version_content_deleted
+from .literals import (
+    OCR_SKIP_REASON_PARSED_CONTENT, OCR_SKIP_REASON_TEXT_LAYER
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -25,6 +28,99 @@ class DocumentVersionPageOCRContentManager(models.Manager):
                 target=document_version
             )
 
+    def get_text_layers(self, document_version):
+        """
+        Return a dictionary of the text layer and the reason to skip the
+        OCR backend of the pages of the document version whose text layer is
+        long enough for the settings of the document type. The parsed
+        content of the document file pages is used when available,
+        otherwise each document file is parsed once, without storing the
+        result, to probe for a text layer.
+        """
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
+        DocumentTypeOCRSettings = apps.get_model(
+            app_label='ocr', model_name='DocumentTypeOCRSettings'
+        )
+
+        try:
+            DocumentFilePageContent = apps.get_model(
+                app_label='document_parsing',
+                model_name='DocumentFilePageContent'
+            )
+        except LookupError:
+            return {}
+
+        try:
+            minimum_characters = DocumentTypeOCRSettings.objects.get(
+                document_type=document_version.document.document_type
+            ).text_layer_minimum_characters
+        except DocumentTypeOCRSettings.DoesNotExist:
+            return {}
+
+        if not minimum_characters:
+            return {}
+
+        document_file_pages = {}
+        for document_version_page in document_version.pages.all():
+            document_file_page = document_version_page.content_object
+            if isinstance(document_file_page, DocumentFilePage):
+                document_file_pages[document_version_page.pk] = document_file_page
+
+        parsed_contents = dict(
+            DocumentFilePageContent.objects.filter(
+                document_file_page__in=document_file_pages.values()
+            ).values_list('document_file_page_id', 'content')
+        )
+
+        document_file_contents = {}
+        result = {}
+
+        for document_version_page_id, document_file_page in document_file_pages.items():
+            content = parsed_contents.get(document_file_page.pk)
+            skip_reason = OCR_SKIP_REASON_PARSED_CONTENT
+
+            if content is None:
+                document_file_id = document_file_page.document_file_id
+                if document_file_id not in document_file_contents:
+                    document_file_contents[document_file_id] = DocumentFilePageContent.objects.get_document_file_contents(
+                        document_file=document_file_page.document_file
+                    ) or ()
+
+                try:
+                    content = document_file_contents[document_file_id][
+                        document_file_page.page_number - 1
+                    ]
+                except IndexError:
+                    content = None
+
+                skip_reason = OCR_SKIP_REASON_TEXT_LAYER
+
+            if content and len(''.join(content.split())) >= minimum_characters:
+                result[document_version_page_id] = (content, skip_reason)
+
+        return result
+
+    def process_document_version_text_layers(self, document_version):
+        """
+        Store the text layers of the document version pages as their OCR
+        content. Return the IDs of the pages that do not need OCR.
+        """
+        text_layers = self.get_text_layers(document_version=document_version)
+
+        for document_version_page_id, (content, skip_reason) in text_layers.items():
+            self.update_or_create(
+                document_version_page_id=document_version_page_id,
+                defaults={'content': content, 'skip_reason': skip_reason}
+            )
+            logger.info(
+                'Skipped OCR of page ID: %d of document version: %s; %s',
+                document_version_page_id, document_version, skip_reason
+            )
+
+        return set(text_layers)
+
     def process_document_version_page(
         self, document_version_page, user=None
     ):
@@ -42,8 +138,8 @@ class DocumentVersionPageOCRContentManager(models.Manager):
 
         try:
             document_version_page_lock = LockingBackend.get_backend().acquire_lock(
-                name=lock_name, timeout=DOCUMENT_IMAGE_TASK_TIMEOUT * 2
-
+                blocking=True, name=lock_name,
+                timeout=DOCUMENT_IMAGE_TASK_TIMEOUT * 2
             )
         except Exception:
             raise
@@ -60,7 +156,7 @@ class DocumentVersionPageOCRContentManager(models.Manager):
                     )
                     DocumentVersionPageOCRContent.objects.update_or_create(
                         document_version_page=document_version_page, defaults={
-                            'content': ocr_content
+                            'content': ocr_content, 'skip_reason': ''
                         }
                     )
             except Exception as exception:
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('ocr', '0010_auto_20210304_1215'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttypeocrsettings',
+            name='text_layer_minimum_characters',
+            field=models.PositiveIntegerField(
+                default=0, help_text='Pages with a text layer of at least '
+                'this many non blank characters are not processed by the '
+                'OCR backend. The text of the page is used as the OCR '
+                'content instead. Use 0 to process all pages.',
+                verbose_name='Text layer minimum characters'
+            ),
+        ),
+        migrations.AddField(
+            model_name='documentversionpageocrcontent',
+            name='skip_reason',
+            field=models.CharField(
+                blank=True, choices=[
+                    ('parsed_content', 'Parsed content available'),
+                    ('text_layer', 'Text layer found')
+                ], help_text='Reason the page was not processed by the OCR '
+                'backend.', max_length=32, verbose_name='Skip reason'
+            ),
+        ),
+    ]
@@ -6,6 +6,7 @@ from mayan.apps.documents.models.document_type_models import DocumentType
 from mayan.apps.documents.models.document_version_models import DocumentVersion
 from mayan.apps.documents.models.document_version_page_models import DocumentVersionPage
 
+from .literals import OCR_SKIP_REASON_CHOICES
 from .managers import (
     DocumentVersionPageOCRContentManager, DocumentTypeSettingsManager
 )
@@ -23,6 +24,14 @@ class DocumentTypeOCRSettings(models.Model):
         default=True,
         verbose_name=_('Automatically queue newly created documents for OCR.')
     )
+    text_layer_minimum_characters = models.PositiveIntegerField(
+        default=0, help_text=_(
+            'Pages with a text layer of at least this many non blank '
+            'characters are not processed by the OCR backend. The text of '
+            'the page is used as the OCR content instead. Use 0 to process '
+            'all pages.'
+        ), verbose_name=_('Text layer minimum characters')
+    )
 
     objects = DocumentTypeSettingsManager()
 
@@ -71,6 +80,11 @@ class DocumentVersionPageOCRContent(models.Model):
             'The actual text content extracted by the OCR backend.'
         ), verbose_name=_('Content')
     )
+    skip_reason = models.CharField(
+        blank=True, choices=OCR_SKIP_REASON_CHOICES, help_text=_(
+            'Reason the page was not processed by the OCR backend.'
+        ), max_length=32, verbose_name=_('Skip reason')
+    )
 
     objects = DocumentVersionPageOCRContentManager()
 
@@ -5,11 +5,12 @@ from .models import DocumentVersionPageOCRContent, DocumentTypeOCRSettings
 
 class DocumentVersionPageOCRContentSerializer(serializers.ModelSerializer):
     class Meta:
-        fields = ('content',)
+        fields = ('content', 'skip_reason')
         model = DocumentVersionPageOCRContent
+        read_only_fields = ('skip_reason',)
 
 
 class DocumentTypeOCRSettingsSerializer(serializers.ModelSerializer):
     class Meta:
-        fields = ('auto_ocr',)
+        fields = ('auto_ocr', 'text_layer_minimum_characters')
         model = DocumentTypeOCRSettings
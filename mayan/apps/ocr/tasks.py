@@ -24,25 +24,36 @@ def task_document_version_ocr_process(self, document_version_id, user_id=None):
     DocumentVersion = apps.get_model(
         app_label='documents', model_name='DocumentVersion'
     )
+    DocumentVersionPageOCRContent = apps.get_model(
+        app_label='ocr', model_name='DocumentVersionPageOCRContent'
+    )
 
     document_version = DocumentVersion.objects.get(
         pk=document_version_id
     )
 
     try:
+        skipped_page_ids = DocumentVersionPageOCRContent.objects.process_document_version_text_layers(
+            document_version=document_version
+        )
+
         document_version_page_tasks = []
-        for document_version_page in document_version.pages.all():
+        for document_version_page in document_version.pages.exclude(pk__in=skipped_page_ids):
             document_version_page_tasks.append(
                 task_document_version_page_ocr_process.s(
                     document_version_page_id=document_version_page.pk,
                     user_id=user_id
                 )
             )
-        chord(document_version_page_tasks)(
-            task_document_version_ocr_finished.s(
-                document_version_id=document_version.pk, user_id=user_id
-            )
+
+        finished_task = task_document_version_ocr_finished.s(
+            document_version_id=document_version.pk, user_id=user_id
         )
+
+        if document_version_page_tasks:
+            chord(document_version_page_tasks)(finished_task)
+        else:
+            finished_task.delay(results=())
     except Exception as exception:
         document_version.ocr_errors.create(result=exception)
         raise
@@ -3,6 +3,7 @@
 TEST_DOCUMENT_VERSION_OCR_CONTENT = 'Mayan EDMS Documentation'
 TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_1 = 'Repository für elektronische Dokumente.'
 TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2 = 'Es bietet einen'
+TEST_DOCUMENT_VERSION_OCR_TEXT_LAYER_CONTENT = 'Sample text'
 TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT = 'test content'
 TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT_UPDATED = 'updated content'
 
@@ -0,0 +1,33 @@
+import ctypes.util
+import unittest
+
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+
+from ..backends.literals import DEFAULT_TESSERACT_LIBRARY_NAME
+from ..backends.tesseract_library import TesseractLibrary
+from ..exceptions import OCRError
+
+from .literals import TEST_DOCUMENT_VERSION_OCR_CONTENT
+
+
+class TesseractLibraryBackendTestCase(GenericDocumentTestCase):
+    def test_library_not_found(self):
+        with self.assertRaises(expected_exception=OCRError):
+            TesseractLibrary(library_path='/non_existent_library.so')
+
+    @unittest.skipUnless(
+        ctypes.util.find_library(DEFAULT_TESSERACT_LIBRARY_NAME),
+        'Tesseract library not available.'
+    )
+    def test_execute(self):
+        test_document_version_page = self.test_document_version.pages.first()
+        cache_filename = test_document_version_page.generate_image()
+
+        backend = TesseractLibrary()
+
+        with test_document_version_page.cache_partition.get_file(filename=cache_filename).open() as file_object:
+            content = backend.execute(
+                file_object=file_object, language='eng'
+            )
+
+        self.assertTrue(TEST_DOCUMENT_VERSION_OCR_CONTENT in content)
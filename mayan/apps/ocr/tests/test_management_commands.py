@@ -0,0 +1,22 @@
+from io import StringIO
+
+from django.core import management
+
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+
+
+class BenchmarkOCRManagementCommandTestCase(GenericDocumentTestCase):
+    def test_benchmarkocr_command(self):
+        backend_string = 'mayan.apps.ocr.backends.tesseract.Tesseract'
+        stderr = StringIO()
+        stdout = StringIO()
+
+        management.call_command(
+            command_name='benchmarkocr', backends=[backend_string], pages=1,
+            stderr=stderr, stdout=stdout
+        )
+
+        # The backend is either measured or reported as unavailable.
+        self.assertTrue(
+            backend_string in stdout.getvalue() + stderr.getvalue()
+        )
@@ -1,11 +1,17 @@
 from django.test import override_settings
 
+from mayan.apps.document_parsing.models import DocumentFilePageContent
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
-from mayan.apps.documents.tests.literals import TEST_DEU_DOCUMENT_PATH
+from mayan.apps.documents.tests.literals import (
+    TEST_DEU_DOCUMENT_PATH, TEST_HYBRID_DOCUMENT
+)
+
+from ..literals import OCR_SKIP_REASON_TEXT_LAYER
 
 from .literals import (
     TEST_DOCUMENT_VERSION_OCR_CONTENT, TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_1,
-    TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2
+    TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2,
+    TEST_DOCUMENT_VERSION_OCR_TEXT_LAYER_CONTENT
 )
 
 
@@ -30,3 +36,43 @@ class GermanOCRSupportTestCase(GenericDocumentTestCase):
         self.assertTrue(
             TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2 in content
         )
+
+
+@override_settings(OCR_AUTO_OCR=True)
+class DocumentOCRTextLayerTestCase(GenericDocumentTestCase):
+    auto_upload_test_document = False
+    test_document_filename = TEST_HYBRID_DOCUMENT
+
+    def test_text_layer_skip(self):
+        self.test_document_type.ocr_settings.text_layer_minimum_characters = 1
+        self.test_document_type.ocr_settings.save()
+
+        self._upload_test_document()
+
+        ocr_content = self.test_document_version.pages.first().ocr_content
+        self.assertTrue(
+            TEST_DOCUMENT_VERSION_OCR_TEXT_LAYER_CONTENT in ocr_content.content
+        )
+        self.assertEqual(ocr_content.skip_reason, OCR_SKIP_REASON_TEXT_LAYER)
+
+    def test_text_layer_skip_parsing_disabled(self):
+        self.test_document_type.ocr_settings.text_layer_minimum_characters = 1
+        self.test_document_type.ocr_settings.save()
+        self.test_document_type.parsing_settings.auto_parsing = False
+        self.test_document_type.parsing_settings.save()
+
+        self._upload_test_document()
+
+        ocr_content = self.test_document_version.pages.first().ocr_content
+        self.assertEqual(ocr_content.skip_reason, '')
+        self.assertFalse(
+            DocumentFilePageContent.objects.filter(
+                document_file_page__document_file=self.test_document.file_latest
+            ).exists()
+        )
+
+    def test_text_layer_skip_disabled(self):
+        self._upload_test_document()
+
+        ocr_content = self.test_document_version.pages.first().ocr_content
+        self.assertEqual(ocr_content.skip_reason, '')
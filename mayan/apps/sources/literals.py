@@ -76,3 +76,5 @@ SOURCE_CHOICES = (
 )
 STAGING_FILE_IMAGE_TASK_TIMEOUT = 120
 STORAGE_NAME_SOURCE_STAGING_FOLDER_FILE = 'sources__staging_file_image_cache'
+WATCH_FOLDER_EVENT_DELAY = 1000  # Milliseconds
+WATCH_FOLDER_PROCESSING_DIRECTORY_NAME = '.mayan_processing'
@@ -0,0 +1,96 @@
+import logging
+import os
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = flags = None
+else:
+    WATCH_FLAGS = flags.CLOSE_WRITE | flags.CREATE | flags.MOVED_TO
+
+from django.core import management
+
+from ...literals import (
+    WATCH_FOLDER_EVENT_DELAY, WATCH_FOLDER_PROCESSING_DIRECTORY_NAME
+)
+from ...models import WatchFolderSource
+from ...tasks import task_check_interval_source
+
+logger = logging.getLogger(name=__name__)
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Watch the folders of the enabled watch folder sources and check '
+        'them as soon as files are written or moved into them instead of '
+        'waiting for their interval. Restart the command after changing '
+        'the watch folder sources.'
+    )
+
+    def add_watch(self, path, source):
+        watch_descriptor = self.inotify.add_watch(path, WATCH_FLAGS)
+        self.watch_descriptors[watch_descriptor] = (path, source)
+
+        if source.include_subdirectories:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    if entry.is_dir(follow_symlinks=False) and entry.name != WATCH_FOLDER_PROCESSING_DIRECTORY_NAME:
+                        self.add_watch(path=entry.path, source=source)
+
+    def handle(self, *args, **options):
+        if not INotify:
+            raise management.CommandError(
+                'This command requires the optional inotify_simple Python '
+                'package.'
+            )
+
+        self.inotify = INotify()
+        self.watch_descriptors = {}
+
+        for source in WatchFolderSource.objects.filter(enabled=True):
+            try:
+                self.add_watch(path=source.folder_path, source=source)
+            except OSError as exception:
+                self.stderr.write(
+                    'Unable to watch folder of source "{}"; {}'.format(
+                        source, exception
+                    )
+                )
+
+        while True:
+            source_ids = set()
+
+            # Wait for the events of the same burst of files to group them
+            # in a single check.
+            for event in self.inotify.read(read_delay=WATCH_FOLDER_EVENT_DELAY):
+                if event.mask & flags.IGNORED:
+                    self.watch_descriptors.pop(event.wd, None)
+                    continue
+
+                try:
+                    path, source = self.watch_descriptors[event.wd]
+                except KeyError:
+                    continue
+
+                if event.mask & flags.ISDIR:
+                    if source.include_subdirectories and event.name != WATCH_FOLDER_PROCESSING_DIRECTORY_NAME:
+                        try:
+                            self.add_watch(
+                                path=os.path.join(path, event.name),
+                                source=source
+                            )
+                        except OSError as exception:
+                            logger.warning(
+                                'Unable to watch directory: %s; %s',
+                                event.name, exception
+                            )
+                        else:
+                            source_ids.add(source.pk)
+                elif event.mask & (flags.CLOSE_WRITE | flags.MOVED_TO):
+                    source_ids.add(source.pk)
+
+            for source_id in source_ids:
+                logger.debug('checking source: %s', source_id)
+                task_check_interval_source.apply_async(
+                    kwargs={'source_id': source_id}
+                )
@@ -1,13 +1,22 @@
 import errno
 import fcntl
 import logging
+import os
 from pathlib import Path
+import uuid
 
+from django.core.files import File
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
+from mayan.apps.storage.models import SharedUploadedFile
+
 from ..exceptions import SourceException
-from ..literals import SOURCE_CHOICE_WATCH, SOURCE_UNCOMPRESS_CHOICE_Y
+from ..literals import (
+    SOURCE_CHOICE_WATCH, SOURCE_UNCOMPRESS_CHOICE_Y,
+    WATCH_FOLDER_PROCESSING_DIRECTORY_NAME
+)
+from ..tasks import task_source_handle_upload
 
 from .base import IntervalBaseModel
 
@@ -25,6 +34,9 @@ class WatchFolderSource(IntervalBaseModel):
     they want to upload as a bill or invoice to the respective filesystem
     folder. Mayan will periodically scan these filesystem locations and
     upload the files as documents, deleting them if configured.
+
+    Files are claimed by moving them to a processing directory inside the
+    folder and each one is uploaded by its own task.
     """
     source_type = SOURCE_CHOICE_WATCH
 
@@ -53,24 +65,173 @@ class WatchFolderSource(IntervalBaseModel):
         if not path.is_dir():
             raise SourceException('Path {} is not a directory.'.format(path))
 
-        if self.include_subdirectories:
-            iterator = path.rglob(pattern='*')
-        else:
-            iterator = path.glob(pattern='*')
-
-        for entry in iterator:
-            if entry.is_file() or entry.is_symlink():
-                with entry.open(mode='rb+') as file_object:
-                    try:
-                        fcntl.lockf(file_object, fcntl.LOCK_EX | fcntl.LOCK_NB)
-                    except IOError as exception:
-                        if exception.errno != errno.EAGAIN:
-                            raise
-                    else:
-                        self.handle_upload(
-                            file_object=file_object,
-                            expand=(self.uncompress == SOURCE_UNCOMPRESS_CHOICE_Y),
-                            label=entry.name
+        # Files claimed by a previous check that did not finish. The claims
+        # still being uploaded by another check are locked and skipped.
+        for claimed_directory in self.get_claimed_directories():
+            claim_lock = self._lock_claimed_directory(path=claimed_directory)
+            if claim_lock is not None:
+                self._upload_claimed_directory(
+                    claim_lock=claim_lock, path=claimed_directory
+                )
+
+        for entry in self.get_files():
+            if test:
+                with open(file=entry.path, mode='rb+') as file_object:
+                    if self._lock_file(file_object=file_object):
+                        self._upload_file(
+                            file_object=file_object, label=entry.name
+                        )
+            else:
+                claim = self._claim_file(path=entry.path)
+                if claim:
+                    claimed_directory, claim_lock = claim
+                    self._upload_claimed_directory(
+                        claim_lock=claim_lock, path=claimed_directory
+                    )
+
+    def _claim_file(self, path):
+        """
+        Move a file to its own directory inside the processing directory.
+        Returns the claimed directory and its lock or None if the file is
+        locked by another process or was claimed by someone else.
+        """
+        claimed_directory = os.path.join(
+            self.get_processing_directory(), uuid.uuid4().hex
+        )
+
+        try:
+            with open(file=path, mode='rb+') as file_object:
+                if not self._lock_file(file_object=file_object):
+                    return None
+
+                os.makedirs(name=claimed_directory)
+                claim_lock = self._lock_claimed_directory(
+                    path=claimed_directory
+                )
+                if claim_lock is None:
+                    return None
+
+                try:
+                    os.rename(
+                        path, os.path.join(
+                            claimed_directory, os.path.basename(path)
                         )
-                        if not test:
-                            entry.unlink()
+                    )
+                except OSError:
+                    os.close(claim_lock)
+                    raise
+        except FileNotFoundError:
+            return None
+        else:
+            return claimed_directory, claim_lock
+
+    def _lock_claimed_directory(self, path):
+        """
+        Lock a claimed directory. The lock is held while the files are
+        uploaded and released by the operating system if the check is
+        interrupted, making the files available to the next check. Returns
+        the file descriptor of the directory or None if it is being
+        uploaded by another check or was already removed.
+        """
+        try:
+            claim_lock = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+
+        try:
+            fcntl.flock(claim_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except IOError as exception:
+            os.close(claim_lock)
+            if exception.errno not in (errno.EACCES, errno.EAGAIN):
+                raise
+            return None
+
+        # The directory is removed by the check that uploaded it before
+        # releasing its lock.
+        if not os.path.isdir(path):
+            os.close(claim_lock)
+            return None
+
+        return claim_lock
+
+    def _lock_file(self, file_object):
+        """
+        Returns False if the file is locked by another process, usually
+        the one still writing it.
+        """
+        try:
+            fcntl.lockf(file_object, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except IOError as exception:
+            if exception.errno not in (errno.EACCES, errno.EAGAIN):
+                raise
+            return False
+        else:
+            return True
+
+    def _upload_claimed_directory(self, claim_lock, path):
+        try:
+            for name in os.listdir(path):
+                file_path = os.path.join(path, name)
+
+                with open(file=file_path, mode='rb') as file_object:
+                    self._upload_file(file_object=file_object, label=name)
+
+                os.unlink(file_path)
+
+            # Remove the directory before releasing the lock so that other
+            # checks can't lock it afterwards.
+            os.rmdir(path)
+        finally:
+            os.close(claim_lock)
+
+    def _upload_file(self, file_object, label):
+        """
+        Copy the file to the shared storage and dispatch its upload task.
+        The document is created by a worker of the sources queue.
+        """
+        shared_uploaded_file = SharedUploadedFile.objects.create(
+            file=File(file=file_object), filename=label
+        )
+
+        task_source_handle_upload.apply_async(
+            kwargs={
+                'document_type_id': self.document_type_id,
+                'expand': self.uncompress == SOURCE_UNCOMPRESS_CHOICE_Y,
+                'label': label,
+                'shared_uploaded_file_id': shared_uploaded_file.pk,
+                'source_id': self.pk
+            }
+        )
+
+    def get_claimed_directories(self):
+        try:
+            iterator = os.scandir(self.get_processing_directory())
+        except FileNotFoundError:
+            return []
+
+        with iterator:
+            return [
+                entry.path for entry in iterator
+                if entry.is_dir(follow_symlinks=False)
+            ]
+
+    def get_files(self):
+        """
+        Iterate the file entries of the folder, and of its subdirectories
+        if enabled, without reading the attributes of each file.
+        """
+        pending_paths = [self.folder_path]
+
+        while pending_paths:
+            with os.scandir(pending_paths.pop()) as iterator:
+                for entry in iterator:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.include_subdirectories and entry.name != WATCH_FOLDER_PROCESSING_DIRECTORY_NAME:
+                            pending_paths.append(entry.path)
+                    elif entry.is_file() or entry.is_symlink():
+                        yield entry
+
+    def get_processing_directory(self):
+        return os.path.join(
+            self.folder_path, WATCH_FOLDER_PROCESSING_DIRECTORY_NAME
+        )
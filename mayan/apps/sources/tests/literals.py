@@ -138,4 +138,5 @@ TEST_SOURCE_LABEL = 'test source'
 TEST_SOURCE_LABEL_EDITED = 'test source edited'
 TEST_SOURCE_UNCOMPRESS_N = 'n'
 TEST_STAGING_PREVIEW_WIDTH = 640
+TEST_WATCHFOLDER_CLAIMED_DIRECTORY = 'test_claimed_directory'
 TEST_WATCHFOLDER_SUBFOLDER = 'test_subfolder'
@@ -1,5 +1,6 @@
 import fcntl
 from multiprocessing import Process
+import os
 from pathlib import Path
 import shutil
 
@@ -30,7 +31,7 @@ from .literals import (
     TEST_EMAIL_BASE64_FILENAME_FROM, TEST_EMAIL_BASE64_FILENAME_SUBJECT,
     TEST_EMAIL_INLINE_IMAGE, TEST_EMAIL_NO_CONTENT_TYPE,
     TEST_EMAIL_NO_CONTENT_TYPE_STRING, TEST_EMAIL_ZERO_LENGTH_ATTACHMENT,
-    TEST_WATCHFOLDER_SUBFOLDER
+    TEST_WATCHFOLDER_CLAIMED_DIRECTORY, TEST_WATCHFOLDER_SUBFOLDER
 )
 from .mixins import SourceTestMixin, WatchFolderTestMixin
 from .mocks import MockIMAPServer, MockPOP3Mailbox
@@ -465,6 +466,71 @@ class WatchFolderTestCase(WatchFolderTestMixin, GenericDocumentTestCase):
 
             self.assertEqual(Document.objects.count(), 0)
 
+    def test_claimed_file_upload(self):
+        self._create_test_watchfolder()
+
+        test_claimed_path = Path(
+            self.test_watch_folder.get_processing_directory(),
+            TEST_WATCHFOLDER_CLAIMED_DIRECTORY
+        )
+        test_claimed_path.mkdir(parents=True)
+
+        shutil.copy(
+            src=TEST_SMALL_DOCUMENT_PATH, dst=force_text(s=test_claimed_path)
+        )
+        self.test_watch_folder.check_source()
+        self.assertEqual(Document.objects.count(), 1)
+        self.assertEqual(
+            Document.objects.first().label, TEST_SMALL_DOCUMENT_FILENAME
+        )
+        self.assertEqual(self.test_watch_folder.get_claimed_directories(), [])
+
+    def test_claimed_file_upload_locked(self):
+        self._create_test_watchfolder()
+
+        test_claimed_path = Path(
+            self.test_watch_folder.get_processing_directory(),
+            TEST_WATCHFOLDER_CLAIMED_DIRECTORY
+        )
+        test_claimed_path.mkdir(parents=True)
+
+        shutil.copy(
+            src=TEST_SMALL_DOCUMENT_PATH, dst=force_text(s=test_claimed_path)
+        )
+
+        # Claim still being uploaded by another check.
+        claim_lock = os.open(force_text(s=test_claimed_path), os.O_RDONLY)
+        self.addCleanup(os.close, claim_lock)
+        fcntl.flock(claim_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        self.test_watch_folder.check_source()
+        self.assertEqual(Document.objects.count(), 0)
+        self.assertEqual(
+            self.test_watch_folder.get_claimed_directories(),
+            [force_text(s=test_claimed_path)]
+        )
+
+    def test_file_removal(self):
+        self._create_test_watchfolder()
+
+        shutil.copy(
+            src=TEST_SMALL_DOCUMENT_PATH, dst=self.temporary_directory
+        )
+        self.test_watch_folder.check_source()
+        self.assertEqual(Document.objects.count(), 1)
+        self.assertEqual(list(self.test_watch_folder.get_files()), [])
+        self.assertEqual(self.test_watch_folder.get_claimed_directories(), [])
+
+    def test_file_test_check(self):
+        self._create_test_watchfolder()
+
+        shutil.copy(
+            src=TEST_SMALL_DOCUMENT_PATH, dst=self.temporary_directory
+        )
+        self.test_watch_folder.check_source(test=True)
+        self.assertEqual(Document.objects.count(), 1)
+        self.assertEqual(len(list(self.test_watch_folder.get_files())), 1)
+
 
 class SourceModelTestCase(SourceTestMixin, GenericDocumentTestCase):
     auto_upload_test_document = False
@@ -7,7 +7,6 @@ except ImportError:
     COMPRESSION = zipfile.ZIP_STORED
 
 from django.core.files.base import ContentFile
-from django.utils.encoding import force_text
 
 from ..classes import BufferedFile, PassthroughStorage
 
@@ -18,7 +17,6 @@ class BufferedZipFile(BufferedFile):
     def __init__(self, *args, **kwargs):
         self.member_name = kwargs.pop('member_name')
         super().__init__(*args, **kwargs)
-        self.binary_mode = 'b' in self.mode
 
         if 'r' in self.mode:
             zip_mode = 'r'
@@ -33,24 +31,35 @@ class BufferedZipFile(BufferedFile):
         )
 
     def _get_file_object_chunk(self):
-        chunk = self.zip_file_object.read(ZIP_CHUNK_SIZE)
+        return self.zip_file_object.read(ZIP_CHUNK_SIZE)
 
-        if chunk:
-            if self.binary_mode:
-                return chunk
-            else:
-                return force_text(s=chunk)
+    def _get_size(self):
+        return self.zip_container_file_object.getinfo(
+            name=self.member_name
+        ).file_size
+
+    def _rewind_file_object(self):
+        self.zip_file_object.close()
+        self.zip_file_object = self.zip_container_file_object.open(
+            name=self.member_name, mode='r'
+        )
+
+    def _seek_file_object(self, position):
+        # ZipExtFile is seekable on Python 3.7 and later. Stored members
+        # are seeked directly, deflated members are decompressed up to the
+        # position or from the start when seeking backwards.
+        if self.zip_file_object.seekable():
+            return self.zip_file_object.seek(position)
 
     def close(self):
         self.zip_file_object.close()
         self.zip_container_file_object.close()
         self.file_object.close()
 
-    def tell(self):
-        return self.zip_file_object.tell()
-
     def write(self, data):
-        return self.zip_file_object.write(data)
+        count = self.zip_file_object.write(data)
+        self._position += count
+        return count
 
 
 class ZipCompressedPassthroughStorage(PassthroughStorage):
@@ -1,86 +1,116 @@
 from Crypto.Cipher import AES
 from Crypto.Hash import SHA256
 from Crypto.Protocol.KDF import PBKDF2
-from Crypto.Util.Padding import pad, unpad
+from Crypto.Random import get_random_bytes
+from Crypto.Util.Padding import unpad
 
 from django.conf import settings
 from django.core.files.base import ContentFile
-from django.utils.encoding import force_text
+from django.utils.encoding import force_bytes
 
 from ..classes import BufferedFile, PassthroughStorage
 
 from .literals import (
-    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_KEY_DERIVATION_ITERATIONS,
+    ENCRYPTION_FILE_CHUNK_SIZE, ENCRYPTION_FILE_HEADER_MAGIC,
+    ENCRYPTION_FILE_NONCE_SIZE, ENCRYPTION_KEY_DERIVATION_ITERATIONS,
     ENCRYPTION_KEY_SIZE
 )
 
 
 class BufferedEncryptedFile(BufferedFile):
+    """
+    Files are encrypted using AES in CTR mode. The file starts with a
+    header made of a magic string and a random nonce. The counter of each
+    AES block is its index which allows decrypting from any block
+    without decrypting the preceding data.
+    Files without the header use the legacy format: a 16 byte initial
+    vector followed by AES-CBC encrypted and padded chunks. These can only
+    be read sequentially.
+    """
     def __init__(self, *args, **kwargs):
         self.key = kwargs.pop('key')
 
         super().__init__(*args, **kwargs)
 
-        self.initial_vector = self.file_object.read(16)
-        self.cipher = AES.new(
-            key=self.key, mode=AES.MODE_CBC, iv=self.initial_vector
-        )
-        self.binary_mode = 'b' in self.mode
-        self.position = 0
+        self.header_size = len(ENCRYPTION_FILE_HEADER_MAGIC) + ENCRYPTION_FILE_NONCE_SIZE
 
-    def _get_file_object_chunk(self):
-        chunk = self.file_object.read(ENCRYPTION_FILE_CHUNK_SIZE)
+        if 'r' in self.mode:
+            header = self.file_object.read(self.header_size)
 
-        if chunk:
-            data = unpad(
-                padded_data=self.cipher.decrypt(chunk),
-                block_size=AES.block_size
-            )
-
-            if self.binary_mode:
-                return data
+            if header[:len(ENCRYPTION_FILE_HEADER_MAGIC)] == ENCRYPTION_FILE_HEADER_MAGIC:
+                self.is_legacy = False
+                self.nonce = header[len(ENCRYPTION_FILE_HEADER_MAGIC):]
             else:
-                return force_text(s=data)
-
-    def seek(self, pos, whence=0):
-        if whence == 0:
-            self.position = pos
-            self.file_object.seek(pos, whence)
-
-        if whence == 2:
-            raise AttributeError('Only whence 0 is supported.')
+                self.is_legacy = True
+                self.initial_vector = header[:AES.block_size]
+                self.file_object.seek(AES.block_size)
 
-    def tell(self):
-        return self.position
-
-    def write(self, data):
-        if self.position == 0:
-            self.cipher = AES.new(key=self.key, mode=AES.MODE_CBC)
-            self.file_object.write(self.cipher.iv)
-
-        content = ContentFile(content=data)
+            self._rewind_file_object()
+        else:
+            self.is_legacy = False
+            self.cipher = None
 
-        count = 0
-        while True:
-            chunk = content.read(ENCRYPTION_FILE_CHUNK_SIZE)
+    def _get_cipher(self, block_index=0):
+        return AES.new(
+            key=self.key, mode=AES.MODE_CTR, nonce=self.nonce,
+            initial_value=block_index
+        )
 
-            try:
-                chunk = chunk.encode('utf-8')
-            except AttributeError:
-                """Already a byte string"""
+    def _get_file_object_chunk(self):
+        if self.is_legacy:
+            # Each plaintext chunk was padded on its own.
+            chunk = self.file_object.read(
+                ENCRYPTION_FILE_CHUNK_SIZE + AES.block_size
+            )
 
-            count = count + len(chunk)
             if chunk:
-                chunk = pad(
-                    data_to_pad=chunk, block_size=AES.block_size
+                return unpad(
+                    padded_data=self.cipher.decrypt(chunk),
+                    block_size=AES.block_size
                 )
-            else:
-                break
+        else:
+            chunk = self.file_object.read(ENCRYPTION_FILE_CHUNK_SIZE)
+
+            if chunk:
+                return self.cipher.decrypt(chunk)
+
+    def _get_size(self):
+        if not self.is_legacy:
+            position = self.file_object.tell()
+            size = self.file_object.seek(0, 2)
+            self.file_object.seek(position)
+            return size - self.header_size
+
+    def _rewind_file_object(self):
+        if self.is_legacy:
+            self.file_object.seek(AES.block_size)
+            self.cipher = AES.new(
+                key=self.key, mode=AES.MODE_CBC, iv=self.initial_vector
+            )
+        else:
+            self.file_object.seek(self.header_size)
+            self.cipher = self._get_cipher()
+
+    def _seek_file_object(self, position):
+        if not self.is_legacy:
+            block_index = position // AES.block_size
+            self.file_object.seek(
+                self.header_size + block_index * AES.block_size
+            )
+            self.cipher = self._get_cipher(block_index=block_index)
+            return block_index * AES.block_size
 
-            self.file_object.write(self.cipher.encrypt(chunk))
+    def write(self, data):
+        if not self.cipher:
+            self.nonce = get_random_bytes(ENCRYPTION_FILE_NONCE_SIZE)
+            self.cipher = self._get_cipher()
+            self.file_object.write(ENCRYPTION_FILE_HEADER_MAGIC + self.nonce)
+
+        data = force_bytes(s=data)
+        self.file_object.write(self.cipher.encrypt(data))
+        self._position += len(data)
 
-        self.position = self.position + count
-        return count
+        return len(data)
 
 
 class EncryptedPassthroughStorage(PassthroughStorage):
@@ -96,6 +126,17 @@ class EncryptedPassthroughStorage(PassthroughStorage):
         )
         self.position = 0
 
+    def is_format_current(self, name):
+        with self._call_backend_method(
+            method_name='open', kwargs={'name': name, 'mode': 'rb'}
+        ) as file_object:
+            header = file_object.read(len(ENCRYPTION_FILE_HEADER_MAGIC))
+
+        if header != ENCRYPTION_FILE_HEADER_MAGIC:
+            return False
+        else:
+            return super().is_format_current(name=name)
+
     def open(self, name, mode='rb', _direct=False):
         next_kwargs = {'name': name}
         if _direct:
@@ -129,7 +170,6 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                 method_name='save', kwargs=next_kwargs
             )
         else:
-            cipher = AES.new(key=self.key, mode=AES.MODE_CBC)
             if not self._call_backend_method(
                 method_name='exists', kwargs={'name': name}
             ):
@@ -144,23 +184,20 @@ class EncryptedPassthroughStorage(PassthroughStorage):
                     'name': name, 'mode': 'wb'
                 }
             ) as file_object:
-                file_object.write(cipher.iv)
+                encrypted_file = BufferedEncryptedFile(
+                    file_object=file_object, key=self.key, mode='wb'
+                )
 
                 while True:
                     chunk = content.read(ENCRYPTION_FILE_CHUNK_SIZE)
 
-                    try:
-                        chunk = chunk.encode('utf-8')
-                    except AttributeError:
-                        """Already a byte string"""
-
                     if chunk:
-                        chunk = pad(
-                            data_to_pad=chunk, block_size=AES.block_size
-                        )
+                        encrypted_file.write(data=chunk)
                     else:
                         break
 
-                    file_object.write(cipher.encrypt(chunk))
+                if not encrypted_file.cipher:
+                    # Write the header of empty files.
+                    encrypted_file.write(data=b'')
 
             return name
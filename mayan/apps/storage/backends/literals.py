@@ -1,4 +1,8 @@
 ENCRYPTION_FILE_CHUNK_SIZE = 64 * 1024  # 64K
+# Header of the block addressable (AES-CTR) encryption format. Files
+# without it use the legacy AES-CBC format.
+ENCRYPTION_FILE_HEADER_MAGIC = b'MAYANCTR'
+ENCRYPTION_FILE_NONCE_SIZE = 8
 ENCRYPTION_KEY_DERIVATION_ITERATIONS = 100000
 ENCRYPTION_KEY_SIZE = 32
 
@@ -1,5 +1,5 @@
+import codecs
 import logging
-from io import BytesIO, StringIO
 
 from django.core.files.base import File
 from django.core.files.storage import Storage
@@ -15,48 +15,166 @@ logger = logging.getLogger(name=__name__)
 
 
 class BufferedFile(File):
+    """
+    Streaming file object for passthrough storages. Subclasses decode the
+    underlying file object one chunk at a time and only the last decoded
+    chunk is kept in memory. Seeking forward discards decoded data and
+    seeking backwards restarts the decoding from the beginning unless the
+    subclass provides random access to the decoded data.
+    """
     def __init__(self, file_object, mode, name=None):
         self.file_object = file_object
         self.mode = mode
-        if 'b' in mode:
-            self.stream = BytesIO()
+        self.binary_mode = 'b' in mode
+        self.name = name
+
+        if not self.binary_mode:
+            self._decoder = codecs.getincrementaldecoder('utf-8')()
+
+        self._buffer_reset(offset=0)
+        self._position = 0
+
+    def _buffer_reset(self, offset):
+        self._buffer = self._get_empty_value()
+        self._buffer_offset = offset
+
+    def _get_chunk(self):
+        while True:
+            chunk = self._get_file_object_chunk() or b''
+
+            if self.binary_mode:
+                return chunk
+            else:
+                # The decoder returns an empty string when the chunk ends
+                # in the middle of a multibyte character.
+                data = self._decoder.decode(chunk, final=not chunk)
+                if data or not chunk:
+                    return data
+
+    def _get_empty_value(self):
+        if self.binary_mode:
+            return b''
         else:
-            self.stream = StringIO()
+            return ''
 
-        self.name = name
-        self.stream_size = 0
+    def _get_file_object_chunk(self):
+        """
+        Return the next chunk of decoded bytes from the underlying file
+        object or an empty value at the end of the file.
+        """
+        raise NotImplementedError
+
+    def _get_size(self):
+        """
+        Return the size of the decoded data without decoding it, or None
+        when it is not known.
+        """
+
+    def _rewind_file_object(self):
+        """
+        Position the underlying file object so that the next chunk is the
+        first chunk of the decoded data.
+        """
+        raise NotImplementedError
+
+    def _seek_file_object(self, position):
+        """
+        Random access hook for subclasses. Position the underlying file
+        object so that the next chunk starts at or before the decoded
+        position and return the offset of the start of that chunk. Return
+        None to use sequential access.
+        """
 
     def close(self):
         self.file_object.close()
-        self.stream.close()
+        self._buffer_reset(offset=0)
 
     def flush(self):
         return self.file_object.flush()
 
     def read(self, size=None):
-        if size is None:
-            size = -1
-
-        if size == -1 or size > self.stream_size:
-            while True:
-                position = self.stream.tell()
-                chunk = self._get_file_object_chunk()
-                if chunk:
-                    self.stream_size += len(chunk)
-                    self.stream.write(chunk)
-                    self.stream.seek(position)
-                    if self.stream_size >= size and size != -1:
-                        break
-                else:
+        if size is None or size < 0:
+            size = None
+
+        result = []
+        while size is None or size > 0:
+            index = self._position - self._buffer_offset
+            if index >= len(self._buffer):
+                chunk = self._get_chunk()
+                if not chunk:
                     break
 
-        if size:
-            read_size = min(size, self.stream_size)
-            self.stream_size -= read_size
+                self._buffer_reset(
+                    offset=self._buffer_offset + len(self._buffer)
+                )
+                self._buffer = chunk
+                continue
+
+            if size is None:
+                data = self._buffer[index:]
+            else:
+                data = self._buffer[index:index + size]
+                size -= len(data)
+
+            self._position += len(data)
+            result.append(data)
+
+        return self._get_empty_value().join(result)
+
+    def readable(self):
+        return True
+
+    def seek(self, offset, whence=0):
+        if whence == 0:
+            position = offset
+        elif whence == 1:
+            position = self._position + offset
+        elif whence == 2:
+            position = self.size + offset
         else:
-            read_size = None
+            raise ValueError('Invalid whence value: {}'.format(whence))
+
+        if position < 0:
+            raise ValueError('Negative seek position {}'.format(position))
+
+        buffer_end = self._buffer_offset + len(self._buffer)
+
+        if not self._buffer_offset <= position < buffer_end:
+            chunk_offset = None
+            if self.binary_mode:
+                chunk_offset = self._seek_file_object(position=position)
+
+            if chunk_offset is not None:
+                self._buffer_reset(offset=chunk_offset)
+            elif position < self._buffer_offset:
+                self._rewind_file_object()
+                if not self.binary_mode:
+                    self._decoder.reset()
+                self._buffer_reset(offset=0)
 
-        return self.stream.read(read_size)
+        self._position = position
+        return position
+
+    def seekable(self):
+        return True
+
+    @property
+    def size(self):
+        size = None
+        if self.binary_mode:
+            size = self._get_size()
+
+        if size is None:
+            position = self._position
+            while self.read(self.DEFAULT_CHUNK_SIZE):
+                """Decode until the end of the file."""
+            size = self._position
+            self.seek(offset=position)
+
+        return size
+
+    def tell(self):
+        return self._position
 
 
 class DefinedStorage(AppsModuleLoaderMixin):
@@ -193,6 +311,17 @@ class PassthroughStorage(Storage):
     def exists(self, *args, **kwargs):
         return self.next_storage_backend.exists(*args, **kwargs)
 
+    def is_format_current(self, name):
+        """
+        Return False when the file was stored using a previous format of
+        the storage pipeline and needs to be rewritten. Subclasses check
+        their own format and call this method to check the next storages.
+        """
+        if issubclass(self.next_storage_class, PassthroughStorage):
+            return self.next_storage_backend.is_format_current(name=name)
+        else:
+            return True
+
     def path(self, *args, **kwargs):
         return self.next_storage_backend.path(*args, **kwargs)
 
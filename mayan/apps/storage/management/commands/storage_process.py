@@ -33,6 +33,14 @@ class Command(management.BaseCommand):
                 'pipeline transformations.'
             )
         )
+        parser.add_argument(
+            '--rewrite', action='store_true', dest='rewrite',
+            help=_(
+                'Decode and encode again the files stored using a previous '
+                'format to update them to the current format of the storage '
+                'pipeline.'
+            )
+        )
         parser.add_argument(
             '--storage_name', action='store', dest='defined_storage_name',
             help=_('Name of the storage to process.'),
@@ -45,4 +53,6 @@ class Command(management.BaseCommand):
             defined_storage_name=options['defined_storage_name'],
             log_file=options['log_file'], model_name=options['model_name'],
         )
-        processor.execute(reverse=options['reverse'])
+        processor.execute(
+            reverse=options['reverse'], rewrite=options['rewrite']
+        )
@@ -5,6 +5,8 @@ from django.conf import settings
 TEST_DOWNLOAD_FILE_CONTENT_FILE_NAME = 'test content name'
 
 TEST_CONTENT = 'testcontent'
+# Larger than several encryption and zip chunks and not block aligned.
+TEST_CONTENT_LARGE = bytes(range(256)) * 1000 + b'tail'
 TEST_FILE_NAME = 'test_file'
 
 # Filenames
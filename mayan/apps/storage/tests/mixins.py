@@ -3,6 +3,9 @@ import logging
 from pathlib import Path
 import shutil
 
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
 from django.core.files.base import ContentFile
 
 from mayan.apps.acls.classes import ModelPermission
@@ -10,6 +13,7 @@ from mayan.apps.documents.literals import STORAGE_NAME_DOCUMENT_FILES
 from mayan.apps.permissions.tests.mixins import PermissionTestMixin
 from mayan.apps.smart_settings.classes import SettingNamespace
 
+from ..backends.literals import ENCRYPTION_FILE_CHUNK_SIZE
 from ..classes import DefinedStorage
 from ..compressed_files import Archive
 from ..models import DownloadFile
@@ -118,6 +122,24 @@ class DownloadFileViewTestMixin:
         return self.get(viewname='storage:download_file_list')
 
 
+class EncryptedStorageLegacyFileTestMixin:
+    def _create_test_legacy_encrypted_file(self, content, key, path):
+        cipher = AES.new(key=key, mode=AES.MODE_CBC)
+
+        with open(file=path, mode='wb') as file_object:
+            file_object.write(cipher.iv)
+            for index in range(0, len(content), ENCRYPTION_FILE_CHUNK_SIZE):
+                file_object.write(
+                    cipher.encrypt(
+                        pad(
+                            data_to_pad=content[
+                                index:index + ENCRYPTION_FILE_CHUNK_SIZE
+                            ], block_size=AES.block_size
+                        )
+                    )
+                )
+
+
 class StorageProcessorTestMixin:
     @classmethod
     def setUpClass(cls):
@@ -10,10 +10,40 @@ from mayan.apps.testing.tests.base import BaseTestCase
 from ..backends.compressedstorage import ZipCompressedPassthroughStorage
 from ..backends.encryptedstorage import EncryptedPassthroughStorage
 
-from .literals import TEST_CONTENT, TEST_FILE_NAME
+from .literals import TEST_CONTENT, TEST_CONTENT_LARGE, TEST_FILE_NAME
+from .mixins import EncryptedStorageLegacyFileTestMixin
 
 
-class EncryptedPassthroughStorageTestCase(BaseTestCase):
+class BufferedFileTestMixin:
+    def _test_file_seek_and_size(self, storage):
+        storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=TEST_CONTENT_LARGE
+            )
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
+            self.assertEqual(file_object.size, len(TEST_CONTENT_LARGE))
+
+            for offset in (150000, 17, 65540, 0):
+                file_object.seek(offset)
+                self.assertEqual(file_object.tell(), offset)
+                self.assertEqual(
+                    file_object.read(100),
+                    TEST_CONTENT_LARGE[offset:offset + 100]
+                )
+
+            file_object.seek(-4, 2)
+            self.assertEqual(file_object.read(), b'tail')
+
+            file_object.seek(-104, 1)
+            self.assertEqual(file_object.read(100), TEST_CONTENT_LARGE[-104:-4])
+
+
+class EncryptedPassthroughStorageTestCase(
+    BufferedFileTestMixin, EncryptedStorageLegacyFileTestMixin, BaseTestCase
+):
     def setUp(self):
         super().setUp()
         self.temporary_directory = mkdtemp()
@@ -53,8 +83,39 @@ class EncryptedPassthroughStorageTestCase(BaseTestCase):
         with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
             self.assertEqual(file_object.read(999), TEST_CONTENT)
 
+    def test_file_legacy_format_load(self):
+        storage = EncryptedPassthroughStorage(
+            password='testpassword',
+            next_storage_backend_arguments={
+                'location': self.temporary_directory,
+            }
+        )
+
+        self._create_test_legacy_encrypted_file(
+            content=TEST_CONTENT_LARGE, key=storage.key,
+            path=Path(self.temporary_directory) / TEST_FILE_NAME
+        )
+
+        with storage.open(name=TEST_FILE_NAME, mode='rb') as file_object:
+            self.assertEqual(file_object.read(), TEST_CONTENT_LARGE)
 
-class ZipCompressedPassthroughStorageTestCase(BaseTestCase):
+            file_object.seek(17)
+            self.assertEqual(file_object.read(100), TEST_CONTENT_LARGE[17:117])
+
+    def test_file_seek_and_size(self):
+        storage = EncryptedPassthroughStorage(
+            password='testpassword',
+            next_storage_backend_arguments={
+                'location': self.temporary_directory,
+            }
+        )
+
+        self._test_file_seek_and_size(storage=storage)
+
+
+class ZipCompressedPassthroughStorageTestCase(
+    BufferedFileTestMixin, BaseTestCase
+):
     def setUp(self):
         super().setUp()
         self.temporary_directory = mkdtemp()
@@ -90,6 +151,15 @@ class ZipCompressedPassthroughStorageTestCase(BaseTestCase):
         with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
             self.assertEqual(file_object.read(), TEST_CONTENT)
 
+    def test_file_seek_and_size(self):
+        storage = ZipCompressedPassthroughStorage(
+            next_storage_backend_arguments={
+                'location': self.temporary_directory
+            }
+        )
+
+        self._test_file_seek_and_size(storage=storage)
+
 
 class CombinationPassthroughStorageTestCase(BaseTestCase):
     def setUp(self):
@@ -1,3 +1,5 @@
+import mock
+
 from django.core import management
 from django.utils.encoding import force_text
 
@@ -5,19 +7,29 @@ from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.storages import storage_document_files
 from mayan.apps.mimetype.api import get_mimetype
 
-from .mixins import StorageProcessorTestMixin
+from ..backends.compressedstorage import ZipCompressedPassthroughStorage
+from ..backends.encryptedstorage import EncryptedPassthroughStorage
+from ..backends.literals import ENCRYPTION_FILE_HEADER_MAGIC
+
+from .mixins import (
+    EncryptedStorageLegacyFileTestMixin, StorageProcessorTestMixin
+)
 
 
 class StorageProcessManagementCommandTestCase(
-    StorageProcessorTestMixin, GenericDocumentTestCase
+    EncryptedStorageLegacyFileTestMixin, StorageProcessorTestMixin,
+    GenericDocumentTestCase
 ):
-    def _call_command(self, reverse=None):
+    auto_upload_test_document = False
+
+    def _call_command(self, reverse=None, rewrite=None):
         options = {
             'app_label': 'documents',
             'defined_storage_name': storage_document_files.name,
             'log_file': force_text(s=self.path_test_file),
             'model_name': 'DocumentFile',
-            'reverse': reverse
+            'reverse': reverse,
+            'rewrite': rewrite
         }
         management.call_command(command_name='storage_process', **options)
 
@@ -73,3 +85,76 @@ class StorageProcessManagementCommandTestCase(
             self.test_document.file_latest.checksum,
             self.test_document.file_latest.checksum_update(save=False)
         )
+
+    def test_processor_forwards_and_rewrite(self):
+        self._upload_and_call()
+
+        with mock.patch.object(
+            ZipCompressedPassthroughStorage, 'save', autospec=True,
+            side_effect=ZipCompressedPassthroughStorage.save
+        ) as save:
+            self._call_command(rewrite=True)
+
+        # The format of the compressed files did not change.
+        self.assertEqual(save.call_count, 0)
+
+        with open(file=self.test_document.file_latest.file.path, mode='rb') as file_object:
+            self.assertEqual(
+                get_mimetype(file_object=file_object),
+                ('application/zip', 'binary')
+            )
+
+        self.assertEqual(
+            self.test_document.file_latest.checksum,
+            self.test_document.file_latest.checksum_update(save=False)
+        )
+
+    def test_processor_rewrite_legacy_format(self):
+        self.defined_storage.dotted_path = 'django.core.files.storage.FileSystemStorage'
+        self.defined_storage.kwargs = {
+            'location': self.document_storage_kwargs['location']
+        }
+
+        self._upload_test_document()
+
+        path_file = self.test_document.file_latest.file.path
+
+        with open(file=path_file, mode='rb') as file_object:
+            content = file_object.read()
+
+        self.defined_storage.dotted_path = 'mayan.apps.storage.backends.encryptedstorage.EncryptedPassthroughStorage'
+        self.defined_storage.kwargs = {
+            'next_storage_backend': 'django.core.files.storage.FileSystemStorage',
+            'next_storage_backend_arguments': {
+                'location': self.document_storage_kwargs['location']
+            },
+            'password': 'testpassword'
+        }
+
+        # The file was stored in the legacy format without a forward pass.
+        self._create_test_legacy_encrypted_file(
+            content=content,
+            key=self.defined_storage.get_storage_instance().key,
+            path=path_file
+        )
+
+        self._call_command(rewrite=True)
+
+        with open(file=path_file, mode='rb') as file_object:
+            self.assertEqual(
+                file_object.read(len(ENCRYPTION_FILE_HEADER_MAGIC)),
+                ENCRYPTION_FILE_HEADER_MAGIC
+            )
+
+        self.assertEqual(
+            self.test_document.file_latest.checksum,
+            self.test_document.file_latest.checksum_update(save=False)
+        )
+
+        with mock.patch.object(
+            EncryptedPassthroughStorage, 'save', autospec=True,
+            side_effect=EncryptedPassthroughStorage.save
+        ) as save:
+            self._call_command(rewrite=True)
+
+        self.assertEqual(save.call_count, 0)
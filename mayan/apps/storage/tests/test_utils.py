@@ -1,3 +1,5 @@
+import hashlib
+from io import BytesIO
 from pathlib import Path
 import shutil
 
@@ -8,7 +10,9 @@ from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.mimetype.api import get_mimetype
 from mayan.apps.testing.tests.base import BaseTestCase
 
-from ..utils import PassthroughStorageProcessor, mkdtemp, patch_files
+from ..utils import (
+    PassthroughStorageProcessor, TeeFile, mkdtemp, patch_files
+)
 
 from .mixins import StorageProcessorTestMixin
 
@@ -149,3 +153,49 @@ class StorageProcessorTestCase(
             self.test_document.file_latest.checksum,
             self.test_document.file_latest.checksum_update(save=False)
         )
+
+
+class TeeFileTestCase(BaseTestCase):
+    test_data = b'0123456789' * 1000
+
+    def setUp(self):
+        super().setUp()
+        self.hash_object = hashlib.sha256()
+        self.tee_file = TeeFile(
+            consumers=(self.hash_object,), file=BytesIO(self.test_data)
+        )
+
+    def tearDown(self):
+        self.tee_file.close()
+        super().tearDown()
+
+    def test_tee_file_chunks(self):
+        for chunk in self.tee_file.chunks(chunk_size=333):
+            """Read all the data."""
+
+        local_file_object = self.tee_file.finish()
+
+        self.assertEqual(local_file_object.read(), self.test_data)
+        self.assertEqual(
+            self.hash_object.hexdigest(),
+            hashlib.sha256(self.test_data).hexdigest()
+        )
+
+    def test_tee_file_partial_read_and_seek(self):
+        self.tee_file.read(100)
+        self.tee_file.seek(0)
+        self.tee_file.read(50)
+
+        local_file_object = self.tee_file.finish()
+
+        self.assertEqual(local_file_object.read(), self.test_data)
+        self.assertEqual(
+            self.hash_object.hexdigest(),
+            hashlib.sha256(self.test_data).hexdigest()
+        )
+
+    def test_tee_file_seek_past_copy(self):
+        self.tee_file.seek(100)
+        self.tee_file.read(50)
+
+        self.assertEqual(self.tee_file.finish(), None)
@@ -6,6 +6,7 @@ import shutil
 import tempfile
 
 from django.apps import apps
+from django.core.files.base import File
 from django.utils.module_loading import import_string
 
 from .classes import DefinedStorage, PassthroughStorage
@@ -31,7 +32,10 @@ class PassthroughStorageProcessor:
         self.model_name = model_name
 
     def _update_entry(self, key):
-        if not self.reverse:
+        if self.rewrite:
+            # Rewritten files stay encoded, their log entry is kept.
+            return
+        elif not self.reverse:
             self.database[key] = '1'
         else:
             try:
@@ -39,23 +43,38 @@ class PassthroughStorageProcessor:
             except KeyError:
                 pass
 
-    def _inclusion_condition(self, key):
-        if self.reverse:
+    def _inclusion_condition(self, key, file_name):
+        # Only files encoded by a forward pass are reversed. Files are
+        # rewritten based on their format, including those never recorded
+        # by a forward pass.
+        if self.rewrite:
+            return not self.storage_instance.is_format_current(
+                name=file_name
+            )
+        elif self.reverse:
             return key in self.database
         else:
             return key not in self.database
 
-    def execute(self, reverse=False):
-        self.reverse = reverse
+    def execute(self, reverse=False, rewrite=False):
+        """
+        Forward processing encodes the files stored without the storage
+        pipeline transformations. Reverse processing undoes them.
+        Rewriting decodes and encodes again the files stored using a
+        previous format to update them to the current format of the
+        storage pipeline.
+        """
+        self.reverse = reverse and not rewrite
+        self.rewrite = rewrite
         model = apps.get_model(
             app_label=self.app_label, model_name=self.model_name
         )
 
-        storage_instance = DefinedStorage.get(
+        self.storage_instance = DefinedStorage.get(
             name=self.defined_storage_name
         ).get_storage_instance()
 
-        if isinstance(storage_instance, PassthroughStorage):
+        if isinstance(self.storage_instance, PassthroughStorage):
             ContentType = apps.get_model(
                 app_label='contenttypes', model_name='ContentType'
             )
@@ -65,21 +84,92 @@ class PassthroughStorageProcessor:
 
             for instance in model.objects.all():
                 key = '{}.{}'.format(content_type.name, instance.pk)
-                if self._inclusion_condition(key=key):
-                    file_name = getattr(instance, self.file_attribute).name
+                file_name = getattr(instance, self.file_attribute).name
 
-                    content = storage_instance.open(
+                if self._inclusion_condition(file_name=file_name, key=key):
+                    content = self.storage_instance.open(
                         name=file_name, mode='rb',
-                        _direct=not self.reverse
+                        _direct=not (self.reverse or self.rewrite)
                     )
-                    storage_instance.delete(name=file_name)
-                    storage_instance.save(
+                    self.storage_instance.delete(name=file_name)
+                    self.storage_instance.save(
                         name=file_name, content=content,
                         _direct=self.reverse
                     )
                     self._update_entry(key=key)
 
-            self.database.close
+            self.database.close()
+
+
+class TeeFile(File):
+    """
+    File wrapper that copies the data read from the wrapped file into a
+    local temporary file and feeds it to a list of consumers (objects with
+    an .update() method like hash objects) as it is being read. Allows
+    processing a file while it is saved to a storage without having to
+    read it back from the storage afterwards.
+    Data read more than once because of seeks is only copied and fed the
+    first time. A seek past the data already copied invalidates the copy.
+    """
+    def __init__(self, file, consumers=None, name=None):
+        super().__init__(file=file, name=name or getattr(file, 'name', None))
+        self.consumers = consumers or ()
+        self.is_valid = True
+        self.local_file_object = NamedTemporaryFile()
+        self.offset = 0
+        self.offset_copied = 0
+
+    def _copy(self, data):
+        start = self.offset
+        self.offset = start + len(data)
+
+        if not self.is_valid or self.offset <= self.offset_copied:
+            return
+
+        if start > self.offset_copied or not isinstance(data, bytes):
+            self.is_valid = False
+            return
+
+        data = data[self.offset_copied - start:]
+
+        for consumer in self.consumers:
+            consumer.update(data)
+
+        self.local_file_object.write(data)
+        self.offset_copied = self.offset
+
+    def close(self):
+        self.local_file_object.close()
+        return super().close()
+
+    def finish(self):
+        """
+        Copy any remaining data not read by the caller and return the
+        local copy rewound, or None if a complete copy was not possible.
+        """
+        if self.is_valid:
+            try:
+                self.seek(self.offset_copied)
+                while self.read(File.DEFAULT_CHUNK_SIZE):
+                    """Copy until the end of the file."""
+            except (AttributeError, OSError) as exception:
+                logger.debug('Unable to complete file copy; %s', exception)
+                self.is_valid = False
+
+        if self.is_valid:
+            self.local_file_object.flush()
+            self.local_file_object.seek(0)
+            return self.local_file_object
+
+    def read(self, *args, **kwargs):
+        data = self.file.read(*args, **kwargs)
+        self._copy(data=data)
+        return data
+
+    def seek(self, *args, **kwargs):
+        result = self.file.seek(*args, **kwargs)
+        self.offset = self.file.tell()
+        return result
 
 
 def TemporaryFile(*args, **kwargs):
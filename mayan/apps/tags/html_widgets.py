@@ -19,10 +19,10 @@ class DocumentTagWidget(SourceColumnWidget):
         )
 
         try:
-            AccessControlList.objects.check_access(
-                obj=self.value,
+            AccessControlList.objects.check_request_access(
+                obj=self.value, object_list=self.object_list,
                 permissions=(permission_tag_view,),
-                user=self.request.user
+                request=self.request
             )
         except PermissionDenied:
             queryset = self.value.tags.none()
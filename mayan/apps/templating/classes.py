@@ -1,3 +1,4 @@
+from functools import lru_cache
 import hashlib
 
 from django.template import Context, Engine, Template as DjangoTemplate
@@ -6,6 +7,8 @@ from django.urls import reverse
 
 from mayan.apps.common.settings import setting_home_view
 
+from .literals import TEMPLATE_BUILTINS, TEMPLATE_CACHE_MAXIMUM_SIZE
+
 
 class AJAXTemplate:
     _registry = {}
@@ -52,16 +55,30 @@ class AJAXTemplate:
 
 
 class Template:
-    def __init__(self, template_string):
-        engine = Engine(
-            builtins=[
-                'mathfilters.templatetags.mathfilters',
-                'mayan.apps.templating.templatetags.templating_tags',
-            ]
+    """
+    Compiled templates are cached by template string and share a single
+    engine. Rendering a compiled template does not modify it, which allows
+    sharing them between instances and threads.
+    """
+    _engine = None
+
+    @classmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_MAXIMUM_SIZE)
+    def _get_compiled_template(cls, template_string):
+        return DjangoTemplate(
+            engine=cls.get_engine(), template_string=template_string
         )
 
-        self._template = DjangoTemplate(
-            engine=engine, template_string=template_string
+    @classmethod
+    def get_engine(cls):
+        if not cls._engine:
+            cls._engine = Engine(builtins=list(TEMPLATE_BUILTINS))
+
+        return cls._engine
+
+    def __init__(self, template_string):
+        self._template = self.__class__._get_compiled_template(
+            template_string=template_string
         )
 
     def render(self, context=None):
@@ -1 +1,7 @@
 EMPTY_LABEL = '---------'
+
+TEMPLATE_BUILTINS = (
+    'mathfilters.templatetags.mathfilters',
+    'mayan.apps.templating.templatetags.templating_tags',
+)
+TEMPLATE_CACHE_MAXIMUM_SIZE = 1024
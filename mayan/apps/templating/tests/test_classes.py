@@ -0,0 +1,22 @@
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import Template
+
+
+class TemplateTestCase(BaseTestCase):
+    def test_compiled_template_cache(self):
+        template_1 = Template(template_string='{{ value }}')
+        template_2 = Template(template_string='{{ value }}')
+
+        self.assertTrue(template_1._template is template_2._template)
+
+        self.assertEqual(template_1.render(context={'value': 1}), '1')
+        self.assertEqual(template_2.render(context={'value': 2}), '2')
+
+    def test_shared_engine(self):
+        template_1 = Template(template_string='{{ value }}')
+        template_2 = Template(template_string='{{ other_value }}')
+
+        self.assertTrue(
+            template_1._template.engine is template_2._template.engine
+        )
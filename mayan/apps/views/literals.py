@@ -1,5 +1,11 @@
+DEFAULT_VIEWS_DOWNLOAD_SENDFILE_HEADER = None
+DEFAULT_VIEWS_DOWNLOAD_SENDFILE_ROOT = None
+DEFAULT_VIEWS_DOWNLOAD_SENDFILE_URL = None
 DEFAULT_VIEWS_PAGINATE_BY = 40
 
+DOWNLOAD_SENDFILE_HEADER_NGINX = 'X-Accel-Redirect'
+DOWNLOAD_SENDFILE_HEADER_SENDFILE = 'X-Sendfile'
+
 LIST_MODE_CHOICE_LIST = 'list'
 LIST_MODE_CHOICE_ITEM = 'item'
 
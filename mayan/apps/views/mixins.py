@@ -1,26 +1,37 @@
+from pathlib import Path
+from urllib.parse import quote
+
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models.query import QuerySet
-from django.http import Http404, HttpResponseRedirect
+from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
+from django.utils.encoding import force_text
 from django.utils.translation import ungettext, ugettext_lazy as _
 from django.views.generic.detail import SingleObjectMixin
 
 from mayan.apps.acls.classes import ModelPermission
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.common.settings import setting_home_view
+from mayan.apps.mimetype.api import get_mimetype, get_mimetype_from_path
 from mayan.apps.permissions import Permission
 
 from .compat import FileResponse
 from .exceptions import ActionError
 from .forms import DynamicForm
 from .literals import (
-    PK_LIST_SEPARATOR, TEXT_CHOICE_ITEMS, TEXT_CHOICE_LIST,
-    TEXT_LIST_AS_ITEMS_PARAMETER, TEXT_LIST_AS_ITEMS_VARIABLE_NAME,
-    TEXT_SORT_FIELD_PARAMETER, TEXT_SORT_FIELD_VARIABLE_NAME,
+    DOWNLOAD_SENDFILE_HEADER_NGINX, PK_LIST_SEPARATOR, TEXT_CHOICE_ITEMS,
+    TEXT_CHOICE_LIST, TEXT_LIST_AS_ITEMS_PARAMETER,
+    TEXT_LIST_AS_ITEMS_VARIABLE_NAME, TEXT_SORT_FIELD_PARAMETER,
+    TEXT_SORT_FIELD_VARIABLE_NAME,
+)
+from .settings import (
+    setting_download_sendfile_header, setting_download_sendfile_root,
+    setting_download_sendfile_url
 )
+from .utils import get_file_range_iterator, parse_range_header
 
 
 class ContentTypeViewMixin:
@@ -66,26 +77,166 @@ class ExtraDataDeleteViewMixin:
 
 
 class DownloadViewMixin:
+    """
+    Mixin to send a file object as the response of a view.
+    Views that set `download_accept_ranges` to True serve byte range
+    requests. Views that return the filesystem path of the file from
+    `get_download_file_path` can have the file sent by the web server
+    using the sendfile settings.
+    """
     as_attachment = True
+    download_accept_ranges = False
 
     def get_as_attachment(self):
         return self.as_attachment
 
+    def get_download_etag(self):
+        """
+        Strong entity tag of the file used to validate If-Range requests.
+        """
+        return None
+
     def get_download_file_object(self):
         raise NotImplementedError(
             'Class must provide a .get_download_file_object() method that '
             'return a file like object.'
         )
 
+    def get_download_file_path(self):
+        return None
+
     def get_download_filename(self):
         return None
 
+    def get_download_mime_type(self):
+        return None
+
+    def get_download_response_kwargs(self):
+        response_kwargs = {
+            'as_attachment': self.get_as_attachment(),
+            'filename': self.get_download_filename()
+        }
+
+        mime_type = self.get_download_mime_type()
+        if mime_type:
+            response_kwargs['content_type'] = mime_type
+
+        return response_kwargs
+
+    def get_download_sendfile_response(self, file_object):
+        header = setting_download_sendfile_header.value
+        path = self.get_download_file_path()
+        root = setting_download_sendfile_root.value
+
+        if not (header and path and root):
+            return None
+
+        path = Path(path).resolve()
+
+        try:
+            relative_path = path.relative_to(Path(root).resolve())
+        except ValueError:
+            return None
+
+        if header == DOWNLOAD_SENDFILE_HEADER_NGINX:
+            if not setting_download_sendfile_url.value:
+                return None
+
+            header_value = '{}/{}'.format(
+                setting_download_sendfile_url.value.rstrip('/'),
+                quote(relative_path.as_posix())
+            )
+        else:
+            header_value = force_text(s=path)
+
+        # The file object is not sent but is still obtained to trigger any
+        # event or side effect of the download.
+        file_object.close()
+
+        response_kwargs = self.get_download_response_kwargs()
+        response_kwargs.setdefault(
+            'content_type', get_mimetype_from_path(
+                mimetype_only=True, path=force_text(s=path)
+            )[0]
+        )
+        response = FileResponse(streaming_content=(), **response_kwargs)
+        response[header] = header_value
+
+        return response
+
+    def get_download_size(self, file_object):
+        try:
+            return file_object.size
+        except (AttributeError, OSError):
+            position = file_object.tell()
+            size = file_object.seek(0, 2)
+            file_object.seek(position)
+            return size
+
     def render_to_response(self, **response_kwargs):
-        return FileResponse(
-            as_attachment=self.get_as_attachment(),
-            filename=self.get_download_filename(),
-            streaming_content=self.get_download_file_object()
+        file_object = self.get_download_file_object()
+
+        response = self.get_download_sendfile_response(
+            file_object=file_object
         )
+        if response:
+            return response
+
+        response_kwargs = self.get_download_response_kwargs()
+
+        if not self.download_accept_ranges:
+            return FileResponse(
+                streaming_content=file_object, **response_kwargs
+            )
+
+        etag = self.get_download_etag()
+        file_range = None
+        size = self.get_download_size(file_object=file_object)
+
+        range_header = self.request.META.get('HTTP_RANGE')
+        if_range_header = self.request.META.get('HTTP_IF_RANGE')
+
+        if range_header and (not if_range_header or if_range_header == etag):
+            try:
+                file_range = parse_range_header(
+                    header=range_header, size=size
+                )
+            except ValueError:
+                file_object.close()
+                response = HttpResponse(status=416)
+                response['Content-Range'] = 'bytes */{}'.format(size)
+                return response
+
+        if file_range:
+            if 'content_type' not in response_kwargs:
+                response_kwargs['content_type'] = get_mimetype(
+                    file_object=file_object, mimetype_only=True
+                )[0]
+
+            first, last = file_range
+            response = FileResponse(
+                status=206, streaming_content=get_file_range_iterator(
+                    chunk_size=FileResponse.block_size,
+                    file_object=file_object, length=last - first + 1,
+                    start=first
+                ), **response_kwargs
+            )
+            response._closable_objects.append(file_object)
+            response['Content-Length'] = last - first + 1
+            response['Content-Range'] = 'bytes {}-{}/{}'.format(
+                first, last, size
+            )
+        else:
+            response = FileResponse(
+                streaming_content=file_object, **response_kwargs
+            )
+            response['Content-Length'] = size
+
+        response['Accept-Ranges'] = 'bytes'
+        if etag:
+            response['ETag'] = etag
+
+        return response
 
 
 class DynamicFormViewMixin:
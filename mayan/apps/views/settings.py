@@ -2,10 +2,39 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.smart_settings.classes import SettingNamespace
 
-from .literals import DEFAULT_VIEWS_PAGINATE_BY
+from .literals import (
+    DEFAULT_VIEWS_DOWNLOAD_SENDFILE_HEADER,
+    DEFAULT_VIEWS_DOWNLOAD_SENDFILE_ROOT, DEFAULT_VIEWS_DOWNLOAD_SENDFILE_URL,
+    DEFAULT_VIEWS_PAGINATE_BY
+)
 
 namespace = SettingNamespace(label=_('Views'), name='views')
 
+setting_download_sendfile_header = namespace.add_setting(
+    default=DEFAULT_VIEWS_DOWNLOAD_SENDFILE_HEADER,
+    global_name='VIEWS_DOWNLOAD_SENDFILE_HEADER', help_text=_(
+        'Hand off the downloads of files stored in the local filesystem to '
+        'the web server instead of sending them from the application. '
+        'Use "X-Accel-Redirect" for NGINX or "X-Sendfile" for Apache '
+        'with mod_xsendfile. Leave empty to disable.'
+    )
+)
+setting_download_sendfile_root = namespace.add_setting(
+    default=DEFAULT_VIEWS_DOWNLOAD_SENDFILE_ROOT,
+    global_name='VIEWS_DOWNLOAD_SENDFILE_ROOT', help_text=_(
+        'Filesystem path under which files can be handed off to the web '
+        'server. Files outside of this path are sent by the application.'
+    )
+)
+setting_download_sendfile_url = namespace.add_setting(
+    default=DEFAULT_VIEWS_DOWNLOAD_SENDFILE_URL,
+    global_name='VIEWS_DOWNLOAD_SENDFILE_URL', help_text=_(
+        'Internal URL of the web server location that serves the '
+        'VIEWS_DOWNLOAD_SENDFILE_ROOT path. Required when using '
+        '"X-Accel-Redirect".'
+    )
+)
+
 setting_paginate_by = namespace.add_setting(
     default=DEFAULT_VIEWS_PAGINATE_BY, global_name='VIEWS_PAGINATE_BY',
     help_text=_(
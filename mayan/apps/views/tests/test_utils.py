@@ -0,0 +1,51 @@
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..utils import parse_range_header
+
+
+class ParseRangeHeaderTestCase(BaseTestCase):
+    def test_closed_range(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=0-9', size=100), (0, 9)
+        )
+
+    def test_closed_range_past_end(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=90-199', size=100), (90, 99)
+        )
+
+    def test_invalid_range(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=9-0', size=100), None
+        )
+        self.assertEqual(
+            parse_range_header(header='items=0-9', size=100), None
+        )
+        self.assertEqual(
+            parse_range_header(header='bytes=a-b', size=100), None
+        )
+
+    def test_multiple_ranges(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=0-9,20-29', size=100), None
+        )
+
+    def test_open_range(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=10-', size=100), (10, 99)
+        )
+
+    def test_suffix_range(self):
+        self.assertEqual(
+            parse_range_header(header='bytes=-10', size=100), (90, 99)
+        )
+        self.assertEqual(
+            parse_range_header(header='bytes=-200', size=100), (0, 99)
+        )
+
+    def test_unsatisfiable_range(self):
+        with self.assertRaises(ValueError):
+            parse_range_header(header='bytes=100-', size=100)
+
+        with self.assertRaises(ValueError):
+            parse_range_header(header='bytes=-0', size=100)
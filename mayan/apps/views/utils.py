@@ -14,3 +14,62 @@ def convert_to_id_list(items):
 def resolve(path, urlconf=None):
     path = '/{}'.format(path.replace(get_script_prefix(), '', 1))
     return django_resolve(path=path, urlconf=urlconf)
+
+
+def get_file_range_iterator(file_object, start, length, chunk_size):
+    """
+    Return an iterator over the byte range of a file object.
+    """
+    file_object.seek(start)
+
+    while length > 0:
+        chunk = file_object.read(min(chunk_size, length))
+        if not chunk:
+            break
+
+        length -= len(chunk)
+        yield chunk
+
+
+def parse_range_header(header, size):
+    """
+    Parse the value of an HTTP Range header for a file of the given size.
+    Returns a tuple with the first and last byte positions of the range, or
+    None if the header is invalid or specifies multiple ranges, in which
+    case the header must be ignored. Raises ValueError if the range cannot
+    be satisfied.
+    """
+    unit, _, ranges = header.partition('=')
+
+    if unit.strip().lower() != 'bytes' or ',' in ranges:
+        return None
+
+    first, separator, last = ranges.strip().partition('-')
+
+    if not separator or not (first or last):
+        return None
+
+    try:
+        first = int(first) if first else None
+        last = int(last) if last else None
+    except ValueError:
+        return None
+
+    if first is None:
+        # Suffix range, the last N bytes of the file.
+        if last == 0:
+            raise ValueError('Unsatisfiable range: {}'.format(header))
+
+        first = max(size - last, 0)
+        last = size - 1
+    elif last is None:
+        last = size - 1
+    elif last < first:
+        return None
+    else:
+        last = min(last, size - 1)
+
+    if first >= size:
+        raise ValueError('Unsatisfiable range: {}'.format(header))
+
+    return first, last